@@ -2250,6 +2250,78 @@ def test_a_alpha_pure():
         assert_close(a_alpha0, a_alpha1, rtol=1e-13)
 
 
+def test_volume_solutions_batch():
+    from thermo.eos_volume import (volume_solutions_halley, volume_solutions_NR, volume_solutions_fast,
+                                   volume_solutions_Cardano, volume_solutions_halley_batch,
+                                   volume_solutions_NR_batch, volume_solutions_fast_batch,
+                                   volume_solutions_Cardano_batch)
+    solvers = [(volume_solutions_halley, volume_solutions_halley_batch),
+               (volume_solutions_NR, volume_solutions_NR_batch),
+               (volume_solutions_fast, volume_solutions_fast_batch),
+               (volume_solutions_Cardano, volume_solutions_Cardano_batch)]
+    # Includes points below 1e-2 Pa which take the per-point fallbacks
+    Ts = logspace(log10(5.0), log10(5000.0), 12)
+    Ps = logspace(log10(1e-3), log10(1e9), 14)
+    TT, PP = np.meshgrid(Ts, Ps, indexing='ij')
+    for e in (PR, SRK, VDW, PRTranslatedConsistent):
+        obj = e(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
+        a_alphas = np.array([obj.a_alpha_pure(T) for T in TT.ravel()]).reshape(TT.shape)
+        for scalar, batch in solvers:
+            Vs = batch(TT, PP, obj.b, obj.delta, obj.epsilon, a_alphas)
+            assert Vs.shape == (12, 14, 3)
+            for idx in np.ndindex(TT.shape):
+                expect = np.array(scalar(TT[idx], PP[idx], obj.b, obj.delta, obj.epsilon, a_alphas[idx]), dtype=complex)
+                if scalar is volume_solutions_halley:
+                    expect = expect.real
+                # Roots may be ordered differently; every expected root must be present
+                scale = np.abs(expect).max()
+                for V in expect:
+                    assert np.abs(Vs[idx] - V).min() <= 1e-9*scale
+
+    V0, V1, V2 = volume_solutions_halley_batch(299.0, 1e6, 0.000108539, 0.000217079, -1.178e-08, 3.8012)
+    assert_close(V0, volume_solutions_halley(299.0, 1e6, 0.000108539, 0.000217079, -1.178e-08, 3.8012)[0], rtol=1e-14)
+    assert V1 == V2 == 0.0
+
+
+def test_evaluate_vectorized():
+    from thermo.eos import eos_list
+    Ts = [200.0, 300.0, 400.0, 500.0, 600.0]
+    Ps = [1e4, 1e6, 5e6]
+    props = ['V_l', 'V_g', 'H_dep_l', 'H_dep_g', 'S_dep_g', 'Cp_dep_l',
+             'dP_dT_g', 'd2P_dV2_l', 'lnphi_l', 'fugacity_g']
+    eos_objs = [e(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6) for e in eos_list]
+    eos_objs.append(PRTranslatedTwu(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6, c=-4.7e-6,
+                                    alpha_coeffs=(0.694911381318495, 0.919907783415812, 1.70412689631515)))
+    for obj in eos_objs:
+        TT, PP = np.meshgrid(Ts, Ps, indexing='ij')
+        values = obj.evaluate(TT, PP, props)
+        for prop in props:
+            assert values[prop].shape == (5, 3)
+        for i, T in enumerate(Ts):
+            for j, P in enumerate(Ps):
+                point = obj.to_TP(T, P)
+                for prop in props:
+                    expect = getattr(point, prop, None)
+                    calc = values[prop][i, j]
+                    if expect is None:
+                        assert np.isnan(calc)
+                    else:
+                        assert_close(calc, expect, rtol=1e-9, atol=1e-12)
+
+    obj = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
+    # Scalar inputs give 0-d arrays; default props include both phases
+    values = obj.evaluate(400.0, 1e6)
+    assert values['V_l'].shape == ()
+    assert_close(float(values['V_l']), obj.V_l, rtol=1e-12)
+    assert_close(float(values['H_dep_g']), obj.H_dep_g, rtol=1e-12)
+    values = obj.evaluate([400.0], [1e6], props=['a_alpha', 'da_alpha_dT'])
+    assert_close(values['a_alpha'][0], obj.a_alpha, rtol=1e-13)
+    assert_close(values['da_alpha_dT'][0], obj.da_alpha_dT, rtol=1e-13)
+
+    with pytest.raises(ValueError):
+        obj.evaluate([300.0], [1e5], props=['not_a_property'])
+
+
 def test_properties_removed_from_default():
     obj = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400., P=1E6)
     assert_close(obj.V_dep_l, -0.0031697118624756325, rtol=1e-10)
@@ -4482,6 +4482,70 @@ def test_APISRKMIX_alpha_functions():
     assert_close1d(APISRK_a_alpha_and_derivatives_vectorized(T, Tcs, ais, S1s, S2s)[1], da_alpha_dTs_expect, rtol=1e-14)
     assert_close1d(APISRK_a_alpha_and_derivatives_vectorized(T, Tcs, ais, S1s, S2s)[2], d2a_alpha_dT2s_expect, rtol=1e-14)
 
+def test_alpha_functions_vectorized_match_pure():
+    from thermo.eos_alpha_functions import a_alpha_bases
+    Tcs = [507.6, 540.2, 190.56]
+    ais = [2.6923, 3.3729, 0.2488]
+    omegas = [0.3, 0.35, 0.008]
+    coeffs = {Soave_1972_a_alpha: [[0.8], [0.9], [0.4]],
+              Heyen_a_alpha: [[0.4, 1.2], [0.5, 1.1], [0.2, 1.3]],
+              Harmens_Knapp_a_alpha: [[0.8, 0.02], [0.9, 0.03], [0.4, 0.01]],
+              Mathias_1983_a_alpha: [[0.8, 0.05], [0.9, 0.06], [0.4, 0.01]],
+              Mathias_Copeman_untruncated_a_alpha: [[0.8, -0.2, 0.3], [0.9, -0.1, 0.2], [0.4, 0.1, 0.1]],
+              Mathias_Copeman_a_alpha: [[0.2, -0.1, 0.8, 1.0], [0.3, -0.2, 0.9, 1.0], [0.1, 0.1, 0.4, 1.0]],
+              Gibbons_Laughton_a_alpha: [[-0.6, -0.4], [-0.7, -0.3], [-0.4, -0.1]],
+              Soave_1984_a_alpha: [[0.6, 0.05], [0.7, 0.04], [0.3, 0.02]],
+              Yu_Lu_a_alpha: [[0.4, 0.1, -0.05, 0.6], [0.5, 0.1, -0.04, 0.6], [0.3, 0.1, -0.02, 0.6]],
+              Trebble_Bishnoi_a_alpha: [0.6, 0.7, 0.3],
+              Melhem_a_alpha: [[0.7, 0.2], [0.8, 0.3], [0.4, 0.1]],
+              Androulakis_a_alpha: [[0.3, 0.2, 0.1], [0.4, 0.2, 0.1], [0.2, 0.1, 0.05]],
+              Schwartzentruber_a_alpha: [[0.1, 0.05, 0.02, 0.7], [0.1, 0.04, 0.03, 0.8], [0.05, 0.02, 0.01, 0.4]],
+              Almeida_a_alpha: [[0.7, 0.1, 0.5], [0.8, 0.2, 0.4], [0.4, 0.1, 0.3]],
+              Twu91_a_alpha: [[0.3, 0.87, 1.9], [0.33, 0.85, 2.0], [0.15, 0.9, 1.8]],
+              Soave_93_a_alpha: [[0.8, 0.05], [0.9, 0.04], [0.4, 0.02]],
+              Gasem_a_alpha: [[0.134, 0.508, -0.0467], [0.134, 0.508, -0.0467], [0.134, 0.508, -0.0467]],
+              Coquelet_a_alpha: [[0.7, 0.2, 0.1], [0.8, 0.1, 0.2], [0.4, 0.1, 0.05]],
+              Haghtalab_a_alpha: [[0.2, 2.0, 0.1], [0.25, 1.8, 0.1], [0.1, 2.2, 0.05]],
+              Saffari_a_alpha: [[0.001, 0.7, 0.01], [0.002, 0.8, 0.02], [0.001, 0.4, 0.005]],
+              Chen_Yang_a_alpha: [[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7], [0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.75],
+                                  [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]],
+              TwuSRK95_a_alpha: None, TwuPR95_a_alpha: None,
+              Soave_79_a_alpha: [[0.8, 0.1], [0.9, 0.12], [0.4, 0.05]]}
+    assert set(coeffs) == set(a_alpha_bases)
+
+    for cls, alpha_coeffs in coeffs.items():
+        mix = cls()
+        mix.Tcs, mix.ais, mix.omegas, mix.alpha_coeffs, mix.N = Tcs, ais, omegas, alpha_coeffs, 3
+        # Sub- and supercritical, and low enough to hit the TWU low-Tr adjustment
+        for T in (0.5, 150.0, 300.0, 520.0, 600.0):
+            expect = []
+            for i in range(3):
+                pure = cls()
+                pure._init_test(Tcs[i], ais[i], alpha_coeffs[i] if alpha_coeffs else None, omega=omegas[i])
+                if T != 0.5 or cls in (TwuSRK95_a_alpha, TwuPR95_a_alpha):
+                    expect.append(pure.a_alpha_and_derivatives_pure(T))
+            if not expect:
+                continue
+            expect = [list(v) for v in zip(*expect)]
+            assert_close1d(mix.a_alphas_vectorized(T), expect[0], rtol=1e-13)
+            calc = mix.a_alpha_and_derivatives_vectorized(T)
+            assert_close2d(calc, expect, rtol=1e-13)
+
+    alpha_coeffs = [[1e-06, -1e-05, 5.0], [2e-06, -2e-05, 6.5]]
+    assert_close1d(Poly_a_alphas_vectorized(300.0, alpha_coeffs), [5.087, 6.674], rtol=1e-13)
+    assert_close2d(Poly_a_alpha_and_derivatives_vectorized(300.0, alpha_coeffs),
+                   [[5.087, 6.674], [0.00059, 0.00118], [2e-06, 4e-06]], rtol=1e-13)
+
+    # Mixtures built on these alpha functions give the same a_alphas as per-component evaluation
+    kwargs = dict(T=300.0, P=1e5, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5],
+                  omegas=[0.04, 0.011], zs=[0.5, 0.5])
+    for e in (TWUPRMIX, TWUSRKMIX, PRMIXTranslatedConsistent, SRKMIXTranslatedConsistent):
+        for T in (1e-3, 100.0, 300.0):
+            obj = e(**kwargs).to(T=T, P=1e5, zs=[0.5, 0.5])
+            expect = [obj.pures()[i].a_alpha_and_derivatives(T) for i in range(2)]
+            expect = [list(v) for v in zip(*expect)]
+            assert_close2d([obj.a_alphas, obj.da_alpha_dTs, obj.d2a_alpha_dT2s], expect, rtol=1e-12)
+
 def test_a_alpha_vectorized():
     from thermo.eos_mix import eos_mix_list
     for e in eos_mix_list:
@@ -4516,3 +4580,51 @@ def test_IGMIX_numpy():
 
     assert type(eos2.fugacities_g) is np.ndarray
     assert np.all(eos2.fugacities_g == eos2.P*eos2.zs)
+
+
+def test_lazy_derivatives():
+    kwargs = dict(Tcs=[190.6, 305.3, 369.8, 425.1], Pcs=[46e5, 48.7e5, 42.5e5, 38e5],
+                  omegas=[0.008, 0.1, 0.15, 0.2], zs=[0.25, 0.25, 0.25, 0.25])
+    root_props = ['V', 'Z', 'PIP', 'dP_dT', 'H_dep', 'S_dep', 'G_dep', 'Cp_dep', 'Cv_dep',
+                  'd2P_dTdV', 'beta', 'kappa', 'd2V_dT2']
+    props = [p + '_l' for p in root_props] + [p + '_g' for p in root_props]
+    for eos in (PRMIX, SRKMIX, VDWMIX, PRMIXTranslatedConsistent):
+        base = eos(T=300.0, P=1e6, **kwargs)
+        # Two roots, one gas root, one liquid root
+        for T, P in [(250.0, 2e6), (300.0, 1e5), (200.0, 1e7)]:
+            eager = base.to_TP_zs_fast(T, P, kwargs['zs'])
+            lazy = base.to_TP_zs_fast(T, P, kwargs['zs'], lazy=True)
+            assert lazy.lazy_derivatives
+            assert 'H_dep_l' not in lazy.__dict__ and 'H_dep_g' not in lazy.__dict__
+            assert eager.phase == lazy.phase
+            for prop in props:
+                assert hasattr(eager, prop) == hasattr(lazy, prop)
+                if hasattr(eager, prop):
+                    assert_close(getattr(eager, prop), getattr(lazy, prop), rtol=1e-13)
+
+            Z = lazy.Z_g if hasattr(lazy, 'Z_g') else lazy.Z_l
+            dlnphis_dns = lazy.dlnphis_dns(Z)
+            assert lazy.dlnphis_dns(Z) is dlnphis_dns
+            assert_close2d(dlnphis_dns, eager.dlnphis_dns(Z), rtol=1e-12)
+            assert_close1d(lazy.fugacity_coefficients(Z), eager.fugacity_coefficients(Z), rtol=1e-13)
+
+    # The mode propagates through to_TP_zs_fast and memoized values do not survive a new solution
+    base = PRMIX(T=300.0, P=1e6, **kwargs)
+    base.lazy_derivatives = True
+    eos = base.to_TP_zs_fast(250.0, 2e6, kwargs['zs'])
+    assert eos.lazy_derivatives
+    lnphis_old = eos.fugacity_coefficients(eos.Z_l)
+    eos.H_dep_l
+    eos.resolve_full_alphas()
+    assert 'H_dep_l' not in eos.__dict__
+    assert eos.fugacity_coefficients(eos.Z_l) is not lnphis_old
+
+    eos.resolve_lazy_derivatives()
+    assert '_lazy_solutions' not in eos.__dict__
+    assert_close(eos.__dict__['H_dep_l'], PRMIX(T=250.0, P=2e6, **kwargs).H_dep_l, rtol=1e-13)
+    assert not base.to_TP_zs_fast(250.0, 2e6, kwargs['zs'], lazy=False).lazy_derivatives
+
+    # Only the deferred properties are looked up specially
+    assert not hasattr(PRMIX, '__getattr__')
+    assert not hasattr(eos, 'H_dep_x')
+    assert IGMIX(T=300.0, P=1e5, **kwargs).H_dep_g == 0.0
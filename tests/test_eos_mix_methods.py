@@ -117,4 +117,56 @@ def test_PR_lnphis_fastest():
 
     expect = eos.lnphis_g
     calc = PR_lnphis_fastest(eos.zs, eos.T, eos.P, eos.kijs, False, True, eos.ais, eos.bs, eos.a_alphas, eos.a_alpha_roots, eos.kappas)
-    assert_close(expect, calc, rtol=1e-14)
\ No newline at end of file
+    assert_close(expect, calc, rtol=1e-14)
+
+def test_lnphis_fastest_other_models():
+    kwargs = dict(Tcs=[190.56400000000002, 305.32, 369.83, 126.2],
+                  Pcs=[4599000.0, 4872000.0, 4248000.0, 3394387.5],
+                  omegas=[0.008, 0.098, 0.152, 0.04],
+                  zs=[.1, .2, .3, .4],
+                  kijs=[[0.0, -0.0059, 0.0119, 0.0289], [-0.0059, 0.0, 0.0011, 0.0533], [0.0119, 0.0011, 0.0, 0.0878], [0.0289, 0.0533, 0.0878, 0.0]])
+    cs = [-4.4e-6, -2e-6, 1e-6, -4.35e-6]
+    for l, g in ((True, False), (False, True)):
+        eos = SRKMIX(T=200, P=1e5, **kwargs)
+        calc = SRK_lnphis_fastest(eos.zs, eos.T, eos.P, eos.kijs, l, g, eos.ais, eos.bs, eos.a_alphas, eos.a_alpha_roots, eos.ms)
+        assert_close1d(calc, eos.lnphis_l if l else eos.lnphis_g, rtol=1e-13)
+
+        for cls, f in ((RKMIX, RK_lnphis_fastest), (VDWMIX, VDW_lnphis_fastest)):
+            eos = cls(T=200, P=1e5, **kwargs)
+            calc = f(eos.zs, eos.T, eos.P, eos.kijs, l, g, eos.ais, eos.bs, eos.a_alphas, eos.a_alpha_roots)
+            # VDW only has one root here, and has its own expression for the fugacity coefficients
+            expect = eos.fugacity_coefficients(eos.Z_l if (l and hasattr(eos, 'Z_l')) else eos.Z_g)
+            assert_close1d(calc, expect, rtol=1e-12)
+
+        for cls, f in ((PRMIXTranslated, PR_translated_lnphis_fastest),
+                       (PRMIXTranslatedConsistent, PR_translated_lnphis_fastest),
+                       (SRKMIXTranslated, SRK_translated_lnphis_fastest),
+                       (SRKMIXTranslatedConsistent, SRK_translated_lnphis_fastest)):
+            eos = cls(T=200, P=1e5, cs=cs, **kwargs)
+            calc = f(eos.zs, eos.T, eos.P, eos.kijs, l, g, eos.b0s, eos.cs, eos.a_alphas, eos.a_alpha_roots)
+            expect = GCEOSMIX.fugacity_coefficients(eos, eos.Z_l if l else eos.Z_g)
+            assert_close1d(calc, expect, rtol=1e-12)
+            assert_close1d(calc, eos.lnphis_l if l else eos.lnphis_g, rtol=1e-12)
+
+def test_lnphis_direct_reduced():
+    # Nitrogen and CO2 interact with the hydrocarbons, which do not interact with each other
+    kijs = [[0.0, -0.02, 0.03, 0.08, 0.08], [-0.02, 0.0, 0.1, 0.12, 0.12],
+            [0.03, 0.1, 0.0, 0.0, 0.0], [0.08, 0.12, 0.0, 0.0, 0.0], [0.08, 0.12, 0.0, 0.0, 0.0]]
+    groups, one_minus_kijs_groups = kijs_reduction(kijs)
+    assert groups == [0, 1, 2, 3, 3]
+    assert_close2d(one_minus_kijs_groups, [[1.0, 1.02, 0.97, 0.92], [1.02, 1.0, 0.9, 0.88],
+                                           [0.97, 0.9, 1.0, 1.0], [0.92, 0.88, 1.0, 1.0]], rtol=1e-15)
+    assert kijs_reduction([[0.0]*3 for _ in range(3)]) == ([0, 0, 0], [[1.0]])
+
+    eos = PRMIX(T=250.0, P=3e6, Tcs=[126.2, 304.2, 190.56, 305.32, 369.83], Pcs=[3394387.5, 7376460.0, 4599000.0, 4872000.0, 4248000.0],
+                omegas=[0.04, 0.2252, 0.008, 0.098, 0.152], zs=[0.1, 0.1, 0.5, 0.2, 0.1], kijs=kijs)
+    for l, g in ((True, False), (False, True)):
+        expect = lnphis_direct(eos.zs, 'PRMIX', eos.T, eos.P, kijs, l, g, eos.bs, eos.a_alphas, eos.a_alpha_roots)
+        calc = lnphis_direct_reduced(eos.zs, 'PRMIX', eos.T, eos.P, groups, one_minus_kijs_groups, l, g,
+                                     eos.bs, eos.a_alphas, eos.a_alpha_roots)
+        assert_close1d(calc, expect, rtol=1e-12)
+
+    Qs, b = reduced_variables(eos.zs, groups, 4, eos.bs, eos.a_alpha_roots)
+    assert_close(b, eos.b, rtol=1e-14)
+    assert_close1d(lnphis_reduced('PRMIX', eos.T, eos.P, Qs, b, False, True, groups, one_minus_kijs_groups, eos.bs, eos.a_alpha_roots),
+                   eos.lnphis_g, rtol=1e-12)
@@ -1893,3 +1893,59 @@ def test_methanol_inconsistent_full_example():
     assert_close(res.P, 797342.226264512)
     assert_close(res.gas.rho_mass(), 8.416881310028323)
     assert_close(res.liquid0.rho_mass(), 568.7838890605196)
+
+
+def test_build_property_table(tmpdir):
+    constants = ChemicalConstantsPackage(Tcs=[647.14], Pcs=[22048320.0], omegas=[0.344], MWs=[18.01528], CASs=['7732-18-5'])
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases[0:1], skip_missing=True)
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    liquid = CEOSLiquid(PRMIX, HeatCapacityGases=HeatCapacityGases[0:1], eos_kwargs=eos_kwargs)
+    gas = CEOSGas(PRMIX, HeatCapacityGases=HeatCapacityGases[0:1], eos_kwargs=eos_kwargs)
+    flasher = FlashPureVLS(constants, correlations, gas=gas, liquids=[liquid], solids=[])
+
+    table = flasher.build_property_table(spec='H', Pmin=1e5, Pmax=3e7, Tmin=300.0, Tmax=800.0,
+                                         P_pts=12, spec_pts=12, props=['T', 'rho_mass', 'mu'])
+    assert len(table.blocks) == 2
+    assert len(table.blocks[0]['values']) == 3 and len(table.blocks[1]['values']) == 1
+    assert table.max_errors['T'] < 0.02
+    # No viscosity correlation - not available
+    assert isnan(table.max_errors['mu'])
+
+    for T, P in [(400.0, 5e5), (350.0, 1e6), (450.0, 1e5), (700.0, 2.5e7)]:
+        res = flasher.flash(T=T, P=P)
+        T_calc, rho_calc, mu_calc = table.values(P, res.H())
+        assert_close(T_calc, T, rtol=2e-3)
+        assert_close(rho_calc, res.rho_mass(), rtol=5e-3)
+        assert isnan(mu_calc)
+        assert table.value(P, res.H(), 'T') == T_calc
+
+    # Two phase - the temperature is the saturation temperature
+    res = flasher.flash(P=5e5, VF=0.3)
+    assert_close(table.value(5e5, res.H(), 'T'), res.T, rtol=1e-4)
+
+    with pytest.raises(ValueError):
+        table.value(1e3, res.H(), 'T')
+    with pytest.raises(ValueError):
+        table.value(constants.Pcs[0], res.H(), 'T')
+
+    path = os.path.join(str(tmpdir), 'table.npz')
+    table.save(path)
+    loaded = PurePropertyTable.load(path)
+    assert loaded.props == table.props
+    assert loaded.max_errors['T'] == table.max_errors['T']
+    assert loaded.values(5e5, res.H())[0:2] == table.values(5e5, res.H())[0:2]
+
+    # Fallback to flashing outside the table and where not accurate enough
+    table = flasher.build_property_table(spec='S', Pmin=1e5, Pmax=1e6, Tmin=300.0, Tmax=600.0,
+                                         P_pts=5, spec_pts=5, props=['T'], rtol=1e-9)
+    S = flasher.flash(T=400.0, P=3e5).S()
+    assert_close(table.value(3e5, S, 'T'), 400.0, rtol=1e-9)
+    assert table.fallbacks == 1
+    assert_close(table.value(1e7, S, 'T'), flasher.flash(P=1e7, S=S).T, rtol=1e-9)
+    assert table.fallbacks == 2
+    table = PurePropertyTable.load(path, flasher=flasher)
+    table.rtol = 1.0
+    table.value(5e5, res.H(), 'T')
+    assert table.fallbacks == 0
+    table.values(5e5, res.H())
+    assert table.fallbacks == 1
@@ -29,6 +29,7 @@ from fluids.numerics import *
 from math import *
 import json
 import os
+import threading
 import numpy as np
 
 
@@ -223,6 +224,911 @@ def test_C1_C10_PT_flash_VL():
 
 
 
+def test_flash_TP_batch_PR_VL():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], Tms=[90.3, 143.15],
+                                         Tbs=[184.55, 309.21], CASs=['74-84-0', '109-66-0'],
+                                         names=['ethane', 'pentane'], MWs=[30.06904, 72.14878])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    T, P = 350.0, 2e6
+    zs_matrix = [[z, 1.0 - z] for z in linspace(0.02, 0.98, 15)]
+    betas, compositions, values = flasher.flash_TP_batch(T, P, zs_matrix, props=['H', 'V'])
+    assert betas.shape == (15, 2)
+    assert compositions.shape == (15, 2, 2)
+    phase_counts = set()
+    for i, zs in enumerate(zs_matrix):
+        res = flasher.flash(T=T, P=P, zs=zs)
+        phase_counts.add(res.phase_count)
+        # Both are converged to the same sequential substitution tolerance
+        assert_close(betas[i][0], res.VF, atol=1e-6)
+        assert_close(values[i][0], res.H(), rtol=1e-5)
+        assert_close(values[i][1], res.V(), rtol=1e-5)
+        if res.gas is not None:
+            assert_close1d(compositions[i][0], res.gas.zs, rtol=1e-5)
+        else:
+            assert all(isnan(v) for v in compositions[i][0])
+        if res.liquid_count:
+            assert_close1d(compositions[i][1], res.liquid0.zs, rtol=1e-5)
+    # Check all the code paths were exercised
+    assert phase_counts == set([1, 2])
+
+    # The results are laid out gas first, so there is no batch flash without a gas model
+    flasher_no_gas = FlashVLN(constants, correlations, liquids=[liq, liq], gas=None)
+    with pytest.raises(ValueError):
+        flasher_no_gas.flash_TP_batch(T, P, zs_matrix)
+
+
+def test_flash_TP_batch_K_composition_independent():
+    constants = ChemicalConstantsPackage(Tcs=[508.1, 536.2, 512.5], Pcs=[4700000.0, 5330000.0, 8084000.0], omegas=[0.309, 0.21600000000000003, 0.5589999999999999],
+                                         MWs=[58.07914, 119.37764000000001, 32.04186], CASs=['67-64-1', '67-66-3', '67-56-1'], names=['acetone', 'chloroform', 'methanol'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [1.5389278550737367e-21, -8.289631533963465e-18, 1.9149760160518977e-14, -2.470836671137373e-11, 1.9355882067011222e-08, -9.265600540761629e-06, 0.0024825718663005762, -0.21617464276832307, 48.149539665907696])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(poly_fit=(207.15, 536.4, [-8.714046553871422e-20, 2.910491615051279e-16, -4.2588796020294357e-13, 3.580003116042944e-10, -1.902612144361103e-07, 6.614096470077095e-05, -0.01494801055978542, 2.079082613726621, -130.24643185169472])),
+                      VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, HeatCapacityGases=HeatCapacityGases,
+                               use_Poynting=False, use_phis_sat=False)
+    correlations = PropertyCorrelationsPackage(constants=constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases,
+                                               VaporPressures=VaporPressures)
+    gas = IdealGas(HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVLN(constants, correlations, liquids=[liquid], gas=gas)
+
+    T, P = 330.0, 6e4
+    zs_matrix = [[0.2, 0.0, 0.8], [0.6, 0.3, 0.1], [0.1, 0.8, 0.1], [0.98, 0.01, 0.01], [0.01, 0.01, 0.98]]
+    betas, compositions = flasher.flash_TP_batch(T, P, zs_matrix)
+    for i, zs in enumerate(zs_matrix):
+        res = flasher.flash(T=T, P=P, zs=zs)
+        assert_close(betas[i][0], res.VF, atol=1e-10)
+        if res.phase_count == 2:
+            assert_close1d(compositions[i][0], res.gas.zs)
+            assert_close1d(compositions[i][1], res.liquid0.zs)
+
+
+def test_K_cache_composition_independent():
+    constants = ChemicalConstantsPackage(Tcs=[508.1, 536.2, 512.5], Pcs=[4700000.0, 5330000.0, 8084000.0], omegas=[0.309, 0.21600000000000003, 0.5589999999999999],
+                                         MWs=[58.07914, 119.37764000000001, 32.04186], CASs=['67-64-1', '67-66-3', '67-56-1'], names=['acetone', 'chloroform', 'methanol'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+     HeatCapacityGas(poly_fit=(200.0, 1000.0, [1.5389278550737367e-21, -8.289631533963465e-18, 1.9149760160518977e-14, -2.470836671137373e-11, 1.9355882067011222e-08, -9.265600540761629e-06, 0.0024825718663005762, -0.21617464276832307, 48.149539665907696])),
+     HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(178.51, 498.1, [6.564241965071999e-23, -1.6568522275506375e-19, 1.800261692081815e-16, -1.0988731296761538e-13, 4.118691518070104e-11, -9.701938804617744e-09, 1.4022905458596618e-06, -0.00011362923883050033, 0.0040109650220160956])),
+                    VolumeLiquid(poly_fit=(209.63, 509.5799999999999, [2.034047306563089e-23, -5.45567626310959e-20, 6.331811062990084e-17, -4.149759318710192e-14, 1.6788970104955462e-11, -4.291900093120011e-09, 6.769385838271721e-07, -6.0166473220815445e-05, 0.0023740769479069054])),
+                    VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),]
+
+    VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(poly_fit=(207.15, 536.4, [-8.714046553871422e-20, 2.910491615051279e-16, -4.2588796020294357e-13, 3.580003116042944e-10, -1.902612144361103e-07, 6.614096470077095e-05, -0.01494801055978542, 2.079082613726621, -130.24643185169472])),
+                      VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, HeatCapacityGases=HeatCapacityGases, use_Poynting=False, use_phis_sat=False)
+    correlations = PropertyCorrelationsPackage(constants=constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases,
+                                               VaporPressures=VaporPressures)
+    flasher = FlashVLN(constants, correlations, liquids=[liquid], gas=IdealGas(HeatCapacityGases=HeatCapacityGases))
+    flasher_cached = FlashVLN(constants, correlations, liquids=[liquid], gas=IdealGas(HeatCapacityGases=HeatCapacityGases))
+    cache = flasher_cached.K_cache = KValueCache(max_size=2, Ts=linspace(300.0, 360.0, 61), Ps=logspace(4.0, 6.0, 11), rtol=1e-5)
+
+    # Interpolated K values are within the tolerance
+    for T, P in [(300.0, 1e4), (330.3, 6.1e4), (359.9, 1e6)]:
+        assert_close1d(flasher_cached.Ks_composition_independent(T, P),
+                       flasher.Ks_composition_independent(T, P), rtol=1e-5)
+    assert cache.interpolated == 3
+    assert cache.errors.shape == (60, 10)
+    assert cache.errors.max() < 1e-5
+
+    # Outside the grid or in cells which are too inaccurate, exact K values are stored
+    cache.rtol = 0.0
+    Ks = flasher_cached.Ks_composition_independent(330.3, 6.1e4)
+    assert Ks == flasher.Ks_composition_independent(330.3, 6.1e4)
+    assert flasher_cached.Ks_composition_independent(330.3, 6.1e4) is Ks
+    flasher_cached.Ks_composition_independent(400.0, 6.1e4)
+    flasher_cached.Ks_composition_independent(400.0, 7e4)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+    cache.clear()
+    assert cache.errors is None and not len(cache)
+
+    cache.rtol = 1e-5
+    T, P = 330.0, 6e4
+    zs_matrix = [[0.2, 0.0, 0.8], [0.6, 0.3, 0.1], [0.1, 0.8, 0.1], [0.98, 0.01, 0.01], [0.01, 0.01, 0.98]]
+    betas, compositions = flasher_cached.flash_TP_batch(T, P, zs_matrix)
+    for i, zs in enumerate(zs_matrix):
+        res = flasher.flash(T=T, P=P, zs=zs)
+        res_cached = flasher_cached.flash(T=T, P=P, zs=zs)
+        assert_close(res_cached.VF, res.VF, atol=1e-5)
+        assert_close(betas[i][0], res.VF, atol=1e-5)
+    assert cache.interpolated == 6
+
+
+def test_grid_flash_parallel():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], Tms=[90.3, 143.15],
+                                         Tbs=[184.55, 309.21], CASs=['74-84-0', '109-66-0'],
+                                         names=['ethane', 'pentane'], MWs=[30.06904, 72.14878])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    zs = [0.5, 0.5]
+    # The negative temperature row fails, and must be reported not raised
+    Ts, Ps = [300.0, 350.0, 400.0, -10.0], [1e5, 1e6, 2e6]
+    serial, serial_props = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'])
+    serial_failures = flasher.grid_flash_failures
+    assert [f['index'] for f in serial_failures] == [(3, 0), (3, 1), (3, 2)]
+    assert serial_failures[0]['specs'] == {'zs': zs, 'T': -10.0, 'P': 1e5}
+    assert serial[3] == [None, None, None]
+    assert serial_props[3] == [[None, None]]*3
+
+    parallel, parallel_props = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'], n_jobs=2)
+    assert parallel_props == serial_props
+    assert flasher.grid_flash_failures == serial_failures
+    assert parallel[1][2].flasher is flasher
+    assert_close(parallel[1][2].H(), serial[1][2].H(), rtol=1e-13)
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(2) as executor:
+        props = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props='H', store=False, executor=executor)
+    assert props == [[v[0] for v in row] for row in serial_props]
+
+
+def test_grid_flash_continuation():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], Tms=[90.3, 143.15],
+                                         Tbs=[184.55, 309.21], CASs=['74-84-0', '109-66-0'],
+                                         names=['ethane', 'pentane'], MWs=[30.06904, 72.14878])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+    zs = [0.5, 0.5]
+    Ts, Ps = linspace(300.0, 380.0, 6), linspace(5e5, 2e6, 5)
+    cold = flasher.grid_flash(zs, Ts=Ts, Ps=Ps)
+    hot, hot_props = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props='VF', continuation=True)
+    assert flasher.grid_flash_failures == []
+    hot_started = 0
+    for cold_row, hot_row, props_row in zip(cold, hot, hot_props):
+        for cold_state, hot_state, VF in zip(cold_row, hot_row, props_row):
+            assert cold_state.phase_count == hot_state.phase_count
+            # Both solutions are only converged to the sequential substitution tolerance
+            assert_close(cold_state.VF, VF, atol=1e-6)
+            assert_close(cold_state.H(), hot_state.H(), rtol=1e-5)
+            # Two phase points seeded from a two phase neighbour skip the stability test
+            hot_started += 'stab_info' not in hot_state.flash_convergence
+    assert hot_started > 10
+
+    # Outside of a continuation grid flash, a hot start does not skip the stability test
+    two_phase = [state for row in hot for state in row if state.phase_count == 2][0]
+    res = flasher.flash(T=two_phase.T, P=two_phase.P, zs=zs, hot_start=two_phase)
+    assert 'stab_info' in res.flash_convergence
+    assert_close(res.VF, two_phase.VF, atol=1e-6)
+
+    # Reversed rows must still be returned in the order of the specifications
+    props = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props='T', store=False, continuation=True)
+    assert_close2d(props, [[T]*len(Ps) for T in Ts])
+
+
+def test_dew_bubble_curves():
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    path = [[0.1*(1.0 - x), 0.45*(1.0 - x) + 0.05, 0.45*(1.0 - x) + 0.95*x] for x in linspace(0.0, 1.0, 12)]
+
+    Ts, ys = flasher.bubble_T_curve(2e6, path)
+    assert Ts.shape == (12,) and ys.shape == (12, 3)
+    assert flasher.dew_bubble_curve_failures == []
+    for T, y, zs in zip(Ts, ys, path):
+        res = flasher.flash(P=2e6, VF=0.0, zs=zs)
+        assert_close(T, res.T, rtol=1e-8)
+        assert_close1d(y, res.gas.zs, atol=1e-5)
+
+    Ps, xs = flasher.dew_P_curve(300.0, path)
+    for P, x, zs in zip(Ps, xs, path):
+        res = flasher.flash(T=300.0, VF=1.0, zs=zs)
+        assert_close(P, res.P, rtol=1e-8)
+        assert_close1d(x, res.liquid0.zs, atol=1e-5)
+
+    assert_close1d(flasher.dew_T_curve(2e6, path[:3])[0], [flasher.flash(P=2e6, VF=1.0, zs=zs).T for zs in path[:3]], rtol=1e-8)
+    assert_close1d(flasher.bubble_P_curve(300.0, path[:3])[0], [flasher.flash(T=300.0, VF=0.0, zs=zs).P for zs in path[:3]], rtol=1e-8)
+
+    # Several paths, in parallel; a failed point is reported and does not stop its path
+    paths = [path, path[::-1], [[0.5, 0.5, 0.0], [-1.0, 1.0, 1.0], [0.0, 0.5, 0.5]]]
+    Ts_all, ys_all = flasher.bubble_T_curve(2e6, paths, n_jobs=2)
+    assert_close1d(Ts_all[0], Ts, rtol=1e-9)
+    assert_close1d(Ts_all[1][::-1], Ts, rtol=1e-7)
+    assert isnan(Ts_all[2][1])
+    assert not isnan(Ts_all[2][2])
+    assert [(f['path'], f['index']) for f in flasher.dew_bubble_curve_failures] == [(2, 1)]
+
+    with pytest.raises(ValueError):
+        flasher.dew_bubble_curve(path, 0.5, P=2e6)
+
+
+def test_phase_envelope_PR_ternary():
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 369.83], Pcs=[4599000.0, 4872000.0, 4248000.0],
+                                         omegas=[0.008, 0.098, 0.152], MWs=[16.04246, 30.06904, 44.09562],
+                                         CASs=['74-82-8', '74-84-0', '74-98-6'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs)
+    flasher = FlashVL(constants, None, liquid=liquid, gas=gas)
+    zs = [0.8, 0.15, 0.05]
+
+    Ts, Ps, Ks, critical = flasher.phase_envelope(zs, P_start=2e5)
+    assert_close(Ps[0], 2e5)
+    assert_close(Ps[-1], 2e5)
+    assert Ps.max() > critical[1]
+    assert Ts.max() > critical[0]
+
+    # Starts on the dew point curve, ends on the bubble point curve
+    dew = flasher.flash(P=Ps[0], VF=1, zs=zs)
+    assert_close(Ts[0], dew.T, rtol=1e-9)
+    assert_close1d(Ks[0], [y/x for x, y in zip(dew.liquid0.zs, dew.gas.zs)], rtol=1e-4)
+    bubble = flasher.flash(P=Ps[-1], VF=0, zs=zs)
+    assert_close(Ts[-1], bubble.T, rtol=1e-9)
+    assert_close1d(Ks[-1], [y/x for x, y in zip(bubble.liquid0.zs, bubble.gas.zs)], rtol=1e-4)
+
+    # Dew points up to the critical point, then bubble points
+    dew = [abs(sum([zi/Ki for zi, Ki in zip(zs, K)]) - 1.0) < 1e-9 for K in Ks]
+    bubble = [abs(sum([zi*Ki for zi, Ki in zip(zs, K)]) - 1.0) < 1e-9 for K in Ks]
+    assert dew == sorted(dew, reverse=True)
+    assert all(d != b for d, b in zip(dew, bubble))
+    i = dew.index(False)
+    assert min(Ps[i-1], Ps[i]) < critical[1] < max(Ps[i-1], Ps[i])
+    assert min(Ts[i-1], Ts[i]) < critical[0] < max(Ts[i-1], Ts[i])
+
+    # Tracing from the bubble point side gives the same curve
+    Ts_bubble, Ps_bubble, Ks_bubble, critical_bubble = flasher.phase_envelope(zs, P_start=2e5, VF=0)
+    assert_close1d(critical_bubble, critical, rtol=2e-3)
+    assert_close(Ts_bubble[0], Ts[-1], rtol=1e-9)
+    assert_close(Ts_bubble[-1], Ts[0], rtol=1e-9)
+
+
+def test_flash_cache():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                         CASs=['74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    reference = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+
+    cache = flasher.flash_cache = FlashCache(max_size=2)
+    res = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    assert (cache.hits, cache.near_hits, cache.misses) == (0, 0, 1)
+    assert_close(res.VF, reference.VF, rtol=1e-13)
+    assert flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5]) is res
+    assert (cache.hits, cache.near_hits, cache.misses) == (1, 0, 1)
+
+    # Within tolerance - hot started, not returned directly
+    near = flasher.flash(T=350.0000001, P=2e6, zs=[0.5000000001, 0.4999999999])
+    assert near is not res
+    assert near.T == 350.0000001
+    assert (cache.hits, cache.near_hits, cache.misses) == (1, 1, 1)
+    assert_close(near.VF, reference.VF, rtol=1e-6)
+
+    # Different spec pair
+    flasher.flash(P=2e6, VF=1, zs=[0.5, 0.5])
+    assert (cache.hits, cache.near_hits, cache.misses) == (1, 1, 2)
+    assert len(cache) == 2
+
+    # The least recently used result was evicted
+    flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    assert (cache.hits, cache.near_hits, cache.misses) == (1, 2, 2)
+
+    # Hot starts bypass the cache; the default `dest` does not
+    flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5], hot_start=res)
+    assert (cache.hits, cache.near_hits, cache.misses) == (1, 2, 2)
+    flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5], dest=EquilibriumState)
+    assert (cache.hits, cache.near_hits, cache.misses) == (2, 2, 2)
+
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0
+
+
+def test_flash_profiler():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                         CASs=['74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    reference = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+
+    records = []
+    profiler = flasher.profiler = FlashProfiler(callback=records.append)
+    res = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    assert_close(res.VF, reference.VF, rtol=1e-13)
+    record = records[0]
+    assert record['error'] is None
+    assert record['specs']['T'] == 350.0
+    assert record['calls']['stability_test'] == 1
+    assert record['calls']['PT_algorithm'] >= 1
+    assert record['calls']['identify_sort_phases'] == 1
+    assert record['calls']['fugacities'] > 0
+    assert record['calls']['volume_solutions'] > 0
+    assert record['calls']['dew_bubble'] == 0
+    assert sum(record['timings'].values()) > 0.0
+
+    flasher.flash(P=2e6, VF=1, zs=[0.5, 0.5])
+    assert records[1]['calls']['dew_bubble'] >= 1
+
+    with pytest.raises(Exception):
+        flasher.flash(T=-10.0, P=2e6, zs=[0.5, 0.5])
+    assert records[2]['error'] is not None
+    assert profiler.flashes == 3
+    assert profiler.calls['stability_test'] == record['calls']['stability_test']
+    assert 'stability_test' in profiler.report()
+
+    # Flashes outside a profiled flash are not recorded
+    other = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    other.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    assert profiler.flashes == 3
+    assert profiler.calls['stability_test'] == record['calls']['stability_test']
+
+    # Profiled flashes in several threads are recorded by their own profiler
+    profilers = [FlashProfiler() for _ in range(4)]
+    def profile(p):
+        flasher_thread = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+        flasher_thread.profiler = p
+        for _ in range(5):
+            flasher_thread.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    threads = [threading.Thread(target=profile, args=(p,)) for p in profilers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for p in profilers:
+        assert p.flashes == 5
+        assert p.calls['stability_test'] == 5
+        assert p.calls['identify_sort_phases'] == 5
+    assert profiler.flashes == 3
+
+    profiler.reset()
+    assert profiler.flashes == 0 and profiler.times['stability_test'] == 0.0
+
+    # Nothing is left patched after profiling, including after a failure
+    import thermo.flash
+    from thermo import eos_mix_methods
+    assert not thermo.flash._flash_profile_patches
+    assert FlashVL.PT_algorithms[0] is thermo.flash.sequential_substitution_2P
+    assert not hasattr(thermo.flash.sequential_substitution_2P, 'profiled_section')
+    assert not hasattr(thermo.flash.identify_sort_phases, 'profiled_section')
+    assert not hasattr(eos_mix_methods.volume_solutions_halley, 'profiled_section')
+    assert not hasattr(FlashVL.stability_test_Michelsen, 'profiled_section')
+    assert not hasattr(CEOSGas.to_TP_zs, 'profiled_section')
+    assert not hasattr(CEOSLiquid.lnphis, 'profiled_section')
+    assert not hasattr(PRMIX.volume_solutions, 'profiled_section')
+    assert not any(hasattr(f, 'profiled_section') for f in FlashVL.dew_T_flash_algos)
+
+
+def test_flash_adaptive_PT_strategy():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                         CASs=['74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    reference = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+
+    strategy = flasher.PT_strategy = AdaptivePTStrategy()
+    region = strategy.region(350.0, 2e6, [0.5, 0.5], constants, 2)
+    res = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    assert_close(res.VF, reference.VF, rtol=1e-6)
+    assert list(strategy.stats[region].keys()) == ['SS']
+    assert strategy.stats[region]['SS'][0] == 1
+
+    # SS has only failed here - it is skipped, and the next algorithm is used
+    strategy.stats[region]['SS'] = [0, 3, 0]
+    assert strategy.order(region, flasher.PT_methods) == ['SS Mehra', 'SS GDEM3', 'Newton lnK VF']
+    res = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    assert_close(res.VF, reference.VF, rtol=1e-6)
+    assert strategy.stats[region]['SS Mehra'][0] == 1
+    assert strategy.stats[region]['SS'] == [0, 3, 0]
+
+    # Failures do not count towards the iterations of an algorithm
+    iterations = strategy.stats[region]['SS Mehra'][2]
+    strategy.record(region, 'SS Mehra', False)
+    assert strategy.stats[region]['SS Mehra'] == [1, 1, iterations]
+    strategy.stats[region]['SS Mehra'] = [1, 0, iterations]
+
+    # An algorithm which has succeeded is ranked ahead of untried ones, even
+    # if it sometimes failed
+    mostly = AdaptivePTStrategy()
+    mostly.stats[region] = {'SS': [9, 1, 90]}
+    assert mostly.order(region, flasher.PT_methods) == flasher.PT_methods
+    mostly.stats[region] = {'SS': [9, 1, 90], 'SS Mehra': [0, 1, 0], 'Newton lnK VF': [1, 0, 5]}
+    assert mostly.order(region, flasher.PT_methods) == ['Newton lnK VF', 'SS', 'SS GDEM3', 'SS Mehra']
+
+    # Every algorithm failing does not remove them all
+    fails = AdaptivePTStrategy()
+    for method in flasher.PT_methods:
+        fails.stats.setdefault(region, {})[method] = [0, 5, 0]
+    assert fails.order(region, flasher.PT_methods) == flasher.PT_methods
+
+    copy = AdaptivePTStrategy.from_JSON(strategy.as_JSON())
+    assert copy == strategy
+    assert copy.order(region, flasher.PT_methods) == strategy.order(region, flasher.PT_methods)
+
+
+def test_flash_stability_memory():
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    zs = [0.3, 0.3, 0.4]
+    Ts = [250.0 + 10.0*i for i in range(8)]
+    references = [flasher.flash(T=T, P=2e6, zs=zs) for T in Ts]
+    assert flasher.stab_memory == []
+
+    flasher.PT_STABILITY_MEMORY = True
+    for i, T in enumerate(Ts):
+        res = flasher.flash(T=T, P=2e6, zs=zs)
+        assert res.phase_count == references[i].phase_count
+        assert_close(res.VF, references[i].VF, rtol=1e-10)
+        if i:
+            # The previous incipient phase shows the instability immediately
+            assert res.flash_convergence['stab_info']['stab_guess_name'] == 'previous0'
+    assert 1 <= len(flasher.stab_memory) <= flasher.PT_STABILITY_MEMORY_SIZE
+    assert not flasher.stab_memory[0][1]
+
+    # A single phase flash keeps unstable points at the head of the memory
+    flasher.flash(T=500.0, P=2e6, zs=zs)
+    assert not flasher.stab_memory[0][1]
+    assert len(flasher.stab_memory) <= flasher.PT_STABILITY_MEMORY_SIZE
+
+
+def test_flash_lnphis_direct_kernels():
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas,
+                      kijs=[[0, 0.003, 0.02], [0.003, 0, 0.01], [0.02, 0.01, 0]])
+    gas, liquid = CEOSGas(PRMIX, eos_kwargs), CEOSLiquid(PRMIX, eos_kwargs)
+    flasher = FlashVL(constants, None, liquid=liquid, gas=gas)
+    assert flasher.supports_lnphis_direct
+    assert not FlashVL(constants, None, liquid=CEOSLiquid(SRKMIX, eos_kwargs), gas=gas).supports_lnphis_direct
+
+    T, P, zs = 280.0, 3e6, [0.4, 0.3, 0.3]
+    l, g = liquid.to(T=T, P=P, zs=zs), gas.to(T=T, P=P, zs=zs)
+    xs_guess, ys_guess = [0.1, 0.3, 0.6], [0.8, 0.15, 0.05]
+    expect = sequential_substitution_2P(T, P, None, zs, xs_guess, ys_guess, l, g)
+    eos = l.eos_mix
+    VF, xs, ys, iterations, err = sequential_substitution_2P_functional(T, P, zs, xs_guess, ys_guess, 'PRMIX', eos.kijs,
+                                                                        eos.bs, eos.a_alphas, eos.a_alpha_roots)
+    assert_close(VF, expect[0], rtol=1e-12)
+    assert_close1d(xs, expect[1], rtol=1e-12)
+    assert_close1d(ys, expect[2], rtol=1e-12)
+    assert iterations == expect[5]
+
+    expect = stabiliy_iteration_Michelsen(l, ys_guess, test_phase=g, maxiter=100)
+    sln = stability_iteration_Michelsen_functional(T, P, zs, ys_guess, l.fugacities_lowest_Gibbs(), 'PRMIX', eos.kijs,
+                                                   eos.bs, eos.a_alphas, eos.a_alpha_roots, test_liquid=False, maxiter=100)
+    assert_close(sln[0], expect[0], rtol=1e-12)
+    assert_close1d(sln[2], expect[2], rtol=1e-12)
+    assert_close(sln[3], expect[3], rtol=1e-12)
+    assert_close(sln[6], expect[6], rtol=1e-10)
+
+    res = flasher.flash(T=T, P=P, zs=zs)
+    flasher_objects = FlashVL(constants, None, liquid=liquid, gas=gas)
+    flasher_objects.PT_LNPHIS_DIRECT = False
+    assert flasher_objects.supports_lnphis_direct
+    expect = flasher_objects.flash(T=T, P=P, zs=zs)
+    assert_close(res.VF, expect.VF, rtol=1e-12)
+    assert_close1d(res.liquid0.zs, expect.liquid0.zs, rtol=1e-12)
+
+
+def test_flash_reduced_kernels():
+    # Methane, ethane and pentane only interact with nitrogen and CO2
+    constants = ChemicalConstantsPackage(Tcs=[126.2, 304.2, 190.56, 305.32, 469.7], Pcs=[3394387.5, 7376460.0, 4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.04, 0.2252, 0.008, 0.098, 0.251], MWs=[28.0134, 44.0095, 16.04246, 30.06904, 72.14878],
+                                         CASs=['7727-37-9', '124-38-9', '74-82-8', '74-84-0', '109-66-0'])
+    kijs = [[0.0, -0.02, 0.03, 0.08, 0.08], [-0.02, 0.0, 0.1, 0.12, 0.12], [0.03, 0.1, 0.0, 0.0, 0.0],
+            [0.08, 0.12, 0.0, 0.0, 0.0], [0.08, 0.12, 0.0, 0.0, 0.0]]
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas, kijs=kijs)
+    gas, liquid = CEOSGas(PRMIX, eos_kwargs), CEOSLiquid(PRMIX, eos_kwargs)
+    flasher = FlashVL(constants, None, liquid=liquid, gas=gas)
+    flasher_reduced = FlashVL(constants, None, liquid=liquid, gas=gas)
+    flasher_reduced.PT_REDUCED = True
+    groups, one_minus_kijs_groups = flasher_reduced.kijs_reduced
+    assert groups == [0, 1, 2, 3, 3]
+
+    T, P, zs = 230.0, 3e6, [0.05, 0.05, 0.5, 0.2, 0.2]
+    l, g = liquid.to(T=T, P=P, zs=zs), gas.to(T=T, P=P, zs=zs)
+    eos = l.eos_mix
+    xs_guess, ys_guess = [0.02, 0.05, 0.2, 0.3, 0.43], [0.1, 0.05, 0.75, 0.08, 0.02]
+    expect = sequential_substitution_2P_functional(T, P, zs, xs_guess, ys_guess, 'PRMIX', eos.kijs,
+                                                   eos.bs, eos.a_alphas, eos.a_alpha_roots)
+    # Newton steps in the reduced variables are not taken when the substitution converges quickly
+    calc = sequential_substitution_2P_reduced(T, P, zs, xs_guess, ys_guess, 'PRMIX', groups, one_minus_kijs_groups,
+                                              eos.bs, eos.a_alphas, eos.a_alpha_roots, newton_tol=0.0)
+    assert_close(calc[0], expect[0], rtol=1e-12)
+    assert_close1d(calc[1], expect[1], rtol=1e-12)
+    assert_close1d(calc[2], expect[2], rtol=1e-12)
+    assert calc[3] == expect[3]
+    calc = sequential_substitution_2P_reduced(T, P, zs, xs_guess, ys_guess, 'PRMIX', groups, one_minus_kijs_groups,
+                                              eos.bs, eos.a_alphas, eos.a_alpha_roots, newton_tol=1.0)
+    assert_close(calc[0], expect[0], rtol=1e-6)
+    assert_close1d(calc[1], expect[1], rtol=1e-6)
+    assert calc[4] < 1e-13
+
+    expect = stability_iteration_Michelsen_functional(T, P, zs, ys_guess, l.fugacities_lowest_Gibbs(), 'PRMIX', eos.kijs,
+                                                      eos.bs, eos.a_alphas, eos.a_alpha_roots, maxiter=100)
+    calc = stability_iteration_Michelsen_reduced(T, P, zs, ys_guess, l.fugacities_lowest_Gibbs(), 'PRMIX', groups,
+                                                 one_minus_kijs_groups, eos.bs, eos.a_alphas, eos.a_alpha_roots, maxiter=100)
+    assert_close(calc[0], expect[0], rtol=1e-12)
+    assert_close1d(calc[2], expect[2], rtol=1e-12)
+    assert_close(calc[6], expect[6], rtol=1e-10)
+
+    for T, P in [(230.0, 3e6), (200.0, 1e6), (300.0, 1e5), (180.0, 5e6)]:
+        expect = flasher.flash(T=T, P=P, zs=zs)
+        res = flasher_reduced.flash(T=T, P=P, zs=zs)
+        assert res.phase_count == expect.phase_count
+        assert_close(res.VF, expect.VF, atol=1e-7)
+        assert_close1d(res.liquid0.zs if res.liquid_count else res.gas.zs,
+                       expect.liquid0.zs if expect.liquid_count else expect.gas.zs, rtol=1e-6)
+
+    # A component missing from the feed leaves a group with no reduced variables
+    T, P, zs = 230.0, 3e6, [0.0, 0.1, 0.5, 0.2, 0.2]
+    xs_guess, ys_guess = [0.0, 0.05, 0.2, 0.3, 0.45], [0.0, 0.05, 0.8, 0.1, 0.05]
+    expect = sequential_substitution_2P_functional(T, P, zs, xs_guess, ys_guess, 'PRMIX', eos.kijs,
+                                                   eos.bs, eos.a_alphas, eos.a_alpha_roots)
+    calc = sequential_substitution_2P_reduced(T, P, zs, xs_guess, ys_guess, 'PRMIX', groups, one_minus_kijs_groups,
+                                              eos.bs, eos.a_alphas, eos.a_alpha_roots, newton_tol=1.0)
+    assert_close(calc[0], expect[0], rtol=1e-6)
+    assert_close1d(calc[1], expect[1], rtol=1e-6)
+    assert calc[1][0] == 0.0 and calc[2][0] == 0.0
+    expect = flasher.flash(T=T, P=P, zs=zs)
+    res = flasher_reduced.flash(T=T, P=P, zs=zs)
+    assert_close(res.VF, expect.VF, rtol=1e-10)
+    assert_close1d(res.liquid0.zs, expect.liquid0.zs, rtol=1e-10)
+
+
+def test_flash_HSGUA_newton_2P():
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-4.2488015925e-21, 1.5758436e-17, -2.3837195e-14, 1.7978935e-11, -6.1082826e-09, -1.3045165e-07, 0.000745364, 0.0118437, 19.2017]))]
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    T, P, zs = 300.0, 2e6, [0.3, 0.3, 0.4]
+    ref = flasher.flash(T=T, P=P, zs=zs)
+    l, g = liquid.to(T=280.0, P=P, zs=zs), gas.to(T=280.0, P=P, zs=zs)
+
+    # Quadratic convergence from a poor guess for every spec
+    for spec in ('H', 'S', 'U', 'G', 'A'):
+        VF, T_calc, xs, ys, l_calc, g_calc, iterations, err = nonlin_2P_HSGUAbeta_newton(
+            getattr(ref, spec)(), spec, 280.0, 'T', P, 'P', zs, [0.1, 0.3, 0.6], [0.7, 0.25, 0.05],
+            l, g, V_over_F_guess=0.5)
+        assert iterations < 8
+        assert err < 1e-10
+        assert_close(T_calc, T, rtol=1e-8)
+        assert_close(VF, ref.VF, rtol=1e-7)
+        assert_close1d(xs, ref.liquid0.zs, rtol=1e-7)
+        assert_close1d(ys, ref.gas.zs, rtol=1e-7)
+        assert_close(VF*getattr(g_calc, spec)() + (1.0 - VF)*getattr(l_calc, spec)(), getattr(ref, spec)(), rtol=1e-10)
+
+    # Pressure as the unknown
+    VF, P_calc, xs, ys, _, _, _, _ = nonlin_2P_HSGUAbeta_newton(ref.H(), 'H', 1.5e6, 'P', T, 'T', zs,
+                                                                [0.1, 0.3, 0.6], [0.7, 0.25, 0.05], l, g)
+    assert_close(P_calc, P, rtol=1e-7)
+    assert_close(VF, ref.VF, rtol=1e-7)
+
+    # Flasher uses it from a two-phase hot start and falls back when single phase
+    hot_start = flasher.flash(T=290.0, P=P, zs=zs)
+    expect = flasher.flash(P=P, H=ref.H(), zs=zs)
+    expect_gas = flasher.flash(P=P, H=ref.H() + 20000.0, zs=zs)
+    FlashVL.TPV_HSGUA_NEWTON_2P_FIRST = True
+    try:
+        res = flasher.flash(P=P, H=ref.H(), zs=zs, hot_start=hot_start)
+        assert res.flash_convergence['iterations'] < 6
+        assert_close(res.T, expect.T, rtol=1e-8)
+        assert_close(res.VF, expect.VF, rtol=1e-7)
+        assert_close(res.H(), ref.H(), rtol=1e-10)
+
+        res = flasher.flash(P=P, S=ref.S(), zs=zs, hot_start=hot_start)
+        assert_close(res.T, T, rtol=1e-8)
+
+        res = flasher.flash(T=T, H=ref.H(), zs=zs, hot_start=hot_start)
+        assert_close(res.P, P, rtol=1e-7)
+
+        res = flasher.flash(P=P, H=ref.H() + 20000.0, zs=zs, hot_start=hot_start)
+        assert res.phase == 'V'
+        assert_close(res.T, expect_gas.T, rtol=1e-9)
+    finally:
+        FlashVL.TPV_HSGUA_NEWTON_2P_FIRST = False
+
+
+def test_nonlin_spec_NP_jacobian_uses_iterate_phases():
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-4.2488015925e-21, 1.5758436e-17, -2.3837195e-14, 1.7978935e-11, -6.1082826e-09, -1.3045165e-07, 0.000745364, 0.0118437, 19.2017]))]
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    # Template phases at a state far from the iterate, so a Jacobian evaluated
+    # on them instead of the iterate's phases is visibly wrong
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=500.0, P=1e5, zs=[0.8, 0.1, 0.1])
+    liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=500.0, P=1e5, zs=[0.1, 0.1, 0.8])
+    zs = [0.3, 0.3, 0.4]
+    _, _, to_solve = nonlin_spec_NP(250.0, 2e6, -10000.0, zs, [[0.1, 0.3, 0.6], [0.6, 0.3, 0.1]], [0.6, 0.4],
+                                    [liquid, gas], iter_var='T', fixed_var='P', spec='H',
+                                    method='fsolve', debug=True)
+
+    point, dT = [0.1, 0.12, 0.08, 260.0], 1e-4
+    errs, jac = to_solve(point, jac=True)
+    errs_dT = to_solve(point[:-1] + [point[-1] + dT], jac=False)
+    assert_close1d([row[-1] for row in jac], [(e2 - e1)/dT for e1, e2 in zip(errs, errs_dT)], rtol=1e-5)
+
+
+def test_flash_lite():
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                         CASs=['74-84-0', '109-66-0'])
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True,
+                                               HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                                                                  HeatCapacityGas(poly_fit=(200.0, 1000.0, [-4.2488015925e-21, 1.5758436e-17, -2.3837195e-14, 1.7978935e-11, -6.1082826e-09, -1.3045165e-07, 0.000745364, 0.0118437, 19.2017])),])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+
+    full = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    lite = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5], lite=True)
+    assert type(lite) is EquilibriumStateLite
+    assert lite._state is None
+    assert lite.phase == full.phase == 'VL'
+    assert lite.phase_count == 2 and lite.liquid_count == 1
+    assert_close(lite.VF, full.VF, rtol=1e-13)
+    assert_close1d(lite.liquid0.zs, full.liquid0.zs, rtol=1e-13)
+    assert_close1d(lite.gas.zs, full.gas.zs, rtol=1e-13)
+    assert lite._state is None
+
+    # Anything else creates the full state
+    assert_close(lite.H(), full.H(), rtol=1e-13)
+    assert type(lite.state) is EquilibriumState
+    assert lite.state is lite.state
+    assert_close(lite.bulk.Cp(), full.bulk.Cp(), rtol=1e-13)
+
+    # A lite result can be used as a hot start
+    res = flasher.flash(T=351.0, P=2e6, zs=[0.5, 0.5], hot_start=flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5], lite=True))
+    assert_close(res.VF, flasher.flash(T=351.0, P=2e6, zs=[0.5, 0.5]).VF, atol=1e-6)
+
+    full = flasher.flash(P=1e5, H=-5000.0, zs=[0.5, 0.5])
+    lite = flasher.flash(P=1e5, H=-5000.0, zs=[0.5, 0.5], lite=True)
+    assert_close(lite.T, full.T, rtol=1e-12)
+    assert_close(lite.state.H(), -5000.0, rtol=1e-7)
+
+    lite = flasher.flash(P=1e6, VF=1, zs=[0.5, 0.5], lite=True)
+    assert_close(lite.T, flasher.flash(P=1e6, VF=1, zs=[0.5, 0.5]).T, rtol=1e-12)
+
+
+def test_flash_time_limit():
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    zs = [0.3, 0.3, 0.4]
+    res = flasher.flash(T=300.0, P=2e6, zs=zs, time_budget=100.0)
+    assert_close(res.VF, flasher.flash(T=300.0, P=2e6, zs=zs).VF, rtol=1e-12)
+
+    for specs in [{'T': 300.0, 'P': 2e6}, {'P': 2e6, 'VF': 1}, {'T': 250.0, 'VF': 0},
+                  {'P': 2e6, 'H': -5000.0}]:
+        with pytest.raises(FlashTimeoutError) as e:
+            flasher.flash(zs=zs, time_budget=0.0, **specs)
+        assert e.value.stage is not None
+        assert e.value.elapsed >= 0.0
+        assert e.value.progress
+
+    with pytest.raises(FlashTimeoutError) as e:
+        flasher.flash(P=2e6, VF=1, zs=zs, time_budget=0.0)
+    assert e.value.stage == 'dew_bubble_Michelsen_Mollerup'
+    assert e.value.iterations == 0
+    assert 'guess' in e.value.progress
+
+    # The lower level methods accept the same arguments, and the limit is removed afterwards
+    with pytest.raises(FlashTimeoutError):
+        flasher.flash_TPV(T=300.0, P=2e6, V=None, zs=zs, deadline=0.0)
+    assert thermo.flash._flash_deadline.deadline is None
+    with flash_time_limit(time_budget=100.0):
+        with flash_time_limit(deadline=0.0):
+            with pytest.raises(FlashTimeoutError):
+                flasher.flash(T=300.0, P=2e6, zs=zs)
+        flasher.flash(T=300.0, P=2e6, zs=zs)
+    assert thermo.flash._flash_deadline.deadline is None
+
+    # The array-based kernels are still used, and check the limit
+    assert flasher.supports_lnphis_direct
+    with pytest.raises(FlashTimeoutError) as e:
+        flasher.flash(T=300.0, P=2e6, zs=zs, time_budget=0.0)
+    assert e.value.stage == 'stability_iteration_Michelsen_functional'
+
+    # A limit only applies to the thread which set it
+    results = []
+    def flash_other_thread():
+        results.append(flasher.flash(T=300.0, P=2e6, zs=zs).VF)
+    with flash_time_limit(deadline=0.0):
+        thread = threading.Thread(target=flash_other_thread)
+        thread.start()
+        thread.join()
+    assert_close(results[0], res.VF, rtol=1e-12)
+
+
+def test_flash_stream():
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    zs = [0.3, 0.3, 0.4]
+    Ts = linspace(200.0, 400.0, 15)
+
+    stream = flasher.flash_stream(({'T': T, 'P': 2e6} for T in Ts), props=['T', 'VF'], zs=zs)
+    assert not isinstance(stream, list)
+    rows = list(stream)
+    assert len(rows) == len(Ts)
+    for T, row in zip(Ts, rows):
+        assert type(row) is tuple
+        assert_close(row[0], T)
+        assert_close(row[1], flasher.flash(T=T, P=2e6, zs=zs).VF, atol=1e-6)
+
+    # Changing the specifications or composition between rows is allowed
+    specs = [{'T': 300.0, 'P': 2e6}, {'P': 2e6, 'VF': 1.0}, {'T': 300.0, 'P': 2e6, 'zs': [0.1, 0.1, 0.8]}]
+    rows = list(flasher.flash_stream(specs, props=['P', 'VF'], zs=zs, hot_start_tol=0.0))
+    assert_close(rows[1][1], 1.0)
+    assert_close(rows[2][1], flasher.flash(T=300.0, P=2e6, zs=[0.1, 0.1, 0.8]).VF)
+
+    # Failures yield None
+    assert list(flasher.flash_stream([{'T': -1.0, 'P': 1e5}], props=['T', 'VF'], zs=zs)) == [(None, None)]
+
+    # A pure component flasher needs no composition, and non-numeric
+    # specifications are compared by equality
+    pure_constants = ChemicalConstantsPackage(Tcs=[305.32], Pcs=[4872000.0], omegas=[0.098], MWs=[30.06904],
+                                              CASs=['74-84-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17,
+                                                                  5.957592282542187e-14, -5.91169369931607e-11,
+                                                                  3.391209091071677e-08, -1.158730780040934e-05,
+                                                                  0.002409311277400987, -0.18906638711444712,
+                                                                  37.94602410497228]))]
+    pure_correlations = PropertyCorrelationsPackage(pure_constants, HeatCapacityGases=HeatCapacityGases,
+                                                    skip_missing=True)
+    pure_kwargs = dict(Tcs=pure_constants.Tcs, Pcs=pure_constants.Pcs, omegas=pure_constants.omegas)
+    pure = FlashPureVLS(pure_constants, pure_correlations,
+                        CEOSGas(PRMIX, pure_kwargs, HeatCapacityGases=HeatCapacityGases),
+                        [CEOSLiquid(PRMIX, pure_kwargs, HeatCapacityGases=HeatCapacityGases)], [])
+    rows = list(pure.flash_stream([{'T': 250.0, 'P': 1e5}, {'T': 251.0, 'P': 1e5}], props=['T']))
+    assert_close1d([r[0] for r in rows], [250.0, 251.0])
+    Hs = [pure.flash(T=T, P=1e6).H() for T in (250.0, 252.0)]
+    rows = list(pure.flash_stream([{'P': 1e6, 'H': H, 'solution': 'high'} for H in Hs], props=['T']))
+    assert_close1d([r[0] for r in rows], [250.0, 252.0])
+
+
+def test_async_flasher():
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    constants = ChemicalConstantsPackage(Tcs=[190.56, 305.32, 469.7], Pcs=[4599000.0, 4872000.0, 3370000.0],
+                                         omegas=[0.008, 0.098, 0.251], MWs=[16.04246, 30.06904, 72.14878],
+                                         CASs=['74-82-8', '74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    zs = [0.3, 0.3, 0.4]
+
+    async def main(async_flasher):
+        same = [async_flasher.flash(T=300.0, P=2e6, zs=zs) for _ in range(4)]
+        other = async_flasher.flash(P=2e6, VF=1.0, zs=zs)
+        return await asyncio.gather(*same, other)
+
+    with AsyncFlasher(flasher, executor=ThreadPoolExecutor(1)) as async_flasher:
+        res = asyncio.run(main(async_flasher))
+        assert async_flasher.flashes == 2
+        assert async_flasher.coalesced == 3
+        assert async_flasher.pending == 0
+        assert all(r is res[0] for r in res[:4])
+        assert type(res[0]) is EquilibriumState
+        assert res[0].flasher is flasher
+        assert_close(res[0].VF, flasher.flash(T=300.0, P=2e6, zs=zs).VF, rtol=1e-12)
+        assert_close(res[4].VF, 1.0)
+
+        # Errors are raised to the caller as with Flash.flash
+        with pytest.raises(Exception):
+            asyncio.run(async_flasher.flash(T=300.0, zs=zs))
+        with pytest.raises(ValueError):
+            asyncio.run(async_flasher.flash(T=300.0, P=2e6, zs=zs, lite=True))
+        assert async_flasher.pending == 0
+
+    # Backpressure
+    async def overload(async_flasher):
+        return await asyncio.gather(*[async_flasher.flash(T=300.0 + i, P=2e6, zs=zs) for i in range(3)],
+                                    return_exceptions=True)
+    with AsyncFlasher(flasher, executor=ThreadPoolExecutor(1), max_in_flight=1, max_pending=2) as async_flasher:
+        res = asyncio.run(overload(async_flasher))
+    assert type(res[0]) is EquilibriumState and type(res[1]) is EquilibriumState
+    assert type(res[2]) is FlashQueueFullError
+
+    # Pre-warmed process pool
+    with AsyncFlasher(flasher, n_jobs=2, warmup=[{'T': 300.0, 'P': 1e5, 'zs': zs}]) as async_flasher:
+        res = asyncio.run(async_flasher.flash_many([{'T': T, 'P': 2e6, 'zs': zs} for T in (250.0, 300.0, 350.0)]))
+    for T, r in zip((250.0, 300.0, 350.0), res):
+        assert r.flasher is flasher
+        assert_close(r.VF, flasher.flash(T=T, P=2e6, zs=zs).VF, rtol=1e-12)
+
+
+def _grid_table_worker_value(table, T, P):
+    return table.value(T, P, 'VF')
+
+def test_grid_props_table(tmpdir):
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                         CASs=['74-84-0', '109-66-0'])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    zs = [0.5, 0.5]
+    path = os.path.join(str(tmpdir), 'table.grid')
+
+    # Specifications are stored in grid_flash order
+    table = flasher.grid_props_table(path, zs, props=['VF', 'rho_mass'], spec0='P', spec1='T',
+                                     Tmin=300.0, Tmax=400.0, Pmin=1e5, Pmax=2e6, pts=6)
+    assert (table.spec0, table.spec1) == ('T', 'P')
+    assert table.zs == zs and table.props == ['VF', 'rho_mass']
+    assert table.log0 and table.log1
+    assert type(table.data) is np.memmap
+    assert table.data.shape == (6, 6, 2)
+
+    Ts, Ps = list(table.specs0), list(table.specs1)
+    values = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['VF', 'rho_mass'], store=False)
+    assert table.values(Ts[2], Ps[3]) == values[2][3]
+    assert table.value(Ts[-1], Ps[-1], 'rho_mass') == values[-1][-1][1]
+
+    # Between the nodes
+    T, P = (Ts[1]*Ts[2])**0.5, (Ps[0]*Ps[1])**0.5
+    VF, rho = table.values(T, P)
+    assert_close(VF, 1.0)
+    assert_close(rho, flasher.flash(T=T, P=P, zs=zs).rho_mass(), rtol=0.1)
+    with pytest.raises(ValueError):
+        table.value(500.0, 1e5, 'VF')
+
+    # Pickling only keeps the path, and worker processes map the same file
+    loaded = pickle.loads(pickle.dumps(table))
+    assert type(loaded.data) is np.memmap
+    assert loaded.values(T, P) == [VF, rho]
+    with ProcessPoolExecutor(2) as executor:
+        assert executor.submit(_grid_table_worker_value, table, T, P).result() == VF
+
+    # Single property outputs of grid_props, with failed points and decreasing axes
+    write_grid_table(path, 'P', 'VF', [2e5, 1e5], [0.0, 1.0], zs, 'T', [[1.0, None], [3.0, 4.0]])
+    table = GridPropertyTable(path)
+    assert table.log0 and not table.log1
+    assert list(table.specs0) == [1e5, 2e5]
+    assert table.value(1e5, 0.0, 'T') == 3.0
+    assert table.value(1e5, 1.0, 'T') == 4.0
+    assert isnan(table.value(2e5, 1.0, 'T'))
+    assert_close(table.value(1e5, 0.25, 'T'), 3.25)
+
+    with open(path, 'wb') as f:
+        f.write(b'not a table')
+    with pytest.raises(ValueError):
+        GridPropertyTable(path)
+
+
 def test_combustion_products():
     from chemicals.combustion import fuel_air_spec_solver
     IDs = ['methane', 'carbon dioxide', 'ethane', 'propane',
@@ -418,6 +418,80 @@ def test_butanol_water_ethanol_3P():
     res = flashN.flash(T=366, P=1e5, zs=zs) # V
     assert_close1d([i.rho_mass() for i in res.phases], [1.1145608982480968])
 
+def test_Rachford_Rice_solutionN_batch():
+    from chemicals.rachford_rice import Rachford_Rice_solutionN
+    ns = [0.204322076984, 0.070970999150, 0.267194323384, 0.296291964579, 0.067046080882, 0.062489248292, 0.031685306730]
+    Ks_y = [1.23466988745, 0.89727701141, 2.29525708098, 1.58954899888, 0.23349348597, 0.02038108640, 1.40715641002]
+    Ks_z = [1.52713341421, 0.02456487977, 1.46348240453, 1.16090546194, 0.24166289908, 0.14815282572, 14.3128010831]
+    zs_all, Ks_all, guesses = [], [], []
+    for scale in (1.0, 0.9, 1.1, 1.3):
+        zs_all.append(ns)
+        Ks_all.append([[K*scale for K in Ks_y], Ks_z])
+        guesses.append([0.1, 0.6])
+    betas, comps = Rachford_Rice_solutionN_batch(zs_all, Ks_all, guesses)
+    assert betas.shape == (4, 3) and comps.shape == (4, 3, 7)
+    for i in range(4):
+        betas_expect, comps_expect = Rachford_Rice_solutionN(ns, Ks_all[i], [0.1, 0.6])
+        assert_close1d(betas[i], betas_expect, rtol=1e-10)
+        assert_close2d(comps[i], comps_expect, rtol=1e-9)
+        assert_close(sum(comps[i][-1]), sum(ns), rtol=1e-13)
+
+    # Same outputs as Rachford_Rice_solutionN
+    betas, comps = Rachford_Rice_solutionN_Okuno(ns, [Ks_y, Ks_z], [0.1, 0.6])
+    assert type(betas) is list and len(betas) == 3
+    assert_close1d(betas, [0.6868328915094767, 0.06019424397668605, 0.25297286451383727], rtol=1e-10)
+
+    # A row with all K values above 1 has no solution in the region
+    betas, comps = Rachford_Rice_solutionN_batch([ns, ns], [[Ks_y, Ks_z], [[2.0]*7, [3.0]*7]])
+    assert not np.isnan(betas[0]).any()
+    assert np.isnan(betas[1]).all()
+
+    # Guess outside the region and zero phase fractions not in it either
+    zs = [1/3., 1/3., 1/3.]
+    Ks = [[0.026852515477041428, 1056613.2679342998, 214358755854377.28],
+          [0.02339163856758538, 4471.365343055387, 9511903748653642.0]]
+    betas, comps = Rachford_Rice_solutionN_Okuno(zs, Ks, [0.5274853826036925, 0.4725146173963075])
+    assert_close1d(betas, Rachford_Rice_solutionN(zs, Ks, [0.5274853826036925, 0.4725146173963075])[0], rtol=1e-9)
+
+
+def test_water_C1_C8_Okuno_RR():
+    T, P = 298.15, 101325.0
+    omegas = [0.344, 0.008, 0.394]
+    Tcs = [647.14, 190.564, 568.7]
+    Pcs = [22048320.0, 4599000.0, 2490000.0]
+    kijs=[[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+    zs = [1.0/3.0]*3
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.069661592422583e-22, -1.2992882995593864e-18, 8.808066659263286e-15, -2.1690080247294972e-11, 2.8519221306107026e-08, -2.187775092823544e-05, 0.009432620102532702, -1.5719488702446165, 217.60587499269303]))]
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 16.04246, 114.22852],
+                                         CASs=['7732-18-5', '74-82-8', '111-65-9'])
+    properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    flashN.SS_NP_RR_METHOD = 'Okuno'
+    res = flashN.flash(T=T, P=P, zs=zs)
+    assert res.phase_count == 3
+    assert_close1d(res.betas, [0.3481686901529188, 0.3182988549790946, 0.33353245486798655], rtol=1e-7)
+    assert_close1d(res.gas.zs, [0.026792655758364814, 0.9529209534990141, 0.020286390742620692], rtol=1e-7)
+
+    res = flashN.flash(T=100.0, P=294705.1702551713, zs=zs)
+    assert res.phase_count == 3
+    assert_close(res.water_phase.Z(), 0.006887567438189129)
+
+    # Hot starts from a three phase result
+    res = flashN.flash(T=T, P=P, zs=zs)
+    hot = flashN.flash(T=T+1.0, P=P, zs=zs, hot_start=res)
+    assert_close1d(hot.betas, flashN.flash(T=T+1.0, P=P, zs=zs).betas, rtol=1e-7)
+
+    with pytest.raises(ValueError):
+        sequential_substitution_NP(T, P, zs, [i.zs for i in res.phases], list(res.betas),
+                                   res.phases, RR_method='bad')
+
+
 def test_VLL_PR_random0_wrong_stab_test():
     # Example was truly random, from a phase plot
     # Needed to change the stability test to try liquid as a third phase first
@@ -937,6 +937,37 @@ def test_EOSGas_phis():
 
 
 
+def test_CEOS_lnphis_at_zs_direct_models():
+    eos_kwargs = {'Pcs': [4700000.0, 5330000.0, 8084000.0], 'Tcs': [508.1, 536.2, 512.5],
+                  'omegas': [0.309, 0.21600000000000003, 0.5589999999999999],
+                  'kijs': [[0, 0.038, 0.08], [0.038, 0, 0.021], [0.08, 0.021, 0]]}
+    translated_kwargs = dict(eos_kwargs, cs=[-3.2e-6, 1.1e-6, 2.5e-6])
+    zs, zs2 = [0.229, 0.175, 0.596], [0.5, 0.3, 0.2]
+    for eos, kwargs in ((SRKMIX, eos_kwargs), (RKMIX, eos_kwargs), (VDWMIX, eos_kwargs),
+                        (PRMIXTranslated, translated_kwargs), (PRMIXTranslatedConsistent, translated_kwargs),
+                        (SRKMIXTranslated, translated_kwargs), (SRKMIXTranslatedConsistent, translated_kwargs)):
+        # VDWMIX has its own expression for the fugacity coefficients
+        lnphis_func = VDWMIX.fugacity_coefficients if eos is VDWMIX else GCEOSMIX.fugacity_coefficients
+        for cls, T, P in ((CEOSGas, 331.42, 90923.0), (CEOSLiquid, 300.0, 1e6)):
+            phase = cls(eos, kwargs, HeatCapacityGases=[], T=T, P=P, zs=zs)
+            eos_mix = phase.eos_mix
+            expect = lnphis_func(eos_mix, eos_mix.Z_g if cls is CEOSGas else eos_mix.Z_l)
+            assert_close1d(phase.lnphis(), expect, rtol=1e-11)
+
+            eos_mix = phase.to_TP_zs(T, P, zs2).eos_mix
+            expect = lnphis_func(eos_mix, eos_mix.Z_g if cls is CEOSGas else eos_mix.Z_l)
+            assert_close1d(phase.lnphis_at_zs(zs2), expect, rtol=1e-11)
+
+    # Tiny `a_alpha` values whose volumes are solved with complex arithmetic,
+    # and `a_alpha` values of zero which the translated formulas cannot use
+    for eos in (PRMIXTranslatedConsistent, SRKMIXTranslatedConsistent):
+        for kwargs, T, zs, zs2 in ((dict(Tcs=[126.2, 132.86], Pcs=[3394387.5, 3494000.0], omegas=[0.04, 0.05]), 2700.0, [0.3, 0.7], [0.4, 0.6]),
+                                   (dict(Tcs=[126.2], Pcs=[3394387.5], omegas=[0.04]), 3e4, [1.0], [1.0])):
+            for cls in (CEOSGas, CEOSLiquid):
+                phase = cls(eos, kwargs, HeatCapacityGases=[], T=T, P=1e5, zs=zs)
+                assert_close1d(phase.lnphis_at_zs(zs2), phase.to_TP_zs(T, 1e5, zs2).lnphis(), rtol=1e-11)
+
+
 def test_chemical_potential():
     T, P = 200.0, 1e5
     zs = [0.229, 0.175, 0.596]
@@ -37,7 +37,8 @@ Base Class
     :special-members: __repr__
     :show-inheritance:
     :exclude-members: _P_zero_g_cheb_coeffs, _P_zero_l_cheb_coeffs,
-                      main_derivatives_and_departures, derivatives_and_departures
+                      main_derivatives_and_departures, derivatives_and_departures,
+                      main_derivatives_and_departures_vectorized
 
 Standard Peng-Robinson Family EOSs
 ==================================
@@ -262,7 +263,9 @@ __all__ = ['GCEOS', 'PR', 'SRK', 'PR78', 'PRSV', 'PRSV2', 'VDW', 'RK',
 ]
 
 __all__.extend(['main_derivatives_and_departures',
-                'main_derivatives_and_departures_VDW'])
+                'main_derivatives_and_departures_VDW',
+                'main_derivatives_and_departures_vectorized',
+                'main_derivatives_and_departures_VDW_vectorized'])
 
 
 from cmath import atanh as catanh, log as clog
@@ -288,7 +291,8 @@ from thermo.eos_volume import (volume_solutions_mpmath, volume_solutions_mpmath_
                                volume_solutions_NR, volume_solutions_NR_low_P,
                                volume_solutions_halley, volume_solutions_fast,
                                volume_solutions_Cardano, volume_solutions_numpy,
-                               volume_solutions_ideal, volume_solutions_a1, volume_solutions_a2)
+                               volume_solutions_ideal, volume_solutions_a1, volume_solutions_a2,
+                               volume_solutions_halley_batch)
 from thermo.eos_alpha_functions import (Poly_a_alpha, Twu91_a_alpha, Mathias_Copeman_a_alpha,
                                     TwuSRK95_a_alpha, TwuPR95_a_alpha, Soave_79_a_alpha,
                                     TWU_a_alpha_common)
@@ -380,6 +384,81 @@ def main_derivatives_and_departures_VDW(T, P, V, b, delta, epsilon, a_alpha,
     return [dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep]
 
 
+def main_derivatives_and_departures_vectorized(T, P, V, b, delta, epsilon,
+                                               a_alpha, da_alpha_dT,
+                                               d2a_alpha_dT2):
+    r'''Vectorized version of :obj:`main_derivatives_and_departures`, which
+    accepts NumPy arrays of `T`, `P`, `V`, `a_alpha`, `da_alpha_dT` and
+    `d2a_alpha_dT2`. Only real values of
+    :math:`1/\sqrt{\delta^2 - 4\epsilon}` are supported; the real parts of
+    the complex logarithms of the scalar version are calculated with real
+    logarithms of absolute values.
+
+    Entries of `V` which are NaN result in NaN outputs.
+
+    Returns
+    -------
+    dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep : ndarray
+        Derivatives and departure properties, [various]
+    '''
+    epsilon2 = epsilon + epsilon
+    x10 = delta*delta - epsilon2 - epsilon2
+    if x10 < 0.0:
+        raise ValueError("Complex values of the departure integral are not supported")
+    x11 = x10**-0.5 if x10 != 0.0 else 0.0
+    x11_half = 0.5*x11
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        x0 = 1.0/(V - b)
+        x1 = 1.0/(V*(V + delta) + epsilon)
+        x3 = R*T
+        x4 = x0*x0
+        x5 = V + V + delta
+        x6 = x1*x1
+        x7 = a_alpha*x6
+        u = x11*x5
+        # Re(atanh(u)) = 0.5*log(|(1 + u)/(1 - u)|) for real u
+        x12 = x11*np.log(np.abs((1.0 + u)/(1.0 - u))) if x11 != 0.0 else 0.0*x5
+        x14 = 0.5*x5
+        x18 = x11_half*delta*delta - epsilon2*x11
+        x17 = x5*x6
+        dP_dT = R*x0 - da_alpha_dT*x1
+        dP_dV = x5*x7 - x3*x4
+        d2P_dT2 = -d2a_alpha_dT2*x1
+        d2P_dV2 = 2.0*(x7 + x3*x4*x0 - a_alpha*x5*x17*x1)
+        d2P_dTdV = da_alpha_dT*x17 - R*x4
+        H_dep = x12*(T*da_alpha_dT - a_alpha) - x3 + P*V
+        S_dep = -R*np.log(np.abs(x3*x0/P)) + da_alpha_dT*x12
+        x19 = (x14 + x18)/(x14 - x18)
+        Cv_dep = T*d2a_alpha_dT2*x11_half*np.log(x19*x19)
+    return dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep
+
+
+def main_derivatives_and_departures_VDW_vectorized(T, P, V, b, delta, epsilon,
+                                                   a_alpha, da_alpha_dT,
+                                                   d2a_alpha_dT2):
+    r'''Vectorized version of :obj:`main_derivatives_and_departures_VDW`,
+    which accepts NumPy arrays of `T`, `P`, `V`, and `a_alpha`.
+
+    Returns
+    -------
+    dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep : ndarray
+        Derivatives and departure properties, [various]
+    '''
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        x0 = 1.0/(V - b)
+        V_inv = 1.0/V
+        dP_dT = R*x0
+        dP_dV = -R*T*x0*x0 + 2.0*a_alpha*V_inv*V_inv*V_inv
+        # Multiplication keeps the NaN of missing roots
+        d2P_dT2 = 0.0*V
+        d2P_dV2 = 2.0*(R*T*x0*x0*x0 - 3.0*a_alpha*V_inv*V_inv*V_inv*V_inv)
+        d2P_dTdV = -R*x0*x0
+        H_dep = P*V - R*T - a_alpha*V_inv
+        S_dep = R*(-np.log(V) + np.log(V - b)) + R*np.log(P*V/(R*T))
+        Cv_dep = 0.0*V
+    return dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep
+
+
 class GCEOS(object):
     r'''Class for solving a generic Pressure-explicit three-parameter cubic
     equation of state. Does not implement any parameters itself; must be
@@ -806,6 +885,15 @@ class GCEOS(object):
     Psat_cheb_range = (0.0, 0.0)
 
     main_derivatives_and_departures = staticmethod(main_derivatives_and_departures)
+    main_derivatives_and_departures_vectorized = staticmethod(main_derivatives_and_departures_vectorized)
+
+    evaluate_default_props = ('V_l', 'V_g', 'H_dep_l', 'H_dep_g', 'S_dep_l', 'S_dep_g',
+                              'Cp_dep_l', 'Cp_dep_g', 'fugacity_l', 'fugacity_g')
+    '''Properties calculated by :obj:`evaluate` when none are specified'''
+    evaluate_root_props = frozenset(['V', 'Z', 'PIP', 'dP_dT', 'dP_dV', 'dV_dT', 'dV_dP',
+                                     'dT_dV', 'dT_dP', 'd2P_dT2', 'd2P_dV2', 'd2P_dTdV',
+                                     'H_dep', 'S_dep', 'G_dep', 'Cp_dep', 'Cv_dep',
+                                     'lnphi', 'phi', 'fugacity'])
 
     c1 = None
     '''Parameter used by some equations of state in the `a` calculation'''
@@ -1670,6 +1758,9 @@ class GCEOS(object):
     # Solver which actually has the roots
     volume_solutions_full = staticmethod(volume_solutions_NR)
 
+    # Array version of `volume_solutions`, used by `evaluate`; None to solve point by point
+    volume_solutions_batch = staticmethod(volume_solutions_halley_batch)
+
 #    volume_solutions = volume_solutions_mpmath_float
 
     @property
@@ -3626,6 +3717,135 @@ class GCEOS(object):
             # Error message
             return self.__class__(T=T, V=V, P=P, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
 
+    def evaluate(self, Ts, Ps, props=None):
+        r'''Method to calculate properties of the pure-component EOS at many
+        temperatures and pressures at once, without constructing an EOS
+        object for each state. The inputs are broadcast against each other,
+        and each requested property is returned as an array of the broadcast
+        shape.
+
+        The `a_alpha` terms are calculated once for each unique temperature,
+        the volumes are solved for all points at once with
+        :obj:`thermo.eos_volume.volume_solutions_halley_batch`, and the derivatives and departure properties of both roots are
+        calculated for all points at once with
+        :obj:`main_derivatives_and_departures_vectorized`.
+
+        As in :obj:`set_from_PT`, when two or three valid volumes exist the
+        smallest is the liquid and the largest is the gas; when only one
+        exists, it is assigned to the liquid or the gas according to its
+        phase identification parameter. Properties of a phase which does not
+        exist at a point are NaN.
+
+        Parameters
+        ----------
+        Ts : float or ndarray
+            Temperatures, [K]
+        Ps : float or ndarray
+            Pressures, [Pa]
+        props : list[str], optional
+            Properties to calculate; any of 'a_alpha', 'da_alpha_dT',
+            'd2a_alpha_dT2', and the following suffixed with '_l' or '_g':
+            'V', 'Z', 'PIP', 'dP_dT', 'dP_dV', 'dV_dT', 'dV_dP', 'dT_dV',
+            'dT_dP', 'd2P_dT2', 'd2P_dV2', 'd2P_dTdV', 'H_dep', 'S_dep',
+            'G_dep', 'Cp_dep', 'Cv_dep', 'lnphi', 'phi', 'fugacity'. Defaults
+            to the volumes, `H_dep`, `S_dep`, `Cp_dep` and fugacities of both
+            phases, [-]
+
+        Returns
+        -------
+        values : dict[str, ndarray]
+            Calculated properties, [various]
+
+        Notes
+        -----
+        The special handling of the exact critical point performed by
+        :obj:`set_from_PT` is not replicated.
+
+        Examples
+        --------
+        >>> eos = PR(Tc=507.6, Pc=3025000.0, omega=0.2975, T=400.0, P=1E6)
+        >>> values = eos.evaluate([300.0, 400.0, 500.0], 1e6, props=['V_l', 'V_g'])
+        >>> values['V_l']
+        array([0.00013038, 0.00015607,        nan])
+        >>> values['V_g']
+        array([       nan, 0.00214188, 0.00356689])
+        '''
+        if self.multicomponent:
+            raise NotImplementedError("Only pure component EOSs are supported")
+        if props is None:
+            props = self.evaluate_default_props
+        root_props = {}
+        for prop in props:
+            if prop in ('a_alpha', 'da_alpha_dT', 'd2a_alpha_dT2'):
+                continue
+            name, phase = prop[:-2], prop[-2:]
+            if phase not in ('_l', '_g') or name not in self.evaluate_root_props:
+                raise ValueError("Unrecognized property %s" %(prop))
+            root_props.setdefault(phase, []).append(name)
+
+        Ts, Ps = np.broadcast_arrays(np.asarray(Ts, dtype=float), np.asarray(Ps, dtype=float))
+        shape = Ts.shape
+        T, P = Ts.ravel(), Ps.ravel()
+        pts = T.size
+
+        T_unique, T_idx = np.unique(T, return_inverse=True)
+        alphas = np.array([self.a_alpha_and_derivatives_pure(Ti) for Ti in T_unique.tolist()]).reshape(len(T_unique), 3)
+        a_alpha, da_alpha_dT, d2a_alpha_dT2 = alphas[T_idx, 0], alphas[T_idx, 1], alphas[T_idx, 2]
+
+        b, delta, epsilon = self.b, self.delta, self.epsilon
+        if self.volume_solutions_batch is not None:
+            Vs = self.volume_solutions_batch(T, P, b, delta, epsilon, a_alpha)
+        else:
+            volume_solutions = self.volume_solutions
+            Vs = np.array([volume_solutions(Ti, Pi, b, delta, epsilon, a_alpha_i)
+                           for Ti, Pi, a_alpha_i in zip(T.tolist(), P.tolist(), a_alpha.tolist())],
+                          dtype=complex).reshape(pts, 3)
+        Vs_real = Vs.real
+        with np.errstate(divide='ignore', invalid='ignore'):
+            good = (Vs_real > b) & ((Vs_real == 0.0) | (np.abs(Vs.imag/Vs_real) < 1E-12))
+        good_count = good.sum(axis=1)
+        multiple = good_count > 1
+        V_l = np.where(multiple, np.where(good, Vs_real, np.inf).min(axis=1), np.nan)
+        V_g = np.where(multiple, np.where(good, Vs_real, -np.inf).max(axis=1), np.nan)
+        V_single = np.where(good_count == 1, np.where(good, Vs_real, 0.0).sum(axis=1), np.nan)
+
+        main_derivatives = self.main_derivatives_and_departures_vectorized
+        single = ~np.isnan(V_single)
+        if single.any():
+            dP_dT, dP_dV, _, d2P_dV2, d2P_dTdV, _, _, _ = main_derivatives(
+                T, P, V_single, b, delta, epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                PIP = V_single*(d2P_dTdV/dP_dT - d2P_dV2/dP_dV)
+            liquid = single & (PIP > 1.00000000000001)
+            gas = single & ~liquid
+            V_l[liquid] = V_single[liquid]
+            V_g[gas] = V_single[gas]
+
+        values = {'a_alpha': a_alpha, 'da_alpha_dT': da_alpha_dT, 'd2a_alpha_dT2': d2a_alpha_dT2}
+        for phase, V in (('_l', V_l), ('_g', V_g)):
+            if phase not in root_props:
+                continue
+            dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep = main_derivatives(
+                T, P, V, b, delta, epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2)
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                dV_dP = 1.0/dP_dV
+                dT_dP = 1.0/dP_dT
+                dV_dT = -dP_dT*dV_dP
+                G_dep = H_dep - T*S_dep
+                lnphi = G_dep*R_inv/T
+                phi = np.exp(lnphi)
+                phi[np.isinf(phi)] = 1e308
+                root_values = {'V': V, 'Z': P*V*R_inv/T, 'dP_dT': dP_dT, 'dP_dV': dP_dV,
+                               'dV_dT': dV_dT, 'dV_dP': dV_dP, 'dT_dV': 1.0/dV_dT,
+                               'dT_dP': dT_dP, 'd2P_dT2': d2P_dT2, 'd2P_dV2': d2P_dV2,
+                               'd2P_dTdV': d2P_dTdV, 'H_dep': H_dep, 'S_dep': S_dep,
+                               'G_dep': G_dep, 'Cp_dep': -T*dP_dT*dP_dT*dV_dP + Cv_dep - R,
+                               'Cv_dep': Cv_dep, 'PIP': V*(d2P_dTdV*dT_dP - d2P_dV2*dV_dP),
+                               'lnphi': lnphi, 'phi': phi, 'fugacity': P*phi}
+            for name in root_props[phase]:
+                values[name + phase] = root_values[name]
+        return {prop: values[prop].reshape(shape) for prop in props}
+
     def T_min_at_V(self, V, Pmin=1e-15):
         '''Returns the minimum temperature for the EOS to have the
         volume as specified. Under this temperature, the pressure will go
@@ -7013,6 +7233,7 @@ class IG(GCEOS):
     epsilon = 0.0
     '''float: `epsilon` parameter for an ideal gas is 0'''
     volume_solutions = staticmethod(volume_solutions_ideal)
+    volume_solutions_batch = None
 
     # Handle the properties where numerical error puts values - but they should
     # be zero. Not all of them are non-zero all the time - but some times
@@ -9004,6 +9225,7 @@ class VDW(GCEOS):
     _P_zero_l_cheb_coeffs = [0.23949680596158576, -0.28552048884377407, 0.17223773827357045, -0.10535895068953466, 0.06539081523178862, -0.04127943642449526, 0.02647106353835149, -0.017260750015435533, 0.011558172064668568, -0.007830624115831804, 0.005422844032253547, -0.00383463423135285, 0.0027718803475398936, -0.0020570084561681613, 0.0015155074622906842, -0.0011495238177958583, 0.000904782154904249, -0.000683347677699564, 0.0005800187592994201, -0.0004529246894177611, 0.00032901743817593566, -0.0002990561659229427, 0.00023524411148843384, -0.00019464055011993858, 0.0001441665975916752, -0.00013106835607900116, 9.72812311007959e-05, -7.611327134024459e-05, 5.240433315348986e-05, -3.6415012576658176e-05, 3.89310794418167e-05, -2.2160354688301534e-05, 2.7908599229672926e-05, 1.6405692108915904e-05, -1.3931165551671343e-06, -4.80770003354232e-06]
     P_zero_l_cheb_limits = (0.002354706203222534, 9.0)
     main_derivatives_and_departures = staticmethod(main_derivatives_and_departures_VDW)
+    main_derivatives_and_departures_vectorized = staticmethod(main_derivatives_and_departures_VDW_vectorized)
     def __init__(self, Tc, Pc, T=None, P=None, V=None, omega=None):
         self.Tc = Tc
         self.Pc = Pc
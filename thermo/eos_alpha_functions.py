@@ -41,6 +41,31 @@ Vectorized Alpha Functions
 .. autofunction:: thermo.eos_alpha_functions.PRSV2_a_alphas_vectorized
 .. autofunction:: thermo.eos_alpha_functions.APISRK_a_alphas_vectorized
 .. autofunction:: thermo.eos_alpha_functions.RK_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_1972_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Heyen_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Harmens_Knapp_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_1983_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_Copeman_untruncated_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Gibbons_Laughton_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_1984_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Yu_Lu_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Trebble_Bishnoi_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Melhem_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Androulakis_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Schwartzentruber_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Almeida_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_93_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Gasem_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Coquelet_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Haghtalab_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Saffari_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Poly_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_Copeman_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Twu91_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_79_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Chen_Yang_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuPR95_a_alphas_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuSRK95_a_alphas_vectorized
 
 Vectorized Alpha Functions With Derivatives
 -------------------------------------------
@@ -50,6 +75,31 @@ Vectorized Alpha Functions With Derivatives
 .. autofunction:: thermo.eos_alpha_functions.PRSV2_a_alpha_and_derivatives_vectorized
 .. autofunction:: thermo.eos_alpha_functions.APISRK_a_alpha_and_derivatives_vectorized
 .. autofunction:: thermo.eos_alpha_functions.RK_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_1972_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Heyen_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Harmens_Knapp_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_1983_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_Copeman_untruncated_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Gibbons_Laughton_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_1984_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Yu_Lu_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Trebble_Bishnoi_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Melhem_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Androulakis_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Schwartzentruber_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Almeida_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_93_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Gasem_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Coquelet_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Haghtalab_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Saffari_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Poly_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Mathias_Copeman_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Twu91_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Soave_79_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.Chen_Yang_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuPR95_a_alpha_and_derivatives_vectorized
+.. autofunction:: thermo.eos_alpha_functions.TwuSRK95_a_alpha_and_derivatives_vectorized
 
 Class With Alpha Functions
 --------------------------
@@ -173,6 +223,31 @@ __all__ = [
            'PRSV_a_alphas_vectorized', 'PRSV_a_alpha_and_derivatives_vectorized',
            'PRSV2_a_alphas_vectorized', 'PRSV2_a_alpha_and_derivatives_vectorized',
            'APISRK_a_alphas_vectorized', 'APISRK_a_alpha_and_derivatives_vectorized',
+           'Soave_1972_a_alphas_vectorized', 'Soave_1972_a_alpha_and_derivatives_vectorized',
+           'Heyen_a_alphas_vectorized', 'Heyen_a_alpha_and_derivatives_vectorized',
+           'Harmens_Knapp_a_alphas_vectorized', 'Harmens_Knapp_a_alpha_and_derivatives_vectorized',
+           'Mathias_1983_a_alphas_vectorized', 'Mathias_1983_a_alpha_and_derivatives_vectorized',
+           'Mathias_Copeman_untruncated_a_alphas_vectorized', 'Mathias_Copeman_untruncated_a_alpha_and_derivatives_vectorized',
+           'Gibbons_Laughton_a_alphas_vectorized', 'Gibbons_Laughton_a_alpha_and_derivatives_vectorized',
+           'Soave_1984_a_alphas_vectorized', 'Soave_1984_a_alpha_and_derivatives_vectorized',
+           'Yu_Lu_a_alphas_vectorized', 'Yu_Lu_a_alpha_and_derivatives_vectorized',
+           'Trebble_Bishnoi_a_alphas_vectorized', 'Trebble_Bishnoi_a_alpha_and_derivatives_vectorized',
+           'Melhem_a_alphas_vectorized', 'Melhem_a_alpha_and_derivatives_vectorized',
+           'Androulakis_a_alphas_vectorized', 'Androulakis_a_alpha_and_derivatives_vectorized',
+           'Schwartzentruber_a_alphas_vectorized', 'Schwartzentruber_a_alpha_and_derivatives_vectorized',
+           'Almeida_a_alphas_vectorized', 'Almeida_a_alpha_and_derivatives_vectorized',
+           'Soave_93_a_alphas_vectorized', 'Soave_93_a_alpha_and_derivatives_vectorized',
+           'Gasem_a_alphas_vectorized', 'Gasem_a_alpha_and_derivatives_vectorized',
+           'Coquelet_a_alphas_vectorized', 'Coquelet_a_alpha_and_derivatives_vectorized',
+           'Haghtalab_a_alphas_vectorized', 'Haghtalab_a_alpha_and_derivatives_vectorized',
+           'Saffari_a_alphas_vectorized', 'Saffari_a_alpha_and_derivatives_vectorized',
+           'Poly_a_alphas_vectorized', 'Poly_a_alpha_and_derivatives_vectorized',
+           'Mathias_Copeman_a_alphas_vectorized', 'Mathias_Copeman_a_alpha_and_derivatives_vectorized',
+           'Twu91_a_alphas_vectorized', 'Twu91_a_alpha_and_derivatives_vectorized',
+           'Soave_79_a_alphas_vectorized', 'Soave_79_a_alpha_and_derivatives_vectorized',
+           'Chen_Yang_a_alphas_vectorized', 'Chen_Yang_a_alpha_and_derivatives_vectorized',
+           'TwuPR95_a_alphas_vectorized', 'TwuPR95_a_alpha_and_derivatives_vectorized',
+           'TwuSRK95_a_alphas_vectorized', 'TwuSRK95_a_alpha_and_derivatives_vectorized',
 
 'a_alpha_base', 'Poly_a_alpha', 'Soave_1972_a_alpha', 'Heyen_a_alpha',
 'Harmens_Knapp_a_alpha', 'Mathias_1983_a_alpha', 'Mathias_Copeman_untruncated_a_alpha',
@@ -1062,6 +1137,2669 @@ def APISRK_a_alpha_and_derivatives_vectorized(T, Tcs, ais, S1s, S2s):
         d2a_alpha_dT2s[i] = ais[i]*(-x4*(-x2*x7 + x5 + x7) + x6*x6)*c0
     return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
 
+def Soave_1972_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Soave
+    (1972) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. One coefficient is needed for each
+    component. This is the vectorized form of
+    :obj:`Soave_1972_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Soave_1972_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8], [0.9]])
+    [3.780462214891, 5.097085426402]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        c1 = alpha_coeffs[i][0]
+        x0 = c1*(1.0 - sqrt(T/Tc)) + 1.0
+        a_alpha = a*x0*x0
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Soave_1972_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Soave (1972) given the critical
+    temperatures `Tcs`, constants `ais`, and coefficients `alpha_coeffs`.
+    One coefficient is needed for each component. This is the vectorized
+    form of :obj:`Soave_1972_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Soave_1972_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8], [0.9]])
+    ([3.780462214891, 5.097085426402], [-0.006540376198192, -0.009269734192453], [1.655820514251e-05, 2.387868508813e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        c1 = alpha_coeffs[i][0]
+        rt = sqrt(T/Tc)
+        x0 = c1*(1.0 - rt) + 1.0
+        x1 = a*c1*T_inv
+        a_alpha = a*x0*x0
+        da_alpha_dT = -x1*rt*x0
+        d2a_alpha_dT2 = 0.5*x1*(c1/Tc + rt*x0*T_inv)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Heyen_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Heyen
+    (1980) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Two coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Heyen_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \left(\frac{T}{T_{c,i}}\right)^{c_{2}}
+        + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Heyen_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.4, 1.2], [0.5, 1.1]])
+    [3.246546959986, 4.280024006596]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        a_alpha = a*exp(c1*(1.0 - (T/Tc)**c2))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Heyen_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Heyen (1980) given the critical
+    temperatures `Tcs`, constants `ais`, and coefficients `alpha_coeffs`.
+    Two coefficients are needed for each component. This is the vectorized
+    form of :obj:`Heyen_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \left(\frac{T}{T_{c,i}}\right)^{c_{2}}
+        + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Heyen_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.4, 1.2], [0.5, 1.1]])
+    ([3.246546959986, 4.280024006596], [-0.002763511278418, -0.004108761967973], [5.100029394697e-07, 2.574765532243e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        x0 = (T/Tc)**c2
+        x1 = c1*c2*x0
+        a_alpha = a*exp(c1*(1.0 - x0))
+        da_alpha_dT = -a_alpha*x1*T_inv
+        d2a_alpha_dT2 = a_alpha*x1*(x1 - c2 + 1.0)*T_inv*T_inv
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Harmens_Knapp_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Harmens and
+    Knapp (1980) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Two coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Harmens_Knapp_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        - c_{2} \left(1 - \frac{T_{c,i}}{T}\right) + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Harmens_Knapp_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8, 0.02], [0.9, 0.03]])
+    [3.869285956475, 5.29822061038]
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        x0 = c1*(1.0 - sqrt(T/Tc)) - c2*(1.0 - Tc*T_inv) + 1.0
+        a_alpha = a*x0*x0
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Harmens_Knapp_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Harmens and Knapp (1980) given the
+    critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Two coefficients are needed for each component. This is
+    the vectorized form of
+    :obj:`Harmens_Knapp_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        - c_{2} \left(1 - \frac{T_{c,i}}{T}\right) + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Harmens_Knapp_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8, 0.02], [0.9, 0.03]])
+    ([3.869285956475, 5.29822061038], [-0.00734490697296, -0.01097326484957], [2.285349085792e-05, 3.726428631446e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        x0 = c1*sqrt(T/Tc)
+        x1 = Tc*c2*T_inv
+        x2 = 1.0 + c1 - x0 - c2 + x1
+        x3 = x0 + 2.0*x1
+        a_alpha = a*x2*x2
+        da_alpha_dT = -a*x2*x3*T_inv
+        d2a_alpha_dT2 = 0.5*a*(x3*x3 + (x0 + 8.0*x1)*x2)*T_inv*T_inv
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Mathias_1983_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Mathias
+    (1983) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Two coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Mathias_1983_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        - c_{2} \left(- \frac{T}{T_{c,i}} + 0.7\right) \left(- \frac{T}{T_{c,i}}
+        + 1\right) + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Mathias_1983_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8, 0.05], [0.9, 0.06]])
+    [3.766255558269, 5.065133358913]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tr = T/Tc
+        x0 = 1.0 + c1*(1.0 - sqrt(Tr)) - c2*(1.0 - Tr)*(0.7 - Tr)
+        a_alpha = a*x0*x0
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Mathias_1983_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Mathias (1983) given the critical
+    temperatures `Tcs`, constants `ais`, and coefficients `alpha_coeffs`.
+    Two coefficients are needed for each component. This is the vectorized
+    form of :obj:`Mathias_1983_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        - c_{2} \left(- \frac{T}{T_{c,i}} + 0.7\right) \left(- \frac{T}{T_{c,i}}
+        + 1\right) + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Mathias_1983_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8, 0.05], [0.9, 0.06]])
+    ([3.766255558269, 5.065133358913], [-0.006203140150981, -0.008699555209427], [1.351676494794e-05, 1.947258523059e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        x0 = c1*sqrt(Tr)
+        x1 = 1.0 + c1 - x0 - c2*(1.0 - Tr)*(0.7 - Tr)
+        x2 = 2.0*c2*(1.7 - 2.0*Tr)*Tc_inv - x0*T_inv
+        a_alpha = a*x1*x1
+        da_alpha_dT = a*x1*x2
+        d2a_alpha_dT2 = 0.5*a*(x2*x2 - x1*(8.0*c2*Tc_inv*Tc_inv - x0*T_inv*T_inv))
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Mathias_Copeman_untruncated_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Mathias and
+    Copeman (1983) given the critical temperatures `Tcs`, constants `ais`,
+    and coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Mathias_Copeman_untruncated_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        + c_{2} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2} + c_{3} \left(
+        - \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{3} + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Mathias_Copeman_untruncated_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8, -0.2, 0.3], [0.9, -0.1, 0.2]])
+    [3.736029744312, 5.070719090364]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        tau = 1.0 - sqrt(T/Tc)
+        x0 = 1.0 + tau*(c1 + tau*(c2 + tau*c3))
+        a_alpha = a*x0*x0
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Mathias_Copeman_untruncated_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Mathias and Copeman (1983) given
+    the critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Three coefficients are needed for each component. This
+    is the vectorized form of
+    :obj:`Mathias_Copeman_untruncated_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \left(c_{1} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        + c_{2} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2} + c_{3} \left(
+        - \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{3} + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Mathias_Copeman_untruncated_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729],
+    ...     alpha_coeffs=[[0.8, -0.2, 0.3], [0.9, -0.1, 0.2]])
+    ([3.736029744312, 5.070719090364], [-0.00614120754612, -0.009122368373009], [1.545147101364e-05, 2.475880766045e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        rt = sqrt(T/Tc)
+        tau = 1.0 - rt
+        x0 = 1.0 + tau*(c1 + tau*(c2 + tau*c3))
+        x1 = c1 + tau*(2.0*c2 + 3.0*c3*tau)
+        x2 = rt*x1*T_inv
+        a_alpha = a*x0*x0
+        da_alpha_dT = -a*x0*x2
+        d2a_alpha_dT2 = 0.5*a*(x1*x1/Tc + (2.0*(c2 + 3.0*c3*tau)/Tc + x2)*x0)*T_inv
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Gibbons_Laughton_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Gibbons and
+    Laughton (1984) given the critical temperatures `Tcs`, constants `ais`,
+    and coefficients `alpha_coeffs`. Two coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Gibbons_Laughton_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(\frac{T}{T_{c,i}} - 1\right) + c_{2}
+        \left(\sqrt{\frac{T}{T_{c,i}}} - 1\right) + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Gibbons_Laughton_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[-0.6, -0.4], [-0.7, -0.3]])
+    [3.601973430818, 4.680538555821]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tr = T/Tc
+        a_alpha = a*(c1*(Tr - 1.0) + c2*(sqrt(Tr) - 1.0) + 1.0)
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Gibbons_Laughton_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Gibbons and Laughton (1984) given
+    the critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Two coefficients are needed for each component. This is
+    the vectorized form of
+    :obj:`Gibbons_Laughton_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(\frac{T}{T_{c,i}} - 1\right) + c_{2}
+        \left(\sqrt{\frac{T}{T_{c,i}}} - 1\right) + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Gibbons_Laughton_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[-0.6, -0.4], [-0.7, -0.3]])
+    ([3.601973430818, 4.680538555821], [-0.004562238135398, -0.005627431914555], [2.299750714237e-06, 2.094621498958e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tr = T/Tc
+        rt = sqrt(Tr)
+        x0 = c2*rt*T_inv
+        a_alpha = a*(c1*(Tr - 1.0) + c2*(rt - 1.0) + 1.0)
+        da_alpha_dT = a*(c1/Tc + 0.5*x0)
+        d2a_alpha_dT2 = -0.25*a*x0*T_inv
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Soave_1984_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Soave
+    (1984) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Two coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Soave_1984_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) + c_{2} \left(-1
+        + \frac{T_{c,i}}{T}\right) + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Soave_1984_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.6, 0.05], [0.7, 0.04]])
+    [3.446117267943, 4.530755039446]
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        a_alpha = a*(c1*(1.0 - T/Tc) + c2*(Tc*T_inv - 1.0) + 1.0)
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Soave_1984_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Soave (1984) given the critical
+    temperatures `Tcs`, constants `ais`, and coefficients `alpha_coeffs`.
+    Two coefficients are needed for each component. This is the vectorized
+    form of :obj:`Soave_1984_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) + c_{2} \left(-1
+        + \frac{T_{c,i}}{T}\right) + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Soave_1984_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.6, 0.05], [0.7, 0.04]])
+    ([3.446117267943, 4.530755039446], [-0.003941616306856, -0.005180454828513], [5.061524e-06, 5.398638755556e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        x0 = Tc*T_inv
+        x1 = c2*x0*T_inv
+        a_alpha = a*(c1*(1.0 - T/Tc) + c2*(x0 - 1.0) + 1.0)
+        da_alpha_dT = -a*(c1/Tc + x1)
+        d2a_alpha_dT2 = 2.0*a*x1*T_inv
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Yu_Lu_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Yu and Lu
+    (1987) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Four coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Yu_Lu_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = 10^{c_{4} \left(- \frac{T}{T_{c,i}} + 1\right) \left(
+        \frac{T^{2} c_{3}}{Tc^{2}} + \frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Yu_Lu_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.4, 0.1, -0.05, 0.6], [0.5, 0.1, -0.04, 0.6]])
+    [3.455386995076, 4.708942870213]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3, c4 = coeffs[0], coeffs[1], coeffs[2], coeffs[3]
+        Tr = T/Tc
+        a_alpha = a*10.0**(c4*(1.0 - Tr)*(c1 + Tr*(c2 + Tr*c3)))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Yu_Lu_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Yu and Lu (1987) given the
+    critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Four coefficients are needed for each component. This is
+    the vectorized form of
+    :obj:`Yu_Lu_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = 10^{c_{4} \left(- \frac{T}{T_{c,i}} + 1\right) \left(
+        \frac{T^{2} c_{3}}{Tc^{2}} + \frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Yu_Lu_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.4, 0.1, -0.05, 0.6], [0.5, 0.1, -0.04, 0.6]])
+    ([3.455386995076, 4.708942870213], [-0.003996123024375, -0.006244170889471], [2.348228196122e-06, 5.009083952916e-06])
+    '''
+    N = len(Tcs)
+    ln10 = log(10.0)
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3, c4 = coeffs[0], coeffs[1], coeffs[2], coeffs[3]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        x0 = 1.0 - Tr
+        x1 = c1 + Tr*(c2 + Tr*c3)
+        x2 = c2 + 2.0*c3*Tr
+        x3 = ln10*c4*Tc_inv*(x0*x2 - x1)
+        a_alpha = a*10.0**(c4*x0*x1)
+        da_alpha_dT = a_alpha*x3
+        d2a_alpha_dT2 = a_alpha*(2.0*ln10*c4*Tc_inv*Tc_inv*(c3*x0 - x2) + x3*x3)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Trebble_Bishnoi_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Trebble and
+    Bishnoi (1987) given the critical temperatures `Tcs`, constants `ais`,
+    and coefficients `alpha_coeffs`. One coefficient is needed for each
+    component. This is the vectorized form of
+    :obj:`Trebble_Bishnoi_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[float]
+        Coefficient of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Trebble_Bishnoi_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[0.6, 0.7])
+    [3.441081865762, 4.604471972354]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        c1 = alpha_coeffs[i]
+        a_alpha = ais[i]*exp(c1*(1.0 - T/Tcs[i]))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Trebble_Bishnoi_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Trebble and Bishnoi (1987) given
+    the critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. One coefficient is needed for each component. This is
+    the vectorized form of
+    :obj:`Trebble_Bishnoi_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[float]
+        Coefficient of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Trebble_Bishnoi_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[0.6, 0.7])
+    ([3.441081865762, 4.604471972354], [-0.004067472654565, -0.00596655013078], [4.80788729854e-06, 7.731553297938e-06])
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc = Tcs[i]
+        c1 = alpha_coeffs[i]
+        x0 = c1/Tc
+        a_alpha = ais[i]*exp(c1*(1.0 - T/Tc))
+        da_alpha_dT = -a_alpha*x0
+        d2a_alpha_dT2 = a_alpha*x0*x0
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Melhem_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Melhem et
+    al. (1989) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Two coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Melhem_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) + c_{2}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2}}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Melhem_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.7, 0.2], [0.8, 0.3]])
+    [3.623270858576, 4.908493991592]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tr = T/Tc
+        tau = 1.0 - sqrt(Tr)
+        a_alpha = a*exp(c1*(1.0 - Tr) + c2*tau*tau)
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Melhem_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Melhem et al. (1989) given the
+    critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Two coefficients are needed for each component. This is
+    the vectorized form of
+    :obj:`Melhem_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) + c_{2}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2}}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Melhem_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.7, 0.2], [0.8, 0.3]])
+    ([3.623270858576, 4.908493991592], [-0.005426010862849, -0.008201117255258], [1.122067688665e-05, 1.979893269791e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        rt = sqrt(Tr)
+        tau = 1.0 - rt
+        x0 = rt*tau*T_inv
+        x1 = c1*Tc_inv + c2*x0
+        a_alpha = a*exp(c1*(1.0 - Tr) + c2*tau*tau)
+        da_alpha_dT = -a_alpha*x1
+        d2a_alpha_dT2 = a_alpha*(x1*x1 + 0.5*c2*T_inv*(Tc_inv + x0))
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Androulakis_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Androulakis
+    et al. (1989) given the critical temperatures `Tcs`, constants `ais`,
+    and coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Androulakis_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(- \left(\frac{T}{T_{c,i}}\right)^{\frac{2}{3}}
+        + 1\right) + c_{2} \left(- \left(\frac{T}{T_{c,i}}\right)^{\frac{2}{3}}
+        + 1\right)^{2} + c_{3} \left(- \left(\frac{T}{T_{c,i}}\right)^{
+        \frac{2}{3}} + 1\right)^{3} + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Androulakis_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[1.1, -0.2, 0.3], [1.2, -0.1, 0.2]])
+    [3.541939436101, 4.673301700281]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        tau = 1.0 - (T/Tc)**(2.0/3.0)
+        a_alpha = a*(1.0 + tau*(c1 + tau*(c2 + tau*c3)))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Androulakis_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Androulakis et al. (1989) given
+    the critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Three coefficients are needed for each component. This
+    is the vectorized form of
+    :obj:`Androulakis_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(- \left(\frac{T}{T_{c,i}}\right)^{\frac{2}{3}}
+        + 1\right) + c_{2} \left(- \left(\frac{T}{T_{c,i}}\right)^{\frac{2}{3}}
+        + 1\right)^{2} + c_{3} \left(- \left(\frac{T}{T_{c,i}}\right)^{
+        \frac{2}{3}} + 1\right)^{3} + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Androulakis_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[1.1, -0.2, 0.3], [1.2, -0.1, 0.2]])
+    ([3.541939436101, 4.673301700281], [-0.004468089953501, -0.00606807974149], [5.837171702083e-06, 8.181153803355e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        x0 = (T/Tc)**(2.0/3.0)
+        tau = 1.0 - x0
+        x1 = a*x0*T_inv
+        a_alpha = a*(1.0 + tau*(c1 + tau*(c2 + tau*c3)))
+        da_alpha_dT = -2.0/3.0*x1*(c1 + tau*(2.0*c2 + 3.0*c3*tau))
+        d2a_alpha_dT2 = 2.0/9.0*x1*T_inv*(c1 + 4.0*c2*x0 + 2.0*c2*tau + 3.0*c3*tau*(4.0*x0 + tau))
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Schwartzentruber_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of
+    Schwartzentruber et al. (1990) given the critical temperatures `Tcs`,
+    constants `ais`, and coefficients `alpha_coeffs`. Four coefficients are
+    needed for each component. This is the vectorized form of
+    :obj:`Schwartzentruber_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \left(c_{4} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        - \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right) \left(\frac{T^{2} c_{3}}
+        {Tc^{2}} + \frac{T c_{2}}{T_{c,i}} + c_{1}\right) + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Schwartzentruber_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.1, 0.05, -0.02, 0.8], [0.1, 0.04, -0.01, 0.9]])
+    [3.601797701617, 4.848493391904]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3, c4 = coeffs[0], coeffs[1], coeffs[2], coeffs[3]
+        Tr = T/Tc
+        x0 = 1.0 + (1.0 - sqrt(Tr))*(c4 - c1 - Tr*(c2 + Tr*c3))
+        a_alpha = a*x0*x0
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Schwartzentruber_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Schwartzentruber et al. (1990)
+    given the critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Four coefficients are needed for each component. This is
+    the vectorized form of
+    :obj:`Schwartzentruber_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \left(c_{4} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)
+        - \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right) \left(\frac{T^{2} c_{3}}
+        {Tc^{2}} + \frac{T c_{2}}{T_{c,i}} + c_{1}\right) + 1\right)^{2}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Schwartzentruber_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729],
+    ...     alpha_coeffs=[[0.1, 0.05, -0.02, 0.8], [0.1, 0.04, -0.01, 0.9]])
+    ([3.601797701617, 4.848493391904], [-0.005480678166926, -0.007954367948804], [1.423201632126e-05, 2.081429881989e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3, c4 = coeffs[0], coeffs[1], coeffs[2], coeffs[3]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        rt = sqrt(Tr)
+        tau = 1.0 - rt
+        x0 = c1 + Tr*(c2 + Tr*c3) - c4
+        x1 = (c2 + 2.0*c3*Tr)*Tc_inv
+        x2 = 1.0 - tau*x0
+        x3 = rt*x0*T_inv
+        x4 = x3 - 2.0*tau*x1
+        a_alpha = a*x2*x2
+        da_alpha_dT = a*x2*x4
+        d2a_alpha_dT2 = 0.5*a*(x2*(4.0*rt*x1*T_inv - 8.0*c3*tau*Tc_inv*Tc_inv - x3*T_inv) + x4*x4)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Almeida_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Almeida et
+    al. (1991) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Almeida_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) \left|{
+        \frac{T}{T_{c,i}} - 1}\right|^{c_{2} - 1} + c_{3} \left(-1
+        + \frac{T_{c,i}}{T}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Almeida_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.5, 1.3, 0.1], [0.6, 1.2, 0.2]])
+    [3.373592155256, 4.966792712221]
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        x0 = T/Tc - 1.0
+        a_alpha = a*exp(c3*(Tc*T_inv - 1.0) - c1*x0*abs(x0)**(c2 - 1.0))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Almeida_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Almeida et al. (1991) given the
+    critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Three coefficients are needed for each component. This
+    is the vectorized form of
+    :obj:`Almeida_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) \left|{
+        \frac{T}{T_{c,i}} - 1}\right|^{c_{2} - 1} + c_{3} \left(-1
+        + \frac{T_{c,i}}{T}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Almeida_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.5, 1.3, 0.1], [0.6, 1.2, 0.2]])
+    ([3.373592155256, 4.966792712221], [-0.005206371277958, -0.01159170074702], [1.451956020494e-05, 4.0227677601e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tc_inv = 1.0/Tc
+        x0 = T*Tc_inv - 1.0
+        x1 = abs(x0)
+        x2 = x1**(c2 - 2.0)
+        x3 = x1*x2
+        x4 = Tc*c3*T_inv*T_inv
+        x5 = c1*c2*x3*Tc_inv + x4
+        x6 = exp(c3*(Tc*T_inv - 1.0) - c1*x0*x3)
+        a_alpha = a*x6
+        da_alpha_dT = -a_alpha*x5
+        # Matches `Almeida_a_alpha.a_alpha_and_derivatives_pure`, where only the
+        # first term is multiplied by `a`
+        d2a_alpha_dT2 = x6*(a*x5*x5 - c1*c2*(c2 - 1.0)*x2*copysign(1.0, x0)*Tc_inv*Tc_inv + 2.0*x4*T_inv)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Soave_93_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Soave
+    (1993) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Two coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Soave_93_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) + c_{2}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2} + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Soave_93_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.9, 0.3], [1.0, 0.2]])
+    [3.726478302255, 4.916450018153]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tr = T/Tc
+        tau = 1.0 - sqrt(Tr)
+        a_alpha = a*(c1*(1.0 - Tr) + c2*tau*tau + 1.0)
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Soave_93_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Soave (1993) given the critical
+    temperatures `Tcs`, constants `ais`, and coefficients `alpha_coeffs`.
+    Two coefficients are needed for each component. This is the vectorized
+    form of :obj:`Soave_93_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) + c_{2}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2} + 1
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Soave_93_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.9, 0.3], [1.0, 0.2]])
+    ([3.726478302255, 4.916450018153], [-0.005252163349669, -0.006670736073658], [3.449626071356e-06, 2.792828665278e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2 = coeffs[0], coeffs[1]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        rt = sqrt(Tr)
+        tau = 1.0 - rt
+        x0 = rt*tau*T_inv
+        a_alpha = a*(c1*(1.0 - Tr) + c2*tau*tau + 1.0)
+        da_alpha_dT = -a*(c1*Tc_inv + c2*x0)
+        d2a_alpha_dT2 = 0.5*a*c2*T_inv*(Tc_inv + x0)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Gasem_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Gasem
+    (2001) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Gasem_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{\left(- \left(\frac{T}{T_{c,i}}\right)^{c_{3}} + 1\right)
+        \left(\frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Gasem_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.13, 0.35, 1.6], [0.14, 0.36, 1.5]])
+    [3.261017701872, 4.116561474884]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tr = T/Tc
+        a_alpha = a*exp((1.0 - Tr**c3)*(c1 + c2*Tr))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Gasem_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Gasem (2001) given the critical
+    temperatures `Tcs`, constants `ais`, and coefficients `alpha_coeffs`.
+    Three coefficients are needed for each component. This is the vectorized
+    form of :obj:`Gasem_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{\left(- \left(\frac{T}{T_{c,i}}\right)^{c_{3}} + 1\right)
+        \left(\frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Gasem_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.13, 0.35, 1.6], [0.14, 0.36, 1.5]])
+    ([3.261017701872, 4.116561474884], [-0.001246313391636, -0.001287601516781], [-1.491398880143e-05, -1.577683340264e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        x0 = Tr**c3
+        x1 = c1 + c2*Tr
+        x2 = c2*(1.0 - x0)*Tc_inv - c3*x0*x1*T_inv
+        a_alpha = a*exp((1.0 - x0)*x1)
+        da_alpha_dT = a_alpha*x2
+        d2a_alpha_dT2 = a_alpha*(x2*x2 - c3*x0*T_inv*(2.0*c2*Tc_inv + (c3 - 1.0)*x1*T_inv))
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Coquelet_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Coquelet et
+    al. (2004) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Coquelet_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) \left(c_{2}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2} + c_{3}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{3} + 1\right)^{2}}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Coquelet_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.7, 0.2, 0.1], [0.8, 0.3, 0.1]])
+    [3.609449795636, 4.887510857194]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tr = T/Tc
+        tau = 1.0 - sqrt(Tr)
+        x0 = 1.0 + tau*tau*(c2 + c3*tau)
+        a_alpha = a*exp(c1*(1.0 - Tr)*x0*x0)
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Coquelet_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Coquelet et al. (2004) given the
+    critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Three coefficients are needed for each component. This
+    is the vectorized form of
+    :obj:`Coquelet_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{c_{1} \left(- \frac{T}{T_{c,i}} + 1\right) \left(c_{2}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{2} + c_{3}
+        \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)^{3} + 1\right)^{2}}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Coquelet_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.7, 0.2, 0.1], [0.8, 0.3, 0.1]])
+    ([3.609449795636, 4.887510857194], [-0.005387851722091, -0.008307193875836], [1.321852391093e-05, 2.599767080116e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        rt = sqrt(Tr)
+        tau = 1.0 - rt
+        x0 = 1.0 - Tr
+        # y = 1 + c2*tau^2 + c3*tau^3 and its first two derivatives
+        y = 1.0 + tau*tau*(c2 + c3*tau)
+        dtau = -0.5*rt*T_inv
+        x1 = tau*(2.0*c2 + 3.0*c3*tau)
+        dy = x1*dtau
+        d2y = (2.0*c2 + 6.0*c3*tau)*dtau*dtau - 0.5*x1*dtau*T_inv
+        # Exponent c1*(1 - Tr)*y^2 and its first two derivatives
+        dg = c1*y*(2.0*x0*dy - y*Tc_inv)
+        d2g = 2.0*c1*(x0*(dy*dy + y*d2y) - 2.0*y*dy*Tc_inv)
+        a_alpha = a*exp(c1*x0*y*y)
+        da_alpha_dT = a_alpha*dg
+        d2a_alpha_dT2 = a_alpha*(dg*dg + d2g)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Haghtalab_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Haghtalab
+    et al. (2010) given the critical temperatures `Tcs`, constants `ais`,
+    and coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Haghtalab_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{\left(- c_{3}^{\log{\left (\frac{T}{T_{c,i}} \right )}}
+        + 1\right) \left(- \frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Haghtalab_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[2.0, 0.2, 2.2], [2.1, 0.3, 2.3]])
+    [5.099497897574, 7.131905983637]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tr = T/Tc
+        a_alpha = a*exp((1.0 - c3**log(Tr))*(c1 - c2*Tr))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Haghtalab_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Haghtalab et al. (2010) given the
+    critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Three coefficients are needed for each component. This
+    is the vectorized form of
+    :obj:`Haghtalab_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{\left(- c_{3}^{\log{\left (\frac{T}{T_{c,i}} \right )}}
+        + 1\right) \left(- \frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Haghtalab_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[2.0, 0.2, 2.2], [2.1, 0.3, 2.3]])
+    ([5.099497897574, 7.131905983637], [-0.01734193951309, -0.02498976094825], [7.769913246083e-05, 0.0001141016543133])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tc_inv = 1.0/Tc
+        Tr = T*Tc_inv
+        x0 = c3**log(Tr)
+        x1 = log(c3)
+        x2 = c1 - c2*Tr
+        x3 = c2*(x0 - 1.0)*Tc_inv - x0*x1*x2*T_inv
+        a_alpha = a*exp((1.0 - x0)*x2)
+        da_alpha_dT = a_alpha*x3
+        d2a_alpha_dT2 = a_alpha*(x3*x3 + x0*x1*T_inv*(2.0*c2*Tc_inv - (x1 - 1.0)*x2*T_inv))
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Saffari_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Saffari and
+    Zahedi (2013) given the critical temperatures `Tcs`, constants `ais`,
+    and coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Saffari_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{\frac{T c_{1}}{T_{c,i}} + c_{2} \log{\left (\frac{T}{T_{c,i}}
+        \right )} + c_{3} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Saffari_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.1, -0.5, 0.6], [0.2, -0.4, 0.7]])
+    [4.268180091485, 5.699925290626]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tr = T/Tc
+        a_alpha = a*exp(c1*Tr + c2*log(Tr) + c3*(1.0 - sqrt(Tr)))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Saffari_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Saffari and Zahedi (2013) given
+    the critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Three coefficients are needed for each component. This
+    is the vectorized form of
+    :obj:`Saffari_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{\frac{T c_{1}}{T_{c,i}} + c_{2} \log{\left (\frac{T}{T_{c,i}}
+        \right )} + c_{3} \left(- \sqrt{\frac{T}{T_{c,i}}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Saffari_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.1, -0.5, 0.6], [0.2, -0.4, 0.7]])
+    ([4.268180091485, 5.699925290626], [-0.009554052910413, -0.01044523329882], [5.056704940019e-05, 5.273350285269e-05])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a = Tcs[i], ais[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3 = coeffs[0], coeffs[1], coeffs[2]
+        Tr = T/Tc
+        rt = sqrt(Tr)
+        x0 = c3*rt*T_inv
+        x1 = c1/Tc + c2*T_inv - 0.5*x0
+        a_alpha = a*exp(c1*Tr + c2*log(Tr) + c3*(1.0 - rt))
+        da_alpha_dT = a_alpha*x1
+        d2a_alpha_dT2 = a_alpha*(x1*x1 - (c2*T_inv - 0.25*x0)*T_inv)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Poly_a_alphas_vectorized(T, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms of a mixture where each component's
+    :math:`a \alpha` is given by a polynomial in temperature. This is the
+    vectorized form of :obj:`Poly_a_alpha.a_alpha_pure`.
+
+    .. math::
+        a \alpha = \text{poly}(T)
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    alpha_coeffs : list[list[float]]
+        Polynomial coefficients of each component, in order of decreasing
+        power, [Pa*m^6/mol^2]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Poly_a_alphas_vectorized(300.0, alpha_coeffs=[[1e-06, -1e-05, 5.0], [2e-06, -2e-05, 6.5]])
+    [5.087, 6.674]
+    '''
+    N = len(alpha_coeffs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        a_alphas[i] = horner(alpha_coeffs[i], T)
+    return a_alphas
+
+def Poly_a_alpha_and_derivatives_vectorized(T, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives of a mixture where each component's :math:`a \alpha` is given
+    by a polynomial in temperature. This is the vectorized form of
+    :obj:`Poly_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        a \alpha = \text{poly}(T)
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    alpha_coeffs : list[list[float]]
+        Polynomial coefficients of each component, in order of decreasing
+        power, [Pa*m^6/mol^2]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Poly_a_alpha_and_derivatives_vectorized(300.0, alpha_coeffs=[[1e-06, -1e-05, 5.0], [2e-06, -2e-05, 6.5]])
+    ([5.087, 6.674], [0.00059, 0.00118], [2e-06, 4e-06])
+    '''
+    N = len(alpha_coeffs)
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        a_alpha, da_alpha_dT, d2a_alpha_dT2 = horner_and_der2(alpha_coeffs[i], T)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Mathias_Copeman_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the Mathias-Copeman alpha function
+    given the critical temperatures `Tcs`, constants `ais`, and polynomial
+    coefficients `alpha_coeffs` (in order of decreasing power). Above the
+    critical point only the linear coefficient is used. This is the
+    vectorized form of :obj:`Mathias_Copeman_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \left[1 + \sum_{k} c_k\left(1 - \sqrt{T_r}\right)^k
+        \right]^2
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Polynomial coefficients of the alpha function of each component,
+        in order of decreasing power and ending with 1, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Mathias_Copeman_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.2, -0.1, 0.8, 1.0], [0.3, -0.2, 0.9, 1.0]])
+    [3.762146516616, 5.030786291781]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc = Tcs[i]
+        tau = 1.0 - (T/Tc)**0.5
+        if T < Tc:
+            x0 = horner(alpha_coeffs[i], tau)
+            a_alpha = x0*x0*ais[i]
+        else:
+            coeffs = alpha_coeffs[i]
+            x = (1.0 + coeffs[len(coeffs) - 2]*tau)
+            a_alpha = ais[i]*x*x
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Mathias_Copeman_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Mathias-Copeman alpha function given the critical
+    temperatures `Tcs`, constants `ais`, and polynomial coefficients
+    `alpha_coeffs` (in order of decreasing power). Above the critical point
+    only the linear coefficient is used. This is the vectorized form of
+    :obj:`Mathias_Copeman_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \left[1 + \sum_{k} c_k\left(1 - \sqrt{T_r}\right)^k
+        \right]^2
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Polynomial coefficients of the alpha function of each component,
+        in order of decreasing power and ending with 1, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Mathias_Copeman_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729],
+    ...     alpha_coeffs=[[0.2, -0.1, 0.8, 1.0], [0.3, -0.2, 0.9, 1.0]])
+    ([3.762146516616, 5.030786291781], [-0.006408980000077, -0.008764235237001], [1.695015226164e-05, 2.298608321949e-05])
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        a = ais[i]
+        Tc = Tcs[i]
+        rt = (T/Tc)**0.5
+        tau = 1.0 - rt
+        if T < Tc:
+            x0, x1, x2 = horner_and_der2(alpha_coeffs[i], tau)
+            a_alpha = x0*x0*a
+            da_alpha_dT = -a*(rt*x0*x1/T)
+            d2a_alpha_dT2 = a*((x0*x2/Tc + x1*x1/Tc + rt*x0*x1/T)/(2.0*T))
+        else:
+            coeffs = alpha_coeffs[i]
+            c1 = coeffs[len(coeffs) - 2]
+            x0 = 1.0/T
+            x1 = 1.0/Tc
+            x3 = c1*(rt - 1.0) - 1.0
+            x4 = x0*rt*x3
+            a_alpha = a*x3*x3
+            da_alpha_dT = a*c1*x4
+            d2a_alpha_dT2 = a*0.5*c1*x0*(c1*x1 - x4)
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Twu91_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Twu et al.
+    (1991) given the critical temperatures `Tcs`, constants `ais`, and
+    coefficients `alpha_coeffs`. Three coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Twu91_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \left(\frac{T}{T_{c,i}}\right)^{c_{3} \left(c_{2}
+        - 1\right)} e^{c_{1} \left(- \left(\frac{T}{T_{c,i}}
+        \right)^{c_{2} c_{3}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Twu91_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.3, 0.87, 1.9], [0.33, 0.85, 2.0]])
+    [3.649267240801, 4.95701436298]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        coeffs = alpha_coeffs[i]
+        c0, c1, c2 = coeffs[0], coeffs[1], coeffs[2]
+        Tr = T/Tcs[i]
+        a_alphas[i] = ais[i]*(Tr**(c2*(c1 - 1.0))*exp(c0*(1.0 - (Tr)**(c1*c2))))
+    return a_alphas
+
+def Twu91_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Twu et al. (1991) given the
+    critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs`. Three coefficients are needed for each component. This
+    is the vectorized form of
+    :obj:`Twu91_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \left(\frac{T}{T_{c,i}}\right)^{c_{3} \left(c_{2}
+        - 1\right)} e^{c_{1} \left(- \left(\frac{T}{T_{c,i}}
+        \right)^{c_{2} c_{3}} + 1\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Twu91_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.3, 0.87, 1.9], [0.33, 0.85, 2.0]])
+    ([3.649267240801, 4.95701436298], [-0.005533469608013, -0.008367569940629], [1.290115517718e-05, 2.26900951853e-05])
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    T_inv = 1.0/T
+    for i in range(N):
+        coeffs = alpha_coeffs[i]
+        c0, c1, c2 = coeffs[0], coeffs[1], coeffs[2]
+        Tr = T/Tcs[i]
+
+        x1 = c1 - 1.0
+        x2 = c2*x1
+        x3 = c1*c2
+        x4 = Tr**x3
+        x5 = ais[i]*Tr**x2*exp(-c0*(x4 - 1.0))
+        x6 = c0*x4
+        x7 = c1*x6
+        x8 = c2*x5
+        x9 = c1*c1*c2
+
+        d2a_alpha_dT2 = (x8*(c0*c0*x4*x4*x9 - c1 + c2*x1*x1
+                             - 2.0*x2*x7 - x6*x9 + x7 + 1.0)*T_inv*T_inv)
+        a_alphas[i] = x5
+        da_alpha_dTs[i] = x8*(x1 - x7)*T_inv
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Soave_79_a_alphas_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Soave (1979)
+    given the critical temperatures `Tcs`, constants `ais`, and coefficients
+    `alpha_coeffs` (`M` and `N` for each component). This is the vectorized
+    form of :obj:`Soave_79_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = 1 + (1 - T_r)(M + \frac{N}{T_r})
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Soave_79_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8, 0.1], [0.9, 0.12]])
+    [3.759492077258, 5.046752611859]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        coeffs = alpha_coeffs[i]
+        M, N_coeff = coeffs[0], coeffs[1]
+        Tr = T/Tcs[i]
+        a_alphas[i] = ais[i]*(1.0 + (1.0 - Tr)*(M + N_coeff/Tr))
+    return a_alphas
+
+def Soave_79_a_alpha_and_derivatives_vectorized(T, Tcs, ais, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Soave (1979) given the critical
+    temperatures `Tcs`, constants `ais`, and coefficients `alpha_coeffs`
+    (`M` and `N` for each component). This is the vectorized form of
+    :obj:`Soave_79_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = 1 + (1 - T_r)(M + \frac{N}{T_r})
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Soave_79_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729], alpha_coeffs=[[0.8, 0.1], [0.9, 0.12]])
+    ([3.759492077258, 5.046752611859], [-0.005761640809141, -0.008048806173802], [1.0123048e-05, 1.619591626667e-05])
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    T_inv = 1.0/T
+    for i in range(N):
+        a, Tc = ais[i], Tcs[i]
+        coeffs = alpha_coeffs[i]
+        M, N_coeff = coeffs[0], coeffs[1]
+        x0 = 1.0/Tc
+        x1 = T*x0 - 1.0
+        x2 = Tc*T_inv
+        x3 = M + N_coeff*x2
+        x4 = N_coeff*T_inv*T_inv
+        a_alphas[i] = a*(1.0 - x1*x3)
+        da_alpha_dTs[i] = a*(Tc*x1*x4 - x0*x3)
+        d2a_alpha_dT2s[i] = a*(2.0*x4*(1.0 - x1*x2))
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def Chen_Yang_a_alphas_vectorized(T, Tcs, ais, omegas, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms for the alpha function of Hamid and
+    Yang (2017) given the critical temperatures `Tcs`, constants `ais`,
+    acentric factors `omegas`, and coefficients `alpha_coeffs`. Seven
+    coefficients are needed for each component. This is the vectorized form
+    of :obj:`Chen_Yang_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = e^{\left(- c_{3}^{\log{\left (\frac{T}{T_{c,i}} \right )}}
+        + 1\right) \left(- \frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Examples
+    --------
+    >>> Chen_Yang_a_alphas_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729],
+    ...     omegas=[0.3, 0.35], alpha_coeffs=[[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7], [0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.75]])
+    [2.935652640631, 3.890182935246]
+    '''
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc, a, omega = Tcs[i], ais[i], omegas[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3, c4, c5, c6, c7 = coeffs[0], coeffs[1], coeffs[2], coeffs[3], coeffs[4], coeffs[5], coeffs[6]
+        Tr = T/Tc
+        x0 = log(1.0 + (1.0 - sqrt(Tr))*(c5 + omega*(c6 + omega*c7)))
+        a_alpha = a*exp(c4*x0*x0 + (1.0 - Tr)*(c1 + omega*(c2 + omega*c3)))
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def Chen_Yang_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas, alpha_coeffs):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the alpha function of Hamid and Yang (2017) given the
+    critical temperatures `Tcs`, constants `ais`, acentric factors `omegas`,
+    and coefficients `alpha_coeffs`. Seven coefficients are needed for each
+    component. This is the vectorized form of
+    :obj:`Chen_Yang_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = e^{\left(- c_{3}^{\log{\left (\frac{T}{T_{c,i}} \right )}}
+        + 1\right) \left(- \frac{T c_{2}}{T_{c,i}} + c_{1}\right)}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+    alpha_coeffs : list[list[float]]
+        Coefficients of the alpha function of each component, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Examples
+    --------
+    >>> Chen_Yang_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 540.2], ais=[2.6923, 3.3729],
+    ...     omegas=[0.3, 0.35], alpha_coeffs=[[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7], [0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.75]])
+    ([2.935652640631, 3.890182935246], [-0.001383990975715, -0.002638330865738], [2.460987067943e-06, 5.009912546725e-06])
+    '''
+    N = len(Tcs)
+    T_inv = 1.0/T
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a, omega = Tcs[i], ais[i], omegas[i]
+        coeffs = alpha_coeffs[i]
+        c1, c2, c3, c4, c5, c6, c7 = coeffs[0], coeffs[1], coeffs[2], coeffs[3], coeffs[4], coeffs[5], coeffs[6]
+        Tr = T/Tc
+        rt = sqrt(Tr)
+        x0 = c1 + omega*(c2 + omega*c3)
+        x1 = c5 + omega*(c6 + omega*c7)
+        x2 = 1.0 + (1.0 - rt)*x1
+        x3 = log(x2)
+        x4 = 0.5*x1*rt*T_inv/x2
+        a_alpha = a*exp(c4*x3*x3 + (1.0 - Tr)*x0)
+        x5 = -x0/Tc - 2.0*c4*x3*x4
+        da_alpha_dT = a_alpha*x5
+        d2a_alpha_dT2 = a_alpha*(x5*x5 + 2.0*c4*(x4*x4*(1.0 - x3) + 0.5*x3*x4*T_inv))
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+def _TWU_a_alphas_vectorized(T, Tcs, ais, omegas, sub_params, super_params):
+    # Same as `TWU_a_alpha_common` with `full=False`, for every component
+    min_a_alpha = 1e-3
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    for i in range(N):
+        Tc = Tcs[i]
+        Tr = T/Tc
+        if Tr < 5e-3:
+            Tr = 4e-3 + Tr*(1e-3)/5e-3
+        if Tr < 1.0:
+            L0, M0, N0, L1, M1, N1 = sub_params
+        else:
+            L0, M0, N0, L1, M1, N1 = super_params
+        alpha0 = Tr**(N0*(M0-1.))*exp(L0*(1.-Tr**(N0*M0)))
+        alpha1 = Tr**(N1*(M1-1.))*exp(L1*(1.-Tr**(N1*M1)))
+        a_alpha = ais[i]*(alpha0 + omegas[i]*(alpha1 - alpha0))
+        if a_alpha < min_a_alpha:
+            a_alpha = min_a_alpha
+        a_alphas[i] = a_alpha
+    return a_alphas
+
+def _TWU_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas, sub_params, super_params):
+    # Same as `TWU_a_alpha_common` with `full=True, quick=True`, for every component
+    min_a_alpha = 1e-3
+    N = len(Tcs)
+    a_alphas = [0.0]*N
+    da_alpha_dTs = [0.0]*N
+    d2a_alpha_dT2s = [0.0]*N
+    for i in range(N):
+        Tc, a, omega = Tcs[i], ais[i], omegas[i]
+        Ti = T
+        Tr = T/Tc
+        if Tr < 5e-3:
+            Tr = 4e-3 + Tr*(1e-3)/5e-3
+            Ti = Tc*Tr
+        if Tr < 1.0:
+            L0, M0, N0, L1, M1, N1 = sub_params
+        else:
+            L0, M0, N0, L1, M1, N1 = super_params
+        x0 = Tr
+        x1 = M0 - 1
+        x2 = N0*x1
+        x3 = x0**x2
+        x4 = M0*N0
+        x5 = x0**x4
+        x6 = exp(-L0*(x5 - 1.))
+        x7 = x3*x6
+        x8 = M1 - 1.
+        x9 = N1*x8
+        x10 = x0**x9
+        x11 = M1*N1
+        x12 = x0**x11
+        x13 = x2*x7
+        x14 = L0*M0*N0*x3*x5*x6
+        x15 = x13 - x14
+        x16 = exp(-L1*(x12 - 1))
+        x17 = -L1*M1*N1*x10*x12*x16 + x10*x16*x9 - x13 + x14
+        x18 = N0*N0
+        x19 = x18*x3*x6
+        x20 = x1**2*x19
+        x21 = M0**2
+        x22 = L0*x18*x3*x5*x6
+        x23 = x21*x22
+        x24 = 2*M0*x1*x22
+        x25 = L0*L0*x5*x5*x19*x21
+        x26 = N1**2
+        x27 = x10*x16*x26
+        x28 = M1**2
+        x29 = L1*x10*x12*x16*x26
+        x30 = x15 - x20 + x23 + x24 - x25
+        x31 = x28*(x29 - L1*L1*x12*x12*x27) + 2.*M1*x29*x8 - x27*x8*x8 + x17 + x15 - x30
+        Ti_inv = 1.0/Ti
+        a_alpha = a*(x7 + omega*(x10*x16 - x7))
+        da_alpha_dT = a*(omega*x17 + x15)*Ti_inv
+        d2a_alpha_dT2 = -a*(x30 + omega*x31)*Ti_inv*Ti_inv
+        if a_alpha < min_a_alpha:
+            a_alpha = min_a_alpha
+            da_alpha_dT = d2a_alpha_dT2 = 0.0
+        a_alphas[i] = a_alpha
+        da_alpha_dTs[i] = da_alpha_dT
+        d2a_alpha_dT2s[i] = d2a_alpha_dT2
+    return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+
+_TWU_PR_SUBCRITICAL = (0.125283, 0.911807, 1.948150, 0.511614, 0.784054, 2.812520)
+_TWU_PR_SUPERCRITICAL = (0.401219, 4.963070, -0.2, 0.024955, 1.248089, -8.)
+_TWU_SRK_SUBCRITICAL = (0.141599, 0.919422, 2.496441, 0.500315, 0.799457, 3.291790)
+_TWU_SRK_SUPERCRITICAL = (0.441411, 6.500018, -0.20, 0.032580,  1.289098, -8.0)
+
+def TwuPR95_a_alphas_vectorized(T, Tcs, ais, omegas):
+    r'''Calculates the `a_alpha` terms for the Twu (1995) alpha function
+    fit to the Peng-Robinson EOS given the critical temperatures `Tcs`, constants
+    `ais`, and acentric factors `omegas`. This is the vectorized form of
+    :obj:`TwuPR95_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \alpha^{(0)} + \omega(\alpha^{(1)}-\alpha^{(0)})
+
+    .. math::
+        \alpha^{(i)} = T_r^{N(M-1)}\exp[L(1-T_r^{NM})]
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Notes
+    -----
+    The same low-temperature adjustment and lower limit on `a_alpha` as
+    :obj:`TWU_a_alpha_common` are applied.
+
+    Examples
+    --------
+    >>> TwuPR95_a_alphas_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.6923, 0.2488], omegas=[0.3, 0.008])
+    [3.805212913993, 0.2000520848303]
+    '''
+    return _TWU_a_alphas_vectorized(T, Tcs, ais, omegas, _TWU_PR_SUBCRITICAL,
+                                    _TWU_PR_SUPERCRITICAL)
+
+def TwuPR95_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Twu (1995) alpha function fit to the Peng-Robinson EOS given
+    the critical temperatures `Tcs`, constants `ais`, and acentric factors
+    `omegas`. This is the vectorized form of
+    :obj:`TwuPR95_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \alpha^{(0)} + \omega(\alpha^{(1)}-\alpha^{(0)})
+
+    .. math::
+        \alpha^{(i)} = T_r^{N(M-1)}\exp[L(1-T_r^{NM})]
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Notes
+    -----
+    The same low-temperature adjustment and lower limit on `a_alpha` as
+    :obj:`TWU_a_alpha_common` are applied.
+
+    Examples
+    --------
+    >>> TwuPR95_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.6923, 0.2488], omegas=[0.3, 0.008])
+    ([3.805212913993, 0.2000520848303], [-0.006983397005662, -0.0003632762719901], [2.361947665028e-05, 1.331747950775e-06])
+    '''
+    return _TWU_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas, _TWU_PR_SUBCRITICAL,
+                                                   _TWU_PR_SUPERCRITICAL)
+
+def TwuSRK95_a_alphas_vectorized(T, Tcs, ais, omegas):
+    r'''Calculates the `a_alpha` terms for the Twu (1995) alpha function
+    fit to the SRK EOS given the critical temperatures `Tcs`, constants
+    `ais`, and acentric factors `omegas`. This is the vectorized form of
+    :obj:`TwuSRK95_a_alpha.a_alpha_pure`.
+
+    .. math::
+        \alpha = \alpha^{(0)} + \omega(\alpha^{(1)}-\alpha^{(0)})
+
+    .. math::
+        \alpha^{(i)} = T_r^{N(M-1)}\exp[L(1-T_r^{NM})]
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+
+    Notes
+    -----
+    The same low-temperature adjustment and lower limit on `a_alpha` as
+    :obj:`TWU_a_alpha_common` are applied.
+
+    Examples
+    --------
+    >>> TwuSRK95_a_alphas_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.6923, 0.2488], omegas=[0.3, 0.008])
+    [3.976388203526, 0.1831072697179]
+    '''
+    return _TWU_a_alphas_vectorized(T, Tcs, ais, omegas, _TWU_SRK_SUBCRITICAL,
+                                    _TWU_SRK_SUPERCRITICAL)
+
+def TwuSRK95_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas):
+    r'''Calculates the `a_alpha` terms and their first two temperature
+    derivatives for the Twu (1995) alpha function fit to the SRK EOS given
+    the critical temperatures `Tcs`, constants `ais`, and acentric factors
+    `omegas`. This is the vectorized form of
+    :obj:`TwuSRK95_a_alpha.a_alpha_and_derivatives_pure`.
+
+    .. math::
+        \alpha = \alpha^{(0)} + \omega(\alpha^{(1)}-\alpha^{(0)})
+
+    .. math::
+        \alpha^{(i)} = T_r^{N(M-1)}\exp[L(1-T_r^{NM})]
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    Tcs : list[float]
+        Critical temperatures of components, [K]
+    ais : list[float]
+        `a` parameters of cubic EOS, [Pa*m^6/mol^2]
+    omegas : list[float]
+        Acentric factors of components, [-]
+
+    Returns
+    -------
+    a_alphas : list[float]
+        Pure component `a_alpha` terms in the cubic EOS, [Pa*m^6/mol^2]
+    da_alpha_dTs : list[float]
+        First temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K)]
+    d2a_alpha_dT2s : list[float]
+        Second temperature derivative of pure component `a_alpha`,
+        [Pa*m^6/(mol^2*K^2)]
+
+    Notes
+    -----
+    The same low-temperature adjustment and lower limit on `a_alpha` as
+    :obj:`TWU_a_alpha_common` are applied.
+
+    Examples
+    --------
+    >>> TwuSRK95_a_alpha_and_derivatives_vectorized(300.0, Tcs=[507.6, 190.56], ais=[2.6923, 0.2488], omegas=[0.3, 0.008])
+    ([3.976388203526, 0.1831072697179], [-0.007788665164957, -0.0004809026235816], [2.45850091094e-05, 2.0463116665e-06])
+    '''
+    return _TWU_a_alpha_and_derivatives_vectorized(T, Tcs, ais, omegas, _TWU_SRK_SUBCRITICAL,
+                                                   _TWU_SRK_SUPERCRITICAL)
+
 def TWU_a_alpha_common(T, Tc, omega, a, full=True, quick=True, method='PR'):
     r'''Function to calculate `a_alpha` and optionally its first and second
     derivatives for the TWUPR or TWUSRK EOS. Returns 'a_alpha', and
@@ -1242,6 +3980,12 @@ class Poly_a_alpha(object):
         '''
         return horner(self.alpha_coeffs, T)
 
+    def a_alphas_vectorized(self, T):
+        return Poly_a_alphas_vectorized(T, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Poly_a_alpha_and_derivatives_vectorized(T, self.alpha_coeffs)
+
 class Soave_1972_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1277,6 +4021,12 @@ class Soave_1972_a_alpha(a_alpha_base):
         a_alpha = a*(c1*(-sqrt(T/Tc) + 1) + 1)**2
         return a_alpha
 
+    def a_alphas_vectorized(self, T):
+        return Soave_1972_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Soave_1972_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 class Heyen_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1308,6 +4058,12 @@ class Heyen_a_alpha(a_alpha_base):
         a_alpha = a*exp(c1*(1 -(T/Tc)**c2))
         return a_alpha
 
+    def a_alphas_vectorized(self, T):
+        return Heyen_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Heyen_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 class Harmens_Knapp_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1338,6 +4094,12 @@ class Harmens_Knapp_a_alpha(a_alpha_base):
         a_alpha = a*(c1*(-sqrt(T/Tc) + 1) - c2*(1 - Tc/T) + 1)**2
         return a_alpha
 
+    def a_alphas_vectorized(self, T):
+        return Harmens_Knapp_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Harmens_Knapp_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 class Mathias_1983_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1371,6 +4133,12 @@ class Mathias_1983_a_alpha(a_alpha_base):
         Tr = T/Tc
         return a*(1 + c1*(1-sqrt(Tr)) -c2*(1-Tr)*(0.7-Tr))**2
 
+    def a_alphas_vectorized(self, T):
+        return Mathias_1983_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Mathias_1983_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 class Mathias_Copeman_untruncated_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1403,51 +4171,14 @@ class Mathias_Copeman_untruncated_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(c1*(-sqrt(T/Tc) + 1) + c2*(-sqrt(T/Tc) + 1)**2 + c3*(-sqrt(T/Tc) + 1)**3 + 1)**2
 
-
-class Mathias_Copeman_a_alpha(a_alpha_base):
-
     def a_alphas_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas = []
-        for i in range(self.N):
-            tau = 1.0 - (T/Tcs[i])**0.5
-            if T < Tcs[i]:
-                x0 = horner(alpha_coeffs[i], tau)
-                a_alpha = x0*x0*ais[i]
-            else:
-                x = (1.0 + alpha_coeffs[i][-2]*tau)
-                a_alpha = ais[i]*x*x
-            a_alphas.append(a_alpha)
-        return a_alphas
+        return Mathias_Copeman_untruncated_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [], [], []
-        for i in range(self.N):
-            a = ais[i]
-            Tc = Tcs[i]
-            rt = (T/Tc)**0.5
-            tau = 1.0 - rt
-            if T < Tc:
-                x0, x1, x2 = horner_and_der2(alpha_coeffs[i], tau)
-                a_alpha = x0*x0*a
-                da_alpha_dT = -a*(rt*x0*x1/T)
-                d2a_alpha_dT2 = a*((x0*x2/Tc + x1*x1/Tc + rt*x0*x1/T)/(2.0*T))
-            else:
-                c1 = alpha_coeffs[i][-2]
-                x0 = 1.0/T
-                x1 = 1.0/Tc
-                x2 = rt#sqrt(T*x1)
-                x3 = c1*(x2 - 1.0) - 1.0
-                x4 = x0*x2*x3
-                a_alpha = a*x3*x3
-                da_alpha_dT = a*c1*x4
-                d2a_alpha_dT2 = a*0.5*c1*x0*(c1*x1 - x4)
-            a_alphas.append(a_alpha)
-            da_alpha_dTs.append(da_alpha_dT)
-            d2a_alpha_dT2s.append(d2a_alpha_dT2)
-        return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+        return Mathias_Copeman_untruncated_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
 
+
+class Mathias_Copeman_a_alpha(a_alpha_base):
     def a_alpha_pure(self, T):
         Tc = self.Tc
         a = self.a
@@ -1496,6 +4227,12 @@ class Mathias_Copeman_a_alpha(a_alpha_base):
             d2a_alpha_dT2 = 0.5*a*c1*x0*(c1*x1 - x4)
             return a_alpha, da_alpha_dT, d2a_alpha_dT2
 
+    def a_alphas_vectorized(self, T):
+        return Mathias_Copeman_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Mathias_Copeman_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Gibbons_Laughton_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1526,6 +4263,12 @@ class Gibbons_Laughton_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(c1*(T/Tc - 1) + c2*(sqrt(T/Tc) - 1) + 1)
 
+    def a_alphas_vectorized(self, T):
+        return Gibbons_Laughton_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Gibbons_Laughton_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Soave_1984_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1556,6 +4299,12 @@ class Soave_1984_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(c1*(-T/Tc + 1) + c2*(-1 + Tc/T) + 1)
 
+    def a_alphas_vectorized(self, T):
+        return Soave_1984_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Soave_1984_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Yu_Lu_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1586,6 +4335,12 @@ class Yu_Lu_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*10**(c4*(-T/Tc + 1)*(T**2*c3/Tc**2 + T*c2/Tc + c1))
 
+    def a_alphas_vectorized(self, T):
+        return Yu_Lu_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Yu_Lu_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Trebble_Bishnoi_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1613,6 +4368,13 @@ class Trebble_Bishnoi_a_alpha(a_alpha_base):
         c1 = self.alpha_coeffs
         Tc, a = self.Tc, self.a
         return a*exp(c1*(-T/Tc + 1))
+
+    def a_alphas_vectorized(self, T):
+        return Trebble_Bishnoi_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Trebble_Bishnoi_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 class Melhem_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1642,6 +4404,12 @@ class Melhem_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*exp(c1*(-T/Tc + 1) + c2*(-sqrt(T/Tc) + 1)**2)
 
+    def a_alphas_vectorized(self, T):
+        return Melhem_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Melhem_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 class Androulakis_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1674,6 +4442,12 @@ class Androulakis_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(c1*(-(T/Tc)**(2/3) + 1) + c2*(-(T/Tc)**(2/3) + 1)**2 + c3*(-(T/Tc)**(2/3) + 1)**3 + 1)
 
+    def a_alphas_vectorized(self, T):
+        return Androulakis_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Androulakis_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 class Schwartzentruber_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate `a_alpha` and its first and second
@@ -1703,6 +4477,12 @@ class Schwartzentruber_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*((c4*(-sqrt(T/Tc) + 1) - (-sqrt(T/Tc) + 1)*(T**2*c3/Tc**2 + T*c2/Tc + c1) + 1)**2)
 
+    def a_alphas_vectorized(self, T):
+        return Schwartzentruber_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Schwartzentruber_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Almeida_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1735,6 +4515,12 @@ class Almeida_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*exp(c1*(-T/Tc + 1)*abs(T/Tc - 1)**(c2 - 1) + c3*(-1 + Tc/T))
 
+    def a_alphas_vectorized(self, T):
+        return Almeida_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Almeida_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Twu91_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1780,14 +4566,7 @@ class Twu91_a_alpha(a_alpha_base):
         return a_alpha
 
     def a_alphas_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas = []
-        for i in range(self.N):
-            coeffs = alpha_coeffs[i]
-            Tr = T/Tcs[i]
-            a_alpha = ais[i]*(Tr**(coeffs[2]*(coeffs[1] - 1.0))*exp(coeffs[0]*(1.0 - (Tr)**(coeffs[1]*coeffs[2]))))
-            a_alphas.append(a_alpha)
-        return a_alphas
+        return Twu91_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
 
     def a_alpha_and_derivatives_vectorized(self, T):
         r'''Method to calculate the pure-component `a_alphas` and their first
@@ -1815,35 +4594,7 @@ class Twu91_a_alpha(a_alpha_base):
             Second temperature derivative of coefficient calculated by
             EOS-specific method, [J^2/mol^2/Pa/K**2]
         '''
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        N = len(ais)
-        a_alphas = [0.0]*N
-        da_alpha_dTs = [0.0]*N
-        d2a_alpha_dT2s = [0.0]*N
-        T_inv = 1.0/T
-        for i in range(N):
-            coeffs = alpha_coeffs[i]
-            c0, c1, c2 = coeffs[0], coeffs[1], coeffs[2]
-            Tr = T/Tcs[i]
-
-            x1 = c1 - 1.0
-            x2 = c2*x1
-            x3 = c1*c2
-            x4 = Tr**x3
-            x5 = ais[i]*Tr**x2*exp(-c0*(x4 - 1.0))
-            x6 = c0*x4
-            x7 = c1*x6
-            x8 = c2*x5
-            x9 = c1*c1*c2
-
-            d2a_alpha_dT2 = (x8*(c0*c0*x4*x4*x9 - c1 + c2*x1*x1
-                                 - 2.0*x2*x7 - x6*x9 + x7 + 1.0)*T_inv*T_inv)
-            a_alphas[i] = x5
-            da_alpha_dTs[i] = x8*(x1 - x7)*T_inv
-            d2a_alpha_dT2s[i] = d2a_alpha_dT2
-
-        return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
-
+        return Twu91_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
 
 class Soave_93_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1873,6 +4624,12 @@ class Soave_93_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(c1*(-T/Tc + 1) + c2*(-sqrt(T/Tc) + 1)**2 + 1)
 
+    def a_alphas_vectorized(self, T):
+        return Soave_93_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Soave_93_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Gasem_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1904,6 +4661,12 @@ class Gasem_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(exp((-(T/Tc)**c3 + 1)*(T*c2/Tc + c1)))
 
+    def a_alphas_vectorized(self, T):
+        return Gasem_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Gasem_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Coquelet_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1938,6 +4701,12 @@ class Coquelet_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(exp(c1*(-T/Tc + 1)*(c2*(-sqrt(T/Tc) + 1)**2 + c3*(-sqrt(T/Tc) + 1)**3 + 1)**2))
 
+    def a_alphas_vectorized(self, T):
+        return Coquelet_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Coquelet_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Haghtalab_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1969,6 +4738,12 @@ class Haghtalab_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*exp((-c3**log(T/Tc) + 1)*(-T*c2/Tc + c1))
 
+    def a_alphas_vectorized(self, T):
+        return Haghtalab_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Haghtalab_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Saffari_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -1999,6 +4774,12 @@ class Saffari_a_alpha(a_alpha_base):
         Tc, a = self.Tc, self.a
         return a*(exp(T*c1/Tc + c2*log(T/Tc) + c3*(-sqrt(T/Tc) + 1)))
 
+    def a_alphas_vectorized(self, T):
+        return Saffari_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Saffari_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
+
 
 class Chen_Yang_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -2031,6 +4812,12 @@ class Chen_Yang_a_alpha(a_alpha_base):
         Tc, a, omega = self.Tc, self.a, self.omega
         return a*exp(c4*log((-sqrt(T/Tc) + 1)*(c5 + c6*omega + c7*omega**2) + 1)**2 + (-T/Tc + 1)*(c1 + c2*omega + c3*omega**2))
 
+    def a_alphas_vectorized(self, T):
+        return Chen_Yang_a_alphas_vectorized(T, self.Tcs, self.ais, self.omegas, self.alpha_coeffs)
+
+    def a_alpha_and_derivatives_vectorized(self, T):
+        return Chen_Yang_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.omegas, self.alpha_coeffs)
+
 class TwuSRK95_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
         r'''Method to calculate :math:`a \alpha` and its first and second
@@ -2132,21 +4919,10 @@ class TwuSRK95_a_alpha(a_alpha_base):
         return TWU_a_alpha_common(T, self.Tc, self.omega, self.a, full=False, quick=True, method='SRK')
 
     def a_alphas_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        return [TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=False, quick=True, method='SRK')
-                for i in range(self.N)]
+        return TwuSRK95_a_alphas_vectorized(T, self.Tcs, self.ais, self.omegas)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        r0, r1, r2 = [], [], []
-        for i in range(self.N):
-            v0, v1, v2 = TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=True, quick=True, method='SRK')
-            r0.append(v0)
-            r1.append(v1)
-            r2.append(v2)
-        return r0, r1, r2
-
-
+        return TwuSRK95_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.omegas)
 
 class TwuPR95_a_alpha(a_alpha_base):
 
@@ -2250,20 +5026,10 @@ class TwuPR95_a_alpha(a_alpha_base):
         return TWU_a_alpha_common(T, self.Tc, self.omega, self.a, full=False, quick=True, method='PR')
 
     def a_alphas_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        return [TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=False, quick=True, method='PR')
-                for i in range(self.N)]
+        return TwuPR95_a_alphas_vectorized(T, self.Tcs, self.ais, self.omegas)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        Tcs, omegas, ais = self.Tcs, self.omegas, self.ais
-        r0, r1, r2 = [], [], []
-        for i in range(self.N):
-            v0, v1, v2 = TWU_a_alpha_common(T, Tcs[i], omegas[i], ais[i], full=True, quick=True, method='PR')
-            r0.append(v0)
-            r1.append(v1)
-            r2.append(v2)
-        return r0, r1, r2
-
+        return TwuPR95_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.omegas)
 
 class Soave_79_a_alpha(a_alpha_base):
     def a_alpha_and_derivatives_pure(self, T):
@@ -2298,31 +5064,10 @@ class Soave_79_a_alpha(a_alpha_base):
         return a*(1.0 + (1.0 - Tr)*(M + N/Tr))
 
     def a_alphas_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        a_alphas = []
-        for i in range(self.N):
-            Tr = T/Tcs[i]
-            M, N = alpha_coeffs[i]
-            a_alphas.append(ais[i]*(1.0 + (1.0 - Tr)*(M + N/Tr)))
-        return a_alphas
+        return Soave_79_a_alphas_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
 
     def a_alpha_and_derivatives_vectorized(self, T):
-        ais, alpha_coeffs, Tcs = self.ais, self.alpha_coeffs, self.Tcs
-        T_inv = 1.0/T
-        a_alphas, da_alpha_dTs, d2a_alpha_dT2s = [], [], []
-        for i in range(self.N):
-            a = ais[i]
-            M, N = alpha_coeffs[i]
-            x0 = 1.0/Tcs[i]
-            x1 = T*x0 - 1.0
-            x2 = Tcs[i]*T_inv
-            x3 = M + N*x2
-            x4 = N*T_inv*T_inv
-
-            a_alphas.append(a*(1.0 - x1*x3))
-            da_alpha_dTs.append(a*(Tcs[i]*x1*x4 - x0*x3))
-            d2a_alpha_dT2s.append(a*(2.0*x4*(1.0 - x1*x2)))
-        return a_alphas, da_alpha_dTs, d2a_alpha_dT2s
+        return Soave_79_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.alpha_coeffs)
 
 
 a_alpha_bases = [Soave_1972_a_alpha, Heyen_a_alpha, Harmens_Knapp_a_alpha, Mathias_1983_a_alpha,
@@ -197,9 +197,10 @@ __all__ = ['GCEOSMIX', 'PRMIX', 'SRKMIX', 'PR78MIX', 'VDWMIX', 'PRSVMIX',
 'eos_mix_list', 'eos_mix_no_coeffs_list', 'SRKMIXTranslated']
 
 import sys
+from functools import wraps
 from cmath import log as clog, atanh as catanh
 
-from fluids.numerics import numpy as np, IS_PYPY, newton_system, broyden2, UnconvergedError, trunc_exp, solve_2_direct
+from fluids.numerics import numpy as np, IS_PYPY, newton_system, broyden2, UnconvergedError, trunc_exp, solve_2_direct, inf
 from fluids.numerics.arrays import det, subset_matrix
 from fluids.constants import R
 
@@ -211,7 +212,8 @@ from chemicals.flash_basic import K_value, Wilson_K_value
 from thermo import utils
 from thermo.eos_mix_methods import (a_alpha_aijs_composition_independent,
     a_alpha_aijs_composition_independent_support_zeros, a_alpha_and_derivatives, a_alpha_and_derivatives_full,
-    a_alpha_quadratic_terms, a_alpha_and_derivatives_quadratic_terms)
+    a_alpha_quadratic_terms, a_alpha_and_derivatives_quadratic_terms, PR_translated_lnphis,
+    SRK_lnphis, SRK_translated_lnphis, VDW_lnphis)
 from thermo.eos_alpha_functions import (TwuPR95_a_alpha, TwuSRK95_a_alpha, Twu91_a_alpha, Mathias_Copeman_a_alpha,
                                     Soave_79_a_alpha, PR_a_alpha_and_derivatives_vectorized, PR_a_alphas_vectorized,
                                     RK_a_alpha_and_derivatives_vectorized, RK_a_alphas_vectorized,
@@ -287,6 +289,44 @@ c2R_PR = PR.c2R
 #    return PR_lnphis(T, P, Z, b, a_alpha, zs, bs, a_alpha_j_rows)
 
 
+class _LazySolutionProperty(object):
+    # Property of a root which is calculated on first access when it was
+    # deferred in `lazy_derivatives` mode. Once calculated (or when set
+    # normally) the value in the instance dictionary takes precedence.
+    def __init__(self, name):
+        self.name = name
+        self.phase = name[-1]
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        phase = self.phase
+        pending = obj.__dict__.get('_lazy_solutions')
+        if pending and phase in pending:
+            GCEOS.set_properties_from_solution(obj, *pending.pop(phase),
+                                               force_l=(phase == 'l'), force_g=(phase == 'g'))
+            return obj.__dict__[self.name]
+        raise AttributeError(self.name)
+
+def _lazy_memoize(method):
+    # Cache the result of a method taking `Z` or `phase` for the life of the
+    # current solution, when the EOS is in `lazy_derivatives` mode.
+    # The cache is reset whenever a new root is set.
+    name = method.__name__
+    @wraps(method)
+    def lazy_method(self, arg):
+        if not self.lazy_derivatives:
+            return method(self, arg)
+        cache = self.__dict__.setdefault('_lazy_cache', {})
+        key = (name, arg)
+        try:
+            return cache[key]
+        except KeyError:
+            cache[key] = value = method(self, arg)
+            return value
+    return lazy_method
+
+
 class GCEOSMIX(GCEOS):
     r'''Class for solving a generic pressure-explicit three-parameter cubic
     equation of state for a mixture. Does not implement any parameters itself;
@@ -306,6 +346,20 @@ class GCEOSMIX(GCEOS):
     multicomponent = True
     scalar = True
 
+    lazy_derivatives = False
+    '''Whether only `a_alpha`, the volumes and the fugacity coefficients are
+    computed when the EOS is solved; when True, the departure properties and
+    temperature and pressure derivatives of each root are computed on first
+    access, and the composition derivatives are memoized. Set on an instance
+    and it propagates through :obj:`to_TP_zs_fast <GCEOSMIX.to_TP_zs_fast>`.
+    '''
+    lazy_solution_props = ('PIP', 'dP_dT', 'dP_dV', 'dV_dT', 'dV_dP', 'dT_dV',
+                           'dT_dP', 'd2P_dT2', 'd2P_dV2', 'd2P_dTdV', 'H_dep',
+                           'S_dep', 'G_dep', 'Cp_dep', 'Cv_dep')
+    '''Tuple of root properties (without the `_l` or `_g` suffix) whose
+    calculation is deferred in `lazy_derivatives` mode.
+    '''
+
     def subset(self, idxs, **state_specs):
         r'''Method to construct a new :obj:`GCEOSMIX` that removes all components
         not specified in the `idxs` argument.
@@ -449,7 +503,116 @@ class GCEOSMIX(GCEOS):
         new.__dict__ = d
         return new
 
-    def to_TP_zs_fast(self, T, P, zs, only_l=False, only_g=False, full_alphas=True):
+    def set_properties_from_solution(self, T, P, V, b, delta, epsilon, a_alpha,
+                                     da_alpha_dT, d2a_alpha_dT2, quick=True,
+                                     force_l=False, force_g=False):
+        r'''Sets the properties of a volume solution; see
+        :obj:`GCEOS.set_properties_from_solution <thermo.eos.GCEOS.set_properties_from_solution>`.
+
+        In :obj:`lazy_derivatives <GCEOSMIX.lazy_derivatives>` mode, only the
+        phase of the root is determined and `V` and `Z` are set; the other
+        properties are calculated the first time one of them is accessed.
+        '''
+        if not self.lazy_derivatives:
+            return GCEOS.set_properties_from_solution(self, T, P, V, b, delta, epsilon, a_alpha,
+                                                      da_alpha_dT, d2a_alpha_dT2, quick=quick,
+                                                      force_l=force_l, force_g=force_g)
+        if force_l or force_g:
+            phase = 'l' if force_l else 'g'
+        else:
+            if self.main_derivatives_and_departures is main_derivatives_and_departures:
+                # Only the terms needed by the phase identification parameter
+                x0 = 1.0/(V - b)
+                x1 = 1.0/(V*(V + delta) + epsilon)
+                x3 = R*T
+                x4 = x0*x0
+                x5 = V + V + delta
+                x6 = x1*x1
+                x7 = a_alpha*x6
+                x17 = x5*x6
+                dP_dT = R*x0 - da_alpha_dT*x1
+                dP_dV = x5*x7 - x3*x4
+                d2P_dV2 = (x7 + x3*x4*x0 - a_alpha*x5*x17*x1)
+                d2P_dV2 += d2P_dV2
+                d2P_dTdV = da_alpha_dT*x17 - R*x4
+            else:
+                dP_dT, dP_dV, _, d2P_dV2, d2P_dTdV, _, _, _ = self.main_derivatives_and_departures(
+                        T, P, V, b, delta, epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2)
+            try:
+                dV_dP = 1.0/dP_dV
+            except:
+                dV_dP = inf
+            PIP = V*(d2P_dTdV*(1./dP_dT) - d2P_dV2*dV_dP)
+            phase = 'l' if PIP > 1.00000000000001 else 'g'
+
+        d = self.__dict__
+        if phase == 'l':
+            if 'H_dep_l' in d:
+                for name in self.lazy_solution_props:
+                    d.pop(name + '_l', None)
+            self.V_l, self.Z_l = V, P*V*R_inv/T
+        else:
+            if 'H_dep_g' in d:
+                for name in self.lazy_solution_props:
+                    d.pop(name + '_g', None)
+            self.V_g, self.Z_g = V, P*V*R_inv/T
+        try:
+            pending = d['_lazy_solutions']
+        except KeyError:
+            d['_lazy_solutions'] = pending = {}
+        pending[phase] = (T, P, V, b, delta, epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2)
+        d['_lazy_cache'] = {}
+        return phase
+
+    def resolve_lazy_derivatives(self):
+        r'''Method to calculate all properties of the roots which were
+        deferred in :obj:`lazy_derivatives <GCEOSMIX.lazy_derivatives>`
+        mode, and clear the memoized composition derivatives. Afterwards the
+        object holds the same attributes as one solved without the lazy mode.
+
+        Examples
+        --------
+        >>> base = PRMIX(T=115, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.5, 0.5], kijs=[[0,0.41],[0.41,0]])
+        >>> base.lazy_derivatives = True
+        >>> eos = base.to_TP_zs_fast(T=115, P=1E6, zs=[0.5, 0.5])
+        >>> 'H_dep_g' in eos.__dict__
+        False
+        >>> eos.H_dep_g
+        -470.18397
+        >>> eos.resolve_lazy_derivatives()
+        >>> 'H_dep_l' in eos.__dict__
+        True
+        '''
+        d = self.__dict__
+        pending = d.pop('_lazy_solutions', None)
+        if pending:
+            for phase, args in pending.items():
+                GCEOS.set_properties_from_solution(self, *args, force_l=(phase == 'l'),
+                                                   force_g=(phase == 'g'))
+        d.pop('_lazy_cache', None)
+
+    def as_JSON(self):
+        r'''Method to create a JSON serialization of the mixture eos
+        which can be stored, and reloaded later. Properties deferred in
+        :obj:`lazy_derivatives <GCEOSMIX.lazy_derivatives>` mode are
+        calculated first.
+
+        Returns
+        -------
+        json_repr : str
+            Json representation, [-]
+
+        Examples
+        --------
+        >>> eos = PRMIX(T=115, P=1E6, Tcs=[126.1, 190.6], Pcs=[33.94E5, 46.04E5], omegas=[0.04, 0.011], zs=[0.5, 0.5], kijs=[[0,0.41],[0.41,0]])
+        >>> PRMIX.from_JSON(eos.as_JSON()).H_dep_g
+        -470.18397
+        '''
+        self.resolve_lazy_derivatives()
+        return GCEOS.as_JSON(self)
+
+    def to_TP_zs_fast(self, T, P, zs, only_l=False, only_g=False, full_alphas=True,
+                      lazy=None):
         r'''Method to construct a new :obj:`GCEOSMIX` instance with the same
         parameters as the existing object. If both instances are at the same
         temperature, `a_alphas` and `da_alpha_dTs` and `d2a_alpha_dT2s` are
@@ -474,6 +637,12 @@ class GCEOSMIX(GCEOS):
         only_g : bool
             When true, if there is a liquid and a vapor root, only the vapor
             root (and properties) will be set.
+        full_alphas : bool
+            Whether or not to calculate the temperature derivatives of
+            `a_alpha`, [-]
+        lazy : bool, optional
+            Whether the new object should be in :obj:`lazy_derivatives <GCEOSMIX.lazy_derivatives>`
+            mode; defaults to the mode of this object, [-]
 
         Returns
         -------
@@ -509,6 +678,11 @@ class GCEOSMIX(GCEOS):
             except:
                 pass
 
+        if lazy is None:
+            lazy = self.lazy_derivatives
+        if lazy:
+            new.lazy_derivatives = True
+
         new.zs = zs
         new.T = T
         new.P = P
@@ -3311,6 +3485,7 @@ class GCEOSMIX(GCEOS):
         d2a_alpha_dT2 = self.d2a_alpha_dT2
         return [2.0*(t - d2a_alpha_dT2) for t in d2a_alpha_dT2_j_rows]
 
+    @_lazy_memoize
     def dV_dzs(self, Z):
         r'''Calculates the molar volume composition derivative
         (where the mole fractions do not sum to 1). Verified numerically.
@@ -3408,6 +3583,7 @@ class GCEOSMIX(GCEOS):
         return [t5*depsilon_dzs[i] - t1*da_alpha_dzs[i] + x11t2*db_dzs[i] + t6*ddelta_dzs[i]
                 for i in range(self.N)]
 
+    @_lazy_memoize
     def dV_dns(self, Z):
         r'''Calculates the molar volume mole number derivatives
         (where the mole fractions sum to 1). No specific formula is implemented
@@ -3703,6 +3879,7 @@ class GCEOSMIX(GCEOS):
         '''
         return dxs_to_dn_partials(self.dZ_dzs(Z), self.zs, Z)
 
+    @_lazy_memoize
     def dH_dep_dzs(self, Z):
         r'''Calculates the molar departure enthalpy composition derivative
         (where the mole fractions do not sum to 1). Verified numerically.
@@ -3800,6 +3977,7 @@ class GCEOSMIX(GCEOS):
             dH_dzs.append(value)
         return dH_dzs
 
+    @_lazy_memoize
     def dS_dep_dzs(self, Z):
         r'''Calculates the molar departure entropy composition derivative
         (where the mole fractions do not sum to 1). Verified numerically.
@@ -3834,6 +4012,7 @@ class GCEOSMIX(GCEOS):
         T_inv = 1.0/self.T
         return [T_inv*(dH_dep_dzs[i] - dG_dep_dzs[i]) for i in range(self.N)]
 
+    @_lazy_memoize
     def dS_dep_dns(self, Z):
         r'''Calculates the molar departure entropy mole number derivatives
         (where the mole fractions sum to 1). No specific formula is implemented
@@ -4068,6 +4247,7 @@ class GCEOSMIX(GCEOS):
 
 
 
+    @_lazy_memoize
     def dH_dep_dns(self, Z):
         r'''Calculates the molar departure enthalpy mole number derivatives
         (where the mole fractions sum to 1). No specific formula is implemented
@@ -4201,6 +4381,7 @@ class GCEOSMIX(GCEOS):
                                           ddelta=self.ddelta_dzs, dVs=self.dV_dzs(Z),
                                           da_alphas=self.da_alpha_dzs, G=False)
 
+    @_lazy_memoize
     def dlnphi_dns(self, Z):
         r'''Calculates the mixture log *fugacity coefficient* mole number
         derivatives (where the mole fractions sum to 1). No specific formula is
@@ -4363,6 +4544,7 @@ class GCEOSMIX(GCEOS):
         dG_dns = self.dG_dep_dns(Z)
         return dns_to_dn_partials(dG_dns, F)
 
+    @_lazy_memoize
     def fugacity_coefficients(self, Z):
         r'''Generic formula for calculating log fugacity coefficients for each
         species in a mixture. Verified numerically. Applicable to all cubic
@@ -4524,6 +4706,7 @@ class GCEOSMIX(GCEOS):
                                      da_alphas=da_alpha_dzs, d2a_alphas=d2a_alpha_dzizjs,
                                      G=False)
 
+    @_lazy_memoize
     def d2lnphi_dninjs(self, Z):
         r'''Calculates the mixture log *fugacity coefficient* second mole
         number derivatives (where the mole fraction sum to 1). No
@@ -4623,6 +4806,7 @@ class GCEOSMIX(GCEOS):
                                      d_deltas=ddelta_dzs, d2_deltas=d2delta_dzizjs,
                                      da_alphas=da_alpha_dzs, d2a_alphas=d2a_alpha_dzizjs,
                                      G=True)
+    @_lazy_memoize
     def dlnphis_dns(self, Z):
         r'''Generic formula for calculating the mole number derivaitves of
         log fugacity coefficients for each species in a mixture. Verified
@@ -4890,6 +5074,7 @@ class GCEOSMIX(GCEOS):
 
 
 
+    @_lazy_memoize
     def d2A_dep_dninjs(self, Z):
         V = Z*self.T*R/self.P
         dV_dns = self.dV_dns(Z)
@@ -5563,6 +5748,7 @@ class GCEOSMIX(GCEOS):
                     self.dV_dep_dzs_l, self.dG_dep_dzs_l, self.dH_dep_dzs_l = dV_dep_dns, dG_dep_dns, dH_dep_dns
                     self.dU_dep_dzs_l, self.dS_dep_dzs_l, self.dA_dep_dzs_l = dU_dep_dns, dS_dep_dns, dA_dep_dns
 
+    @_lazy_memoize
     def dlnphis_dP(self, phase):
         r'''Generic formula for calculating the pressure derivaitve of
         log fugacity coefficients for each species in a mixture. Verified
@@ -5675,6 +5861,7 @@ class GCEOSMIX(GCEOS):
         return dlnphis_dPs
 
 
+    @_lazy_memoize
     def dlnphis_dT(self, phase):
         r'''Generic formula for calculating the temperature derivaitve of
         log fugacity coefficients for each species in a mixture. Verified
@@ -5799,6 +5986,7 @@ class GCEOSMIX(GCEOS):
             dlnphis_dTs.append(dlnphi_dT + dG_dep_dT)
         return dlnphis_dTs
 
+    @_lazy_memoize
     def dlnphis_dzs(self, Z):
         r'''Generic formula for calculating the mole fraction derivaitves of
         log fugacity coefficients for each species in a mixture. Verified
@@ -5827,6 +6015,10 @@ class GCEOSMIX(GCEOS):
         d2ns = d2xs_to_dxdn_partials(d2dxs, self.zs)
         return d2ns
 
+for _prop in GCEOSMIX.lazy_solution_props:
+    for _name in (_prop + '_l', _prop + '_g'):
+        setattr(GCEOSMIX, _name, _LazySolutionProperty(_name))
+
 class EpsilonZeroMixingRules(object):
     @property
     def depsilon_dzs(self):
@@ -6206,6 +6398,9 @@ class IGMIX(EpsilonZeroMixingRules, GCEOSMIX, IG):
     da_alpha_dTs = None
     d2a_alpha_dT2s = None
 
+    # The ideal gas departures are constant properties, never deferred
+    H_dep_g, S_dep_g, G_dep_g, Cp_dep_g = IG.H_dep_g, IG.S_dep_g, IG.G_dep_g, IG.Cp_dep_g
+
     nonstate_constants_specific = ()
 
     def _zeros1d(self):
@@ -6484,6 +6679,7 @@ class IGMIX(EpsilonZeroMixingRules, GCEOSMIX, IG):
     except:
         pass
 
+    @_lazy_memoize
     def fugacity_coefficients(self, Z):
         r'''Calculate and return the fugacity coefficients of the ideal-gas
         phase (0 by definition).
@@ -6500,6 +6696,7 @@ class IGMIX(EpsilonZeroMixingRules, GCEOSMIX, IG):
         '''
         return self.zeros1d
 
+    @_lazy_memoize
     def dlnphis_dT(self, phase):
         r'''Calculate and return the temperature derivative of fugacity
         coefficients of the ideal-gas phase (0 by definition).
@@ -6517,6 +6714,7 @@ class IGMIX(EpsilonZeroMixingRules, GCEOSMIX, IG):
         '''
         return self.zeros1d
 
+    @_lazy_memoize
     def dlnphis_dP(self, phase):
         r'''Calculate and return the pressure derivative of fugacity
         coefficients of the ideal-gas phase (0 by definition).
@@ -6674,6 +6872,31 @@ class RKMIX(EpsilonZeroMixingRules, GCEOSMIX, RK):
             b += bi*zi
         self.b = self.delta = b
 
+    @_lazy_memoize
+    def fugacity_coefficients(self, Z):
+        r'''Literature formula for calculating fugacity coefficients for each
+        species in a mixture. Verified numerically. The RK equation of state
+        has the same functional form as the SRK equation of state, so this is
+        the same formula as :obj:`SRKMIX.fugacity_coefficients`.
+
+        .. math::
+            \ln \hat \phi_i = \frac{B_i}{B}(Z-1) - \ln(Z-B) + \frac{A}{B}
+            \left[\frac{B_i}{B} - \frac{2}{a \alpha}\sum_i y_i(a\alpha)_{ij}
+            \right]\ln\left(1+\frac{B}{Z}\right)
+
+        Parameters
+        ----------
+        Z : float
+            Compressibility of the mixture for a desired phase, [-]
+
+        Returns
+        -------
+        log_phis : float
+            Log fugacity coefficient for each species, [-]
+        '''
+        return SRK_lnphis(self.T, self.P, Z, self.b, self.a_alpha, self.zs,
+                          self.bs, self._a_alpha_j_rows)
+
     def a_alphas_vectorized(self, T):
         r'''Method to calculate the pure-component `a_alphas` for the RK EOS.
         This vectorized implementation is added for extra speed.
@@ -7121,6 +7344,7 @@ class PRMIX(GCEOSMIX, PR):
             d3a_alpha_dT3s.append(v)
         return d3a_alpha_dT3s
 
+    @_lazy_memoize
     def fugacity_coefficients(self, Z):
         r'''Literature formula for calculating fugacity coefficients for each
         species in a mixture. Verified numerically. Applicable to most
@@ -7190,6 +7414,7 @@ class PRMIX(GCEOSMIX, PR):
         else:
             return bs*t51 - x0 - t50*a_alpha_j_rows
 
+    @_lazy_memoize
     def dlnphis_dT(self, phase):
         r'''Formula for calculating the temperature derivaitve of
         log fugacity coefficients for each species in a mixture for the
@@ -7279,6 +7504,7 @@ class PRMIX(GCEOSMIX, PR):
                         for i in range(self.N)]
         return d_lnphis_dTs
 
+    @_lazy_memoize
     def dlnphis_dP(self, phase):
         r'''Generic formula for calculating the pressure derivaitve of
         log fugacity coefficients for each species in a mixture for the
@@ -7474,6 +7700,7 @@ class PRMIX(GCEOSMIX, PR):
         Jfun_partial = nd.Jacobian(lnphis_from_zs, step=1e-4, order=2, method='central')
         return Jfun_partial(zs)
 
+    @_lazy_memoize
     def dlnphis_dzs(self, Z):
         r'''Calculate and return the mole fraction derivaitves of
         log fugacity coefficients for each species in a mixture. This formula
@@ -7990,7 +8217,6 @@ class PRMIXTranslated(PRMIX):
     eos_pure = PRTranslated
     mix_kwargs_to_pure = {'cs': 'c'}
     kwargs_linear = ('cs',)
-    fugacity_coefficients = GCEOSMIX.fugacity_coefficients
     dlnphis_dT = GCEOSMIX.dlnphis_dT
     dlnphis_dP = GCEOSMIX.dlnphis_dP
     d_lnphi_dzs = GCEOSMIX.dlnphis_dzs
@@ -8056,6 +8282,35 @@ class PRMIXTranslated(PRMIX):
         self.delta = 2.0*(c + b0)
         self.epsilon = -b0*b0 + c*(c + b0 + b0) # Very important to be calculated exactly the same way as the other implementation
 
+    @_lazy_memoize
+    def fugacity_coefficients(self, Z):
+        r'''Literature formula for calculating fugacity coefficients for each
+        species in a mixture. Verified numerically. The translated model is
+        the Peng-Robinson equation of state evaluated at :math:`v + c`, so
+        the log fugacity coefficients are those of the untranslated model
+        with a correction for the translation of each component; see
+        :obj:`thermo.eos_mix_methods.PR_translated_lnphis`.
+
+        .. math::
+            \ln \hat \phi_i = \ln \hat \phi_i^0\left(Z + \frac{cP}{RT},
+            b^0\right) - \frac{c_i P}{RT}
+
+        Parameters
+        ----------
+        Z : float
+            Compressibility of the mixture for a desired phase, [-]
+
+        Returns
+        -------
+        log_phis : float
+            Log fugacity coefficient for each species, [-]
+        '''
+        if self.a_alpha == 0.0:
+            # The translated formula divides by `a_alpha`
+            return GCEOSMIX.fugacity_coefficients(self, Z)
+        return PR_translated_lnphis(self.T, self.P, Z, self.b, self.c, self.a_alpha, self.zs,
+                             self.b0s, self.cs, self._a_alpha_j_rows)
+
     @property
     def ddelta_dzs(self):
         r'''Helper method for calculating the composition derivatives of
@@ -8830,6 +9085,7 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
         '''
         return SRK_a_alpha_and_derivatives_vectorized(T, self.Tcs, self.ais, self.ms)
 
+    @_lazy_memoize
     def fugacity_coefficients(self, Z):
         r'''Literature formula for calculating fugacity coefficients for each
         species in a mixture. Verified numerically. Applicable to most
@@ -8877,6 +9133,7 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
         return phis
 
 
+    @_lazy_memoize
     def dlnphis_dT(self, phase):
         r'''Formula for calculating the temperature derivaitve of
         log fugacity coefficients for each species in a mixture for the
@@ -8953,6 +9210,7 @@ class SRKMIX(EpsilonZeroMixingRules, GCEOSMIX, SRK):
             d_lnphis_dTs.append(d_lhphi_dT)
         return d_lnphis_dTs
 
+    @_lazy_memoize
     def dlnphis_dP(self, phase):
         r'''Generic formula for calculating the pressure derivaitve of
         log fugacity coefficients for each species in a mixture for the
@@ -9088,7 +9346,6 @@ class SRKMIXTranslated(SRKMIX):
     For P-V initializations, a numerical solver is used to find T.
 
     '''
-    fugacity_coefficients = GCEOSMIX.fugacity_coefficients
     dlnphis_dT = GCEOSMIX.dlnphis_dT
     dlnphis_dP = GCEOSMIX.dlnphis_dP
     d_lnphi_dzs = GCEOSMIX.dlnphis_dzs
@@ -9153,6 +9410,35 @@ class SRKMIXTranslated(SRKMIX):
         self.delta = c + c + b0
         self.epsilon = c*(b0 + c)
 
+    @_lazy_memoize
+    def fugacity_coefficients(self, Z):
+        r'''Literature formula for calculating fugacity coefficients for each
+        species in a mixture. Verified numerically. The translated model is
+        the SRK equation of state evaluated at :math:`v + c`, so
+        the log fugacity coefficients are those of the untranslated model
+        with a correction for the translation of each component; see
+        :obj:`thermo.eos_mix_methods.SRK_translated_lnphis`.
+
+        .. math::
+            \ln \hat \phi_i = \ln \hat \phi_i^0\left(Z + \frac{cP}{RT},
+            b^0\right) - \frac{c_i P}{RT}
+
+        Parameters
+        ----------
+        Z : float
+            Compressibility of the mixture for a desired phase, [-]
+
+        Returns
+        -------
+        log_phis : float
+            Log fugacity coefficient for each species, [-]
+        '''
+        if self.a_alpha == 0.0:
+            # The translated formula divides by `a_alpha`
+            return GCEOSMIX.fugacity_coefficients(self, Z)
+        return SRK_translated_lnphis(self.T, self.P, Z, self.b, self.c, self.a_alpha, self.zs,
+                              self.b0s, self.cs, self._a_alpha_j_rows)
+
     @property
     def ddelta_dzs(self):
         r'''Helper method for calculating the composition derivatives of
@@ -9865,6 +10151,7 @@ class PSRK(Mathias_Copeman_a_alpha, PSRKMixingRules, SRKMIXTranslated):
     eos_pure = SRKTranslated
     mix_kwargs_to_pure = {'cs': 'c', 'alpha_coeffs': 'alpha_coeffs'}
     kwargs_linear = ('cs', 'alpha_coeffs')
+    fugacity_coefficients = GCEOSMIX.fugacity_coefficients
 
     def __init__(self, Tcs, Pcs, omegas, zs, alpha_coeffs, ge_model,
                  kijs=None, cs=None,
@@ -10216,6 +10503,7 @@ class VDWMIX(EpsilonZeroMixingRules, GCEOSMIX, VDW):
         zeros = [0.0]*self.N
         return self.ais, zeros, zeros
 
+    @_lazy_memoize
     def fugacity_coefficients(self, Z):
         r'''Literature formula for calculating fugacity coefficients for each
         species in a mixture. Verified numerically.
@@ -10241,18 +10529,9 @@ class VDWMIX(EpsilonZeroMixingRules, GCEOSMIX, VDW):
         .. [1] Walas, Stanley M. Phase Equilibria in Chemical Engineering.
            Butterworth-Heinemann, 1985.
         '''
-        phis = []
-        V = Z*R*self.T/self.P
-
-        t1 = log(Z*(1. - self.b/V))
-        t2 = 2.0/(R*self.T*V)
-        t3 = 1.0/(V - self.b)
-        a_alpha = self.a_alpha
-        for ai, bi in zip(self.ais, self.bs):
-            phi = (bi*t3 - t1 - t2*(a_alpha*ai)**0.5)
-            phis.append(phi)
-        return phis
+        return VDW_lnphis(self.T, self.P, Z, self.b, self.a_alpha, self.bs, self.ais)
 
+    @_lazy_memoize
     def dlnphis_dT(self, phase):
         r'''Formula for calculating the temperature derivaitve of
         log fugacity coefficients for each species in a mixture for the
@@ -10314,6 +10593,7 @@ class VDWMIX(EpsilonZeroMixingRules, GCEOSMIX, VDW):
             d_lnphis_dTs.append(d_lhphi_dT)
         return d_lnphis_dTs
 
+    @_lazy_memoize
     def dlnphis_dP(self, phase):
         r'''Generic formula for calculating the pressure derivaitve of
         log fugacity coefficients for each species in a mixture for the
@@ -61,6 +61,30 @@ implemented
 
 .. autofunction:: PR_lnphis
 .. autofunction:: PR_lnphis_fastest
+.. autofunction:: PR_translated_lnphis
+.. autofunction:: PR_translated_lnphis_fastest
+.. autofunction:: SRK_lnphis
+.. autofunction:: SRK_lnphis_fastest
+.. autofunction:: RK_lnphis_fastest
+.. autofunction:: SRK_translated_lnphis
+.. autofunction:: SRK_translated_lnphis_fastest
+.. autofunction:: VDW_lnphis
+.. autofunction:: VDW_lnphis_fastest
+.. autofunction:: lnphis_direct
+
+Reduced Variables
+-----------------
+Components whose rows of binary interaction parameters are identical (such as
+the hydrocarbons of a petroleum fluid, which often only have non-zero
+interaction parameters with a few light gases) can be lumped together when
+evaluating the mixing rules, so that the fugacities of a mixture depend on its
+composition only through a few reduced variables. The cost of these functions
+grows linearly with the number of components.
+
+.. autofunction:: kijs_reduction
+.. autofunction:: reduced_variables
+.. autofunction:: lnphis_reduced
+.. autofunction:: lnphis_direct_reduced
 
 
 '''
@@ -73,7 +97,13 @@ from thermo.eos_volume import volume_solutions_halley
 __all__ = ['a_alpha_aijs_composition_independent',
            'a_alpha_and_derivatives', 'a_alpha_and_derivatives_full',
            'a_alpha_quadratic_terms', 'a_alpha_and_derivatives_quadratic_terms',
-           'PR_lnphis', 'PR_lnphis_fastest']
+           'PR_lnphis', 'PR_lnphis_fastest', 'PR_translated_lnphis',
+           'PR_translated_lnphis_fastest', 'SRK_lnphis', 'SRK_lnphis_fastest',
+           'RK_lnphis_fastest', 'SRK_translated_lnphis',
+           'SRK_translated_lnphis_fastest', 'VDW_lnphis', 'VDW_lnphis_fastest',
+           'lnphis_direct',
+           'lnphis_direct_models', 'kijs_reduction', 'reduced_variables',
+           'lnphis_reduced', 'lnphis_direct_reduced']
 
 R2 = R*R
 R_inv = 1.0/R
@@ -713,18 +743,19 @@ def PR_lnphis(T, P, Z, b, a_alpha, zs, bs, a_alpha_j_rows):
     return lnphis
 
 
-def PR_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots, kappas):
-    # Uses precomputed values
-    # Only creates its own arrays for a_alpha_j_rows and PR_lnphis
-    N = len(bs)
-    b = 0.0
-    for i in range(N):
-        b += bs[i]*zs[i]
-    delta = 2.0*b
-    epsilon = -b*b
+def _real_volume(V):
+    # The solver used by `volume_solutions_halley` at low pressures and
+    # `a_alpha` returns complex roots; only ones which are practically real
+    # are kept
+    if abs(V.imag) > 1e-12*abs(V.real):
+        return 0.0
+    return V.real
 
-    a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, kijs)
+
+def _lnphis_direct_Z(T, P, b, delta, epsilon, a_alpha, l, g):
+    # Solve the cubic and select the liquid-like or gas-like root
     V0, V1, V2 = volume_solutions_halley(T, P, b, delta, epsilon, a_alpha)
+    V0, V1, V2 = _real_volume(V0), _real_volume(V1), _real_volume(V2)
     if l:
         # Prefer liquid, ensure V0 is the smalest root
         if V1 != 0.0:
@@ -740,5 +771,472 @@ def PR_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots, ka
                 V0 = V2
     else:
         raise ValueError("Root must be specified")
-    Z = Z = P*V0/(R*T)
+    return P*V0/(R*T)
+
+
+def PR_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots, kappas):
+    # Uses precomputed values
+    # Only creates its own arrays for a_alpha_j_rows and PR_lnphis
+    N = len(bs)
+    b = 0.0
+    for i in range(N):
+        b += bs[i]*zs[i]
+    delta = 2.0*b
+    epsilon = -b*b
+
+    a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, kijs)
+    Z = _lnphis_direct_Z(T, P, b, delta, epsilon, a_alpha, l, g)
     return PR_lnphis(T, P, Z, b, a_alpha, zs, bs, a_alpha_j_rows)
+
+
+def PR_translated_lnphis(T, P, Z, b, c, a_alpha, zs, b0s, cs, a_alpha_j_rows):
+    r'''Calculate the log fugacity coefficients of a mixture with the
+    volume-translated Peng-Robinson equation of state. The translated model
+    is the original one evaluated at the volume :math:`v + c`, so the
+    original formula of :obj:`PR_lnphis` is used with the untranslated
+    covolumes and a correction is applied for the translation of each
+    component.
+
+    .. math::
+        \ln \hat \phi_i = \ln \hat \phi_i^0\left(Z + \frac{cP}{RT},
+        b^0\right) - \frac{c_i P}{RT}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    Z : float
+        Compressibility of the mixture for the desired phase, [-]
+    b : float
+        Translated covolume of the mixture, [m^3/mol]
+    c : float
+        Volume translation of the mixture, [m^3/mol]
+    a_alpha : float
+        `a_alpha` of the mixture, [J^2/mol^2/Pa]
+    zs : list[float]
+        Mole fractions of each component, [-]
+    b0s : list[float]
+        Untranslated covolume parameters of each component, [m^3/mol]
+    cs : list[float]
+        Volume translation parameters of each component, [m^3/mol]
+    a_alpha_j_rows : list[float]
+        Sums of the mole fractions times the `a_alpha_ij` terms of each
+        component, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    lnphis : list[float]
+        Log fugacity coefficients of each component, [-]
+    '''
+    P_RT = P/(R*T)
+    lnphis = PR_lnphis(T, P, Z + c*P_RT, b + c, a_alpha, zs, b0s, a_alpha_j_rows)
+    for i in range(len(lnphis)):
+        lnphis[i] -= cs[i]*P_RT
+    return lnphis
+
+
+def PR_translated_lnphis_fastest(zs, T, P, kijs, l, g, b0s, cs, a_alphas, a_alpha_roots):
+    N = len(b0s)
+    b0, c = 0.0, 0.0
+    for i in range(N):
+        b0 += b0s[i]*zs[i]
+        c += cs[i]*zs[i]
+    b = b0 - c
+    delta = 2.0*(c + b0)
+    epsilon = -b0*b0 + c*(c + b0 + b0)
+
+    a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, kijs)
+    Z = _lnphis_direct_Z(T, P, b, delta, epsilon, a_alpha, l, g)
+    return PR_translated_lnphis(T, P, Z, b, c, a_alpha, zs, b0s, cs, a_alpha_j_rows)
+
+
+def SRK_lnphis(T, P, Z, b, a_alpha, zs, bs, a_alpha_j_rows):
+    N = len(zs)
+    RT = T*R
+    P_RT = P/RT
+    A = a_alpha*P/(RT*RT)
+    B = b*P_RT
+    A_B = A/B
+    t0 = log(Z - B)
+    t3 = log(1. + B/Z)
+    Z_minus_one_over_B = (Z - 1.0)/B
+    two_over_a_alpha = 2./a_alpha
+    lnphis = [0.0]*N
+    for i in range(N):
+        Bi = bs[i]*P_RT
+        t1 = Bi*Z_minus_one_over_B - t0
+        t2 = A_B*(Bi/B - two_over_a_alpha*a_alpha_j_rows[i])
+        lnphis[i] = t1 + t2*t3
+    return lnphis
+
+
+def SRK_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots, ms):
+    N = len(bs)
+    b = 0.0
+    for i in range(N):
+        b += bs[i]*zs[i]
+
+    a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, kijs)
+    Z = _lnphis_direct_Z(T, P, b, b, 0.0, a_alpha, l, g)
+    return SRK_lnphis(T, P, Z, b, a_alpha, zs, bs, a_alpha_j_rows)
+
+
+def RK_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots):
+    # Same functional form as SRK; only the alpha function differs
+    return SRK_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots, None)
+
+
+def SRK_translated_lnphis(T, P, Z, b, c, a_alpha, zs, b0s, cs, a_alpha_j_rows):
+    r'''Calculate the log fugacity coefficients of a mixture with the
+    volume-translated SRK equation of state, in the same way as
+    :obj:`PR_translated_lnphis`.
+
+    .. math::
+        \ln \hat \phi_i = \ln \hat \phi_i^0\left(Z + \frac{cP}{RT},
+        b^0\right) - \frac{c_i P}{RT}
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    Z : float
+        Compressibility of the mixture for the desired phase, [-]
+    b : float
+        Translated covolume of the mixture, [m^3/mol]
+    c : float
+        Volume translation of the mixture, [m^3/mol]
+    a_alpha : float
+        `a_alpha` of the mixture, [J^2/mol^2/Pa]
+    zs : list[float]
+        Mole fractions of each component, [-]
+    b0s : list[float]
+        Untranslated covolume parameters of each component, [m^3/mol]
+    cs : list[float]
+        Volume translation parameters of each component, [m^3/mol]
+    a_alpha_j_rows : list[float]
+        Sums of the mole fractions times the `a_alpha_ij` terms of each
+        component, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    lnphis : list[float]
+        Log fugacity coefficients of each component, [-]
+    '''
+    P_RT = P/(R*T)
+    lnphis = SRK_lnphis(T, P, Z + c*P_RT, b + c, a_alpha, zs, b0s, a_alpha_j_rows)
+    for i in range(len(lnphis)):
+        lnphis[i] -= cs[i]*P_RT
+    return lnphis
+
+
+def SRK_translated_lnphis_fastest(zs, T, P, kijs, l, g, b0s, cs, a_alphas, a_alpha_roots):
+    N = len(b0s)
+    b0, c = 0.0, 0.0
+    for i in range(N):
+        b0 += b0s[i]*zs[i]
+        c += cs[i]*zs[i]
+    b = b0 - c
+    delta = c + c + b0
+    epsilon = c*(b0 + c)
+
+    a_alpha, a_alpha_j_rows = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, kijs)
+    Z = _lnphis_direct_Z(T, P, b, delta, epsilon, a_alpha, l, g)
+    return SRK_translated_lnphis(T, P, Z, b, c, a_alpha, zs, b0s, cs, a_alpha_j_rows)
+
+
+def VDW_lnphis(T, P, Z, b, a_alpha, bs, a_alphas):
+    N = len(bs)
+    V = Z*R*T/P
+    t1 = log(Z*(1. - b/V))
+    t2 = 2.0/(R*T*V)
+    t3 = 1.0/(V - b)
+    lnphis = [0.0]*N
+    for i in range(N):
+        lnphis[i] = bs[i]*t3 - t1 - t2*(a_alpha*a_alphas[i])**0.5
+    return lnphis
+
+
+def VDW_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots):
+    N = len(bs)
+    b = 0.0
+    for i in range(N):
+        b += bs[i]*zs[i]
+
+    a_alpha = a_alpha_quadratic_terms(a_alphas, a_alpha_roots, T, zs, kijs)[0]
+    Z = _lnphis_direct_Z(T, P, b, 0.0, 0.0, a_alpha, l, g)
+    return VDW_lnphis(T, P, Z, b, a_alpha, bs, a_alphas)
+
+
+lnphis_direct_models = ('PRMIX',)
+
+def lnphis_direct(zs, model, T, P, kijs, l, g, bs, a_alphas, a_alpha_roots):
+    r'''Calculate the log fugacity coefficients of a mixture with one of the
+    equations of state in `lnphis_direct_models`, from only its
+    temperature-dependent pure component terms. This is the common entry
+    point used by the array-based flash kernels in :obj:`thermo.flash`, so
+    they do not depend on the phase objects.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Mole fractions of each component, [-]
+    model : str
+        Name of the equation of state class, [-]
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+    l : bool
+        Whether or not to use the liquid-like volume root, [-]
+    g : bool
+        Whether or not to use the gas-like volume root, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alphas : list[float]
+        Pure component `a_alpha` terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+
+    Returns
+    -------
+    lnphis : list[float]
+        Log fugacity coefficients of each component, [-]
+    '''
+    if model == 'PRMIX':
+        return PR_lnphis_fastest(zs, T, P, kijs, l, g, None, bs, a_alphas, a_alpha_roots, None)
+    raise ValueError("Model not implemented")
+
+
+def kijs_reduction(kijs):
+    r'''Groups the components of a mixture whose rows of binary interaction
+    parameters are identical. Such components also have no interaction
+    parameter between each other, so the attractive term of the mixture
+    depends on their composition only through one sum per group:
+
+    .. math::
+        Q_g = \sum_{i \in g} z_i \sqrt{(a\alpha)_i}
+
+    .. math::
+        a \alpha = \sum_g \sum_h Q_g Q_h (1 - k_{gh})
+
+    This is the reduction method of Hendriks and van Bergen [1]_, for the
+    special case where the matrix of :math:`1 - k_{ij}` is of low rank because
+    of repeated rows. If all of the interaction parameters are zero, there is
+    only one group.
+
+    Parameters
+    ----------
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+
+    Returns
+    -------
+    groups : list[int]
+        Index of the group of each component, [-]
+    one_minus_kijs_groups : list[list[float]]
+        One minus the binary interaction parameters between each group, [-]
+
+    Examples
+    --------
+    >>> kijs_reduction([[0.0, 0.1, 0.1], [0.1, 0.0, 0.0], [0.1, 0.0, 0.0]])
+    ([0, 1, 1], [[1.0, 0.9], [0.9, 1.0]])
+
+    References
+    ----------
+    .. [1] Hendriks, E. M., and A. R. D. Van Bergen. "Application of a
+       Reduction Method to Phase Equilibria Calculations." Fluid Phase
+       Equilibria 74 (1992): 17-34.
+    '''
+    N = len(kijs)
+    groups = [0]*N
+    representatives = []
+    for i in range(N):
+        kijs_i = kijs[i]
+        group = -1
+        for g in range(len(representatives)):
+            kijs_j = kijs[representatives[g]]
+            same = True
+            for k in range(N):
+                if kijs_i[k] != kijs_j[k]:
+                    same = False
+                    break
+            if same:
+                group = g
+                break
+        if group == -1:
+            group = len(representatives)
+            representatives.append(i)
+        groups[i] = group
+    G = len(representatives)
+    one_minus_kijs_groups = [[1.0 - kijs[representatives[g]][representatives[h]] for h in range(G)]
+                             for g in range(G)]
+    return groups, one_minus_kijs_groups
+
+
+def reduced_variables(zs, groups, G, bs, a_alpha_roots):
+    r'''Calculates the reduced variables of a mixture for the groups found by
+    :obj:`kijs_reduction`; these are the sums :math:`Q_g` of each group and
+    the covolume of the mixture.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Mole fractions of each component, [-]
+    groups : list[int]
+        Index of the group of each component, [-]
+    G : int
+        Number of groups, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+
+    Returns
+    -------
+    Qs : list[float]
+        Sums of the mole fractions times `a_alpha_roots` of each group,
+        [J/mol/Pa^0.5]
+    b : float
+        Covolume of the mixture, [m^3/mol]
+    '''
+    Qs = [0.0]*G
+    b = 0.0
+    for i in range(len(zs)):
+        Qs[groups[i]] += zs[i]*a_alpha_roots[i]
+        b += zs[i]*bs[i]
+    return Qs, b
+
+
+def lnphis_reduced(model, T, P, Qs, b, l, g, groups, one_minus_kijs_groups,
+                   bs, a_alpha_roots):
+    r'''Calculate the log fugacity coefficients of a mixture with one of the
+    equations of state in `lnphis_direct_models`, from its reduced variables
+    (see :obj:`reduced_variables`) and only the temperature-dependent pure
+    component terms.
+
+    Parameters
+    ----------
+    model : str
+        Name of the equation of state class, [-]
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    Qs : list[float]
+        Sums of the mole fractions times `a_alpha_roots` of each group,
+        [J/mol/Pa^0.5]
+    b : float
+        Covolume of the mixture, [m^3/mol]
+    l : bool
+        Whether or not to use the liquid-like volume root, [-]
+    g : bool
+        Whether or not to use the gas-like volume root, [-]
+    groups : list[int]
+        Index of the group of each component, [-]
+    one_minus_kijs_groups : list[list[float]]
+        One minus the binary interaction parameters between each group, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+
+    Returns
+    -------
+    lnphis : list[float]
+        Log fugacity coefficients of each component, [-]
+    '''
+    G = len(Qs)
+    N = len(groups)
+    a_alpha = 0.0
+    group_rows = [0.0]*G
+    for k in range(G):
+        one_minus_kijs_k = one_minus_kijs_groups[k]
+        row = 0.0
+        for m in range(G):
+            row += one_minus_kijs_k[m]*Qs[m]
+        group_rows[k] = row
+        a_alpha += Qs[k]*row
+    a_alpha_j_rows = [0.0]*N
+    for i in range(N):
+        a_alpha_j_rows[i] = a_alpha_roots[i]*group_rows[groups[i]]
+
+    if model == 'PRMIX':
+        V0, V1, V2 = volume_solutions_halley(T, P, b, 2.0*b, -b*b, a_alpha)
+        if l:
+            if V1 != 0.0:
+                if V0 > V1 and V1 > b:
+                    V0 = V1
+                if V0 > V2 and V2 > b:
+                    V0 = V2
+        elif g:
+            if V1 != 0.0:
+                if V0 < V1 and V1 > b:
+                    V0 = V1
+                if V0 < V2 and V2 > b:
+                    V0 = V2
+        else:
+            raise ValueError("Root must be specified")
+        Z = P*V0/(R*T)
+        # Only the length of the composition argument is used
+        return PR_lnphis(T, P, Z, b, a_alpha, bs, bs, a_alpha_j_rows)
+    raise ValueError("Model not implemented")
+
+
+def lnphis_direct_reduced(zs, model, T, P, groups, one_minus_kijs_groups, l, g,
+                          bs, a_alphas, a_alpha_roots):
+    r'''Calculate the log fugacity coefficients of a mixture in the same way
+    as :obj:`lnphis_direct`, but with the mixing rules evaluated from the
+    groups of components found by :obj:`kijs_reduction` instead of the full
+    matrix of binary interaction parameters.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Mole fractions of each component, [-]
+    model : str
+        Name of the equation of state class, [-]
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    groups : list[int]
+        Index of the group of each component, [-]
+    one_minus_kijs_groups : list[list[float]]
+        One minus the binary interaction parameters between each group, [-]
+    l : bool
+        Whether or not to use the liquid-like volume root, [-]
+    g : bool
+        Whether or not to use the gas-like volume root, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alphas : list[float]
+        Pure component `a_alpha` terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+
+    Returns
+    -------
+    lnphis : list[float]
+        Log fugacity coefficients of each component, [-]
+
+    Examples
+    --------
+    >>> kijs = [[0.0, 0.1, 0.1], [0.1, 0.0, 0.0], [0.1, 0.0, 0.0]]
+    >>> bs = [2.68e-05, 4.05e-05, 5.63e-05]
+    >>> a_alphas = [0.1405, 0.5452, 1.0815]
+    >>> a_alpha_roots = [v**0.5 for v in a_alphas]
+    >>> groups, one_minus_kijs_groups = kijs_reduction(kijs)
+    >>> lnphis = lnphis_direct_reduced([0.5, 0.3, 0.2], 'PRMIX', 300.0, 1e6, groups, one_minus_kijs_groups, False, True, bs, a_alphas, a_alpha_roots)
+    >>> expect = lnphis_direct([0.5, 0.3, 0.2], 'PRMIX', 300.0, 1e6, kijs, False, True, bs, a_alphas, a_alpha_roots)
+    >>> [abs(a - b) < 1e-12 for a, b in zip(lnphis, expect)]
+    [True, True, True]
+    '''
+    Qs, b = reduced_variables(zs, groups, len(one_minus_kijs_groups), bs, a_alpha_roots)
+    return lnphis_reduced(model, T, P, Qs, b, l, g, groups, one_minus_kijs_groups,
+                          bs, a_alpha_roots)
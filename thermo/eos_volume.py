@@ -71,13 +71,26 @@ Higher-Precision Solvers
 .. autofunction:: volume_solutions_mpmath
 .. autofunction:: volume_solutions_mpmath_float
 
+Batched Solvers
+---------------
+These accept arrays of inputs and return an array of roots with one row of
+three volumes per point; points that need one of the scalar solvers'
+fallbacks are solved individually.
+
+.. autofunction:: volume_solutions_halley_batch
+.. autofunction:: volume_solutions_NR_batch
+.. autofunction:: volume_solutions_fast_batch
+.. autofunction:: volume_solutions_Cardano_batch
+
 '''
 
 from __future__ import division, print_function
 __all__ = ['volume_solutions_mpmath', 'volume_solutions_mpmath_float',
            'volume_solutions_NR', 'volume_solutions_NR_low_P', 'volume_solutions_halley',
            'volume_solutions_fast', 'volume_solutions_Cardano', 'volume_solutions_a1',
-           'volume_solutions_a2', 'volume_solutions_numpy', 'volume_solutions_ideal']
+           'volume_solutions_a2', 'volume_solutions_numpy', 'volume_solutions_ideal',
+           'volume_solutions_halley_batch', 'volume_solutions_NR_batch',
+           'volume_solutions_fast_batch', 'volume_solutions_Cardano_batch']
 
 
 from cmath import sqrt as csqrt
@@ -1107,4 +1120,383 @@ def volume_solutions_ideal(T, P, b=0.0, delta=0.0, epsilon=0.0, a_alpha=0.0):
     >>> volume_solutions_ideal(T=300, P=1e7)
     (0.0002494338785445972, 0.0, 0.0)
     '''
-    return (R*T/P, 0.0, 0.0)
\ No newline at end of file
+    return (R*T/P, 0.0, 0.0)
+
+def _volume_solutions_batch_inputs(T, P, b, delta, epsilon, a_alpha):
+    T, P, b, delta, epsilon, a_alpha = np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                                             for v in (T, P, b, delta, epsilon, a_alpha)])
+    return T.shape, [v.ravel() for v in (T, P, b, delta, epsilon, a_alpha)]
+
+def _volume_solutions_batch_cubic(T, P, b, delta, epsilon, a_alpha):
+    RT_inv = R_inv/T
+    P_RT_inv = P*RT_inv
+    B = etas = b*P_RT_inv
+    deltas = delta*P_RT_inv
+    thetas = a_alpha*P_RT_inv*RT_inv
+    epsilons = epsilon*P_RT_inv*P_RT_inv
+
+    b2 = (deltas - B - 1.0)
+    c2 = (thetas + epsilons - deltas*(B + 1.0))
+    d2 = -(epsilons*(B + 1.0) + thetas*etas)
+    return P_RT_inv, b2, c2, d2
+
+def volume_solutions_halley_batch(T, P, b, delta, epsilon, a_alpha):
+    r'''Batched version of :obj:`volume_solutions_halley`, solving the cubic
+    EOS for the volumes at many points at once. All inputs may be arrays or
+    floats, and are broadcast against each other.
+
+    The initial liquid-like root is solved with Halley's method for all
+    points simultaneously, the cubic is deflated, and the two remaining roots
+    are polished with a single Halley step, exactly as in the scalar
+    function. Points which that function would pass on to
+    :obj:`volume_solutions_NR` (`P < 1e-2` or `a_alpha < 1e-9`) and points
+    whose first Halley solve does not converge are solved one at a time with
+    :obj:`volume_solutions_halley`, so the `NR` and `mpmath` fallbacks still
+    apply per element.
+
+    Parameters
+    ----------
+    T : float or array
+        Temperature, [K]
+    P : float or array
+        Pressure, [Pa]
+    b : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float or array
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float or array
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    Vs : array[float]
+        Three possible molar volumes for each point, with shape
+        `broadcast shape + (3,)`; missing roots are zero, [m^3/mol]
+
+    Examples
+    --------
+    >>> Vs = volume_solutions_halley_batch([299.0, 400.0], 1e6, 0.000108539, 0.000217079, -1.178e-08, [3.8012, 3.2041])
+    >>> Vs.tolist()
+    [[0.000130222, 0.0, 0.0], [0.000156073, 0.00214186, 0.00091931]]
+    '''
+    shape, (T, P, b, delta, epsilon, a_alpha) = _volume_solutions_batch_inputs(T, P, b, delta, epsilon, a_alpha)
+    pts = T.size
+    Vs = np.zeros((pts, 3))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        ideal = a_alpha/(b*(b + delta) + epsilon) + P == P
+        Vs[ideal, 0] = b[ideal] + R*T[ideal]/P[ideal]
+        scalar = ~ideal & ((P < 1e-2) | (a_alpha < 1e-9))
+        halley = ~(ideal | scalar)
+
+        RT = R*T
+        RT_2 = RT + RT
+        a_alpha_2 = a_alpha + a_alpha
+        P_inv = 1.0/P
+        P_RT_inv, b2, c2, d2 = _volume_solutions_batch_cubic(T, P, b, delta, epsilon, a_alpha)
+        RT_P = RT*P_inv
+
+        Vi = -RT_P*d2/c2
+        V = np.where(Vi <= b, b*1.000001, Vi) # avoid a division by zero
+        fval_oldold = np.ones(pts)
+        fval_old = np.zeros(pts)
+        active = halley.copy()
+        converged = np.zeros(pts, dtype=bool)
+        for j in range(50):
+            if not active.any():
+                break
+            x0_inv = 1.0/(V - b)
+            x1_inv = 1.0/(V*(V + delta) + epsilon)
+            x2 = V + V + delta
+            fval = RT*x0_inv - P - a_alpha*x1_inv
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alpha*x1_inv2
+            fder = x2*x3 - RT*x0_inv2
+            fder2 = RT_2*x0_inv2*x0_inv - a_alpha_2*x2*x2*x1_inv2*x1_inv + x3 + x3
+
+            fder_inv = 1.0/fder
+            step = fval*fder_inv
+            rel_err = np.abs(fval*P_inv)
+            step_den = 1.0 - 0.5*step*fder2*fder_inv
+            update = active & (step_den != 0.0)
+            V = np.where(update, V - step/step_den, V)
+
+            done = update & ((rel_err < 3e-15) | (V == Vi) | (fval_old == fval)
+                             | (fval == fval_oldold) | ((j > 10) & (rel_err < 1e-12)))
+            if j != 49:
+                converged |= done
+            active &= ~done
+            fval_oldold = np.where(update, fval_old, fval_oldold)
+            fval_old = np.where(update, fval, fval_old)
+
+        # Deflate the cubic with the converged root and polish the other two roots
+        x0 = V*P_RT_inv
+        F = b2 + x0
+        G = -d2/x0
+        D = F*F - 4.0*G
+        D_root = np.sqrt(np.where(D < 0.0, 0.0, D))
+        x1 = np.where(D < 0.0, 0.0, 0.5*(D_root - F))
+        x2 = np.where(D < 0.0, 0.0, 0.5*(-F - D_root))
+        one_root = x1 == 0.0
+        Vs_roots = [V]
+        for x in (x1, x2):
+            Vj = x*RT_P
+            x0_inv = 1.0/(Vj - b)
+            t90 = Vj*(Vj + delta) + epsilon
+            x1_inv = 1.0/t90
+            x2 = Vj + Vj + delta
+            fval = -P + RT*x0_inv - a_alpha*x1_inv
+            x0_inv2 = x0_inv*x0_inv
+            x1_inv2 = x1_inv*x1_inv
+            x3 = a_alpha*x1_inv2
+            fder = x2*x3 - RT*x0_inv2
+            fder2 = RT_2*x0_inv2*x0_inv - a_alpha_2*x2*x2*x1_inv2*x1_inv + x3 + x3
+            fder_inv = 1.0/fder
+            step = fval*fder_inv
+            # Roots where `t90` is zero are not polished, as in the scalar function
+            Vj = np.where(t90 != 0.0, Vj - step/(1.0 - 0.5*step*fder2*fder_inv), Vj)
+            Vs_roots.append(np.where(one_root, 0.0, Vj))
+
+    converged &= halley
+    for k in range(3):
+        Vs[converged, k] = Vs_roots[k][converged]
+
+    for i in np.nonzero(~(ideal | converged))[0].tolist():
+        Vs[i] = [Vj.real for Vj in volume_solutions_halley(float(T[i]), float(P[i]), float(b[i]),
+                                                           float(delta[i]), float(epsilon[i]), float(a_alpha[i]))]
+    return Vs.reshape(shape + (3,))
+
+def volume_solutions_fast_batch(T, P, b, delta, epsilon, a_alpha):
+    r'''Batched version of :obj:`volume_solutions_fast`, evaluating the same
+    explicit formula in complex arithmetic for many points at once. All inputs
+    may be arrays or floats, and are broadcast against each other. The
+    numerical issues of the analytical formula are unchanged; points where
+    the formula does not produce finite values are evaluated again one at a
+    time with :obj:`volume_solutions_fast`.
+
+    Parameters
+    ----------
+    T : float or array
+        Temperature, [K]
+    P : float or array
+        Pressure, [Pa]
+    b : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float or array
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float or array
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    Vs : array[complex]
+        Three possible molar volumes for each point, with shape
+        `broadcast shape + (3,)`, [m^3/mol]
+    '''
+    shape, (T, P, b, delta, epsilon, a_alpha) = _volume_solutions_batch_inputs(T, P, b, delta, epsilon, a_alpha)
+    x24 = 1.73205080756887729352744634151j + 1.
+    x24_inv = 0.25 - 0.433012701892219323381861585376j
+    x26 = -1.73205080756887729352744634151j + 1.
+    x26_inv = 0.25 + 0.433012701892219323381861585376j
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        x0 = 1./P
+        x1 = P*b
+        x2 = R*T
+        x3 = P*delta
+        x4 = x1 + x2 - x3
+        x5 = x0*x4
+        x6 = a_alpha*b
+        x7 = epsilon*x1
+        x8 = epsilon*x2
+        x9 = x0*x0
+        x10 = P*epsilon
+        x11 = delta*x1
+        x12 = delta*x2
+        x17 = -x4
+        x17_2 = x17*x17
+        x18 = x0*x17_2
+        tm1 = x12 - a_alpha + (x11 - x10)
+        t0 = x6 + x7 + x8
+        t1 = (3.0*tm1 + x18)
+        t2 = (9.*x0*x17*tm1 + 2.0*x17_2*x17*x9 - 27.*t0)
+
+        x4x9 = x4*x9
+        x19 = ((-13.5*x0*t0 - 4.5*x4x9*tm1 - x4*x4x9*x5
+                + 0.5*np.sqrt((x9*(-4.*x0*t1*t1*t1 + t2*t2)) + 0.0j)) + 0.0j)**third
+
+        x20 = -t1/x19
+        x22 = x5 + x5
+        x25 = 4.*x0*x20
+        Vs = np.stack([(x0*x20 - x19 + x5)*third,
+                       (x19*x24 + x22 - x25*x24_inv)*sixth,
+                       (x19*x26 + x22 - x25*x26_inv)*sixth], axis=-1)
+    for i in np.nonzero(~np.isfinite(Vs).all(axis=1))[0].tolist():
+        try:
+            Vs[i] = volume_solutions_fast(float(T[i]), float(P[i]), float(b[i]), float(delta[i]),
+                                          float(epsilon[i]), float(a_alpha[i]))
+        except (ZeroDivisionError, ValueError, OverflowError):
+            Vs[i] = np.nan
+    return Vs.reshape(shape + (3,))
+
+def volume_solutions_Cardano_batch(T, P, b, delta, epsilon, a_alpha):
+    r'''Batched version of :obj:`volume_solutions_Cardano`, solving the
+    reduced cubic for many points at once with the same branches as
+    :obj:`fluids.numerics.roots_cubic` - the real-radical formula when there
+    is one real root, and the complex or trigonometric formulas when there
+    are three. All inputs may be arrays or floats, and are broadcast against
+    each other. Points where the formulas do not produce finite values are
+    evaluated again one at a time with :obj:`volume_solutions_Cardano`.
+
+    Parameters
+    ----------
+    T : float or array
+        Temperature, [K]
+    P : float or array
+        Pressure, [Pa]
+    b : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float or array
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float or array
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    Vs : array[complex]
+        Three possible molar volumes for each point, with shape
+        `broadcast shape + (3,)`, [m^3/mol]
+    '''
+    shape, (T, P, b, delta, epsilon, a_alpha) = _volume_solutions_batch_inputs(T, P, b, delta, epsilon, a_alpha)
+    root_three = 1.7320508075688772
+    one_27 = 1.0/27.0
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        _, b2, c, d = _volume_solutions_batch_cubic(T, P, b, delta, epsilon, a_alpha)
+        f = c - b2*b2*third
+        g = ((2.0*(b2*b2*b2)) - (9.0*b2*c) + (27.0*d))*one_27
+        h = (0.25*(g*g) + (f*f*f)*one_27)
+        roots = np.zeros(T.shape + (3,), dtype=complex)
+
+        # One real root and two complex conjugates
+        root_h = np.sqrt(np.where(h > 0.0, h, 0.0))
+        S = np.cbrt(-0.5*g + root_h)
+        U = np.cbrt(-0.5*g - root_h)
+        SU = S + U
+        b_3a = b2*third
+        t1 = -0.5*SU - b_3a
+        t2 = (S - U)*(0.5j*root_three)
+        one_real = h > 0.0
+        roots[one_real, 0] = (SU - b_3a)[one_real]
+        roots[one_real, 1] = (t1 + t2)[one_real]
+        roots[one_real, 2] = (t1 - t2)[one_real]
+
+        # Three real roots, complex formula
+        choice_term = -18.0*b2*c*d + 4.0*c*c*c + 4.0*b2*b2*b2*d - b2*b2*c*c + 27.0*d*d
+        three_complex = ~one_real & ((np.abs(choice_term) > 1e-12) | (np.abs(b2 + 1.0) < 1e-7))
+        t20 = np.sqrt(choice_term + 0.0j)
+        t31 = (36.0*c*b2 + 12.0*root_three*t20 - 108.0*d - 8.0*b2*b2*b2 + 0.0j)**third
+        t40 = (3.0*c - b2*b2)/t31
+        t50 = -t31/12.0 + t40*third - b_3a
+        t51 = 0.5j*root_three*(t31*sixth + 2.0*third*t40)
+        roots[three_complex, 0] = (t31*sixth - 2.0*third*t40 - b_3a)[three_complex].real
+        roots[three_complex, 1] = (t50 + t51)[three_complex].real
+        roots[three_complex, 2] = (t50 - t51)[three_complex].real
+
+        # Three real roots, trigonometric formula
+        three_trig = ~(one_real | three_complex)
+        i_term = np.sqrt(np.where(three_trig, 0.25*g*g - h, 0.0))
+        j_term = np.cbrt(i_term)
+        k = np.arccos(np.clip(-0.5*g/i_term, -1.0, 1.0))
+        M = np.cos(k*third)
+        N = root_three*np.sin(k*third)
+        P_term = -b_3a
+        roots[three_trig, 0] = (2.0*j_term*M + P_term)[three_trig]
+        roots[three_trig, 1] = (P_term - j_term*(M + N))[three_trig]
+        roots[three_trig, 2] = (P_term - j_term*(M - N))[three_trig]
+
+        # Triple root
+        triple = (h == 0.0) & (g == 0.0) & (f == 0.0)
+        roots[triple, :] = -np.cbrt(d[triple])[:, None]
+
+        Vs = roots*(R*T/P)[:, None]
+    for i in np.nonzero(~np.isfinite(Vs).all(axis=1))[0].tolist():
+        try:
+            Vs[i] = volume_solutions_Cardano(float(T[i]), float(P[i]), float(b[i]), float(delta[i]),
+                                             float(epsilon[i]), float(a_alpha[i]))
+        except (ZeroDivisionError, ValueError, OverflowError):
+            Vs[i] = np.nan
+    return Vs.reshape(shape + (3,))
+
+def volume_solutions_NR_batch(T, P, b, delta, epsilon, a_alpha):
+    r'''Batched version of :obj:`volume_solutions_NR`. The analytical
+    initial guesses of :obj:`volume_solutions_Cardano_batch` are refined with
+    Newton-Raphson iterations for all points at once, and the same acceptance
+    checks as the scalar solver are applied to each point. Points which fail
+    those checks, points with `P < 1e-2` and points with `a_alpha = 0` are
+    solved one at a time with :obj:`volume_solutions_NR`, which continues
+    with its other analytical guesses and finally falls back to `mpmath`.
+    All inputs may be arrays or floats, and are broadcast against each other.
+
+    Parameters
+    ----------
+    T : float or array
+        Temperature, [K]
+    P : float or array
+        Pressure, [Pa]
+    b : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float or array
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float or array
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float or array
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    Vs : array[complex]
+        Three possible molar volumes for each point, with shape
+        `broadcast shape + (3,)`, [m^3/mol]
+    '''
+    shape, (T, P, b, delta, epsilon, a_alpha) = _volume_solutions_batch_inputs(T, P, b, delta, epsilon, a_alpha)
+    Vs = volume_solutions_Cardano_batch(T, P, b, delta, epsilon, a_alpha)
+    RT = R*T
+    P_inv = 1.0/P
+    failed = (a_alpha == 0.0) | (P < 1e-2) | ~np.isfinite(Vs).all(axis=1)
+    rel_err = np.zeros(T.size)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for i in (0, 1, 2):
+            V = Vi = Vs[:, i].copy()
+            err = np.zeros(T.size)
+            active = ~failed
+            for _ in range(11):
+                if not active.any():
+                    break
+                denom1 = 1.0/(V*(V + delta) + epsilon)
+                denom0 = 1.0/(V - b)
+                w0 = RT*denom0
+                w1 = a_alpha*denom1
+                err_new = w0 - w1 - P
+                active &= (err_new != err)
+                err = np.where(active, err_new, err)
+                derr_dV = (V + V + delta)*w1*denom1 - w0*denom0
+                V = np.where(active, V - err/derr_dV, V)
+                rel_err = np.where(active, np.abs(err*P_inv), rel_err)
+                active &= ~((rel_err < 1e-14) | (V == Vi))
+            ratio = (Vi/V).real
+            failed |= (rel_err > 1e-2) | ~((0.95 < ratio) & (ratio < 1.05)) | ~np.isfinite(V)
+            Vs[:, i] = V
+
+        Vr = Vs.real
+        good = (Vr > b[:, None]) & ((Vr == 0.0) | (np.abs(Vs.imag/Vr) < 1E-12))
+    failed |= ~good.any(axis=1)
+
+    for i in np.nonzero(failed)[0].tolist():
+        Vs[i] = volume_solutions_NR(float(T[i]), float(P[i]), float(b[i]), float(delta[i]),
+                                    float(epsilon[i]), float(a_alpha[i]))
+    return Vs.reshape(shape + (3,))
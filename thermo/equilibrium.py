@@ -36,10 +36,16 @@ EquilibriumState
     :members:
     :undoc-members:
     :exclude-members:
+
+EquilibriumStateLite
+====================
+.. autoclass:: EquilibriumStateLite
+    :members:
+    :exclude-members:
 '''
 
 from __future__ import division
-__all__ = ['EquilibriumState']
+__all__ = ['EquilibriumState', 'EquilibriumStateLite']
 
 from fluids.constants import R, R_inv
 from fluids.core import thermal_diffusivity
@@ -2471,4 +2477,176 @@ try:
     EquilibriumState.__doc__ = EquilibriumState.__doc__ +'\n    ' + '\n    '.join(_add_attrs_doc)
 except:
     pass
-del _add_attrs_doc
\ No newline at end of file
+del _add_attrs_doc
+
+class EquilibriumStateLite(object):
+    r'''Class to hold the result of a flash calculation with as little work
+    as possible; this is returned by :obj:`Flash.flash <thermo.flash.Flash.flash>`
+    when it is called with `lite=True`. Only the conditions, phase fractions
+    and phase compositions are stored directly; no bulk objects are created
+    and the phases are not identified or sorted.
+
+    The phases are labeled as they were by the flash algorithm, i.e. according
+    to the phase model which produced them. The complete
+    :obj:`EquilibriumState` with identified and sorted phases is only created
+    on first access of :obj:`state`. Any attribute not defined by this class,
+    such as :obj:`H <EquilibriumState.H>` or
+    :obj:`mu <EquilibriumState.mu>`, is looked up on that
+    :obj:`EquilibriumState`.
+
+    The constructor has the same signature as that of
+    :obj:`EquilibriumState`.
+
+    Attributes
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    gas : :obj:`Phase <thermo.phases.Phase>` or None
+        Gas phase as returned by the flash algorithm, [-]
+    liquids : list[:obj:`Phase <thermo.phases.Phase>`]
+        Liquid phases as returned by the flash algorithm, [-]
+    solids : list[:obj:`Phase <thermo.phases.Phase>`]
+        Solid phases as returned by the flash algorithm, [-]
+    betas : list[float]
+        Molar phase fractions of the gas, liquids, and solids, in that order,
+        [-]
+    flash_specs : dict
+        Specifications of the flash, [-]
+    flash_convergence : dict
+        Convergence information of the flash, [-]
+    '''
+    __slots__ = ('T', 'P', 'zs', 'gas', 'liquids', 'solids', 'betas',
+                 'flash_specs', 'flash_convergence', 'constants',
+                 'correlations', 'flasher', 'settings', '_state')
+
+    def __init__(self, T, P, zs, gas, liquids, solids, betas,
+                 flash_specs=None, flash_convergence=None,
+                 constants=None, correlations=None, flasher=None,
+                 settings=default_settings):
+        self.T = T
+        self.P = P
+        self.zs = zs
+        self.gas = gas
+        self.liquids = liquids
+        self.solids = solids
+        self.betas = betas
+        self.flash_specs = flash_specs
+        self.flash_convergence = flash_convergence
+        self.constants = constants
+        self.correlations = correlations
+        self.flasher = flasher
+        self.settings = settings
+        self._state = None
+
+    def __repr__(self):
+        return '<%s, T=%g K, P=%g Pa, phase=%s, betas=%s>' %(self.__class__.__name__, self.T,
+                                                             self.P, self.phase, self.betas)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.state, name)
+
+    @property
+    def state(self):
+        r'''Full :obj:`EquilibriumState` of the flash result, with identified
+        and sorted phases; it is created on first access.
+
+        Returns
+        -------
+        state : :obj:`EquilibriumState`
+            Equilibrium state, [-]
+        '''
+        state = self._state
+        if state is None:
+            from thermo.phase_identification import identify_sort_phases
+            gas, liquids, solids, betas = self.gas, self.liquids, self.solids, self.betas
+            constants, correlations, flasher = self.constants, self.correlations, self.flasher
+            if len(self.zs) > 1:
+                phases = ([gas] if gas is not None else []) + liquids + solids
+                gas, liquids, solids, betas = identify_sort_phases(phases, betas, constants,
+                                                                   correlations, settings=flasher.settings,
+                                                                   skip_solids=flasher.skip_solids)
+            self._state = state = EquilibriumState(self.T, self.P, self.zs, gas=gas, liquids=liquids,
+                                                   solids=solids, betas=betas, flash_specs=self.flash_specs,
+                                                   flash_convergence=self.flash_convergence,
+                                                   constants=constants, correlations=correlations,
+                                                   flasher=flasher, settings=self.settings)
+        return state
+
+    @property
+    def phases(self):
+        r'''List of all phases, gas first, then liquids, then solids.
+
+        Returns
+        -------
+        phases : list[:obj:`Phase <thermo.phases.Phase>`]
+            Phases, [-]
+        '''
+        if self.gas is not None:
+            return [self.gas] + self.liquids + self.solids
+        return self.liquids + self.solids
+
+    @property
+    def phase_count(self):
+        r'''Number of phases present.
+
+        Returns
+        -------
+        phase_count : int
+            Number of phases, [-]
+        '''
+        return (self.gas is not None) + len(self.liquids) + len(self.solids)
+
+    @property
+    def liquid_count(self):
+        r'''Number of liquid phases present.
+
+        Returns
+        -------
+        liquid_count : int
+            Number of liquid phases, [-]
+        '''
+        return len(self.liquids)
+
+    @property
+    def phase(self):
+        r'''String representing the phases present, as in
+        :obj:`EquilibriumState.phase`.
+
+        Returns
+        -------
+        phase : str
+            Phase string, [-]
+        '''
+        return ('V' if self.gas is not None else '') + 'L'*len(self.liquids) + 'S'*len(self.solids)
+
+    @property
+    def VF(self):
+        r'''Molar vapor fraction; 0 if there is no gas phase.
+
+        Returns
+        -------
+        VF : float
+            Vapor fraction, [-]
+        '''
+        if self.gas is not None:
+            return self.betas[0]
+        return 0.0
+
+    gas_beta = VF
+
+    @property
+    def liquid0(self):
+        r'''First liquid phase, or None if there are no liquids.
+
+        Returns
+        -------
+        liquid0 : :obj:`Phase <thermo.phases.Phase>`
+            First liquid phase, [-]
+        '''
+        return self.liquids[0] if self.liquids else None
@@ -66,7 +66,7 @@ interfaces. The implemented specific flash algorithms may be changed in the
 future, but reading their source code may be helpful for instructive purposes.
 
 '''
-# sequential_substitution_2P sequential_substitution_NP nonlin_equilibrium_NP nonlin_spec_NP nonlin_2P nonlin_2P_HSGUAbeta dew_bubble_newton_zs TPV_solve_HSGUA_1P
+# sequential_substitution_2P sequential_substitution_NP nonlin_equilibrium_NP nonlin_spec_NP nonlin_2P nonlin_2P_HSGUAbeta nonlin_2P_HSGUAbeta_newton dew_bubble_newton_zs TPV_solve_HSGUA_1P
 
 from __future__ import division
 __all__ = ['sequential_substitution_2P', 'sequential_substitution_GDEM3_2P',
@@ -80,6 +80,7 @@ __all__ = ['sequential_substitution_2P', 'sequential_substitution_GDEM3_2P',
            'sequential_substitution_2P_HSGUAbeta',
            'sequential_substitution_2P_sat', 'TP_solve_VF_guesses',
            'TPV_double_solve_1P', 'nonlin_2P_HSGUAbeta',
+           'nonlin_2P_HSGUAbeta_newton',
            'sequential_substitution_2P_double',
            'cm_flash_tol', 'nonlin_2P_newton', 'dew_bubble_newton_zs',
            'existence_3P_Michelsen_Mollerup',
@@ -88,10 +89,29 @@ __all__ = ['sequential_substitution_2P', 'sequential_substitution_GDEM3_2P',
            'nonlin_spec_NP',
            'TPV_solve_HSGUA_guesses_VL',
            'solve_P_VF_IG_K_composition_independent',
-           'solve_T_VF_IG_K_composition_independent'
+           'solve_T_VF_IG_K_composition_independent',
+           'Rachford_Rice_solution_batch', 'grid_flash_row', 'dew_bubble_curve_path',
+           'PT_algorithm_2P',
+           'Rachford_Rice_solutionN_batch', 'Rachford_Rice_solutionN_Okuno',
+           'sequential_substitution_2P_functional',
+           'stability_iteration_Michelsen_functional',
+           'sequential_substitution_2P_reduced',
+           'stability_iteration_Michelsen_reduced',
+           'AdaptivePTStrategy', 'FlashTimeoutError', 'flash_time_limit',
+           'check_flash_deadline',
+           'envelope_2P_Michelsen', 'FlashCache', 'KValueCache', 'FlashProfiler',
+           'AsyncFlasher', 'FlashQueueFullError', 'PurePropertyTable',
+           'GridPropertyTable', 'write_grid_table',
            ]
 
-
+import os
+import sys
+import threading
+from time import perf_counter
+from collections import OrderedDict
+from itertools import chain
+from functools import wraps
+from bisect import bisect_right
 from fluids.constants import R, R2, R_inv
 from fluids.numerics import (UnconvergedError, trunc_exp, newton,
                              brenth, secant, bisect,
@@ -114,18 +134,21 @@ from chemicals.rachford_rice import (flash_inner_loop, Rachford_Rice_solutionN,
                                   Rachford_Rice_flash_error, Rachford_Rice_solution2, Rachford_Rice_solution_LN2)
 from chemicals.phase_change import SMK
 from chemicals.volume import COSTALD
-from chemicals.flash_basic import flash_wilson, flash_Tb_Tc_Pc, flash_ideal
+from chemicals.flash_basic import flash_wilson, flash_Tb_Tc_Pc, flash_ideal, Wilson_K_value
 from chemicals.exceptions import TrivialSolutionError, PhaseCountReducedError, PhaseExistenceImpossible
 from chemicals.iapws import iapws95_Psat, iapws95_Tsat, iapws95_rhog_sat, iapws95_rhol_sat, iapws95_Tc, iapws95_Pc, iapws95_MW, iapws95_T
 
 from thermo.utils import has_matplotlib
-from thermo.equilibrium import EquilibriumState
+from thermo.equilibrium import EquilibriumState, EquilibriumStateLite
 from thermo.phases import Phase, gas_phases, liquid_phases, solid_phases, CEOSLiquid, CEOSGas, CoolPropGas, CoolPropLiquid, CoolPropPhase, GibbsExcessLiquid, IdealGas, IAPWS95Liquid, IAPWS95Gas, IAPWS95
 from thermo.phases import CPPQ_INPUTS, CPQT_INPUTS, CPrhoT_INPUTS, CPunknown, CPiDmolar
 from thermo import phases
 from thermo.phase_identification import identify_sort_phases
 from thermo.bulk import default_settings
 from thermo.eos_mix import VDWMIX, IGMIX
+from thermo import eos_mix_methods
+from thermo.eos_mix_methods import (lnphis_direct, lnphis_direct_models, kijs_reduction,
+                                    reduced_variables, lnphis_reduced, lnphis_direct_reduced)
 from thermo.property_package import StabilityTester
 from thermo.coolprop import CPiP_min
 
@@ -133,6 +156,146 @@ from thermo.coolprop import CPiP_min
 
 CAS_H2O = '7732-18-5'
 
+global json
+json = None
+def get_json():
+    global json
+    if json is None:
+        import json
+    return json
+
+# Exceptions `flash_inner_loop` raises when the K values have no solution
+# or the solver fails on them
+_flash_inner_loop_errors = (ValueError, ArithmeticError, UnconvergedError, NotBoundedError,
+                            NoSolutionError, PhaseCountReducedError)
+
+class FlashTimeoutError(Exception):
+    r'''Error raised when a flash calculation runs past its time budget or
+    deadline. It is deliberately not a subclass of
+    :obj:`UnconvergedError <fluids.numerics.UnconvergedError>`, so the
+    flash algorithms do not treat it as the failure of one method and go on
+    to try the next one.
+
+    Attributes
+    ----------
+    elapsed : float
+        Time since the time limit was started, [s]
+    stage : str
+        Name of the algorithm which was running when the time ran out, [-]
+    iterations : int
+        Number of iterations that algorithm had completed, [-]
+    err : float
+        Last convergence error of that algorithm, if available, [-]
+    progress : dict
+        Latest estimates of the algorithm, such as 'V_over_F', 'xs', and
+        'ys' for sequential substitution, [-]
+    '''
+    def __init__(self, msg, elapsed=None, stage=None, iterations=None,
+                 err=None, progress=None):
+        Exception.__init__(self, msg)
+        self.elapsed = elapsed
+        self.stage = stage
+        self.iterations = iterations
+        self.err = err
+        self.progress = progress if progress is not None else {}
+
+class _FlashDeadline(threading.local):
+    # perf_counter value after which flash algorithms stop in the current
+    # thread, and when the outermost limit was started
+    deadline = None
+    start = None
+
+_flash_deadline = _FlashDeadline()
+
+class flash_time_limit(object):
+    r'''Context manager which limits the time flash algorithms may run for.
+    The iterative algorithms of this module check the time every iteration
+    and raise :obj:`FlashTimeoutError` once it has run out. Limits can be
+    nested; the earliest deadline applies. A limit only applies to the
+    thread which set it.
+
+    :obj:`Flash.flash` accepts the same arguments and uses this internally;
+    it can be used directly to limit lower-level calls such as
+    `flash_TPV`, `flash_TPV_HSGUA`, `flash_TVF` or `flash_PVF`.
+
+    Parameters
+    ----------
+    time_budget : float, optional
+        Time allowed from the start of the limit, [s]
+    deadline : float, optional
+        Time at which to stop, as a value of :obj:`time.perf_counter`, [s]
+
+    Examples
+    --------
+    >>> with flash_time_limit(time_budget=1.0):
+    ...     pass
+    '''
+    def __init__(self, time_budget=None, deadline=None):
+        self.time_budget = time_budget
+        self.deadline = deadline
+
+    def __enter__(self):
+        state = _flash_deadline
+        self.previous = (state.deadline, state.start)
+        now = perf_counter()
+        deadline = self.deadline
+        if self.time_budget is not None:
+            budget_deadline = now + self.time_budget
+            deadline = budget_deadline if deadline is None else min(deadline, budget_deadline)
+        if state.deadline is not None:
+            if deadline is None or state.deadline < deadline:
+                deadline = state.deadline
+        else:
+            state.start = now
+        state.deadline = deadline
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _flash_deadline.deadline, _flash_deadline.start = self.previous
+        return False
+
+def _time_limited(method):
+    # Allow the `time_budget` and `deadline` arguments of `flash_time_limit`
+    # to be given to a flasher method
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        time_budget = kwargs.pop('time_budget', None)
+        deadline = kwargs.pop('deadline', None)
+        if time_budget is None and deadline is None:
+            return method(self, *args, **kwargs)
+        with flash_time_limit(time_budget, deadline):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def check_flash_deadline(stage, iterations=None, err=None, **progress):
+    r'''Raise a :obj:`FlashTimeoutError` if a :obj:`flash_time_limit` is
+    active and its deadline has passed; otherwise do nothing. Called every
+    iteration by the iterative flash algorithms, with their progress.
+
+    Parameters
+    ----------
+    stage : str
+        Name of the calling algorithm, [-]
+    iterations : int, optional
+        Number of iterations completed, [-]
+    err : float, optional
+        Current convergence error, [-]
+    progress : dict
+        Current estimates of the algorithm, [-]
+    '''
+    deadline = _flash_deadline.deadline
+    if deadline is not None:
+        now = perf_counter()
+        if now > deadline:
+            msg = "Flash time limit reached in %s" %(stage)
+            if iterations is not None:
+                msg += " after %d iterations" %(iterations)
+            raise FlashTimeoutError(msg,
+                                    elapsed=now - _flash_deadline.start, stage=stage,
+                                    iterations=iterations, err=err, progress=progress)
+
+
 def sequential_substitution_2P(T, P, V, zs, xs_guess, ys_guess, liquid_phase,
                                gas_phase, maxiter=1000, tol=1E-13,
                                trivial_solution_tol=1e-5, V_over_F_guess=None,
@@ -160,6 +323,8 @@ def sequential_substitution_2P(T, P, V, zs, xs_guess, ys_guess, liquid_phase,
         gas_phase = gas_phase.to_TP_zs(T=T, P=P, zs=ys)
 
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('sequential_substitution_2P', iteration, err, V_over_F=V_over_F, xs=xs, ys=ys)
 #        g = gas_phase.to_TP_zs(T=T, P=P, zs=ys)
 #        l = liquid_phase.to_TP_zs(T=T, P=P, zs=xs)
 
@@ -327,9 +492,308 @@ def sequential_substitution_2P(T, P, V, zs, xs_guess, ys_guess, liquid_phase,
     raise UnconvergedError('End of SS without convergence')
 
 
+def sequential_substitution_2P_functional(T, P, zs, xs_guess, ys_guess,
+                                          model, kijs, bs, a_alphas, a_alpha_roots,
+                                          xs_liquid=True, ys_liquid=False,
+                                          maxiter=1000, tol=1E-13,
+                                          trivial_solution_tol=1e-5, V_over_F_guess=0.5):
+    r'''Array-based version of :obj:`sequential_substitution_2P` for two
+    phases described by the same cubic equation of state, one of those in
+    :obj:`thermo.eos_mix_methods.lnphis_direct_models`. The fugacity
+    coefficients are computed with :obj:`thermo.eos_mix_methods.lnphis_direct`
+    from the temperature-dependent terms of the equation of state, so no phase
+    objects are created and the function can be compiled with numba.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    xs_guess : list[float]
+        Initial guess for the mole fractions of the `x` phase, [-]
+    ys_guess : list[float]
+        Initial guess for the mole fractions of the `y` phase, [-]
+    model : str
+        Name of the equation of state class, [-]
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alphas : list[float]
+        Pure component `a_alpha` terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+    xs_liquid : bool, optional
+        Whether the `x` phase uses the liquid-like volume root, [-]
+    ys_liquid : bool, optional
+        Whether the `y` phase uses the liquid-like volume root, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    tol : float, optional
+        Convergence tolerance on the sum of squared fugacity errors, [-]
+    trivial_solution_tol : float, optional
+        Sum of composition differences below which the solution is considered
+        trivial, [-]
+    V_over_F_guess : float, optional
+        Initial guess for the phase fraction of the `y` phase, [-]
+
+    Returns
+    -------
+    V_over_F : float
+        Phase fraction of the `y` phase, [-]
+    xs : list[float]
+        Mole fractions of the `x` phase, [-]
+    ys : list[float]
+        Mole fractions of the `y` phase, [-]
+    iteration : int
+        Number of iterations used, [-]
+    err : float
+        Final error, [-]
+    '''
+    N = len(zs)
+    xs, ys = xs_guess, ys_guess
+    V_over_F = V_over_F_guess
+    Ks = [0.0]*N
+    err1, err2, err3 = 0.0, 0.0, 0.0
+    for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None: # numba: delete
+            check_flash_deadline('sequential_substitution_2P_functional', iteration, V_over_F=V_over_F, xs=xs, ys=ys) # numba: delete
+        lnphis_x = lnphis_direct(xs, model, T, P, kijs, xs_liquid, not xs_liquid, bs, a_alphas, a_alpha_roots)
+        lnphis_y = lnphis_direct(ys, model, T, P, kijs, ys_liquid, not ys_liquid, bs, a_alphas, a_alpha_roots)
+        for i in range(N):
+            Ks[i] = trunc_exp(lnphis_x[i] - lnphis_y[i])
+
+        V_over_F_old = V_over_F
+        try:
+            V_over_F, xs_new, ys_new = flash_inner_loop(zs, Ks, guess=V_over_F)
+        except _flash_inner_loop_errors: # numba: delete
+#        except: # numba: uncomment
+            V_over_F, xs_new, ys_new = flash_inner_loop(zs, Ks, guess=V_over_F, check=True)
+
+        # Normalize only if negative fractions were produced
+        for xi in xs_new:
+            if xi < 0.0:
+                xs_new_sum_inv = 0.0
+                for i in range(N):
+                    xs_new_sum_inv += abs(xs_new[i])
+                xs_new_sum_inv = 1.0/xs_new_sum_inv
+                for i in range(N):
+                    xs_new[i] = abs(xs_new[i])*xs_new_sum_inv
+                break
+        for yi in ys_new:
+            if yi < 0.0:
+                ys_new_sum_inv = 0.0
+                for i in range(N):
+                    ys_new_sum_inv += abs(ys_new[i])
+                ys_new_sum_inv = 1.0/ys_new_sum_inv
+                for i in range(N):
+                    ys_new[i] = abs(ys_new[i])*ys_new_sum_inv
+                break
+
+        err = 0.0
+        for i in range(N):
+            if ys[i] != 0.0:
+                err_i = Ks[i]*xs[i]/ys[i] - 1.0
+                err += err_i*err_i
+
+        if err > 0.0 and (err == err1 or err == err2 or err == err3):
+            raise OscillationError("Converged to cycle in errors, no progress being made")
+        xs_old, ys_old = xs, ys
+        xs, ys = xs_new, ys_new
+
+        comp_difference = 0.0
+        for i in range(N):
+            comp_difference += abs(xs[i] - ys[i])
+        if comp_difference < trivial_solution_tol:
+            raise TrivialSolutionError("Converged to trivial condition, compositions of both phases equal")
+        if err < tol:
+            return V_over_F_old, xs_old, ys_old, iteration, err
+        err1, err2, err3 = err, err1, err2
+    raise UnconvergedError('End of SS without convergence')
+
+
+def _reduced_2P_map(T, P, zs, thetas, V_over_F, model, groups, one_minus_kijs_groups,
+                    bs, a_alpha_roots, xs_liquid, ys_liquid):
+    # Flash of the feed with the K values of two phases with the reduced
+    # variables `thetas`; returns the reduced variables of the new phases too
+    N, G = len(zs), len(one_minus_kijs_groups)
+    lnphis_x = lnphis_reduced(model, T, P, thetas[:G], thetas[G], xs_liquid, not xs_liquid,
+                              groups, one_minus_kijs_groups, bs, a_alpha_roots)
+    lnphis_y = lnphis_reduced(model, T, P, thetas[G+1:2*G+1], thetas[2*G+1], ys_liquid, not ys_liquid,
+                              groups, one_minus_kijs_groups, bs, a_alpha_roots)
+    Ks = [trunc_exp(lnphis_x[i] - lnphis_y[i]) for i in range(N)]
+    try:
+        V_over_F, xs, ys = flash_inner_loop(zs, Ks, guess=V_over_F)
+    except _flash_inner_loop_errors: # numba: delete
+#    except: # numba: uncomment
+        V_over_F, xs, ys = flash_inner_loop(zs, Ks, guess=V_over_F, check=True)
+    for fracs in (xs, ys):
+        if min(fracs) < 0.0:
+            fracs_sum_inv = 1.0/sum([abs(v) for v in fracs])
+            for i in range(N):
+                fracs[i] = abs(fracs[i])*fracs_sum_inv
+    Qxs, bx = reduced_variables(xs, groups, G, bs, a_alpha_roots)
+    Qys, by = reduced_variables(ys, groups, G, bs, a_alpha_roots)
+    return Ks, V_over_F, xs, ys, Qxs + [bx] + Qys + [by]
+
+
+def sequential_substitution_2P_reduced(T, P, zs, xs_guess, ys_guess,
+                                       model, groups, one_minus_kijs_groups,
+                                       bs, a_alphas, a_alpha_roots,
+                                       xs_liquid=True, ys_liquid=False,
+                                       maxiter=1000, tol=1E-13,
+                                       trivial_solution_tol=1e-5, V_over_F_guess=0.5,
+                                       newton_tol=1e-6):
+    r'''Two-phase PT flash of a cubic equation of state in reduced variables,
+    for mixtures whose components can be grouped by
+    :obj:`thermo.eos_mix_methods.kijs_reduction`. The fugacities of each
+    phase depend on its composition only through the sums of each group
+    and its covolume, so the flash is solved for those `2G + 2` reduced
+    variables of the two phases rather than for the compositions, and the
+    full compositions are reconstructed from a Rachford-Rice solution
+    with the K values of the converged reduced variables.
+
+    Iterations start as sequential substitution; once the sum of squared
+    fugacity errors is below `newton_tol` and is no longer decreasing by more
+    than two orders of magnitude each iteration, Newton's method is applied to
+    the fixed point of the reduced variables with a Jacobian calculated by
+    finite differences, as in the reduction method of Hendriks and van
+    Bergen [1]_.
+    The cost of each iteration grows linearly with the number of components.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    xs_guess : list[float]
+        Initial guess for the mole fractions of the `x` phase, [-]
+    ys_guess : list[float]
+        Initial guess for the mole fractions of the `y` phase, [-]
+    model : str
+        Name of the equation of state class, [-]
+    groups : list[int]
+        Index of the group of each component, [-]
+    one_minus_kijs_groups : list[list[float]]
+        One minus the binary interaction parameters between each group, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alphas : list[float]
+        Pure component `a_alpha` terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+    xs_liquid : bool, optional
+        Whether the `x` phase uses the liquid-like volume root, [-]
+    ys_liquid : bool, optional
+        Whether the `y` phase uses the liquid-like volume root, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    tol : float, optional
+        Convergence tolerance on the sum of squared fugacity errors, [-]
+    trivial_solution_tol : float, optional
+        Sum of composition differences below which the solution is considered
+        trivial, [-]
+    V_over_F_guess : float, optional
+        Initial guess for the phase fraction of the `y` phase, [-]
+    newton_tol : float, optional
+        Sum of squared fugacity errors below which Newton steps are taken, [-]
+
+    Returns
+    -------
+    V_over_F : float
+        Phase fraction of the `y` phase, [-]
+    xs : list[float]
+        Mole fractions of the `x` phase, [-]
+    ys : list[float]
+        Mole fractions of the `y` phase, [-]
+    iteration : int
+        Number of iterations used, [-]
+    err : float
+        Final error, [-]
+
+    References
+    ----------
+    .. [1] Hendriks, E. M., and A. R. D. Van Bergen. "Application of a
+       Reduction Method to Phase Equilibria Calculations." Fluid Phase
+       Equilibria 74 (1992): 17-34.
+    '''
+    N, G = len(zs), len(one_minus_kijs_groups)
+    n_thetas = 2*G + 2
+    xs, ys = xs_guess, ys_guess
+    V_over_F = V_over_F_guess
+    Qxs, bx = reduced_variables(xs, groups, G, bs, a_alpha_roots)
+    Qys, by = reduced_variables(ys, groups, G, bs, a_alpha_roots)
+    thetas = Qxs + [bx] + Qys + [by]
+    map_args = (model, groups, one_minus_kijs_groups, bs, a_alpha_roots, xs_liquid, ys_liquid)
+
+    err1, err2, err3 = 0.0, 0.0, 0.0
+    newton = True
+    for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None: # numba: delete
+            check_flash_deadline('sequential_substitution_2P_reduced', iteration, V_over_F=V_over_F, xs=xs, ys=ys) # numba: delete
+        # `thetas` are the reduced variables of `xs` and `ys`
+        Ks, V_over_F_new, xs_new, ys_new, thetas_new = _reduced_2P_map(T, P, zs, thetas, V_over_F, *map_args)
+        err = 0.0
+        for i in range(N):
+            if ys[i] != 0.0:
+                err_i = Ks[i]*xs[i]/ys[i] - 1.0
+                err += err_i*err_i
+        if err < tol:
+            return V_over_F, xs, ys, iteration, err
+        if err > 0.0 and (err == err1 or err == err2 or err == err3):
+            raise OscillationError("Converged to cycle in errors, no progress being made")
+        if iteration and err > err1:
+            # Stop taking Newton steps if they make things worse
+            newton = False
+
+        # Newton steps are only worth their cost when the substitution is slow
+        if newton and err < newton_tol and err > 0.01*err1:
+            try:
+                jac = [[0.0]*n_thetas for _ in range(n_thetas)]
+                for k in range(n_thetas):
+                    thetas_k = list(thetas)
+                    # Groups absent from a phase have a reduced variable of zero
+                    h = max(abs(thetas[k])*1e-7, 1e-14)
+                    thetas_k[k] += h
+                    thetas_k_new = _reduced_2P_map(T, P, zs, thetas_k, V_over_F_new, *map_args)[4]
+                    h_inv = 1.0/h
+                    for m in range(n_thetas):
+                        jac[m][k] = (thetas_k_new[m] - thetas_new[m])*h_inv
+                    jac[k][k] -= 1.0
+                dthetas = py_solve(jac, [thetas[m] - thetas_new[m] for m in range(n_thetas)])
+                thetas_newton = [thetas[m] + dthetas[m] for m in range(n_thetas)]
+                _, V_over_F_new, xs_new, ys_new, thetas_new = _reduced_2P_map(T, P, zs, thetas_newton, V_over_F_new, *map_args)
+            except Exception:
+                newton = False
+
+        comp_difference = 0.0
+        for i in range(N):
+            comp_difference += abs(xs_new[i] - ys_new[i])
+        if comp_difference < trivial_solution_tol:
+            raise TrivialSolutionError("Converged to trivial condition, compositions of both phases equal")
+        V_over_F, xs, ys, thetas = V_over_F_new, xs_new, ys_new, thetas_new
+        err1, err2, err3 = err, err1, err2
+    raise UnconvergedError('End of SS without convergence')
+
+
 def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
                                phases, maxiter=1000, tol=1E-13,
-                               trivial_solution_tol=1e-5, ref_phase=2):
+                               trivial_solution_tol=1e-5, ref_phase=2,
+                               RR_method=None):
+    # RR_method of None uses Rachford_Rice_solutionN, 'Okuno' uses
+    # Rachford_Rice_solutionN_Okuno
+    if RR_method is None:
+        RR_solver = Rachford_Rice_solutionN
+    elif RR_method == 'Okuno':
+        RR_solver = Rachford_Rice_solutionN_Okuno
+    else:
+        raise ValueError("Unrecognized Rachford-Rice method")
 
     compositions = compositions_guesses
     cmps = range(len(zs))
@@ -344,6 +808,8 @@ def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
     compositions_ref = compositions_guesses[ref_phase]
 
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('sequential_substitution_NP', iteration, betas=betas, compositions=compositions)
         phases = [phases[i].to_TP_zs(T=T, P=P, zs=compositions[i]) for i in phases_iter]
         lnphis = [phases[i].lnphis() for i in phases_iter]
 
@@ -362,7 +828,7 @@ def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
 
         #if phase_count == 3:
         #    Rachford_Rice_solution2(zs, Ks[0], Ks[1], beta_y=beta_guesses[0], beta_z=beta_guesses[1])
-        betas_new, compositions_new = Rachford_Rice_solutionN(zs, Ks, beta_guesses)
+        betas_new, compositions_new = RR_solver(zs, Ks, beta_guesses)
         # Sort the order back
         beta_ref_new = betas_new[-1]
         betas_new = betas_new[:-1]
@@ -411,6 +877,360 @@ def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
     raise UnconvergedError('End of SS without convergence')
 
 
+def Rachford_Rice_solution_batch(zs, Ks, guesses=None, maxiter=100, xtol=1e-14):
+    r'''Solves the two-phase Rachford-Rice equation for many sets of
+    compositions and K values at once, using a bounded Newton method which is
+    vectorized across the rows of the inputs.
+
+    The solution is searched for between the asymptotes of the objective
+    function, so negative flash solutions (`V_over_F` < 0 or > 1) are
+    returned when the inputs are outside of the two-phase region. Rows which
+    have K values all above or all below 1 have no solution; their vapor
+    fraction is returned as `inf` or `-inf` respectively.
+
+    Parameters
+    ----------
+    zs : ndarray
+        Mole fractions of each component in each row, [-]
+    Ks : ndarray
+        K values of each component in each row, [-]
+    guesses : ndarray, optional
+        Initial guesses for the vapor fraction of each row, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    xtol : float, optional
+        Convergence tolerance in vapor fraction, [-]
+
+    Returns
+    -------
+    V_over_Fs : ndarray
+        Vapor fractions of each row, [-]
+    xs : ndarray
+        Liquid mole fractions of each row; only meaningful where a finite
+        vapor fraction was found, [-]
+    ys : ndarray
+        Vapor mole fractions of each row; only meaningful where a finite
+        vapor fraction was found, [-]
+    '''
+    zs = np.atleast_2d(np.asarray(zs, dtype=float))
+    Ks = np.atleast_2d(np.asarray(Ks, dtype=float))
+    M = zs.shape[0]
+    Kms = Ks - 1.0
+    present = zs > 0.0
+    K_max = np.where(present, Ks, -np.inf).max(axis=1)
+    K_min = np.where(present, Ks, np.inf).min(axis=1)
+    two_phase = (K_max > 1.0) & (K_min < 1.0)
+
+    V_over_Fs = np.where(K_min >= 1.0, np.inf, -np.inf)
+    xs = np.array(zs)
+    ys = np.array(zs)
+    if not np.any(two_phase):
+        return V_over_Fs, xs, ys
+
+    zs_2P, Kms_2P = zs[two_phase], Kms[two_phase]
+    with np.errstate(divide='ignore'):
+        low = 1.0/(1.0 - K_max[two_phase])
+        high = 1.0/(1.0 - K_min[two_phase])
+    if guesses is None:
+        V = np.full(zs_2P.shape[0], 0.5)
+    else:
+        V = np.array(np.broadcast_to(guesses, (M,)), dtype=float)[two_phase]
+    bad_guess = ~((V > low) & (V < high))
+    V[bad_guess] = 0.5*(low[bad_guess] + high[bad_guess])
+
+    active = np.ones(V.shape[0], dtype=bool)
+    for _ in range(maxiter):
+        Va, Kma, za = V[active], Kms_2P[active], zs_2P[active]
+        denoms_inv = 1.0/(1.0 + Va[:, None]*Kma)
+        t0 = za*Kma*denoms_inv
+        err = t0.sum(axis=1)
+        derr = -(t0*Kma*denoms_inv).sum(axis=1)
+        # The objective function is monotonically decreasing in V
+        low_a, high_a = low[active], high[active]
+        low_a = np.where(err > 0.0, Va, low_a)
+        high_a = np.where(err < 0.0, Va, high_a)
+        V_new = Va - err/derr
+        out = ~((V_new > low_a) & (V_new < high_a))
+        V_new[out] = 0.5*(low_a[out] + high_a[out])
+        low[active], high[active] = low_a, high_a
+
+        done = np.abs(V_new - Va) <= xtol*np.maximum(1.0, np.abs(Va))
+        V[active] = V_new
+        idxs = np.where(active)[0]
+        active[idxs[done]] = False
+        if not np.any(active):
+            break
+
+    xs_2P = zs_2P/(1.0 + V[:, None]*Kms_2P)
+    V_over_Fs[two_phase] = V
+    xs[two_phase] = xs_2P
+    ys[two_phase] = xs_2P*(Kms_2P + 1.0)
+    return V_over_Fs, xs, ys
+
+
+def Rachford_Rice_solutionN_batch(zs, Ks, betas=None, maxiter=100, xtol=1e-14):
+    r'''Solves the N-phase Rachford-Rice equations for many sets of
+    compositions and K values at once, vectorized across the rows of the
+    inputs.
+
+    The method of Okuno, Johns and Sepehrnoori [1]_ is used: the convex
+    function
+
+    .. math::
+        F(\beta) = -\sum_i z_i \ln t_i, \quad t_i = 1 + \sum_j \beta_j (K_{ij} - 1)
+
+    is minimized by Newton's method with its analytical gradient and
+    Hessian, over the region where all phase compositions are between 0 and
+    1 (:math:`t_i \ge z_i` and :math:`t_i \ge K_{ij} z_i`). Steps are
+    limited to stay inside that region and then halved until `F` decreases.
+    Negative flash solutions are found as well.
+
+    Parameters
+    ----------
+    zs : ndarray
+        Mole fractions of each component in each row, shape (M, N), [-]
+    Ks : ndarray
+        K values of each phase with respect to the reference phase, for each
+        component in each row, shape (M, P-1, N), [-]
+    betas : ndarray, optional
+        Initial guesses for the phase fractions of the first P-1 phases in
+        each row; a guess outside the region is replaced by equal phase
+        fractions, or if those are also outside it by zeros, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    xtol : float, optional
+        Convergence tolerance in phase fractions, [-]
+
+    Returns
+    -------
+    betas : ndarray
+        Phase fractions of each row; one for each set of K values plus the
+        reference phase last, shape (M, P); NaN for rows which could not be
+        solved, [-]
+    compositions : ndarray
+        Mole fractions of each component in each phase of each row, in the
+        same order as `betas`, shape (M, P, N), [-]
+
+    Notes
+    -----
+    Rows are not solved if none of the starting points are inside the
+    region, or if they do not converge in `maxiter` iterations.
+
+    Examples
+    --------
+    >>> ns = [0.204322076984, 0.070970999150, 0.267194323384, 0.296291964579, 0.067046080882, 0.062489248292, 0.031685306730]
+    >>> Ks_y = [1.23466988745, 0.89727701141, 2.29525708098, 1.58954899888, 0.23349348597, 0.02038108640, 1.40715641002]
+    >>> Ks_z = [1.52713341421, 0.02456487977, 1.46348240453, 1.16090546194, 0.24166289908, 0.14815282572, 14.3128010831]
+    >>> betas, comps = Rachford_Rice_solutionN_batch([ns], [[Ks_y, Ks_z]])
+    >>> betas.round(8).tolist()
+    [[0.68683289, 0.06019424, 0.25297286]]
+
+    References
+    ----------
+    .. [1] Okuno, Ryosuke, Russell T. Johns, and Kamy Sepehrnoori. "A New
+       Algorithm for Rachford-Rice for Multiphase Compositional Simulation."
+       SPE Journal 15, no. 2 (2010): 313-25. https://doi.org/10.2118/117752-PA.
+    '''
+    zs = np.atleast_2d(np.asarray(zs, dtype=float))
+    Ks = np.asarray(Ks, dtype=float)
+    if Ks.ndim == 2:
+        Ks = Ks[None, :, :]
+    M, phase_count_m1, N = Ks.shape
+    Kms = Ks - 1.0
+    # Lower limits of t_i keeping every mole fraction at or below one
+    t_min = np.maximum(zs, (Ks*zs[:, None, :]).max(axis=1))
+
+    if betas is None:
+        B = np.zeros((M, phase_count_m1))
+    else:
+        B = np.array(np.broadcast_to(np.asarray(betas, dtype=float)[..., :phase_count_m1],
+                                     (M, phase_count_m1)))
+    # Start from the guess, or else from equal phase fractions, or else from
+    # the reference phase alone, whichever is first inside the region
+    solved = np.zeros(M, dtype=bool)
+    for start in (None, 1.0/(phase_count_m1 + 1.0), 0.0):
+        if start is not None:
+            B[~solved] = start
+        ts = 1.0 + np.einsum('mj,mjn->mn', B, Kms)
+        solved |= np.all(ts > t_min, axis=1)
+
+    active = solved.copy()
+    for _ in range(maxiter):
+        idxs = np.where(active)[0]
+        if not len(idxs):
+            break
+        Ba, Kma, za, t_mina = B[idxs], Kms[idxs], zs[idxs], t_min[idxs]
+        ts = 1.0 + np.einsum('mj,mjn->mn', Ba, Kma)
+        zs_ts = za/ts
+        grad = -np.einsum('mn,mjn->mj', zs_ts, Kma)
+        hess = np.einsum('mn,mjn,mkn->mjk', zs_ts/ts, Kma, Kma)
+        try:
+            d = np.linalg.solve(hess, -grad[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            d = -grad/np.einsum('mjj->mj', hess)
+
+        # Largest step staying inside the region
+        dts = np.einsum('mj,mjn->mn', d, Kma)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            limits = np.where(dts < 0.0, (ts - t_mina)/-dts, np.inf)
+        steps = np.minimum(1.0, 0.99*limits.min(axis=1))
+
+        # Backtrack until the objective function decreases
+        F = -(za*np.log(ts)).sum(axis=1)
+        slope = (grad*d).sum(axis=1)
+        # Changes in F below its rounding error are accepted
+        F_tol = 1e-14*(1.0 + np.abs(F))
+        for _ in range(30):
+            ts_new = ts + steps[:, None]*dts
+            with np.errstate(invalid='ignore', divide='ignore'):
+                F_new = -(za*np.log(ts_new)).sum(axis=1)
+            worse = ~(F_new <= F + 1e-4*steps*slope + F_tol)
+            if not np.any(worse):
+                break
+            steps[worse] *= 0.5
+
+        B[idxs] = Ba + steps[:, None]*d
+        done = np.abs(d).max(axis=1) <= xtol*np.maximum(1.0, np.abs(Ba).max(axis=1))
+        active[idxs[done]] = False
+    solved &= ~active
+
+    betas_out = np.empty((M, phase_count_m1 + 1))
+    betas_out[:, :phase_count_m1] = B
+    betas_out[:, phase_count_m1] = 1.0 - B.sum(axis=1)
+    xs = zs/(1.0 + np.einsum('mj,mjn->mn', B, Kms))
+    compositions = np.empty((M, phase_count_m1 + 1, N))
+    compositions[:, :phase_count_m1] = Ks*xs[:, None, :]
+    compositions[:, phase_count_m1] = xs
+    betas_out[~solved] = np.nan
+    compositions[~solved] = np.nan
+    return betas_out, compositions
+
+
+def Rachford_Rice_solutionN_Okuno(ns, Ks, betas, maxiter=100, xtol=1e-14):
+    r'''Solves the N-phase Rachford-Rice equations for one set of K values
+    with the same method as :obj:`Rachford_Rice_solutionN_batch`, but
+    written with plain lists as it is called for every iteration of
+    :obj:`sequential_substitution_NP`. It has the same signature and outputs
+    as :obj:`chemicals.rachford_rice.Rachford_Rice_solutionN` so it can be
+    used in its place. If no starting point inside the region of the Okuno
+    method is found, or it does not converge,
+    :obj:`chemicals.rachford_rice.Rachford_Rice_solutionN` is used instead.
+
+    Each call takes about 40% longer than
+    :obj:`chemicals.rachford_rice.Rachford_Rice_solutionN`, so it is not the
+    default solver of :obj:`FlashVLN`; it is used there only when
+    `SS_NP_RR_METHOD` is set to 'Okuno'. The method pays off when many sets
+    of K values are solved together with
+    :obj:`Rachford_Rice_solutionN_batch`.
+
+    Parameters
+    ----------
+    ns : list[float]
+        Overall mole fractions of all species, [-]
+    Ks : list[list[float]]
+        Equilibrium K-values of all phases with respect to the reference
+        phase, [-]
+    betas : list[float]
+        Phase fraction initial guesses for the phases of each set of K
+        values; a guess for the reference phase is ignored, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    xtol : float, optional
+        Convergence tolerance in phase fractions, [-]
+
+    Returns
+    -------
+    betas : list[float]
+        Phase fractions of all of the phases, with the reference phase last,
+        [-]
+    compositions : list[list[float]]
+        Mole fractions of each species in each phase, with the reference
+        phase last, [-]
+
+    Examples
+    --------
+    >>> ns = [0.204322076984, 0.070970999150, 0.267194323384, 0.296291964579, 0.067046080882, 0.062489248292, 0.031685306730]
+    >>> Ks_y = [1.23466988745, 0.89727701141, 2.29525708098, 1.58954899888, 0.23349348597, 0.02038108640, 1.40715641002]
+    >>> Ks_z = [1.52713341421, 0.02456487977, 1.46348240453, 1.16090546194, 0.24166289908, 0.14815282572, 14.3128010831]
+    >>> betas, comps = Rachford_Rice_solutionN_Okuno(ns, [Ks_y, Ks_z], [.1, .6])
+    >>> [round(b, 8) for b in betas]
+    [0.68683289, 0.06019424, 0.25297286]
+    '''
+    N = len(ns)
+    P = len(Ks)
+    cmps, phases_m1 = range(N), range(P)
+    Kms = [[K - 1.0 for K in Ks_j] for Ks_j in Ks]
+    t_min = [0.0]*N
+    for i in cmps:
+        t_min_i = ns[i]
+        for j in phases_m1:
+            if Ks[j][i]*ns[i] > t_min_i:
+                t_min_i = Ks[j][i]*ns[i]
+        t_min[i] = t_min_i
+
+    def ts_at(B):
+        ts = [1.0]*N
+        for j in phases_m1:
+            Bj, Kms_j = B[j], Kms[j]
+            for i in cmps:
+                ts[i] += Bj*Kms_j[i]
+        return ts
+
+    B = None
+    for start in (list(betas[:P]), [1.0/(P + 1.0)]*P, [0.0]*P):
+        ts = ts_at(start)
+        if all(ts[i] > t_min[i] for i in cmps):
+            B = start
+            break
+    if B is None:
+        return Rachford_Rice_solutionN(ns, Ks, betas)
+
+    converged = False
+    for _ in range(maxiter):
+        zs_ts = [ns[i]/ts[i] for i in cmps]
+        grad = [-sum([zs_ts[i]*Kms[j][i] for i in cmps]) for j in phases_m1]
+        hess = [[0.0]*P for _ in phases_m1]
+        for j in phases_m1:
+            for k in range(j, P):
+                h = 0.0
+                Kms_j, Kms_k = Kms[j], Kms[k]
+                for i in cmps:
+                    h += zs_ts[i]*Kms_j[i]*Kms_k[i]/ts[i]
+                hess[j][k] = hess[k][j] = h
+        d = py_solve(hess, [-g for g in grad])
+
+        # Largest step staying inside the region, then backtrack until the
+        # objective function decreases beyond its rounding error
+        step = 1.0
+        dts = [sum([d[j]*Kms[j][i] for j in phases_m1]) for i in cmps]
+        for i in cmps:
+            if dts[i] < 0.0:
+                limit = 0.99*(ts[i] - t_min[i])/-dts[i]
+                if limit < step:
+                    step = limit
+        F = -sum([ns[i]*log(ts[i]) for i in cmps])
+        slope = sum([grad[j]*d[j] for j in phases_m1])
+        F_tol = 1e-14*(1.0 + abs(F))
+        for _ in range(30):
+            ts_new = [ts[i] + step*dts[i] for i in cmps]
+            F_new = -sum([ns[i]*log(ts_new[i]) for i in cmps])
+            if F_new <= F + 1e-4*step*slope + F_tol:
+                break
+            step *= 0.5
+
+        B_max = max(abs(b) for b in B)
+        B = [B[j] + step*d[j] for j in phases_m1]
+        ts = ts_new
+        if max(abs(v) for v in d) <= xtol*max(1.0, B_max):
+            converged = True
+            break
+    if not converged:
+        return Rachford_Rice_solutionN(ns, Ks, betas)
+
+    xs = [ns[i]/ts[i] for i in cmps]
+    compositions = [[Ks[j][i]*xs[i] for i in cmps] for j in phases_m1]
+    compositions.append(xs)
+    return B + [1.0 - sum(B)], compositions
 
 
 def sequential_substitution_Mehra_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
@@ -435,6 +1255,8 @@ def sequential_substitution_Mehra_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
     gs = []
     import numpy as np
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('sequential_substitution_Mehra_2P', iteration, V_over_F=V_over_F, xs=xs, ys=ys)
         g = gas_phase.to_TP_zs(T=T, P=P, zs=ys)
         l = liquid_phase.to_TP_zs(T=T, P=P, zs=xs)
 
@@ -461,7 +1283,7 @@ def sequential_substitution_Mehra_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
             lambdas = np.abs(gis.T*gis/(gis_old.T*(gis - gis_old))).tolist() # 34, working
             lambdas = [min(max(li, lambda_min), lambda_max) for li in lambdas]
 #            print(lambdas[0:5])
-            print(lambdas)
+#            print(lambdas)
 #            print('Ks', Ks, )
 #            print(Ks[-1], phis_l[-1], phis_g[-1], lambdas[-1], gis[-1], gis_old[-1])
             Ks = [Ks[i]*(phis_l[i]/phis_g[i]/Ks[i])**lambdas[i] for i in cmps]
@@ -496,7 +1318,7 @@ def sequential_substitution_Mehra_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
             # Could divide by the old Ks as well.
             err_i = Ki*xi/yi - 1.0
             err += err_i*err_i
-        print(err)
+#        print(err)
         # Accept the new compositions
         xs, ys = xs_new, ys_new
         # Check for
@@ -527,6 +1349,8 @@ def sequential_substitution_GDEM3_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
     all_lnKs = []
 
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('sequential_substitution_GDEM3_2P', iteration, V_over_F=V_over_F, xs=xs, ys=ys)
         g = gas_phase.to_TP_zs(T=T, P=P, zs=ys)
         l = liquid_phase.to_TP_zs(T=T, P=P, zs=xs)
 
@@ -553,7 +1377,7 @@ def sequential_substitution_GDEM3_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
         lnKs = [(l - g) for l, g in zip(lnphis_l, lnphis_g)]
         if not (iteration %acc_frequency) and iteration > acc_delay:
             dlnKs = gdem(lnKs, all_lnKs[-1], all_lnKs[-2], all_lnKs[-3])
-            print(dlnKs)
+#            print(dlnKs)
             lnKs = [lnKs[i] + dlnKs[i] for i in cmps]
 
 
@@ -637,6 +1461,8 @@ def nonlin_equilibrium_NP(T, P, zs, compositions_guesses, betas_guesses,
         except:
             flows = list(flows)
         iterations += 1
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('nonlin_equilibrium_NP', iterations, flows=flows)
         iter_flows = []
         iter_comps = []
         iter_betas = []
@@ -786,6 +1612,8 @@ def nonlin_spec_NP(guess, fixed_val, spec_val, zs, compositions_guesses, betas_g
             flows = flows.tolist()
         except:
             flows = list(flows)
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('nonlin_spec_NP', iterations, flows=flows)
         iter_val = flows[-1]
         phase_kwargs[iter_var] = iter_val
         flows = flows[:-1]
@@ -876,7 +1704,7 @@ def nonlin_spec_NP(guess, fixed_val, spec_val, zs, compositions_guesses, betas_g
                             v_ref = dlnfugacities_ref[i][j]/beta_ref
                             jac_arr[nj*N + i][kj*N + j] = dlnfugacities[i][j]*delta/iter_betas[ni] + v_ref
 
-            dlnphis_dspec = [dlnphis_diter_callables[i](phases[i]) for i in phase_iter]
+            dlnphis_dspec = [dlnphis_diter_callables[i](iter_phases[i]) for i in phase_iter]
             dlnphis_dspec_ref = dlnphis_dspec[ref_phase]
             for ni, nj in zip(phase_iter_n1, phase_iter_n1_0):
                 p = iter_phases[ni]
@@ -889,7 +1717,7 @@ def nonlin_spec_NP(guess, fixed_val, spec_val, zs, compositions_guesses, betas_g
                 dspec_calc += dspec_diter_callables[k](iter_phases[k])*iter_betas[k]
             jac_arr[-1][-1] = dspec_calc
 
-            dspec_dns = [dspec_dn_callables[i](phases[i]) for i in phase_iter]
+            dspec_dns = [dspec_dn_callables[i](iter_phases[i]) for i in phase_iter]
             dspec_dns_ref = dspec_dns[ref_phase]
             last_jac_row = jac_arr[-1]
 
@@ -1082,6 +1910,267 @@ def nonlin_2P_HSGUAbeta(spec, spec_var, iter_val, iter_var, fixed_val,
         tot_err += abs(v)
     return V_over_F, solution[-1], xs, ys, info[1], info[2], info[0], tot_err
 
+def _spec_dns(phase, spec):
+    # Mole number derivatives of the molar `spec` property of a phase at
+    # constant T and P, built from the H, S and V derivatives
+    if spec == 'H':
+        return phase.dH_dns()
+    elif spec == 'S':
+        return phase.dS_dns()
+    dH_dns = phase.dH_dns()
+    N = len(dH_dns)
+    if spec in ('U', 'A'):
+        P = phase.P
+        dV_dns = phase.dV_dns()
+        dH_dns = [dH_dns[i] - P*dV_dns[i] for i in range(N)]
+    if spec in ('G', 'A'):
+        T = phase.T
+        dS_dns = phase.dS_dns()
+        dH_dns = [dH_dns[i] - T*dS_dns[i] for i in range(N)]
+    return dH_dns
+
+def nonlin_2P_HSGUAbeta_newton(spec, spec_var, iter_val, iter_var, fixed_val,
+                               fixed_var, zs, xs_guess, ys_guess, liquid_phase,
+                               gas_phase, maxiter=100, tol=1E-10,
+                               trivial_solution_tol=1e-5, V_over_F_guess=None,
+                               max_step_iter=0.2, line_search_steps=20):
+    r'''Solve a two-phase flash with one of `T` or `P` specified along with
+    an energy or entropy specification (`H`, `S`, `U`, `G` or `A`) by
+    Newton's method on the variables (:math:`\ln K_i`, :math:`\beta`,
+    `iter_var`), using a fully analytical Jacobian.
+
+    The residuals are the equality of fugacities, the Rachford-Rice
+    equation, and the specification balance:
+
+    .. math::
+        F_i = \ln K_i + \ln \phi_i^g - \ln \phi_i^l
+
+    .. math::
+        F_{N+1} = \sum_i \frac{z_i(K_i - 1)}{1 + \beta(K_i - 1)}
+
+    .. math::
+        F_{N+2} = \frac{\beta X^g + (1-\beta)X^l - X_{spec}}{RT}
+
+    The Jacobian is assembled from `dlnphis_dns`, `dlnphis_dT` (or
+    `dlnphis_dP`), the mole number derivatives of `H`, `S` and `V`, and the
+    temperature (or pressure) derivative of the specified property, which
+    for `H` is the heat capacity. Each Newton step is followed by a
+    backtracking line search on the sum of squared residuals.
+
+    Parameters
+    ----------
+    spec : float
+        Value of the specified property, [J/mol or J/mol/K]
+    spec_var : str
+        Name of the specified property; one of 'H', 'S', 'U', 'G', 'A', [-]
+    iter_val : float
+        Initial guess for the unknown of `T` or `P`, [K or Pa]
+    iter_var : str
+        Name of the unknown; 'T' or 'P', [-]
+    fixed_val : float
+        Specified value of the other of `T` or `P`, [Pa or K]
+    fixed_var : str
+        Name of the specified state variable; 'P' or 'T', [-]
+    zs : list[float]
+        Overall mole fractions, [-]
+    xs_guess : list[float]
+        Initial guess for the liquid mole fractions, [-]
+    ys_guess : list[float]
+        Initial guess for the gas mole fractions, [-]
+    liquid_phase : Phase
+        Liquid phase object; must implement `dlnphis_dns`, [-]
+    gas_phase : Phase
+        Gas phase object; must implement `dlnphis_dns`, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations, [-]
+    tol : float, optional
+        Convergence tolerance on the largest absolute residual, [-]
+    trivial_solution_tol : float, optional
+        If all `ln K` values fall below this the flash is considered to have
+        converged to the trivial solution, [-]
+    V_over_F_guess : float, optional
+        Initial guess for the gas phase fraction, [-]
+    max_step_iter : float, optional
+        Largest allowed relative change in `iter_var` per iteration, [-]
+    line_search_steps : int, optional
+        Maximum number of step halvings in the line search, [-]
+
+    Returns
+    -------
+    V_over_F : float
+        Gas phase fraction, [-]
+    iter_val : float
+        Solved value of `iter_var`, [K or Pa]
+    xs : list[float]
+        Liquid mole fractions, [-]
+    ys : list[float]
+        Gas mole fractions, [-]
+    l : Phase
+        Liquid phase at the solution, [-]
+    g : Phase
+        Gas phase at the solution, [-]
+    iterations : int
+        Number of Newton iterations performed, [-]
+    err : float
+        Sum of the absolute residuals at the solution, [-]
+
+    Notes
+    -----
+    The phase fraction is not bounded; a solution outside of 0 to 1 means the
+    specification is satisfied by a single phase, which is left for the caller
+    to handle. Compositions are normalized before each phase evaluation; as
+    `lnphis` is homogeneous of degree zero in the mole numbers, their
+    derivatives with respect to the unnormalized compositions are those with
+    respect to mole numbers divided by the sum of the unnormalized
+    compositions.
+    '''
+    N = len(zs)
+    cmps = range(N)
+    if V_over_F_guess is None:
+        beta = 0.5
+    else:
+        beta = V_over_F_guess
+    lnKs = [log(ys_guess[i]/xs_guess[i]) for i in cmps]
+
+    if iter_var == 'T':
+        T_scale = iter_val
+    else:
+        T_scale = fixed_val
+    if spec_var == 'S':
+        scale = R_inv
+    else:
+        scale = R_inv/T_scale
+
+    dlnphis_diter_s = 'dlnphis_d' + iter_var
+    dspec_diter_s = 'd%s_d%s' %(spec_var, iter_var)
+    kwargs = {fixed_var: fixed_val}
+
+    def evaluate(lnKs, beta, iter_val):
+        Ks = [exp(lnKi) for lnKi in lnKs]
+        Ds = [1.0 + beta*(Ki - 1.0) for Ki in Ks]
+        for Di in Ds:
+            if Di <= 0.0:
+                return None
+        xs_raw = [zs[i]/Ds[i] for i in cmps]
+        ys_raw = [Ks[i]*xs_raw[i] for i in cmps]
+        sx, sy = sum(xs_raw), sum(ys_raw)
+        kwargs[iter_var] = iter_val
+        l = liquid_phase.to(zs=[xi/sx for xi in xs_raw], **kwargs)
+        g = gas_phase.to(zs=[yi/sy for yi in ys_raw], **kwargs)
+        lnphis_l, lnphis_g = l.lnphis(), g.lnphis()
+        spec_l, spec_g = getattr(l, spec_var)(), getattr(g, spec_var)()
+        Fs = [lnKs[i] + lnphis_g[i] - lnphis_l[i] for i in cmps]
+        Fs.append(sy - sx)
+        Fs.append((beta*spec_g + (1.0 - beta)*spec_l - spec)*scale)
+        return Fs, (Ks, Ds, xs_raw, ys_raw, sx, sy, l, g, spec_l, spec_g)
+
+    ans = evaluate(lnKs, beta, iter_val)
+    if ans is None:
+        raise ValueError("Initial guesses give negative phase compositions")
+    Fs, state = ans
+    size = N + 2
+    iterations = 0
+    while True:
+        err = max(abs(Fi) for Fi in Fs)
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('nonlin_2P_HSGUAbeta_newton', iterations, err,
+                                 lnKs=lnKs, V_over_F=beta, iter_val=iter_val)
+        if err < tol:
+            break
+        if iterations >= maxiter:
+            raise UnconvergedError('End of iterations reached')
+        iterations += 1
+
+        Ks, Ds, xs_raw, ys_raw, sx, sy, l, g, spec_l, spec_g = state
+        dlnphis_dns_l, dlnphis_dns_g = l.dlnphis_dns(), g.dlnphis_dns()
+        dlnphis_diter_l = getattr(l, dlnphis_diter_s)()
+        dlnphis_diter_g = getattr(g, dlnphis_diter_s)()
+        dspec_dns_l, dspec_dns_g = _spec_dns(l, spec_var), _spec_dns(g, spec_var)
+        dspec_diter_l = getattr(l, dspec_diter_s)()
+        dspec_diter_g = getattr(g, dspec_diter_s)()
+
+        one_m_beta = 1.0 - beta
+        sx_inv, sy_inv = 1.0/sx, 1.0/sy
+        # Derivatives of the unnormalized compositions
+        dxs_dlnKs, dys_dlnKs, dxs_dbeta, dys_dbeta = [], [], [], []
+        for i in cmps:
+            t = Ks[i]*xs_raw[i]/Ds[i]
+            dxs_dlnKs.append(-beta*t)
+            dys_dlnKs.append(one_m_beta*t)
+            dx = -xs_raw[i]*(Ks[i] - 1.0)/Ds[i]
+            dxs_dbeta.append(dx)
+            dys_dbeta.append(Ks[i]*dx)
+
+        J = [[0.0]*size for _ in range(size)]
+        for i in cmps:
+            Ji = J[i]
+            dl, dg = dlnphis_dns_l[i], dlnphis_dns_g[i]
+            dbeta = 0.0
+            for j in cmps:
+                dlj, dgj = dl[j]*sx_inv, dg[j]*sy_inv
+                Ji[j] = dgj*dys_dlnKs[j] - dlj*dxs_dlnKs[j]
+                dbeta += dgj*dys_dbeta[j] - dlj*dxs_dbeta[j]
+            Ji[i] += 1.0
+            Ji[N] = dbeta
+            Ji[N+1] = dlnphis_diter_g[i] - dlnphis_diter_l[i]
+
+        J_RR, J_spec = J[N], J[N+1]
+        dRR_dbeta = 0.0
+        dspec_dbeta = spec_g - spec_l
+        for j in cmps:
+            J_RR[j] = dys_dlnKs[j] - dxs_dlnKs[j]
+            dRR_dbeta += dys_dbeta[j] - dxs_dbeta[j]
+            dsg, dsl = beta*dspec_dns_g[j]*sy_inv, one_m_beta*dspec_dns_l[j]*sx_inv
+            J_spec[j] = (dsg*dys_dlnKs[j] + dsl*dxs_dlnKs[j])*scale
+            dspec_dbeta += dsg*dys_dbeta[j] + dsl*dxs_dbeta[j]
+        J_RR[N] = dRR_dbeta
+        J_spec[N] = dspec_dbeta*scale
+        J_spec[N+1] = (beta*dspec_diter_g + one_m_beta*dspec_diter_l)*scale
+
+        dx = py_solve(J, [-Fi for Fi in Fs])
+        # Limit the change in the unknown state variable
+        step = 1.0
+        max_diter = max_step_iter*abs(iter_val)
+        if abs(dx[-1]) > max_diter:
+            step = max_diter/abs(dx[-1])
+
+        # Backtracking line search on the sum of squared residuals
+        f0 = 0.0
+        for Fi in Fs:
+            f0 += Fi*Fi
+        for _ in range(line_search_steps):
+            lnKs_new = [lnKs[i] + step*dx[i] for i in cmps]
+            beta_new = beta + step*dx[N]
+            iter_val_new = iter_val + step*dx[N+1]
+            ans = evaluate(lnKs_new, beta_new, iter_val_new)
+            if ans is not None:
+                f1 = 0.0
+                for Fi in ans[0]:
+                    f1 += Fi*Fi
+                if f1 <= (1.0 - 2e-4*step)*f0:
+                    break
+            step *= 0.5
+        if ans is None:
+            raise UnconvergedError('Line search failed to find valid phase compositions')
+        lnKs, beta, iter_val = lnKs_new, beta_new, iter_val_new
+        Fs, state = ans
+
+        trivial = True
+        for lnKi in lnKs:
+            if abs(lnKi) > trivial_solution_tol:
+                trivial = False
+                break
+        if trivial:
+            raise TrivialSolutionError("Converged to trivial condition, compositions of both phases equal",
+                                       0.0, iterations, err)
+
+    Ks, Ds, xs_raw, ys_raw, sx, sy, l, g, spec_l, spec_g = state
+    tot_err = 0.0
+    for Fi in Fs:
+        tot_err += abs(Fi)
+    return beta, iter_val, l.zs, g.zs, l, g, iterations, tot_err
+
+
 #def broyden2(xs, fun, jac, xtol=1e-7, maxiter=100, jac_has_fun=False,
 #             skip_J=False):
 
@@ -1150,6 +2239,8 @@ def nonlin_2P_newton(T, P, zs, xs_guess, ys_guess, liquid_phase,
 
     info = []
     def to_solve(lnKsVF):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('nonlin_2P_newton', lnKsVF=lnKsVF)
         # Jacobian verified. However, very sketchy - mole fractions may want
         # to go negative.
         lnKs = lnKsVF[:-1]
@@ -1674,6 +2765,8 @@ def dew_bubble_newton_zs(guess, fixed_val, zs, liquid_phase, gas_phase,
     kwargs[fixed_var] = fixed_val
     kwargs['V'] = None
     def to_solve_comp(iter_vals, jac=True):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('dew_bubble_newton_zs', iter_vals=iter_vals)
         comp = iter_vals[:-1]
         iter_val = iter_vals[-1]
 
@@ -1784,6 +2877,8 @@ def dew_bubble_Michelsen_Mollerup(guess, fixed_val, zs, liquid_phase, gas_phase,
 
     successive_fails = 0
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('dew_bubble_Michelsen_Mollerup', iteration, guess=guess, comp_guess=comp_guess)
         kwargs[iter_var] = guess
         try:
             const_phase = const_phase.to_TP_zs(zs=zs, **kwargs)
@@ -2070,6 +3165,8 @@ def bubble_T_Michelsen_Mollerup(T_guess, P, zs, liquid_phase, gas_phase,
     T_guess_old = None
     successive_fails = 0
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('bubble_T_Michelsen_Mollerup', iteration, T_guess=T_guess)
         try:
             g = gas_phase.to_TP_zs(T=T_guess, P=P, zs=ys)
             lnphis_g = g.lnphis()
@@ -2145,6 +3242,8 @@ def dew_T_Michelsen_Mollerup(T_guess, P, zs, liquid_phase, gas_phase,
     T_guess_old = None
     successive_fails = 0
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('dew_T_Michelsen_Mollerup', iteration, T_guess=T_guess)
         try:
             g = gas_phase.to_TP_zs(T=T_guess, P=P, zs=zs)
             lnphis_g = g.lnphis()
@@ -2220,6 +3319,8 @@ def bubble_P_Michelsen_Mollerup(P_guess, T, zs, liquid_phase, gas_phase,
     P_guess_old = None
     successive_fails = 0
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('bubble_P_Michelsen_Mollerup', iteration, P_guess=P_guess)
         try:
             g = gas_phase = gas_phase.to_TP_zs(T=T, P=P_guess, zs=ys)
             lnphis_g = g.lnphis()
@@ -2291,6 +3392,8 @@ def dew_P_Michelsen_Mollerup(P_guess, T, zs, liquid_phase, gas_phase,
     P_guess_old = None
     successive_fails = 0
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('dew_P_Michelsen_Mollerup', iteration, P_guess=P_guess)
         try:
             g = gas_phase = gas_phase.to_TP_zs(T=T, P=P_guess, zs=zs)
             lnphis_g = g.lnphis()
@@ -2350,6 +3453,275 @@ def dew_P_Michelsen_Mollerup(P_guess, T, zs, liquid_phase, gas_phase,
     return P_guess, xs, l, g, iteration, abs(P_guess - P_guess_old)
 
 
+def envelope_2P_Michelsen_residuals(X, spec_idx, spec_val, zs, beta,
+                                    x_phase, y_phase):
+    # Residuals and jacobian of the saturation equations in the variables
+    # [lnK_0, ..., lnK_N-1, lnT, lnP]; `y_phase` is the phase model of the
+    # y = K*x composition and `x_phase` the one of x
+    N = len(zs)
+    lnKs = X[:N]
+    T, P = exp(X[N]), exp(X[N+1])
+    Ks = np.exp(lnKs)
+    Ds = 1.0 - beta + beta*Ks
+    xs = zs/Ds
+    ys = Ks*xs
+    x_sum, y_sum = float(xs.sum()), float(ys.sum())
+
+    py = y_phase.to_TP_zs(T=T, P=P, zs=(ys/y_sum).tolist())
+    px = x_phase.to_TP_zs(T=T, P=P, zs=(xs/x_sum).tolist())
+
+    F = np.zeros(N + 2)
+    F[:N] = lnKs + np.array(py.lnphis()) - np.array(px.lnphis())
+    F[N] = y_sum - x_sum
+    F[N+1] = X[spec_idx] - spec_val
+
+    J = np.zeros((N + 2, N + 2))
+    # Composition derivatives; lnphis are homogeneous of degree zero in the
+    # mole numbers so the unnormalized compositions scale the derivatives
+    dys_dlnKs = ys*(1.0 - beta)/Ds
+    dxs_dlnKs = -xs*beta*Ks/Ds
+    J[:N, :N] = (np.array(py.dlnphis_dns())*(dys_dlnKs/y_sum)
+                 - np.array(px.dlnphis_dns())*(dxs_dlnKs/x_sum))
+    J[:N, :N] += np.eye(N)
+    J[:N, N] = T*(np.array(py.dlnphis_dT()) - np.array(px.dlnphis_dT()))
+    J[:N, N+1] = P*(np.array(py.dlnphis_dP()) - np.array(px.dlnphis_dP()))
+    J[N, :N] = dys_dlnKs - dxs_dlnKs
+    J[N+1, spec_idx] = 1.0
+    return F, J, px, py
+
+def envelope_2P_Michelsen_point(X, spec_idx, spec_val, zs, beta,
+                                x_phase, y_phase, maxiter=25, xtol=1e-10,
+                                ftol=1e-12, trivial_solution_tol=1e-5):
+    N = len(zs)
+    X = X.copy()
+    small_step = False
+    for iteration in range(maxiter):
+        F, J, px, py = envelope_2P_Michelsen_residuals(X, spec_idx, spec_val, zs, beta,
+                                                       x_phase, y_phase)
+        # Near the critical point the jacobian is nearly singular and the
+        # step may not become small even once the residuals are
+        if small_step or np.abs(F).max() < ftol:
+            if np.abs(X[:N]).max() < trivial_solution_tol:
+                raise TrivialSolutionError("Converged to trivial condition, compositions of both phases equal",
+                                           np.abs(X[:N]).max(), iteration, X[N], X[N+1])
+            return X, J, iteration
+        dX = np.linalg.solve(J, -F)
+        # Damp large steps in T and P which can leave the valid range of the models
+        max_step = max(abs(dX[N]), abs(dX[N+1]))
+        if max_step > 0.2:
+            dX *= 0.2/max_step
+        X += dX
+        small_step = np.abs(dX).max() < xtol
+    raise UnconvergedError("Failed to converge a phase envelope point")
+
+def envelope_2P_Michelsen(zs, T, P, Ks, liquid_phase, gas_phase, beta=1.0,
+                          P_min=None, P_max=1e9, T_min=None, T_max=None,
+                          step=0.05, max_points=1000, maxiter=25, xtol=1e-10,
+                          ftol=1e-12, max_dlnK=0.25, max_dlnT=0.05,
+                          max_dlnP=0.25, min_step=1e-6, critical_lnK=0.1):
+    r'''Trace a phase envelope of constant phase fraction `beta` by natural
+    parameter continuation as described in [1]_, starting from a converged
+    saturation point.
+
+    Each point is solved with Newton's method in the variables
+    :math:`[\ln K_i, \ln T, \ln P]`, using the analytical jacobian formed from
+    the composition, temperature and pressure derivatives of the log
+    fugacity coefficients of both phases. The specified variable is the one
+    with the largest sensitivity along the curve, so cricondentherms and
+    cricondenbars are passed without difficulty. The initial guess of each
+    point is extrapolated from those sensitivities, and the step is grown or
+    shrunk according to the number of iterations the last point took.
+
+    Near the critical point all the K values approach 1; when a step would
+    cross the critical point, it is set to land on the opposite side at the
+    mirrored value of the most sensitive :math:`\ln K`, and the phase models
+    of the two compositions are switched. The critical point is estimated by
+    linear interpolation between those two points.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Overall mole fractions of all species, [-]
+    T : float
+        Temperature of the starting point, [K]
+    P : float
+        Pressure of the starting point, [Pa]
+    Ks : list[float]
+        Equilibrium K values at the starting point; y = K*x, [-]
+    liquid_phase : Phase
+        Phase to use for the liquid, [-]
+    gas_phase : Phase
+        Phase to use for the gas, [-]
+    beta : float, optional
+        Vapor phase fraction of the envelope; 1 to start on the dew point
+        curve and 0 on the bubble point curve, [-]
+    P_min : float, optional
+        The tracing stops once the pressure falls below this value, and the
+        last point is set to it exactly; defaults to `P`, [Pa]
+    P_max : float, optional
+        The tracing stops if the pressure goes above this value, [Pa]
+    T_min : float, optional
+        The tracing stops if the temperature goes below this value, [K]
+    T_max : float, optional
+        The tracing stops if the temperature goes above this value, [K]
+    step : float, optional
+        Initial step in `lnP`, [-]
+    max_points : int, optional
+        Maximum number of points to calculate, [-]
+    maxiter : int, optional
+        Maximum number of newton iterations for each point, [-]
+    xtol : float, optional
+        Convergence tolerance on the newton step for each point, [-]
+    ftol : float, optional
+        Convergence tolerance on the equilibrium residuals for each point, [-]
+    max_dlnK : float, optional
+        Maximum change in any `lnK` between two points, [-]
+    max_dlnT : float, optional
+        Maximum change in `lnT` between two points, [-]
+    max_dlnP : float, optional
+        Maximum change in `lnP` between two points, [-]
+    min_step : float, optional
+        The tracing stops if a point cannot be converged with a step in the
+        specified variable smaller than this, [-]
+    critical_lnK : float, optional
+        Magnitude of the largest `lnK` below which a step crossing the
+        critical point is taken directly, [-]
+
+    Returns
+    -------
+    Ts : ndarray
+        Temperatures along the envelope, [K]
+    Ps : ndarray
+        Pressures along the envelope, [Pa]
+    Ks : ndarray
+        K values (vapor over liquid mole fractions) along the envelope, shape
+        (points, N), [-]
+    critical : tuple(float, float) or None
+        Estimated critical temperature and pressure, if the envelope passes
+        through the critical point, [K, Pa]
+
+    References
+    ----------
+    .. [1] Michelsen, Michael L. "Calculation of Phase Envelopes and Critical
+       Points for Multicomponent Mixtures." Fluid Phase Equilibria 4, no. 1
+       (1980): 1-10. https://doi.org/10.1016/0378-3812(80)80001-X.
+    '''
+    N = len(zs)
+    zs = np.array(zs, dtype=float)
+    if P_min is None:
+        P_min = P
+    lnP_min = log(P_min)
+    lnT_min = log(T_min) if T_min is not None else -1e100
+    lnT_max = log(T_max) if T_max is not None else 1e100
+    lnP_max = log(P_max)
+    max_steps = np.array([max_dlnK]*N + [max_dlnT, max_dlnP])
+
+    y_phase, x_phase = gas_phase, liquid_phase
+    X = np.array([log(K) for K in Ks] + [log(T), log(P)])
+    spec_idx = N + 1
+    X, J, iterations = envelope_2P_Michelsen_point(X, spec_idx, X[spec_idx], zs, beta,
+                                                   x_phase, y_phase,
+                                                   maxiter=maxiter, xtol=xtol, ftol=ftol)
+    points = [X]
+    flipped = [False]
+    critical = None
+    dS = step
+    P_rising = True
+
+    while len(points) < max_points:
+        # Sensitivities of all variables to the current specification
+        rhs = np.zeros(N + 2)
+        rhs[-1] = 1.0
+        sens = np.linalg.solve(J, rhs)
+        # Switch to the most sensitive variable, keeping the same step
+        new_spec_idx = int(np.abs(sens).argmax())
+        dS *= sens[new_spec_idx]
+        sens = sens/sens[new_spec_idx]
+        spec_idx = new_spec_idx
+        if iterations <= 3:
+            dS *= 1.5
+        elif iterations >= 6:
+            dS *= 0.6
+        limit = (max_steps/np.maximum(np.abs(sens), 1e-300)).min()
+        if abs(dS) > limit:
+            dS = copysign(limit, dS)
+
+        converged = False
+        while abs(dS) >= min_step:
+            crossing = False
+            lnKs = X[:N]
+            ref = int(np.abs(lnKs).argmax())
+            lnK_ref = lnKs[ref]
+            lnK_ref_guess = lnK_ref + sens[ref]*dS
+            if lnK_ref_guess*lnK_ref <= 0.0 or abs(lnK_ref_guess) < 0.5*critical_lnK:
+                # The step approaches or crosses the critical point; either
+                # approach it in halving steps or jump to the other side
+                if abs(lnK_ref) > critical_lnK:
+                    dS_ref = -0.5*lnK_ref
+                else:
+                    dS_ref = -2.0*lnK_ref
+                    crossing = True
+                dS_try = dS_ref/sens[ref]
+                if abs(dS_try) > abs(dS) and not crossing:
+                    dS_try = dS
+            else:
+                dS_try = dS
+            X_guess = X + sens*dS_try
+            try:
+                if crossing:
+                    X_new, J_new, iterations = envelope_2P_Michelsen_point(
+                        X_guess, ref, X_guess[ref], zs, beta, y_phase, x_phase,
+                        maxiter=maxiter, xtol=xtol, ftol=ftol)
+                else:
+                    X_new, J_new, iterations = envelope_2P_Michelsen_point(
+                        X_guess, spec_idx, X_guess[spec_idx], zs, beta, x_phase,
+                        y_phase, maxiter=maxiter, xtol=xtol, ftol=ftol)
+            except Exception:
+                dS *= 0.5
+                continue
+            if crossing:
+                if X_new[ref]*lnK_ref >= 0.0:
+                    # Converged back to the same side
+                    dS *= 0.5
+                    continue
+                frac = lnK_ref/(lnK_ref - X_new[ref])
+                critical = (exp(X[N] + frac*(X_new[N] - X[N])),
+                            exp(X[N+1] + frac*(X_new[N+1] - X[N+1])))
+                y_phase, x_phase = x_phase, y_phase
+                # The step was taken in lnK_ref; continue with that specification
+                spec_idx = ref
+                dS = X_new[ref] - X[ref]
+            converged = True
+            break
+        if not converged:
+            break
+
+        if X_new[N+1] < X[N+1]:
+            P_rising = False
+        if not P_rising and X_new[N+1] < lnP_min:
+            # Finish exactly at the minimum pressure
+            try:
+                X_new, J_new, iterations = envelope_2P_Michelsen_point(
+                    X_new, N+1, lnP_min, zs, beta, x_phase, y_phase,
+                    maxiter=maxiter, xtol=xtol, ftol=ftol)
+                points.append(X_new)
+                flipped.append(critical is not None)
+            except Exception:
+                pass
+            break
+        if not (lnT_min <= X_new[N] <= lnT_max) or X_new[N+1] > lnP_max:
+            break
+        points.append(X_new)
+        flipped.append(critical is not None)
+        X, J = X_new, J_new
+
+    points = np.array(points)
+    # Past the critical point the phase models of x and y are swapped
+    lnKs = points[:, :N]
+    lnKs[flipped] *= -1.0
+    return np.exp(points[:, N]), np.exp(points[:, N+1]), np.exp(lnKs), critical
+
+
 # spec, iter_var, fixed_var
 strs_to_ders = {('H', 'T', 'P'): 'dH_dT_P',
                 ('S', 'T', 'P'): 'dS_dT_P',
@@ -2479,6 +3851,8 @@ def TPV_solve_HSGUA_1P(zs, phase, guess, fixed_var_val, spec_val,
     def to_solve(guess, solved_phase=None):
         global iterations
         iterations += 1
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('TPV_solve_HSGUA_1P', iterations, guess=guess)
 
         if solved_phase is not None:
             p = solved_phase
@@ -3351,6 +4725,8 @@ def sequential_substitution_2P_sat(T, P, V, zs_dry, xs_guess, ys_guess, liquid_p
 
 
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('sequential_substitution_2P_sat', iteration, xs=xs, ys=ys)
         p0, p1 = step(p0, p1, err0, err1), p0
         zs = list(zs_dry)
         zs[idx] = p0
@@ -3491,6 +4867,8 @@ def sequential_substitution_2P_HSGUAbeta(zs, xs_guess, ys_guess, liquid_phase,
 
     step_der = None
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('sequential_substitution_2P_HSGUAbeta', iteration, V_over_F=V_over_F, xs=xs, ys=ys)
         if (not (iteration % update_frequency) or err_eq < update_eq) or iteration < 2:
             p0, p1 = step(p0, p1, spec_err, spec_err_old, step_der), p0
         TPV_args[iter_var] = p0
@@ -3602,6 +4980,8 @@ def sequential_substitution_2P_double(zs, xs_guess, ys_guess, liquid_phase,
 
     step_der = None
     for iteration in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('sequential_substitution_2P_double', iteration, xs=xs, ys=ys)
         TPV_args[iter_var0] = iter0_val
         TPV_args[iter_var1] = iter1_val
 
@@ -3705,6 +5085,8 @@ def stabiliy_iteration_Michelsen(trial_phase, zs_test, test_phase=None,
     sum_zs_test = sum_zs_test_inv = 1.0
     converged = False
     for _ in range(maxiter):
+        if _flash_deadline.deadline is not None:
+            check_flash_deadline('stabiliy_iteration_Michelsen', zs_test=zs_test)
 #        test_phase = test_phase.to(T=T, P=P, zs=zs_test)
 #        fugacities_test = test_phase.fugacities_lowest_Gibbs()
         fugacities_test = test_phase.fugacities_at_zs(zs_test)
@@ -3752,22 +5134,244 @@ def stabiliy_iteration_Michelsen(trial_phase, zs_test, test_phase=None,
 
 
 
-def TPV_double_solve_1P(zs, phase, guesses, spec_vals,
-                        goal_specs=('V', 'U'), state_specs=('T', 'P'),
-                        maxiter=200, xtol=1E-10, ytol=None, spec_funs=None):
-    kwargs = {'zs': zs}
-    phase_cls = phase.__class__
-    s00 = 'd%s_d%s_%s' %(goal_specs[0], state_specs[0], state_specs[1])
-    s01 = 'd%s_d%s_%s' %(goal_specs[0], state_specs[1], state_specs[0])
-    s10 = 'd%s_d%s_%s' %(goal_specs[1], state_specs[0], state_specs[1])
-    s11 = 'd%s_d%s_%s' %(goal_specs[1], state_specs[1], state_specs[0])
-    try:
-        err0_fun = getattr(phase_cls, goal_specs[0])
-        err1_fun = getattr(phase_cls, goal_specs[1])
-        j00 = getattr(phase_cls, s00)
-        j01 = getattr(phase_cls, s01)
-        j10 = getattr(phase_cls, s10)
-        j11 = getattr(phase_cls, s11)
+def stability_iteration_Michelsen_functional(T, P, zs, zs_test, fugacities_trial,
+                                             model, kijs, bs, a_alphas, a_alpha_roots,
+                                             test_liquid=False, maxiter=20, xtol=1E-12):
+    r'''Array-based version of :obj:`stabiliy_iteration_Michelsen` for a test
+    phase described by one of the cubic equations of state in
+    :obj:`thermo.eos_mix_methods.lnphis_direct_models`. The fugacities of the
+    feed are computed once by the caller; those of the test phase are computed
+    with :obj:`thermo.eos_mix_methods.lnphis_direct`, so no phase objects are
+    created and the function can be compiled with numba. The feed must not
+    contain any zero mole fractions.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Mole fractions of the feed, [-]
+    zs_test : list[float]
+        Initial guess for the mole fractions of the test phase, [-]
+    fugacities_trial : list[float]
+        Fugacities of the feed, from its lowest Gibbs energy root, [Pa]
+    model : str
+        Name of the equation of state class, [-]
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alphas : list[float]
+        Pure component `a_alpha` terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+    test_liquid : bool, optional
+        Whether the test phase uses the liquid-like volume root, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    xtol : float, optional
+        Convergence tolerance on the sum of squared corrections, [-]
+
+    Returns
+    -------
+    sum_zs_test : float
+        Sum of the unnormalized test phase mole fractions, [-]
+    Ks : list[float]
+        Equilibrium ratios of the stationary point, [-]
+    zs_test : list[float]
+        Mole fractions of the stationary point, [-]
+    V_over_F : float
+        Phase fraction from a flash of the feed with `Ks`, [-]
+    trial_zs : list[float]
+        Mole fractions of the feed-like phase from that flash, [-]
+    appearing_zs : list[float]
+        Mole fractions of the appearing phase from that flash, [-]
+    dG_RT : float
+        Dimensionless Gibbs energy change of forming the appearing phase, [-]
+    '''
+    N = len(zs)
+    Ks = [0.0]*N
+    zs_test_work = [0.0]*N
+    for i in range(N):
+        zi = zs_test[i]
+        if zi == 0.0:
+            zi = 1e-50
+        zs_test_work[i] = zi
+        Ks[i] = zi/zs[i]
+    zs_test = zs_test_work
+
+    sum_zs_test = sum_zs_test_inv = 1.0
+    converged = False
+    for _ in range(maxiter):
+        if _flash_deadline.deadline is not None: # numba: delete
+            check_flash_deadline('stability_iteration_Michelsen_functional', zs_test=zs_test) # numba: delete
+        lnphis_test = lnphis_direct(zs_test, model, T, P, kijs, test_liquid, not test_liquid,
+                                    bs, a_alphas, a_alpha_roots)
+        err = 0.0
+        for i in range(N):
+            ci = fugacities_trial[i]/(P*zs_test[i]*exp(lnphis_test[i]))*sum_zs_test_inv
+            Ks[i] *= ci
+            err += (ci - 1.0)*(ci - 1.0)
+        if err < xtol:
+            converged = True
+            break
+
+        sum_zs_test = 0.0
+        for i in range(N):
+            zs_test[i] = Ks[i]*zs[i]
+            sum_zs_test += zs_test[i]
+        sum_zs_test_inv = 1.0/sum_zs_test
+        for i in range(N):
+            zs_test[i] *= sum_zs_test_inv
+
+    if not converged:
+        raise UnconvergedError('End of stability_iteration_Michelsen_functional without convergence')
+    try:
+        V_over_F, trial_zs, appearing_zs = flash_inner_loop(zs, Ks)
+    except _flash_inner_loop_errors: # numba: delete
+#    except: # numba: uncomment
+        # Converged to trivial solution so closely the math does not work
+        V_over_F, trial_zs, appearing_zs = 0.0, zs, zs
+
+    lnphis_test = lnphis_direct(zs_test, model, T, P, kijs, test_liquid, not test_liquid,
+                                bs, a_alphas, a_alpha_roots)
+    dG_RT = 0.0
+    for i in range(N):
+        dG_RT += zs_test[i]*(log(zs_test[i]) + lnphis_test[i])
+    dG_RT *= V_over_F
+    return sum_zs_test, Ks, zs_test, V_over_F, trial_zs, appearing_zs, dG_RT
+
+
+def stability_iteration_Michelsen_reduced(T, P, zs, zs_test, fugacities_trial,
+                                          model, groups, one_minus_kijs_groups,
+                                          bs, a_alphas, a_alpha_roots,
+                                          test_liquid=False, maxiter=20, xtol=1E-12):
+    r'''Version of :obj:`stability_iteration_Michelsen_functional` which
+    computes the fugacities of the test phase from its reduced variables with
+    :obj:`thermo.eos_mix_methods.lnphis_direct_reduced`, using the groups of
+    components with identical binary interaction parameters found by
+    :obj:`thermo.eos_mix_methods.kijs_reduction`. The cost of each iteration
+    grows linearly with the number of components instead of with its square.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Mole fractions of the feed, [-]
+    zs_test : list[float]
+        Initial guess for the mole fractions of the test phase, [-]
+    fugacities_trial : list[float]
+        Fugacities of the feed, from its lowest Gibbs energy root, [Pa]
+    model : str
+        Name of the equation of state class, [-]
+    groups : list[int]
+        Index of the group of each component, [-]
+    one_minus_kijs_groups : list[list[float]]
+        One minus the binary interaction parameters between each group, [-]
+    bs : list[float]
+        Covolume parameters of each component, [m^3/mol]
+    a_alphas : list[float]
+        Pure component `a_alpha` terms, [J^2/mol^2/Pa]
+    a_alpha_roots : list[float]
+        Square roots of the pure component `a_alpha` terms, [J/mol/Pa^0.5]
+    test_liquid : bool, optional
+        Whether the test phase uses the liquid-like volume root, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    xtol : float, optional
+        Convergence tolerance on the sum of squared corrections, [-]
+
+    Returns
+    -------
+    sum_zs_test : float
+        Sum of the unnormalized test phase mole fractions, [-]
+    Ks : list[float]
+        Equilibrium ratios of the stationary point, [-]
+    zs_test : list[float]
+        Mole fractions of the stationary point, [-]
+    V_over_F : float
+        Phase fraction from a flash of the feed with `Ks`, [-]
+    trial_zs : list[float]
+        Mole fractions of the feed-like phase from that flash, [-]
+    appearing_zs : list[float]
+        Mole fractions of the appearing phase from that flash, [-]
+    dG_RT : float
+        Dimensionless Gibbs energy change of forming the appearing phase, [-]
+    '''
+    N = len(zs)
+    Ks = [0.0]*N
+    zs_test_work = [0.0]*N
+    for i in range(N):
+        zi = zs_test[i]
+        if zi == 0.0:
+            zi = 1e-50
+        zs_test_work[i] = zi
+        Ks[i] = zi/zs[i]
+    zs_test = zs_test_work
+
+    sum_zs_test = sum_zs_test_inv = 1.0
+    converged = False
+    for _ in range(maxiter):
+        if _flash_deadline.deadline is not None: # numba: delete
+            check_flash_deadline('stability_iteration_Michelsen_reduced', zs_test=zs_test) # numba: delete
+        lnphis_test = lnphis_direct_reduced(zs_test, model, T, P, groups, one_minus_kijs_groups,
+                                            test_liquid, not test_liquid, bs, a_alphas, a_alpha_roots)
+        err = 0.0
+        for i in range(N):
+            ci = fugacities_trial[i]/(P*zs_test[i]*exp(lnphis_test[i]))*sum_zs_test_inv
+            Ks[i] *= ci
+            err += (ci - 1.0)*(ci - 1.0)
+        if err < xtol:
+            converged = True
+            break
+
+        sum_zs_test = 0.0
+        for i in range(N):
+            zs_test[i] = Ks[i]*zs[i]
+            sum_zs_test += zs_test[i]
+        sum_zs_test_inv = 1.0/sum_zs_test
+        for i in range(N):
+            zs_test[i] *= sum_zs_test_inv
+
+    if not converged:
+        raise UnconvergedError('End of stability_iteration_Michelsen_reduced without convergence')
+    try:
+        V_over_F, trial_zs, appearing_zs = flash_inner_loop(zs, Ks)
+    except _flash_inner_loop_errors: # numba: delete
+#    except: # numba: uncomment
+        # Converged to trivial solution so closely the math does not work
+        V_over_F, trial_zs, appearing_zs = 0.0, zs, zs
+
+    lnphis_test = lnphis_direct_reduced(zs_test, model, T, P, groups, one_minus_kijs_groups,
+                                        test_liquid, not test_liquid, bs, a_alphas, a_alpha_roots)
+    dG_RT = 0.0
+    for i in range(N):
+        dG_RT += zs_test[i]*(log(zs_test[i]) + lnphis_test[i])
+    dG_RT *= V_over_F
+    return sum_zs_test, Ks, zs_test, V_over_F, trial_zs, appearing_zs, dG_RT
+
+
+def TPV_double_solve_1P(zs, phase, guesses, spec_vals,
+                        goal_specs=('V', 'U'), state_specs=('T', 'P'),
+                        maxiter=200, xtol=1E-10, ytol=None, spec_funs=None):
+    kwargs = {'zs': zs}
+    phase_cls = phase.__class__
+    s00 = 'd%s_d%s_%s' %(goal_specs[0], state_specs[0], state_specs[1])
+    s01 = 'd%s_d%s_%s' %(goal_specs[0], state_specs[1], state_specs[0])
+    s10 = 'd%s_d%s_%s' %(goal_specs[1], state_specs[0], state_specs[1])
+    s11 = 'd%s_d%s_%s' %(goal_specs[1], state_specs[1], state_specs[0])
+    try:
+        err0_fun = getattr(phase_cls, goal_specs[0])
+        err1_fun = getattr(phase_cls, goal_specs[1])
+        j00 = getattr(phase_cls, s00)
+        j01 = getattr(phase_cls, s01)
+        j10 = getattr(phase_cls, s10)
+        j11 = getattr(phase_cls, s11)
     except:
         pass
 
@@ -4193,6 +5797,1618 @@ empty_flash_conv = {'iterations': 0, 'err': 0.0, 'stab_guess_name': None}
 one_in_list = [1.0]
 empty_list = []
 
+class _GridFlashContinuation(threading.local):
+    # Whether the current thread is hot starting a point of a continuation
+    # grid flash; a converged two phase PT hot start is then accepted without
+    # a stability test
+    active = False
+
+_grid_flash_continuation = _GridFlashContinuation()
+
+
+def grid_flash_row(flasher, zs, spec_keys, n0, spec0, spec1s, props=None,
+                   store=True, continuation=False, reverse=False, seeds=None):
+    r'''Flash one row of a grid of specifications, as used by
+    :obj:`Flash.grid_flash`. Failed flashes are recorded rather than raised.
+
+    In continuation mode, each point is hot started from the nearest
+    converged state - the previous point along the row, or the point in the
+    same column of `seeds`; a cold flash is only performed if that fails.
+    PT flashes of :obj:`FlashVL` hot started from a two phase state accept
+    the converged two phase result without a stability test.
+
+    Parameters
+    ----------
+    flasher : :obj:`Flash`
+        Flasher to perform the calculations with, [-]
+    zs : list[float]
+        Mole fractions of each component, [-]
+    spec_keys : list[str]
+        Names of the two specifications, [-]
+    n0 : int
+        Index of the row, [-]
+    spec0 : float
+        Value of the first specification, [various]
+    spec1s : list[float]
+        Values of the second specification, [various]
+    props : str or list[str], optional
+        Property or properties to calculate for each point, [-]
+    store : bool, optional
+        Whether or not to return the flash results, [-]
+    continuation : bool, optional
+        Whether or not to hot start each point from its neighbours, [-]
+    reverse : bool, optional
+        Whether to traverse the row from its last column to its first, [-]
+    seeds : list[EquilibriumState], optional
+        States of an adjacent row, used as hot starts in continuation mode,
+        [-]
+
+    Returns
+    -------
+    row_flashes : list[EquilibriumState] or None
+        Flash results, None for points which failed; None if neither `store`
+        nor `continuation` is True, [-]
+    row_props : list[float] or list[list[float]] or None
+        Calculated properties; None if `props` is not specified, [-]
+    failures : list[dict]
+        Records of the points which failed, [-]
+    '''
+    do_props = props is not None
+    scalar_props = isinstance(props, str)
+    N1 = len(spec1s)
+    keep = store or continuation
+    row_flashes = [None]*N1 if keep else None
+    row_props = [None]*N1 if do_props else None
+    failures = []
+    previous = last_converged = None
+    for n1 in (range(N1-1, -1, -1) if reverse else range(N1)):
+        flash_specs = {'zs': zs, spec_keys[0]: spec0, spec_keys[1]: spec1s[n1]}
+        state = None
+        if continuation:
+            hot_start = previous
+            if hot_start is None and seeds is not None:
+                hot_start = seeds[n1]
+            if hot_start is None:
+                hot_start = last_converged
+            if hot_start is not None:
+                _grid_flash_continuation.active = True
+                try:
+                    state = flasher.flash(hot_start=hot_start, **flash_specs)
+                except Exception:
+                    pass
+                finally:
+                    _grid_flash_continuation.active = False
+        if state is None:
+            try:
+                state = flasher.flash(**flash_specs)
+            except Exception as e:
+                failures.append({'index': (n0, n1), 'specs': flash_specs,
+                                 'error': e.__class__.__name__, 'message': str(e)})
+        previous = state
+        if state is not None:
+            last_converged = state
+        if keep:
+            row_flashes[n1] = state
+        if do_props:
+            if scalar_props:
+                state_props = state.value(props) if state is not None else None
+            else:
+                state_props = [state.value(s) for s in props] if state is not None else [None for s in props]
+            row_props[n1] = state_props
+    if reverse:
+        failures.reverse()
+    return row_flashes, row_props, failures
+
+_grid_flash_worker_flasher = None
+
+def _grid_flash_worker_init(flasher):
+    global _grid_flash_worker_flasher
+    _grid_flash_worker_flasher = flasher
+
+def _grid_flash_worker_row(flasher, zs, spec_keys, n0, spec0, spec1s, props,
+                           store, continuation):
+    if flasher is None:
+        flasher = _grid_flash_worker_flasher
+    row_flashes, row_props, failures = grid_flash_row(flasher, zs, spec_keys, n0, spec0, spec1s,
+                                                      props, store, continuation)
+    if not store:
+        row_flashes = None
+    elif row_flashes is not None:
+        # The parent process re-links the states to its own flasher; sending
+        # the flasher back is wasteful and not always possible
+        for state in row_flashes:
+            if state is not None:
+                _link_state_to_flasher(state, None)
+    return row_flashes, row_props, failures
+
+_state_flasher_links = ('flasher', 'constants', 'correlations', 'settings')
+
+def _link_state_to_flasher(state, flasher):
+    # Set `flasher` and its packages into a state and all its phases; None
+    # clears them
+    links = {k: getattr(flasher, k, None) for k in _state_flasher_links}
+    links['flasher'] = flasher
+    objs = [state, state.bulk] + state.phases
+    for k in ('liquid_bulk', 'solid_bulk'):
+        obj = getattr(state, k, None)
+        if obj is not None and not any(obj is o for o in objs):
+            objs.append(obj)
+    for obj in objs:
+        d = obj.__dict__
+        for k in _state_flasher_links:
+            if k in d:
+                d[k] = links[k]
+
+
+def dew_bubble_curve_path(flasher, zs_path, fixed_val, fixed_var='P', VF=0.0,
+                          liquid=None, gas=None):
+    r'''Calculate the bubble or dew points of a series of compositions, as
+    used by :obj:`FlashVL.dew_bubble_curve`. The points are solved in order,
+    and each one is started from the solution of the previous point, with the
+    unknown temperature or pressure linearly extrapolated from the two
+    previous points according to the distance between the compositions. A
+    point is only solved from scratch if this fails. Failed points are
+    recorded rather than raised.
+
+    Parameters
+    ----------
+    flasher : :obj:`FlashVL`
+        Flasher to perform the calculations with, [-]
+    zs_path : list[list[float]]
+        Mole fractions of each component at each point of the path, [-]
+    fixed_val : float
+        Specified temperature or pressure, [K or Pa]
+    fixed_var : str, optional
+        'T' for dew or bubble pressures or 'P' for dew or bubble temperatures,
+        [-]
+    VF : float, optional
+        Vapor fraction; 0 for bubble points and 1 for dew points, [-]
+    liquid : :obj:`Phase <thermo.phases.Phase>`, optional
+        Liquid phase to use; defaults to the first liquid of `flasher`, [-]
+    gas : :obj:`Phase <thermo.phases.Phase>`, optional
+        Gas phase to use; defaults to the gas of `flasher`, [-]
+
+    Returns
+    -------
+    vals : list[float]
+        Calculated bubble or dew temperatures or pressures, None for points
+        which failed, [K or Pa]
+    comps : list[list[float]]
+        Mole fractions of the incipient phase at each point - the gas for
+        bubble points and the liquid for dew points - None for points which
+        failed, [-]
+    failures : list[dict]
+        Records of the points which failed, [-]
+    '''
+    if liquid is None:
+        liquid = flasher.liquids[0]
+    if gas is None:
+        gas = flasher.gas
+    if fixed_var == 'P':
+        solver, iter_var = flasher.flash_PVF_2P, 'T'
+    elif fixed_var == 'T':
+        solver, iter_var = flasher.flash_TVF_2P, 'P'
+    else:
+        raise ValueError("fixed_var must be 'T' or 'P'")
+    constants, correlations = flasher.constants, flasher.correlations
+    bubble = VF == 0.0
+    N_pts = len(zs_path)
+    vals = [None]*N_pts
+    comps = [None]*N_pts
+    failures = []
+    # Solved neighbours as (composition, value, liquid, gas), most recent last
+    previous = []
+    for i in range(N_pts):
+        zs = list(zs_path[i])
+        sln = None
+        if previous:
+            zs1, val1, l1, g1 = previous[-1]
+            guess = val1
+            if len(previous) > 1:
+                zs0, val0 = previous[-2][0], previous[-2][1]
+                d01 = sum([(a - b)*(a - b) for a, b in zip(zs1, zs0)])**0.5
+                d12 = sum([(a - b)*(a - b) for a, b in zip(zs, zs1)])**0.5
+                if d01 > 0.0:
+                    guess = val1 + (val1 - val0)*d12/d01
+                    if guess <= 0.0:
+                        guess = val1
+            T, P = (guess, fixed_val) if fixed_var == 'P' else (fixed_val, guess)
+            hot_start = EquilibriumStateLite(T, P, zs, gas=g1, liquids=[l1], solids=[],
+                                             betas=[VF, 1.0 - VF], constants=constants,
+                                             correlations=correlations, flasher=flasher)
+            try:
+                sln = solver(fixed_val, VF, zs, liquid, gas, hot_start=hot_start)
+            except FlashTimeoutError:
+                raise
+            except Exception:
+                pass
+        if sln is None:
+            try:
+                sln = solver(fixed_val, VF, zs, liquid, gas)
+            except FlashTimeoutError:
+                raise
+            except Exception as e:
+                failures.append({'index': i, 'zs': zs, 'error': e.__class__.__name__,
+                                 'message': str(e)})
+                continue
+        val, l, g, iterations, err = sln
+        vals[i] = val
+        comps[i] = g.zs if bubble else l.zs
+        previous.append((zs, val, l, g))
+    return vals, comps, failures
+
+def _dew_bubble_curve_worker_path(flasher, zs_path, fixed_val, fixed_var, VF):
+    if flasher is None:
+        flasher = _grid_flash_worker_flasher
+    return dew_bubble_curve_path(flasher, zs_path, fixed_val, fixed_var, VF)
+
+
+class FlashQueueFullError(Exception):
+    r'''Error raised by :obj:`AsyncFlasher` when a flash is requested while
+    its limit of outstanding flashes has been reached.'''
+
+
+def _async_flash_worker_init(flasher, warmup=None):
+    global _grid_flash_worker_flasher
+    _grid_flash_worker_flasher = flasher
+    # Compile caches, stability memories and the like before the first request
+    if warmup is not None:
+        for specs in warmup:
+            try:
+                flasher.flash(**specs)
+            except Exception:
+                pass
+
+def _async_flash_worker(flasher, specs):
+    if flasher is None:
+        flasher = _grid_flash_worker_flasher
+    state = flasher.flash(**specs)
+    _link_state_to_flasher(state, None)
+    return state
+
+
+class AsyncFlasher(object):
+    r'''Asyncio front-end for a flasher, so flashes can be awaited from an
+    event loop without blocking it. Each flash is run in a process pool whose
+    workers unpickle the flasher once at startup, and optionally perform a
+    list of `warmup` flashes before serving any requests.
+
+    Requests with identical specifications which are made while one of them
+    is being calculated are coalesced, and all receive the same result.
+    At most `max_in_flight` flashes are submitted to the pool at once; the
+    rest wait their turn. If `max_pending` flashes are already outstanding, a
+    new request raises :obj:`FlashQueueFullError` immediately, so callers can
+    shed load instead of queueing without bound.
+
+    Parameters
+    ----------
+    flasher : :obj:`Flash`
+        Flasher to perform the calculations with, [-]
+    n_jobs : int, optional
+        Number of worker processes to create; None or -1 uses all CPUs, [-]
+    executor : :obj:`concurrent.futures.Executor`, optional
+        Executor to submit the flashes to instead of creating a process pool;
+        the flasher is then sent with every flash, [-]
+    max_in_flight : int, optional
+        Maximum number of flashes submitted to the executor at once; defaults
+        to `n_jobs`, [-]
+    max_pending : int, optional
+        Maximum number of outstanding flashes, including those waiting to be
+        submitted; None for no limit, [-]
+    warmup : list[dict], optional
+        Keyword arguments of :obj:`Flash.flash` for flashes each worker
+        process performs at startup, [-]
+
+    Attributes
+    ----------
+    flashes : int
+        Number of flashes submitted to the executor, [-]
+    coalesced : int
+        Number of requests answered by a flash already in progress, [-]
+
+    Notes
+    -----
+    The results are :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+    objects linked to `flasher`, as returned by :obj:`Flash.flash`; coalesced
+    requests receive the same object, which should not be modified. Lite
+    results are not supported, as the state has to be built in the worker
+    anyway to be sent back.
+
+    A :obj:`concurrent.futures.ThreadPoolExecutor` may be given as the
+    `executor`, but flashers are not thread safe so it should have a single
+    worker; this is mostly useful for testing.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from thermo import ChemicalConstantsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    >>> async def main(async_flasher):
+    ...     return await asyncio.gather(*[async_flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5]) for _ in range(3)])
+    >>> with AsyncFlasher(flasher, executor=ThreadPoolExecutor(1)) as async_flasher:
+    ...     res = asyncio.run(main(async_flasher))
+    >>> round(res[0].VF, 6), res[0] is res[2], async_flasher.flashes, async_flasher.coalesced
+    (0.334993, True, 1, 2)
+    '''
+
+    def __init__(self, flasher, n_jobs=None, executor=None, max_in_flight=None,
+                 max_pending=None, warmup=None):
+        if n_jobs is None or n_jobs < 0:
+            n_jobs = os.cpu_count()
+        self.flasher = flasher
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.own_executor = executor is None
+        self.max_in_flight = n_jobs if max_in_flight is None else max_in_flight
+        self.max_pending = max_pending
+        self.warmup = warmup
+        self.flashes = self.coalesced = 0
+        self._tasks = set()
+        self._running = {}
+        self._loop = self._semaphore = None
+
+    def __repr__(self):
+        return '%s(n_jobs=%d, max_in_flight=%d, flashes=%d, coalesced=%d, pending=%d)' %(
+            self.__class__.__name__, self.n_jobs, self.max_in_flight,
+            self.flashes, self.coalesced, len(self._tasks))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    @property
+    def pending(self):
+        r'''Number of outstanding flashes, [-]'''
+        return len(self._tasks)
+
+    def shutdown(self, wait=True):
+        r'''Method to shut down the process pool, if it was created by this
+        object. A new pool is started if more flashes are requested.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether or not to wait for the running flashes to finish, [-]
+        '''
+        if self.own_executor and self.executor is not None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
+
+    def _get_executor(self):
+        if self.executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=self.n_jobs,
+                                                initializer=_async_flash_worker_init,
+                                                initargs=(self.flasher, self.warmup))
+        return self.executor
+
+    async def _dispatch(self, specs):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores belong to the loop they are first used in
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        async with self._semaphore:
+            self.flashes += 1
+            # Workers created here already hold the flasher
+            task_flasher = None if self.own_executor else self.flasher
+            state = await loop.run_in_executor(self._get_executor(), _async_flash_worker,
+                                               task_flasher, specs)
+        _link_state_to_flasher(state, self.flasher)
+        return state
+
+    async def flash(self, **specs):
+        r'''Method to perform a flash calculation without blocking the event
+        loop; the arguments are those of :obj:`Flash.flash`.
+
+        Returns
+        -------
+        results : :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+            Equilibrium object containing the state of the phases after the
+            flash calculation [-]
+        '''
+        import asyncio
+        if specs.get('lite'):
+            raise ValueError("Lite flash results are not supported by %s" %(self.__class__.__name__))
+        if specs.get('zs') is not None:
+            specs['zs'] = [float(zi) for zi in specs['zs']]
+        try:
+            key = tuple(sorted((k, tuple(v) if type(v) is list else v) for k, v in specs.items()))
+            hash(key)
+        except TypeError:
+            key = None
+
+        task = self._running.get(key) if key is not None else None
+        if task is not None:
+            self.coalesced += 1
+        else:
+            if self.max_pending is not None and len(self._tasks) >= self.max_pending:
+                raise FlashQueueFullError("%d flashes are already pending" %(len(self._tasks)))
+            task = asyncio.ensure_future(self._dispatch(specs))
+            self._tasks.add(task)
+            if key is not None:
+                self._running[key] = task
+            task.add_done_callback(lambda t, key=key: self._done(t, key))
+        # A cancelled caller must not cancel the flash for the others waiting on it
+        return await asyncio.shield(task)
+
+    def _done(self, task, key):
+        self._tasks.discard(task)
+        if key is not None and self._running.get(key) is task:
+            del self._running[key]
+
+    async def flash_many(self, specs):
+        r'''Method to perform many flash calculations concurrently.
+
+        Parameters
+        ----------
+        specs : iterable[dict]
+            Keyword arguments of :obj:`Flash.flash` for each flash, [-]
+
+        Returns
+        -------
+        results : list[EquilibriumState or Exception]
+            Flash results in the order of `specs`; the exceptions of any
+            flashes which failed are returned in their place, [-]
+        '''
+        import asyncio
+        return await asyncio.gather(*[self.flash(**s) for s in specs],
+                                    return_exceptions=True)
+
+
+class FlashCache(object):
+    r'''Size-bounded, least-recently-used cache of flash results, for use by
+    :obj:`Flash.flash` when set as the `flash_cache` attribute of a flasher.
+    This is useful when the same states are flashed repeatedly, such as in
+    the convergence of a process simulation with recycles.
+
+    Each result is stored under two keys. The exact key is made of the
+    specifications and the composition as given; a flash with an exact key
+    already in the cache returns the stored
+    :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` object
+    without any calculation. The quantized key rounds the specifications to
+    `spec_digits` significant digits and the mole fractions to multiples of
+    `zs_tol`; a flash which only matches a quantized key is performed
+    normally, with the stored result used as its `hot_start`.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of results to store; the least recently used result
+        is discarded when this is exceeded, [-]
+    spec_digits : int, optional
+        Number of significant digits the specifications are rounded to in the
+        quantized key, [-]
+    zs_tol : float, optional
+        Mole fraction resolution of the quantized key, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of flashes returned directly from the cache, [-]
+    near_hits : int
+        Number of flashes hot started from a cached result, [-]
+    misses : int
+        Number of flashes with no related result in the cache, [-]
+
+    Notes
+    -----
+    Results returned on a hit are the same objects each time, so they
+    should not be modified. Flashes with a `hot_start`, or a `dest` other
+    than :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`,
+    do not use the cache.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    >>> flasher.flash_cache = FlashCache(max_size=100)
+    >>> res = flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5])
+    >>> res is flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5])
+    True
+    >>> res = flasher.flash(T=300.0000001, P=1e6, zs=[0.5, 0.5])
+    >>> flasher.flash_cache.hits, flasher.flash_cache.near_hits, flasher.flash_cache.misses
+    (1, 1, 1)
+    '''
+
+    def __init__(self, max_size=1000, spec_digits=6, zs_tol=1e-6):
+        self.max_size = max_size
+        self.spec_digits = spec_digits
+        self.zs_tol = zs_tol
+        self.clear()
+
+    def clear(self):
+        r'''Method to remove all stored results and reset the counters.'''
+        self.states = OrderedDict()
+        self.near_keys = {}
+        self.hits = self.near_hits = self.misses = 0
+
+    def __len__(self):
+        return len(self.states)
+
+    def __repr__(self):
+        return '%s(max_size=%d, hits=%d, near_hits=%d, misses=%d, size=%d)' %(
+            self.__class__.__name__, self.max_size, self.hits, self.near_hits,
+            self.misses, len(self.states))
+
+    def quantize(self, specs, zs):
+        digits = self.spec_digits - 1
+        zs_tol_inv = 1.0/self.zs_tol
+        specs = tuple((k, v if type(v) is str or v is None else float('%.*e' %(digits, v)))
+                      for k, v in specs)
+        return specs, tuple(int(round(zi*zs_tol_inv)) for zi in zs)
+
+    def flash(self, flasher, zs, specs):
+        r'''Method to return the flash result of `flasher` at the given
+        specifications, from the cache if possible.
+
+        Parameters
+        ----------
+        flasher : :obj:`Flash`
+            Flasher to perform the calculation with, [-]
+        zs : list[float]
+            Mole fractions of each component, [-]
+        specs : dict
+            Keyword arguments of :obj:`Flash.flash` other than `zs`, [-]
+
+        Returns
+        -------
+        results : :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+            Equilibrium object containing the state of the phases after the
+            flash calculation [-]
+        '''
+        spec_items = tuple(sorted(specs.items()))
+        zs = tuple(float(zi) for zi in zs)
+        key = (spec_items, zs)
+        states = self.states
+        state = states.get(key)
+        if state is not None:
+            states.move_to_end(key)
+            self.hits += 1
+            return state
+
+        near_key = self.quantize(spec_items, zs)
+        hot_start = None
+        hot_key = self.near_keys.get(near_key)
+        if hot_key is not None:
+            hot_start = states.get(hot_key)
+        if hot_start is not None:
+            self.near_hits += 1
+        else:
+            self.misses += 1
+        state = None
+        if hot_start is not None:
+            try:
+                state = flasher._flash_uncached(zs=list(zs), hot_start=hot_start, **specs)
+            except Exception:
+                pass
+        if state is None:
+            state = flasher._flash_uncached(zs=list(zs), **specs)
+
+        states[key] = state
+        self.near_keys[near_key] = key
+        if len(states) > self.max_size:
+            old_key, _ = states.popitem(last=False)
+            old_near_key = self.quantize(old_key[0], old_key[1])
+            if self.near_keys.get(old_near_key) == old_key:
+                del self.near_keys[old_near_key]
+        return state
+
+
+class KValueCache(object):
+    r'''Cache of the K values of a flasher whose phases do not depend on
+    composition, such as an :obj:`IdealGas <thermo.phases.IdealGas>` gas with
+    a :obj:`GibbsExcessLiquid <thermo.phases.GibbsExcessLiquid>` liquid
+    without activity coefficients, for use by :obj:`FlashVL` and
+    :obj:`FlashVLN` when set as the `K_cache` attribute of a flasher.
+
+    The K values of repeated temperatures and pressures are stored in a
+    size-bounded, least-recently-used dictionary. If `Ts` and `Ps` are
+    specified, the logarithms of the K values are also calculated on a grid
+    of those temperatures and pressures the first time they are needed, and
+    interpolated bilinearly in `1/T` and `ln(P)` inside the grid. The
+    interpolation error of each cell of the grid is checked at its center
+    against the exact K values; in cells where the relative error of any K
+    value is larger than `rtol`, the exact K values are calculated instead.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of exact sets of K values to store; the least recently
+        used is discarded when this is exceeded, [-]
+    Ts : list[float], optional
+        Temperatures of the interpolation grid, [K]
+    Ps : list[float], optional
+        Pressures of the interpolation grid, [Pa]
+    rtol : float, optional
+        Maximum relative error of the interpolated K values, [-]
+
+    Attributes
+    ----------
+    hits : int
+        Number of times stored K values were returned, [-]
+    interpolated : int
+        Number of times interpolated K values were returned, [-]
+    misses : int
+        Number of times the K values were calculated, [-]
+    errors : ndarray
+        Maximum relative error of the interpolated K values at the center of
+        each cell of the grid, with shape (len(`Ts`) - 1, len(`Ps`) - 1);
+        None until the grid has been calculated, [-]
+
+    Notes
+    -----
+    A cache should only be used with one flasher. The returned lists of K
+    values may be shared between calls, so they should not be modified.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, VaporPressure, IdealGas, GibbsExcessLiquid, FlashVLN
+    >>> constants = ChemicalConstantsPackage(Tcs=[508.1, 512.5], Pcs=[4700000.0, 8084000.0], omegas=[0.309, 0.559], MWs=[58.07914, 32.04186], CASs=['67-64-1', '67-56-1'])
+    >>> VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+    ...                   VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    >>> liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, use_Poynting=False, use_phis_sat=False)
+    >>> flasher = FlashVLN(constants, PropertyCorrelationsPackage(constants, skip_missing=True, VaporPressures=VaporPressures), liquids=[liquid], gas=IdealGas())
+    >>> flasher.K_cache = KValueCache(Ts=linspace(300.0, 400.0, 101), Ps=logspace(4.0, 6.0, 21), rtol=1e-5)
+    >>> [round(K, 5) for K in flasher.Ks_composition_independent(330.0, 1e5)]
+    [1.04065, 0.74246]
+    >>> flasher.K_cache.interpolated, flasher.K_cache.misses
+    (1, 0)
+    '''
+
+    def __init__(self, max_size=1000, Ts=None, Ps=None, rtol=1e-6):
+        self.max_size = max_size
+        self.Ts = sorted(Ts) if Ts is not None else None
+        self.Ps = sorted(Ps) if Ps is not None else None
+        self.rtol = rtol
+        self.clear()
+
+    def clear(self):
+        r'''Method to remove all stored K values and the interpolation grid,
+        and reset the counters.'''
+        self.Ks_stored = OrderedDict()
+        self.lnKs_table = self.errors = None
+        self.hits = self.interpolated = self.misses = 0
+
+    def __len__(self):
+        return len(self.Ks_stored)
+
+    def __repr__(self):
+        return '%s(max_size=%d, hits=%d, interpolated=%d, misses=%d, size=%d)' %(
+            self.__class__.__name__, self.max_size, self.hits, self.interpolated,
+            self.misses, len(self.Ks_stored))
+
+    def build(self, flasher):
+        r'''Method to calculate the K values of `flasher` on the grid of `Ts`
+        and `Ps`, and the interpolation error of each cell of the grid.
+
+        Parameters
+        ----------
+        flasher : :obj:`FlashVL`
+            Flasher to calculate the K values with, [-]
+        '''
+        Ts, Ps = self.Ts, self.Ps
+        calc = flasher._Ks_composition_independent
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lnKs = np.log(np.array([[calc(T, P) for P in Ps] for T in Ts], dtype=float))
+            lnKs_approx = 0.25*(lnKs[:-1, :-1] + lnKs[1:, :-1] + lnKs[:-1, 1:] + lnKs[1:, 1:])
+            lnKs_exact = np.log(np.array([[calc(2.0/(1.0/Ts[i] + 1.0/Ts[i+1]), (Ps[j]*Ps[j+1])**0.5)
+                                           for j in range(len(Ps) - 1)]
+                                          for i in range(len(Ts) - 1)], dtype=float))
+            errors = np.abs(np.expm1(lnKs_approx - lnKs_exact)).max(axis=2)
+        # Cells with unavailable K values are never interpolated
+        errors[~np.isfinite(errors)] = np.inf
+        self.lnKs_table, self.errors = lnKs, errors
+
+    def Ks(self, flasher, T, P):
+        r'''Method to return the K values of `flasher` at the given
+        temperature and pressure, from the cache or grid if possible.
+
+        Parameters
+        ----------
+        flasher : :obj:`FlashVL`
+            Flasher to calculate the K values with, [-]
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        Ks : list[float]
+            K values of each component, [-]
+        '''
+        key = (T, P)
+        Ks_stored = self.Ks_stored
+        Ks = Ks_stored.get(key)
+        if Ks is not None:
+            Ks_stored.move_to_end(key)
+            self.hits += 1
+            return Ks
+
+        Ts, Ps = self.Ts, self.Ps
+        if Ts is not None and Ps is not None and Ts[0] <= T <= Ts[-1] and Ps[0] <= P <= Ps[-1]:
+            if self.lnKs_table is None:
+                self.build(flasher)
+            i = min(bisect_right(Ts, T), len(Ts) - 1) - 1
+            j = min(bisect_right(Ps, P), len(Ps) - 1) - 1
+            if self.errors[i, j] <= self.rtol:
+                T_inv0 = 1.0/Ts[i]
+                wT = (1.0/T - T_inv0)/(1.0/Ts[i+1] - T_inv0)
+                lnP0 = log(Ps[j])
+                wP = (log(P) - lnP0)/(log(Ps[j+1]) - lnP0)
+                lnKs = self.lnKs_table
+                lnKs = ((1.0 - wT)*((1.0 - wP)*lnKs[i, j] + wP*lnKs[i, j+1])
+                        + wT*((1.0 - wP)*lnKs[i+1, j] + wP*lnKs[i+1, j+1]))
+                self.interpolated += 1
+                return np.exp(lnKs).tolist()
+
+        self.misses += 1
+        Ks = flasher._Ks_composition_independent(T, P)
+        Ks_stored[key] = Ks
+        if len(Ks_stored) > self.max_size:
+            Ks_stored.popitem(last=False)
+        return Ks
+
+
+class FlashProfiler(object):
+    r'''Class to measure where the time of flash calculations is spent, for
+    use by :obj:`Flash.flash` when set as the `profiler` attribute of a
+    flasher.
+
+    During each profiled flash, the following sections are timed; time spent
+    in a section while it is already being timed is not counted twice.
+
+    * 'phase_creation': the `to_TP_zs` and `to` methods of the phases
+    * 'stability_test': the `stability_test_Michelsen` method of the flasher
+    * 'PT_algorithm': the PT flash algorithms, such as
+      :obj:`sequential_substitution_2P` and :obj:`sequential_substitution_NP`,
+      and those in the `PT_algorithms` attribute of the flasher
+    * 'dew_bubble': the bubble and dew point algorithms in the
+      `dew_bubble_flash_algos` type attributes of the flasher
+    * 'identify_sort_phases': :obj:`identify_sort_phases <thermo.phase_identification.identify_sort_phases>`
+    * 'volume_solutions': the cubic equation of state volume root solvers
+    * 'fugacities': the `lnphis`, `phis`, `fugacities`, `lnphis_at_zs` and
+      `fugacities_at_zs` methods of the phases, and
+      :obj:`thermo.eos_mix_methods.lnphis_direct` and its reduced-variable
+      versions
+
+    The results of every flash are passed to `callback`, if provided, as a
+    dictionary with the keys 'specs' (the arguments to the flash), 'time'
+    (total time, [s]), 'timings' (time of each section, [s]), 'calls'
+    (number of calls to each section), and 'error' (the exception class name
+    if the flash failed, otherwise None). They are also accumulated in the
+    `times` and `calls` attributes, and summarized by :obj:`report`.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Function to call with the results of each flash, [-]
+
+    Attributes
+    ----------
+    flashes : int
+        Number of flashes profiled, [-]
+    total_time : float
+        Total time spent in profiled flashes, [s]
+    times : dict[str, float]
+        Total time spent in each section, [s]
+    calls : dict[str, int]
+        Total number of calls to each section, [-]
+
+    Notes
+    -----
+    The timing is implemented by replacing the profiled functions and methods
+    with timing wrappers only while a profiled flash runs; the originals are
+    restored when it finishes, including when it fails. The wrappers only
+    record timings in the thread running a profiled flash; a flash in
+    another thread which runs at the same time calls the wrapped functions
+    directly through them. Flashes in different threads may be profiled at
+    once, by the same or different profilers. A flash performed during a
+    profiled flash is counted as part of it.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    >>> flasher.profiler = FlashProfiler()
+    >>> res = flasher.flash(T=350.0, P=2e6, zs=[0.5, 0.5])
+    >>> flasher.profiler.flashes, flasher.profiler.calls['stability_test']
+    (1, 1)
+    '''
+
+    sections = ('phase_creation', 'stability_test', 'PT_algorithm', 'dew_bubble',
+                'identify_sort_phases', 'volume_solutions', 'fugacities')
+
+    phase_creation_methods = ('to_TP_zs', 'to')
+    fugacity_methods = ('lnphis', 'phis', 'fugacities', 'lnphis_at_zs', 'fugacities_at_zs')
+    PT_algorithm_names = ('sequential_substitution_2P', 'sequential_substitution_Mehra_2P',
+                          'sequential_substitution_GDEM3_2P', 'nonlin_2P_newton',
+                          'sequential_substitution_NP', 'minimize_gibbs_NP_transformed',
+                          'nonlin_equilibrium_NP', 'sequential_substitution_2P_functional',
+                          'sequential_substitution_2P_reduced')
+    flasher_algos_attrs = (('PT_algorithms', 'PT_algorithm'),
+                           ('dew_T_flash_algos', 'dew_bubble'), ('bubble_T_flash_algos', 'dew_bubble'),
+                           ('dew_P_flash_algos', 'dew_bubble'), ('bubble_P_flash_algos', 'dew_bubble'),
+                           ('VF_flash_algos', 'dew_bubble'))
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        r'''Method to clear all accumulated results.'''
+        self.flashes = 0
+        self.total_time = 0.0
+        self.times = {k: 0.0 for k in self.sections}
+        self.calls = {k: 0 for k in self.sections}
+
+    def report(self):
+        r'''Method to return a text summary of the accumulated results, with
+        the total and average time of each section and its number of calls.
+
+        Returns
+        -------
+        report : str
+            Summary of the results, [-]
+        '''
+        flashes = self.flashes
+        lines = ['%d flashes, %.6g s total' %(flashes, self.total_time),
+                 '%-22s%14s%14s%12s%10s' %('Section', 'Time [s]', 'Per flash [s]', 'Calls', '% time')]
+        for k in self.sections:
+            t = self.times[k]
+            lines.append('%-22s%14.6g%14.6g%12d%10.1f' %(k, t, t/flashes if flashes else 0.0,
+                                                         self.calls[k],
+                                                         100.0*t/self.total_time if self.total_time else 0.0))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _timed(section, f):
+        # Wrapper which only times `f` while the calling thread is in a
+        # profiled flash; otherwise it calls `f` directly
+        def timed(*args, **kwargs):
+            record = _flash_profile_state.record
+            if record is None:
+                return f(*args, **kwargs)
+            depths = record['depths']
+            record['calls'][section] += 1
+            if depths[section]:
+                return f(*args, **kwargs)
+            depths[section] = 1
+            t0 = perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                record['times'][section] += perf_counter() - t0
+                depths[section] = 0
+        timed = wraps(f)(timed)
+        timed.profiled_section = section
+        return timed
+
+    @classmethod
+    def _targets(cls, flasher):
+        # (owner, attribute name, section) of everything timed while
+        # `flasher` is profiled
+        module = sys.modules[__name__]
+        targets = [(module, name, 'PT_algorithm') for name in cls.PT_algorithm_names]
+        targets.append((module, 'identify_sort_phases', 'identify_sort_phases'))
+        for name in ('lnphis_direct', 'lnphis_direct_reduced', 'lnphis_reduced'):
+            targets.append((module, name, 'fugacities'))
+        # The fast fugacity routines solve for the volume directly
+        targets.append((eos_mix_methods, 'volume_solutions_halley', 'volume_solutions'))
+
+        flasher_cls = type(flasher)
+        if hasattr(flasher_cls, 'stability_test_Michelsen'):
+            targets.append((flasher_cls, 'stability_test_Michelsen', 'stability_test'))
+        for attr, section in cls.flasher_algos_attrs:
+            if getattr(flasher, attr, None) is not None:
+                owner = flasher if attr in flasher.__dict__ else flasher_cls
+                targets.append((owner, attr, section))
+
+        for phase in flasher.phases:
+            phase_cls = type(phase)
+            for section, names in (('phase_creation', cls.phase_creation_methods),
+                                   ('fugacities', cls.fugacity_methods)):
+                for name in names:
+                    if hasattr(phase_cls, name):
+                        targets.append((phase_cls, name, section))
+            if hasattr(phase, 'eos_mix'):
+                targets.append((type(phase.eos_mix), 'volume_solutions', 'volume_solutions'))
+        return targets
+
+    @classmethod
+    def _wrapped_value(cls, owner, name, section):
+        value = getattr(owner, name)
+        if type(value) is list:
+            return [cls._wrapper(section, f) for f in value]
+        wrapper = cls._wrapper(section, value)
+        if isinstance(owner, type) and isinstance(_class_attribute(owner, name), staticmethod):
+            return staticmethod(wrapper)
+        return wrapper
+
+    @classmethod
+    def _wrapper(cls, section, f):
+        # One wrapper per function, so e.g. the `PT_algorithms` list and the
+        # module global refer to the same object while patched
+        f = getattr(f, '__wrapped__', f) if hasattr(f, 'profiled_section') else f
+        wrapper = _flash_profile_wrappers.get(f)
+        if wrapper is None:
+            wrapper = _flash_profile_wrappers[f] = cls._timed(section, f)
+        return wrapper
+
+    @classmethod
+    def _install(cls, flasher):
+        # Patch the targets for the duration of a profiled flash; the patches
+        # are reference counted so concurrent profiled flashes share them
+        keys = []
+        with _flash_profile_lock:
+            for owner, name, section in cls._targets(flasher):
+                key = (owner, name)
+                if key in keys:
+                    continue
+                patch = _flash_profile_patches.get(key)
+                if patch is None:
+                    own = name in vars(owner)
+                    original = vars(owner)[name] if own else None
+                    value = cls._wrapped_value(owner, name, section)
+                    setattr(owner, name, value)
+                    _flash_profile_patches[key] = [original, own, 1]
+                else:
+                    patch[2] += 1
+                keys.append(key)
+        return keys
+
+    @staticmethod
+    def _uninstall(keys):
+        # Restore the originals once no profiled flash uses a patch
+        with _flash_profile_lock:
+            for key in keys:
+                patch = _flash_profile_patches[key]
+                patch[2] -= 1
+                if not patch[2]:
+                    owner, name = key
+                    if patch[1]:
+                        setattr(owner, name, patch[0])
+                    else:
+                        delattr(owner, name)
+                    del _flash_profile_patches[key]
+            if not _flash_profile_patches:
+                _flash_profile_wrappers.clear()
+
+    def flash(self, flasher, specs):
+        r'''Method to perform and profile a flash with `flasher`.
+
+        Parameters
+        ----------
+        flasher : :obj:`Flash`
+            Flasher to perform the calculation with, [-]
+        specs : dict
+            Keyword arguments of :obj:`Flash.flash`, [-]
+
+        Returns
+        -------
+        results : :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+            Equilibrium object containing the state of the phases after the
+            flash calculation [-]
+        '''
+        keys = self._install(flasher)
+        call_times = {k: 0.0 for k in self.sections}
+        call_calls = {k: 0 for k in self.sections}
+        error = None
+        _flash_profile_state.record = {'depths': {k: 0 for k in self.sections},
+                                       'times': call_times, 'calls': call_calls}
+        t0 = perf_counter()
+        try:
+            return flasher.flash(**specs)
+        except Exception as e:
+            error = e.__class__.__name__
+            raise
+        finally:
+            elapsed = perf_counter() - t0
+            _flash_profile_state.record = None
+            self._uninstall(keys)
+            with _flash_profile_lock:
+                self.flashes += 1
+                self.total_time += elapsed
+                times, calls = self.times, self.calls
+                for k in self.sections:
+                    times[k] += call_times[k]
+                    calls[k] += call_calls[k]
+            if self.callback is not None:
+                self.callback({'specs': specs, 'time': elapsed, 'timings': call_times,
+                               'calls': call_calls, 'error': error})
+
+class _FlashProfileState(threading.local):
+    # Timings of the profiled flash running in the current thread, if any
+    record = None
+
+_flash_profile_state = _FlashProfileState()
+_flash_profile_lock = threading.RLock()
+# (owner, name) -> [original value, whether it was set on owner, users]
+_flash_profile_patches = {}
+# original function -> timing wrapper, while anything is patched
+_flash_profile_wrappers = {}
+
+def _class_attribute(cls, name):
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return None
+
+
+_hermite_M = [[1.0, 0.0, 0.0, 0.0],
+              [0.0, 0.0, 1.0, 0.0],
+              [-3.0, 3.0, -2.0, -1.0],
+              [2.0, -2.0, 1.0, 1.0]]
+
+def _hermite_coeffs(xs, ys):
+    # Power coefficients of the cubic Hermite interpolant of `ys` in the local
+    # coordinate [0, 1] of each interval, with finite difference derivatives
+    xs, ys = np.array(xs), np.array(ys)
+    hs = np.diff(xs)
+    dys = np.gradient(ys, xs, edge_order=2)
+    local = np.array([ys[:-1], ys[1:], dys[:-1]*hs, dys[1:]*hs])
+    return np.dot(np.array(_hermite_M), local).T
+
+def _bicubic_coeffs(values, xs, ys):
+    # Coefficients a[i, j] of the bicubic Hermite patch of each cell, such that
+    # f = sum(a[i, j]*x**i*y**j) in the local coordinates [0, 1] of the cell
+    xs, ys = np.array(xs), np.array(ys)
+    values = np.array(values)
+    dx, dy = np.gradient(values, xs, ys, edge_order=2)
+    dxy = np.gradient(dx, ys, axis=1, edge_order=2)
+    # Values, y derivatives, x derivatives and cross derivatives at each node
+    grids = ((values, dy), (dx, dxy))
+    local = np.empty((len(xs)-1, len(ys)-1, 4, 4))
+    for k in range(2):
+        for l in range(2):
+            g = grids[k][l]
+            local[:, :, k*2, l*2] = g[:-1, :-1]
+            local[:, :, k*2, l*2+1] = g[:-1, 1:]
+            local[:, :, k*2+1, l*2] = g[1:, :-1]
+            local[:, :, k*2+1, l*2+1] = g[1:, 1:]
+    # Scale the derivatives to the local coordinates of each cell
+    local[:, :, 2:, :] *= np.diff(xs)[:, None, None, None]
+    local[:, :, :, 2:] *= np.diff(ys)[None, :, None, None]
+    M = np.array(_hermite_M)
+    return np.einsum('ik,abkl,jl->abij', M, local, M)
+
+
+class PurePropertyTable(object):
+    r'''Class holding a table of properties of a pure component as a function
+    of pressure and either enthalpy or entropy, for fast evaluation without
+    performing a flash. Tables are normally created with
+    :obj:`FlashPureVLS.build_property_table`, or loaded from a file written by
+    :obj:`save` with :obj:`load`.
+
+    The table is made of one or two blocks of pressure; below the critical
+    pressure the specification is split at the saturation dome into liquid,
+    two-phase, and gas regions, and above it there is a single region. In
+    each region the specification is mapped to a fractional coordinate
+    between the region's bounds at that pressure, and every property is
+    represented by piecewise bicubic Hermite patches in the logarithm of
+    pressure and that coordinate. Properties which are positive at every node
+    are interpolated in log space.
+
+    Parameters
+    ----------
+    spec : str
+        Specification other than pressure the table is keyed by; 'H' or 'S',
+        [-]
+    props : list[str]
+        Names of the properties tabulated, as accepted by
+        :obj:`EquilibriumState.value <thermo.equilibrium.EquilibriumState.value>`,
+        [-]
+    blocks : list[dict]
+        Data of each pressure block, with the keys 'lnPs' (the logarithms of
+        the pressure nodes), 'us' (the fractional coordinate nodes, shared by
+        every region), 'bounds' (values of `spec` at each region boundary and
+        pressure node, lowest first), 'values' (property values at each
+        region, property, pressure node, and coordinate node) and 'errors'
+        (relative error of each region, property and cell, or None), [-]
+    flasher : :obj:`FlashPureVLS`, optional
+        Flasher used to calculate points outside the table, or in cells whose
+        error is above `rtol`, [-]
+    rtol : float, optional
+        Largest relative error of a cell for its interpolated values to be
+        used when a `flasher` is available, [-]
+
+    Attributes
+    ----------
+    max_errors : dict[str, float]
+        Largest relative error of each property found at the cell centers,
+        or None if the errors were not checked, [-]
+    fallbacks : int
+        Number of evaluations which were performed with a flash, [-]
+
+    Notes
+    -----
+    Cells whose nodes could not be calculated are stored as NaN, and
+    evaluate to NaN unless a `flasher` is available. A small region around
+    the critical point is not tabulated.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashPureVLS
+    >>> constants = ChemicalConstantsPackage(Tcs=[647.14], Pcs=[22048320.0], omegas=[0.344], MWs=[18.01528], CASs=['7732-18-5'])
+    >>> HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759]))]
+    >>> correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> liquid = CEOSLiquid(PRMIX, HeatCapacityGases=HeatCapacityGases, eos_kwargs=eos_kwargs)
+    >>> gas = CEOSGas(PRMIX, HeatCapacityGases=HeatCapacityGases, eos_kwargs=eos_kwargs)
+    >>> flasher = FlashPureVLS(constants, correlations, gas=gas, liquids=[liquid], solids=[])
+    >>> table = flasher.build_property_table(spec='H', Pmin=1e5, Pmax=1e6, Tmin=300.0, Tmax=600.0, P_pts=8, spec_pts=8, props=['T', 'rho_mass'])
+    >>> round(table.value(5e5, flasher.flash(T=400.0, P=5e5).H(), 'T'), 2)
+    400.0
+    '''
+
+    def __init__(self, spec, props, blocks, flasher=None, rtol=None):
+        self.spec = spec
+        self.props = props = list(props)
+        self.blocks = blocks
+        self.flasher = flasher
+        self.rtol = rtol
+        self.fallbacks = 0
+
+        N_props = len(props)
+        # Properties which are positive everywhere are interpolated in log space
+        self.log_props = log_props = []
+        for k in range(N_props):
+            positive = True
+            for block in blocks:
+                for values in block['values']:
+                    if np.any(values[k] <= 0.0):
+                        positive = False
+            log_props.append(positive)
+        max_errors = None
+        self._blocks = _blocks = []
+        for block in blocks:
+            lnPs, us = block['lnPs'], block['us']
+            bound_coeffs = [_hermite_coeffs(lnPs, bound).tolist() for bound in block['bounds']]
+            region_coeffs = []
+            for values in block['values']:
+                coeffs = []
+                for k in range(N_props):
+                    if log_props[k]:
+                        coeffs.append(_bicubic_coeffs(np.log(values[k]), lnPs, us).tolist())
+                    else:
+                        coeffs.append(_bicubic_coeffs(values[k], lnPs, us).tolist())
+                region_coeffs.append(coeffs)
+            errors = block.get('errors')
+            if errors is not None:
+                if max_errors is None:
+                    max_errors = [float('nan')]*N_props
+                for region_errors in errors:
+                    for k in range(N_props):
+                        err = np.nanmax(region_errors[k]) if not np.all(np.isnan(region_errors[k])) else float('nan')
+                        if not max_errors[k] >= err:
+                            max_errors[k] = float(err)
+                errors = [[np.array(e).tolist() for e in region_errors] for region_errors in errors]
+            _blocks.append((list(np.array(lnPs).tolist()), list(np.array(us).tolist()),
+                            bound_coeffs, region_coeffs, errors))
+        self.max_errors = None if max_errors is None else dict(zip(props, max_errors))
+
+    def __repr__(self):
+        return '%s(spec=%r, props=%r, blocks=%d)' %(self.__class__.__name__,
+                                                    self.spec, self.props, len(self.blocks))
+
+    def locate(self, P, spec_val):
+        r'''Method to find the cell of the table holding a point.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        spec_val : float
+            Value of the specification of the table, [J/mol or J/mol/K]
+
+        Returns
+        -------
+        cell : tuple or None
+            Block index, region index, pressure cell index, coordinate cell
+            index, and the local coordinates in the cell; None if the point is
+            outside the table, [-]
+        '''
+        lnP = log(P)
+        for b, (lnPs, us, bound_coeffs, _, _) in enumerate(self._blocks):
+            if not (lnPs[0] <= lnP <= lnPs[-1]):
+                continue
+            i = bisect_right(lnPs, lnP) - 1
+            if i == len(lnPs) - 1:
+                i -= 1
+            x = (lnP - lnPs[i])/(lnPs[i+1] - lnPs[i])
+            lo = None
+            for r, coeffs in enumerate(bound_coeffs):
+                c = coeffs[i]
+                hi = c[0] + x*(c[1] + x*(c[2] + x*c[3]))
+                if lo is not None and lo <= spec_val <= hi:
+                    u = (spec_val - lo)/(hi - lo)
+                    j = bisect_right(us, u) - 1
+                    if j == len(us) - 1:
+                        j -= 1
+                    return b, r-1, i, j, x, (u - us[j])/(us[j+1] - us[j])
+                lo = hi
+            return None
+        return None
+
+    def _evaluate(self, cell, k):
+        b, r, i, j, x, y = cell
+        a = self._blocks[b][3][r][k][i][j]
+        f = 0.0
+        for row in reversed(a):
+            f = f*x + (row[0] + y*(row[1] + y*(row[2] + y*row[3])))
+        if self.log_props[k]:
+            return exp(f)
+        return f
+
+    def _use_flash(self, cell, ks):
+        if self.flasher is None:
+            return False
+        if cell is None:
+            return True
+        b, r, i, j, _, _ = cell
+        errors = self._blocks[b][4]
+        if self.rtol is None or errors is None:
+            return False
+        rtol = self.rtol
+        for k in ks:
+            if not errors[r][k][i][j] <= rtol:
+                return True
+        return False
+
+    def _flash(self, P, spec_val):
+        self.fallbacks += 1
+        return self.flasher.flash(P=P, **{self.spec: spec_val})
+
+    def value(self, P, spec_val, prop):
+        r'''Method to evaluate a property from the table; if a `flasher` is
+        set, points outside the table or in cells with an error above `rtol`
+        are calculated with a flash instead.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        spec_val : float
+            Value of the specification of the table, [J/mol or J/mol/K]
+        prop : str
+            Name of the property, [-]
+
+        Returns
+        -------
+        value : float
+            Value of the property, [various]
+        '''
+        k = self.props.index(prop)
+        cell = self.locate(P, spec_val)
+        if self._use_flash(cell, (k,)):
+            return self._flash(P, spec_val).value(prop)
+        if cell is None:
+            raise ValueError('P=%g, %s=%g is outside the table' %(P, self.spec, spec_val))
+        return self._evaluate(cell, k)
+
+    def values(self, P, spec_val):
+        r'''Method to evaluate every property of the table at once, in the
+        order of `props`; if a `flasher` is set, points outside the table or
+        in cells with an error above `rtol` are calculated with a flash
+        instead.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        spec_val : float
+            Value of the specification of the table, [J/mol or J/mol/K]
+
+        Returns
+        -------
+        values : list[float]
+            Values of the properties, [various]
+        '''
+        cell = self.locate(P, spec_val)
+        if self._use_flash(cell, range(len(self.props))):
+            state = self._flash(P, spec_val)
+            return [state.value(k) for k in self.props]
+        if cell is None:
+            raise ValueError('P=%g, %s=%g is outside the table' %(P, self.spec, spec_val))
+        return [self._evaluate(cell, k) for k in range(len(self.props))]
+
+    def save(self, path):
+        r'''Method to write the table to a NumPy `.npz` file; only the node
+        values are stored, and the patches are recalculated by :obj:`load`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file; '.npz' is appended if it has no such extension,
+            [-]
+        '''
+        arrays = {}
+        for n, block in enumerate(self.blocks):
+            for key in ('lnPs', 'us', 'bounds', 'values', 'errors'):
+                if block.get(key) is not None:
+                    arrays['%d_%s' %(n, key)] = np.array(block[key], dtype=float)
+        header = {'spec': self.spec, 'props': self.props, 'blocks': len(self.blocks),
+                  'rtol': self.rtol}
+        np.savez_compressed(path, header=np.array(get_json().dumps(header)), **arrays)
+
+    @classmethod
+    def load(cls, path, flasher=None):
+        r'''Method to create a table from a file written by :obj:`save`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, [-]
+        flasher : :obj:`FlashPureVLS`, optional
+            Flasher used to calculate points outside the table, or in cells
+            whose error is above `rtol`, [-]
+
+        Returns
+        -------
+        table : :obj:`PurePropertyTable`
+            Loaded table, [-]
+        '''
+        with np.load(path, allow_pickle=False) as data:
+            header = get_json().loads(str(data['header']))
+            blocks = []
+            for n in range(header['blocks']):
+                block = {}
+                for key in ('lnPs', 'us', 'bounds', 'values', 'errors'):
+                    name = '%d_%s' %(n, key)
+                    block[key] = data[name] if name in data.files else None
+                blocks.append(block)
+        return cls(header['spec'], header['props'], blocks, flasher=flasher,
+                   rtol=header['rtol'])
+
+
+
+GRID_TABLE_MAGIC = b'THERMOGRIDTABLE\x00'
+GRID_TABLE_ALIGN = 64
+
+def write_grid_table(path, spec0, spec1, specs0, specs1, zs, props, values,
+                     log_specs=None):
+    r'''Write a grid of properties, as calculated by :obj:`Flash.grid_flash`
+    or :obj:`Flash.grid_props`, to a binary file which can be opened with
+    :obj:`GridPropertyTable`.
+
+    The file starts with the 16 byte magic string `GRID_TABLE_MAGIC`, the
+    length of the header as a little-endian 64-bit unsigned integer, and a
+    JSON header with the keys 'version', 'spec0', 'spec1', 'n0', 'n1', 'zs',
+    'props', 'log0', 'log1', 'dtype' and 'offset'. At 'offset' bytes, a
+    multiple of 64, follow the values of the first specification, the values
+    of the second specification, and the property values as an array of shape
+    (n0, n1, len(props)), all as little-endian doubles; the properties of each
+    point are stored together.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, [-]
+    spec0 : str
+        Name of the specification varying along the rows, [-]
+    spec1 : str
+        Name of the specification varying along the columns, [-]
+    specs0 : list[float]
+        Values of `spec0`, [various]
+    specs1 : list[float]
+        Values of `spec1`, [various]
+    zs : list[float]
+        Mole fractions of each component, [-]
+    props : str or list[str]
+        Property or properties in `values`, [-]
+    values : list[list[float]] or list[list[list[float]]]
+        Property values at each point, indexed by the row, column, and - if
+        `props` is a list - property, as returned by
+        :obj:`Flash.grid_flash`; None for points which failed, [various]
+    log_specs : tuple(bool, bool), optional
+        Whether to interpolate each specification in log space; by default
+        only 'T', 'P' and 'V' are, as they are generated logarithmically
+        spaced, [-]
+    '''
+    if isinstance(props, str):
+        props = [props]
+        values = [[[v] for v in row] for row in values]
+    values = np.array([[[np.nan if v is None else v for v in point] for point in row]
+                       for row in values], dtype='<f8')
+    specs0, specs1 = np.array(specs0, dtype='<f8'), np.array(specs1, dtype='<f8')
+    n0, n1 = len(specs0), len(specs1)
+    if values.shape != (n0, n1, len(props)):
+        raise ValueError('Shape of values does not match the specifications and properties')
+    # Store the axes in increasing order
+    order0, order1 = np.argsort(specs0), np.argsort(specs1)
+    specs0, specs1 = specs0[order0], specs1[order1]
+    values = values[order0][:, order1]
+    if np.any(np.diff(specs0) <= 0.0) or np.any(np.diff(specs1) <= 0.0):
+        raise ValueError('Specification values must be unique')
+    if log_specs is None:
+        log_specs = (spec0 in ('T', 'P', 'V'), spec1 in ('T', 'P', 'V'))
+
+    header = {'version': 1, 'spec0': spec0, 'spec1': spec1, 'n0': n0, 'n1': n1,
+              'zs': [float(zi) for zi in zs], 'props': list(props),
+              'log0': bool(log_specs[0]), 'log1': bool(log_specs[1]),
+              'dtype': '<f8', 'offset': 0}
+    json = get_json()
+    prefix = len(GRID_TABLE_MAGIC) + 8
+    # The offset is part of the header, so iterate until its length is stable
+    while True:
+        header_bytes = json.dumps(header).encode('utf-8')
+        offset = -(-(prefix + len(header_bytes))//GRID_TABLE_ALIGN)*GRID_TABLE_ALIGN
+        if offset == header['offset']:
+            break
+        header['offset'] = offset
+    header_bytes += b' '*(offset - prefix - len(header_bytes))
+    with open(path, 'wb') as f:
+        f.write(GRID_TABLE_MAGIC)
+        f.write(np.array([len(header_bytes)], dtype='<u8').tobytes())
+        f.write(header_bytes)
+        f.write(specs0.tobytes())
+        f.write(specs1.tobytes())
+        f.write(values.tobytes())
+
+
+class GridPropertyTable(object):
+    r'''Class to interpolate properties from a file written by
+    :obj:`write_grid_table`. The file is opened with :obj:`numpy.memmap` in
+    read-only mode and values are read directly from the mapped buffer, so
+    any number of processes using the same file share one copy of it in the
+    operating system's page cache. Pickling a table only stores its path;
+    the file is mapped again when it is unpickled, such as in the worker of a
+    process pool.
+
+    Properties are interpolated bilinearly, in log space for specifications
+    flagged as such in the file.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, [-]
+
+    Attributes
+    ----------
+    spec0 : str
+        Name of the specification varying along the rows, [-]
+    spec1 : str
+        Name of the specification varying along the columns, [-]
+    specs0 : numpy.ndarray
+        Values of `spec0`, in increasing order, [various]
+    specs1 : numpy.ndarray
+        Values of `spec1`, in increasing order, [various]
+    zs : list[float]
+        Mole fractions of each component, [-]
+    props : list[str]
+        Names of the properties in the table, [-]
+    data : numpy.memmap
+        Property values, indexed by row, column and property, [various]
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> from thermo import ChemicalConstantsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+    >>> path = os.path.join(tempfile.mkdtemp(), 'table.grid')
+    >>> table = flasher.grid_props_table(path, zs=[0.5, 0.5], props=['VF', 'rho_mass'], Tmin=300.0, Tmax=400.0, Pmin=1e5, Pmax=1e6, pts=5)
+    >>> table.value(350.0, 1e5, 'VF')
+    1.0
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.read(len(GRID_TABLE_MAGIC)) != GRID_TABLE_MAGIC:
+                raise ValueError('%s is not a grid property table' %(path))
+            header_length = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+            header = get_json().loads(f.read(header_length).decode('utf-8'))
+        self.header = header
+        self.spec0, self.spec1 = header['spec0'], header['spec1']
+        self.zs, self.props = header['zs'], header['props']
+        n0, n1, N_props = header['n0'], header['n1'], len(header['props'])
+
+        self.buffer = buffer = np.memmap(path, dtype=header['dtype'], mode='r',
+                                         offset=header['offset'],
+                                         shape=(n0 + n1 + n0*n1*N_props,))
+        self.specs0 = buffer[:n0]
+        self.specs1 = buffer[n0:n0+n1]
+        self.data = buffer[n0+n1:].reshape((n0, n1, N_props))
+        # The axes are small, and searched on every call
+        self.log0, self.log1 = header['log0'], header['log1']
+        self._axis0 = [log(v) for v in self.specs0] if self.log0 else self.specs0.tolist()
+        self._axis1 = [log(v) for v in self.specs1] if self.log1 else self.specs1.tolist()
+
+    def __repr__(self):
+        return '%s(%r)' %(self.__class__.__name__, self.path)
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def _locate(self, axis, v, log_axis, name):
+        if log_axis:
+            v = log(v)
+        if not (axis[0] <= v <= axis[-1]):
+            raise ValueError('%s is outside the table' %(name))
+        i = bisect_right(axis, v) - 1
+        if i == len(axis) - 1:
+            i -= 1
+        return i, (v - axis[i])/(axis[i+1] - axis[i])
+
+    def _weights(self, spec0_val, spec1_val):
+        # Corners of the cell with a nonzero weight, so points on a node or
+        # an edge are not affected by failed neighbours
+        i, x = self._locate(self._axis0, spec0_val, self.log0, self.spec0)
+        j, y = self._locate(self._axis1, spec1_val, self.log1, self.spec1)
+        corners = ((i, j, (1.0 - x)*(1.0 - y)), (i, j+1, (1.0 - x)*y),
+                   (i+1, j, x*(1.0 - y)), (i+1, j+1, x*y))
+        return [c for c in corners if c[2] != 0.0]
+
+    def values(self, spec0_val, spec1_val):
+        r'''Method to interpolate every property of the table, in the order of
+        `props`.
+
+        Parameters
+        ----------
+        spec0_val : float
+            Value of the first specification, [various]
+        spec1_val : float
+            Value of the second specification, [various]
+
+        Returns
+        -------
+        values : list[float]
+            Interpolated properties, NaN where a neighbouring point failed,
+            [various]
+        '''
+        data = self.data
+        f = 0.0
+        for i, j, w in self._weights(spec0_val, spec1_val):
+            f = f + w*data[i, j]
+        return f.tolist()
+
+    def value(self, spec0_val, spec1_val, prop):
+        r'''Method to interpolate one property of the table.
+
+        Parameters
+        ----------
+        spec0_val : float
+            Value of the first specification, [various]
+        spec1_val : float
+            Value of the second specification, [various]
+        prop : str
+            Name of the property, [-]
+
+        Returns
+        -------
+        value : float
+            Interpolated property, NaN where a neighbouring point failed,
+            [various]
+        '''
+        k = self.props.index(prop)
+        data = self.data
+        f = 0.0
+        for i, j, w in self._weights(spec0_val, spec1_val):
+            f += w*float(data[i, j, k])
+        return f
+
 
 class Flash(object):
     r'''Base class for performing flash calculations. All Flash objects need
@@ -4209,6 +7425,12 @@ class Flash(object):
         Absolute minimum pressure to search for a valid flash, [Pa]
     P_MAX_FIXED : float
         Absolute maximum pressure to search for a valid flash, [Pa]
+    flash_cache : :obj:`FlashCache` or None
+        Cache of flash results used by :obj:`flash <Flash.flash>`; None to
+        disable caching, the default, [-]
+    profiler : :obj:`FlashProfiler` or None
+        Profiler to time the calls to :obj:`flash <Flash.flash>` with; None
+        to disable profiling, the default, [-]
     '''
 
     T_MIN_FIXED = Phase.T_MIN_FIXED
@@ -4217,9 +7439,12 @@ class Flash(object):
     P_MIN_FIXED = Phase.P_MIN_FIXED
     P_MAX_FIXED = Phase.P_MAX_FIXED
 
+    flash_cache = None
+    profiler = None
+
     def flash(self, zs=None, T=None, P=None, VF=None, SF=None, V=None, H=None,
               S=None, G=None, U=None, A=None, solution=None, hot_start=None,
-              retry=False, dest=None):
+              retry=False, dest=None, lite=False, time_budget=None, deadline=None):
         r'''Method to perform a flash calculation and return the result as an
         :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` object.
         This generic interface allows flashes with any combination of valid
@@ -4274,6 +7499,21 @@ class Flash(object):
         dest : None or :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` or :obj:`EquilibriumStream <thermo.stream.EquilibriumStream>`
             What type of object the flash result is set into; leave as None to
             obtain the normal `EquilibriumState` results, [-]
+        lite : bool, optional
+            If True, the phases are not identified and sorted and the result
+            is returned as an
+            :obj:`EquilibriumStateLite <thermo.equilibrium.EquilibriumStateLite>`
+            object which creates the `EquilibriumState` only if it is needed;
+            this is faster when only `T`, `P`, and the phase fractions and
+            compositions are required, [-]
+        time_budget : float, optional
+            Maximum time the flash may take; if it is exceeded, a
+            :obj:`FlashTimeoutError` is raised which records the algorithm
+            that was running, its iteration count and error, and its latest
+            estimates, [s]
+        deadline : float, optional
+            Time by which the flash must be completed, as a value of
+            :obj:`time.perf_counter`; handled like `time_budget`, [s]
 
         Returns
         -------
@@ -4283,6 +7523,11 @@ class Flash(object):
 
         Notes
         -----
+        If the `flash_cache` attribute is set to a :obj:`FlashCache`, flashes
+        without a `hot_start` which return an `EquilibriumState` are looked
+        up in it first. If the
+        `profiler` attribute is set to a :obj:`FlashProfiler`, the flash is
+        timed by it.
 
         Examples
         --------
@@ -4292,9 +7537,38 @@ class Flash(object):
                 zs = [1.0]
             else:
                 raise ValueError("Composition missing for flash")
+        if time_budget is not None or deadline is not None:
+            with flash_time_limit(time_budget, deadline):
+                return self.flash(zs=zs, T=T, P=P, VF=VF, SF=SF, V=V, H=H, S=S, G=G, U=U, A=A,
+                                  solution=solution, hot_start=hot_start, retry=retry,
+                                  dest=dest, lite=lite)
+        profiler = self.profiler
+        if profiler is not None and _flash_profile_state.record is None:
+            return profiler.flash(self, {'zs': zs, 'T': T, 'P': P, 'VF': VF, 'SF': SF,
+                                         'V': V, 'H': H, 'S': S, 'G': G, 'U': U, 'A': A,
+                                         'solution': solution, 'hot_start': hot_start,
+                                         'retry': retry, 'dest': dest, 'lite': lite})
+        if (dest is None or dest is EquilibriumState) and hot_start is None and not lite and self.flash_cache is not None:
+            specs = {k: v for k, v in (('T', T), ('P', P), ('VF', VF), ('SF', SF),
+                                       ('V', V), ('H', H), ('S', S), ('G', G),
+                                       ('U', U), ('A', A), ('solution', solution))
+                     if v is not None}
+            if retry:
+                specs['retry'] = retry
+            return self.flash_cache.flash(self, zs, specs)
+        return self._flash_uncached(zs=zs, T=T, P=P, VF=VF, SF=SF, V=V, H=H, S=S, G=G,
+                                    U=U, A=A, solution=solution, hot_start=hot_start,
+                                    retry=retry, dest=dest, lite=lite)
+
+    def _flash_uncached(self, zs, T=None, P=None, VF=None, SF=None, V=None, H=None,
+                        S=None, G=None, U=None, A=None, solution=None, hot_start=None,
+                        retry=False, dest=None, lite=False):
+        # Body of `flash` after the time limit, profiler and cache are handled
         constants, correlations = self.constants, self.correlations
         settings = self.settings
-        if dest is None:
+        if lite:
+            dest = EquilibriumStateLite
+        elif dest is None:
             dest = EquilibriumState
 #        if self.N > 1 and 0:
 #            for zi in zs:
@@ -4350,9 +7624,10 @@ class Flash(object):
             else:
                 id_phases = ls + ss
 
-            g, ls, ss, betas = identify_sort_phases(id_phases, betas, constants,
-                                                    correlations, settings=settings,
-                                                    skip_solids=self.skip_solids)
+            if not lite:
+                g, ls, ss, betas = identify_sort_phases(id_phases, betas, constants,
+                                                        correlations, settings=settings,
+                                                        skip_solids=self.skip_solids)
 
             a_phase = id_phases[0]
             return dest(a_phase.T, a_phase.P, zs, gas=g, liquids=ls, solids=ss,
@@ -4461,7 +7736,7 @@ class Flash(object):
             if g:
                 phases += [g]
             T, P = phases[0].T, phases[0].P
-            if self.N > 1:
+            if self.N > 1 and not lite:
                 g, ls, ss, betas = identify_sort_phases(phases, betas, constants,
                                                         correlations, settings=settings,
                                                         skip_solids=self.skip_solids)
@@ -4593,10 +7868,78 @@ class Flash(object):
 
     def grid_flash(self, zs, Ts=None, Ps=None, Vs=None,
                    VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
-                   props=None, store=True):
+                   props=None, store=True, n_jobs=None, executor=None,
+                   continuation=False):
+        r'''Method to flash a mixture over a two-dimensional grid of
+        specifications. Exactly two of the specification arrays should be
+        provided; the first one varies along the rows of the outputs and the
+        second along the columns.
+
+        Rows are independent, so they can be distributed over a process pool.
+        When `n_jobs` is given, a :obj:`concurrent.futures.ProcessPoolExecutor`
+        is created whose workers unpickle this flasher once at startup; each
+        task then only carries the specifications of one row. An existing
+        `executor` can be provided instead, in which case the flasher is sent
+        with every row.
+
+        In `continuation` mode, the grid is traversed in a serpentine order -
+        alternate rows are walked backwards - so consecutive points are always
+        neighbours. Each point is hot started from the nearest converged state,
+        and only flashed from scratch if that fails. When most of the grid is
+        in the same phase regime this saves many iterations and stability
+        tests; for :obj:`FlashVL`, a PT point hot started from a two phase
+        neighbour which converges to two phases is accepted without a
+        stability test. When run in parallel, the continuation is only along
+        each row.
+
+        Flashes which fail do not stop the calculation; their entries are set
+        to None and a record of each failure is stored in the list
+        `grid_flash_failures` of this object, as dictionaries with the keys
+        'index' (the (row, column) of the point), 'specs' (the flash
+        specifications), 'error' (the exception class name), and 'message'.
 
-        flashes = []
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        Ts : list[float], optional
+            Temperatures, [K]
+        Ps : list[float], optional
+            Pressures, [Pa]
+        Vs : list[float], optional
+            Molar volumes, [m^3/mol]
+        VFs : list[float], optional
+            Vapor fractions, [-]
+        SFs : list[float], optional
+            Solid fractions, [-]
+        Hs : list[float], optional
+            Molar enthalpies, [J/mol]
+        Ss : list[float], optional
+            Molar entropies, [J/(mol*K)]
+        Us : list[float], optional
+            Molar internal energies, [J/mol]
+        props : str or list[str], optional
+            Property or properties to calculate at each point with
+            :obj:`EquilibriumState.value <thermo.equilibrium.EquilibriumState.value>`, [-]
+        store : bool, optional
+            Whether or not to return the
+            :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+            objects, [-]
+        n_jobs : int, optional
+            Number of worker processes to use; -1 uses all CPUs; None or 1
+            performs the calculation serially in this process, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            Executor to submit the rows to, instead of creating one, [-]
+        continuation : bool, optional
+            Whether or not to hot start each flash from its neighbours, [-]
 
+        Returns
+        -------
+        flashes : list[list[EquilibriumState]], optional
+            Flash results, returned if `store` is True, [-]
+        calc_props : list[list[float]] or list[list[list[float]]], optional
+            Calculated properties, returned if `props` is specified, [-]
+        '''
         T_spec = Ts is not None
         P_spec = Ps is not None
         V_spec = Vs is not None
@@ -4606,7 +7949,6 @@ class Flash(object):
         VF_spec = VFs is not None
         SF_spec = SFs is not None
 
-        flash_specs = {'zs': zs}
         spec_keys = []
         spec_iters = []
         if T_spec:
@@ -4635,36 +7977,57 @@ class Flash(object):
             spec_iters.append(SFs)
 
         do_props = props is not None
-        scalar_props = isinstance(props, str)
-
-        calc_props = []
-        for n0, spec0 in enumerate(spec_iters[0]):
-            if do_props:
-                row_props = []
+        spec0s, spec1s = list(spec_iters[0]), list(spec_iters[1])
+        rows = len(spec0s)
+
+        # Preallocated so rows can be filled in whatever order they complete
+        flashes = [None]*rows
+        calc_props = [None]*rows
+        row_failures = [None]*rows
+
+        if n_jobs is not None and n_jobs < 0:
+            n_jobs = os.cpu_count()
+        parallel = executor is not None or (n_jobs is not None and n_jobs > 1)
+        if not parallel:
+            seeds = None
+            for n0 in range(rows):
+                flashes[n0], calc_props[n0], row_failures[n0] = grid_flash_row(
+                    self, zs, spec_keys, n0, spec0s[n0], spec1s, props, store,
+                    continuation=continuation, reverse=continuation and n0 % 2 == 1,
+                    seeds=seeds)
+                if continuation:
+                    seeds = flashes[n0]
+                    if not store:
+                        flashes[n0] = None
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            own_executor = executor is None
+            if own_executor:
+                executor = ProcessPoolExecutor(max_workers=n_jobs,
+                                               initializer=_grid_flash_worker_init,
+                                               initargs=(self,))
+                # Workers already hold the flasher; do not send it again
+                task_flasher = None
+            else:
+                task_flasher = self
+            try:
+                futures = {executor.submit(_grid_flash_worker_row, task_flasher, zs,
+                                           spec_keys, n0, spec0s[n0], spec1s,
+                                           props, store, continuation): n0 for n0 in range(rows)}
+                for future in as_completed(futures):
+                    n0 = futures[future]
+                    flashes[n0], calc_props[n0], row_failures[n0] = future.result()
+            finally:
+                if own_executor:
+                    executor.shutdown()
             if store:
-                row_flashes = []
-            for n1, spec1 in enumerate(spec_iters[1]):
-                flash_specs = {'zs': zs, spec_keys[0]: spec0, spec_keys[1]: spec1}
-                try:
-                    state = self.flash(**flash_specs)
-                except Exception as e:
-                    state = None
-                    print('Failed trying to flash %s, with exception %s.'%(flash_specs, e))
-
-                if store:
-                    row_flashes.append(state)
-                if do_props:
-                    if scalar_props:
-                        state_props = state.value(props)if state is not None else None
-                    else:
-                        state_props = [state.value(s) for s in props] if state is not None else [None for s in props]
-
-                    row_props.append(state_props)
+                # States come back holding copies of the flasher and constants
+                for row_flashes in flashes:
+                    for state in row_flashes:
+                        if state is not None:
+                            _link_state_to_flasher(state, self)
 
-            if do_props:
-                calc_props.append(row_props)
-            if store:
-                flashes.append(row_flashes)
+        self.grid_flash_failures = [f for failures in row_failures for f in failures]
 
         if do_props and store:
             return flashes, calc_props
@@ -4674,6 +8037,96 @@ class Flash(object):
             return flashes
         return None
 
+    def flash_stream(self, specs, props=('T', 'P', 'VF'), zs=None,
+                     hot_start_tol=0.05):
+        r'''Generator to flash a sequence of specifications one at a time,
+        yielding a tuple of the requested properties for each. Unlike
+        :obj:`grid_flash`, no flash results are kept; only the previous
+        state is held, so memory use does not depend on the length of
+        `specs`, which may be any iterable - including another generator.
+
+        When a specification has the same keys as the one before it, each of
+        its numeric values is within a relative tolerance `hot_start_tol` of
+        the previous one, each mole fraction is within an absolute tolerance
+        `hot_start_tol` of the previous one, and its other values (such as
+        `solution`) are equal to the previous ones, the flash is hot started
+        from the previous result; a cold flash is only performed if that
+        fails. Points which fail yield a tuple of None.
+
+        Parameters
+        ----------
+        specs : iterable[dict]
+            Keyword arguments to :obj:`flash` for each point, such as
+            `{'T': 300.0, 'P': 1e5}`; a 'zs' key overrides `zs`, [-]
+        props : list[str], optional
+            Properties to calculate at each point with
+            :obj:`EquilibriumState.value <thermo.equilibrium.EquilibriumState.value>`, [-]
+        zs : list[float], optional
+            Mole fractions of each component, used when a specification does
+            not include them, [-]
+        hot_start_tol : float, optional
+            Maximum relative change in every numeric specification, and
+            absolute change in every mole fraction, for which the previous
+            result is used as a hot start; 0 disables hot starts, [-]
+
+        Yields
+        ------
+        values : tuple
+            Calculated properties for one specification, in the order of
+            `props`, [various]
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, CEOSLiquid, CEOSGas, FlashVL, PRMIX
+        >>> constants, correlations = ChemicalConstantsPackage.from_IDs(['methane', 'ethane'])
+        >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+        >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        >>> flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+        >>> specs = ({'T': T, 'P': 2e6} for T in (180.0, 190.0, 200.0))
+        >>> [round(VF, 4) for VF, in flasher.flash_stream(specs, props=['VF'], zs=[.5, .5])]
+        [0.0, 0.0392, 0.2499]
+        '''
+        props = tuple(props)
+        failed = (None,)*len(props)
+        previous, previous_specs = None, None
+        for spec in specs:
+            flash_specs = dict(spec)
+            if flash_specs.get('zs') is None:
+                flash_specs['zs'] = zs
+            state = None
+            if (previous is not None and hot_start_tol > 0.0
+                    and flash_specs.keys() == previous_specs.keys()):
+                try:
+                    close = True
+                    for k, v in flash_specs.items():
+                        v_old = previous_specs[k]
+                        if v is None or v_old is None:
+                            close = v is v_old
+                        elif k == 'zs':
+                            close = (len(v) == len(v_old)
+                                     and all(abs(a - b) <= hot_start_tol for a, b in zip(v, v_old)))
+                        elif isinstance(v, (int, float)) and isinstance(v_old, (int, float)):
+                            close = abs(v - v_old) <= hot_start_tol*abs(v_old)
+                        else:
+                            close = v == v_old
+                        if not close:
+                            break
+                    if close:
+                        state = self.flash(hot_start=previous, **flash_specs)
+                except Exception:
+                    state = None
+            if state is None:
+                try:
+                    state = self.flash(**flash_specs)
+                except Exception:
+                    pass
+            previous, previous_specs = state, flash_specs
+            if state is None:
+                yield failed
+            else:
+                yield tuple([state.value(p) for p in props])
+
     def debug_grid_flash(self, zs, check0, check1, Ts=None, Ps=None, Vs=None,
                          VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
                          retry=False):
@@ -4981,6 +8434,72 @@ class Flash(object):
 
         return props
 
+    def grid_props_table(self, path, zs, props, spec0='T', spec1='P',
+                         Ts=None, Tmin=None, Tmax=None,
+                         Ps=None, Pmin=None, Pmax=None,
+                         Vs=None, Vmin=None, Vmax=None,
+                         VFs=None, auto_range=None, pts=50, n_jobs=None,
+                         continuation=False):
+        r'''Method to calculate a grid of properties as in :obj:`grid_props`,
+        write it to a file with :obj:`write_grid_table`, and return a
+        :obj:`GridPropertyTable` memory-mapping that file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to write, [-]
+        zs : list[float]
+            Mole fractions of each component, [-]
+        props : list[str]
+            Properties to calculate at each point with
+            :obj:`EquilibriumState.value <thermo.equilibrium.EquilibriumState.value>`, [-]
+        spec0 : str, optional
+            First specification; one of 'T', 'P', 'V' or 'VF', [-]
+        spec1 : str, optional
+            Second specification; one of 'T', 'P', 'V' or 'VF', [-]
+        pts : int, optional
+            Number of points of each generated specification, [-]
+        n_jobs : int, optional
+            Number of worker processes, as in :obj:`grid_flash`, [-]
+        continuation : bool, optional
+            Whether or not to hot start each flash from its neighbours, as in
+            :obj:`grid_flash`, [-]
+
+        Returns
+        -------
+        table : :obj:`GridPropertyTable`
+            Table of the calculated properties, [-]
+
+        Notes
+        -----
+        The remaining arguments are those of :obj:`generate_Ts`,
+        :obj:`generate_Ps` and :obj:`generate_Vs`.
+        '''
+        specs = {}
+        for a_spec in (spec0, spec1):
+            if 'T' == a_spec:
+                specs['T'] = self.generate_Ts(Ts=Ts, Tmin=Tmin, Tmax=Tmax, pts=pts, zs=zs,
+                                              method=auto_range)
+            elif 'P' == a_spec:
+                specs['P'] = self.generate_Ps(Ps=Ps, Pmin=Pmin, Pmax=Pmax, pts=pts, zs=zs,
+                                              method=auto_range)
+            elif 'V' == a_spec:
+                specs['V'] = self.generate_Vs(Vs=Vs, Vmin=Vmin, Vmax=Vmax, pts=pts, zs=zs,
+                                              method=auto_range)
+            elif 'VF' == a_spec:
+                specs['VF'] = linspace(0, 1, pts) if VFs is None else VFs
+            else:
+                raise ValueError('Unsupported specification %s' %(a_spec))
+        # grid_flash orders the specifications by kind, not argument order
+        keys = [k for k in ('T', 'P', 'V', 'VF') if k in specs]
+        props = list(props)
+        values = self.grid_flash(zs, Ts=specs.get('T'), Ps=specs.get('P'),
+                                 Vs=specs.get('V'), VFs=specs.get('VF'), props=props,
+                                 store=False, n_jobs=n_jobs, continuation=continuation)
+        write_grid_table(path, keys[0], keys[1], specs[keys[0]], specs[keys[1]], zs,
+                         props, values)
+        return GridPropertyTable(path)
+
     def debug_PT(self, zs, Pmin=None, Pmax=None, Tmin=None, Tmax=None, pts=50,
                 ignore_errors=True, values=False, verbose=False, show=False,
                 T_pts=None, P_pts=None, Ts=None, Ps=None): # pragma: no cover
@@ -5284,6 +8803,270 @@ PT_SS_GDEM3 = 'SS GDEM3'
 PT_NEWTON_lNKVF = 'Newton lnK VF'
 
 
+def PT_algorithm_2P(method, T, P, zs, xs_guess, ys_guess, liquid_phase,
+                    gas_phase, V_over_F_guess=None, maxiter=1000, tol=1e-13):
+    r'''Solve a two-phase PT flash with one of the named algorithms in
+    `FlashVL.PT_methods`, returning the results in the format of
+    :obj:`sequential_substitution_2P`.
+
+    Parameters
+    ----------
+    method : str
+        Name of the algorithm; one of 'SS', 'SS Mehra', 'SS GDEM3' or
+        'Newton lnK VF', [-]
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions of all species, [-]
+    xs_guess : list[float]
+        Initial guess of the liquid mole fractions, [-]
+    ys_guess : list[float]
+        Initial guess of the gas mole fractions, [-]
+    liquid_phase : :obj:`Phase <thermo.phases.Phase>`
+        Liquid phase object, [-]
+    gas_phase : :obj:`Phase <thermo.phases.Phase>`
+        Gas phase object, [-]
+    V_over_F_guess : float, optional
+        Initial guess of the vapor fraction, [-]
+    maxiter : int, optional
+        Maximum number of iterations, [-]
+    tol : float, optional
+        Convergence tolerance; not used by 'Newton lnK VF', [-]
+
+    Returns
+    -------
+    V_over_F : float
+        Vapor fraction, [-]
+    xs : list[float]
+        Liquid mole fractions, [-]
+    ys : list[float]
+        Gas mole fractions, [-]
+    l : :obj:`Phase <thermo.phases.Phase>`
+        Liquid phase at the solution, [-]
+    g : :obj:`Phase <thermo.phases.Phase>`
+        Gas phase at the solution, [-]
+    iteration : int
+        Number of iterations performed, [-]
+    err : float
+        Convergence error at the solution, [-]
+    '''
+    if method == PT_SS:
+        return sequential_substitution_2P(T=T, P=P, V=None, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                          liquid_phase=liquid_phase, gas_phase=gas_phase, maxiter=maxiter,
+                                          tol=tol, V_over_F_guess=V_over_F_guess)
+    elif method == PT_SS_MEHRA:
+        return sequential_substitution_Mehra_2P(T=T, P=P, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                                liquid_phase=liquid_phase, gas_phase=gas_phase,
+                                                maxiter=maxiter, tol=tol, V_over_F_guess=V_over_F_guess)
+    elif method == PT_SS_GDEM3:
+        return sequential_substitution_GDEM3_2P(T=T, P=P, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                                liquid_phase=liquid_phase, gas_phase=gas_phase,
+                                                maxiter=maxiter, tol=tol, V_over_F_guess=V_over_F_guess)
+    elif method == PT_NEWTON_lNKVF:
+        V_over_F, xs, ys, l, g, err, J, iteration = nonlin_2P_newton(T=T, P=P, zs=zs, xs_guess=xs_guess,
+                                                                     ys_guess=ys_guess, liquid_phase=liquid_phase,
+                                                                     gas_phase=gas_phase, maxiter=maxiter,
+                                                                     V_over_F_guess=V_over_F_guess)
+        return V_over_F, xs, ys, l, g, iteration, err
+    raise ValueError("Unrecognized PT method %s" %(method))
+
+
+class AdaptivePTStrategy(object):
+    r'''Class to choose the order in which the two-phase PT flash algorithms
+    of a flasher are tried, from a record of how they performed before. Set
+    an instance as the `PT_strategy` attribute of a :obj:`FlashVL` or
+    :obj:`FlashVLN` object to use it.
+
+    Flashes are grouped into regions by the reduced temperature and pressure
+    of the feed (with pseudocritical properties from Kay's rule) and the
+    number of phases being solved for. In each region, the number of
+    successes and failures of every algorithm are recorded, along with the
+    iterations of its successful runs. Algorithms which have succeeded in a
+    region are tried first, in order of increasing failure rate, then of
+    increasing mean iterations to converge, then in the default order of
+    the flasher. They are followed by the algorithms which have not been
+    tried in the region, and then by those which have only failed there.
+    Algorithms which failed at least `skip_failures` times in a region
+    without ever succeeding there are skipped, unless every algorithm would
+    be.
+
+    The order depends only on the recorded statistics, so it is
+    deterministic; they can be saved with :obj:`as_JSON` and loaded with
+    :obj:`from_JSON`.
+
+    Parameters
+    ----------
+    Tr_step : float, optional
+        Width of the reduced temperature regions, [-]
+    Pr_decade_steps : int, optional
+        Number of reduced pressure regions per decade of reduced pressure, [-]
+    skip_failures : int, optional
+        Number of failures without any success after which an algorithm is
+        no longer tried in a region, [-]
+
+    Attributes
+    ----------
+    stats : dict[tuple(int, int, int), dict[str, list[int]]]
+        Statistics of each region, indexed by the region key and then by the
+        algorithm name; each entry is [successes, failures, iterations], where
+        the iterations are the total of the successful runs, [-]
+
+    Examples
+    --------
+    >>> strategy = AdaptivePTStrategy()
+    >>> region = (7, -2, 2)
+    >>> strategy.record(region, 'SS', False)
+    >>> strategy.record(region, 'Newton lnK VF', True, 8)
+    >>> strategy.order(region, ['SS', 'SS Mehra', 'Newton lnK VF'])
+    ['Newton lnK VF', 'SS Mehra', 'SS']
+    '''
+
+    def __init__(self, Tr_step=0.1, Pr_decade_steps=4, skip_failures=3):
+        self.Tr_step = Tr_step
+        self.Pr_decade_steps = Pr_decade_steps
+        self.skip_failures = skip_failures
+        self.stats = {}
+
+    def __eq__(self, other):
+        return (self.__class__ is other.__class__ and self.Tr_step == other.Tr_step
+                and self.Pr_decade_steps == other.Pr_decade_steps
+                and self.skip_failures == other.skip_failures and self.stats == other.stats)
+
+    def region(self, T, P, zs, constants, phase_count=2):
+        r'''Method to compute the key of the region a flash belongs to.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        zs : list[float]
+            Mole fractions of each component, [-]
+        constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`
+            Constants of the flasher; `Tcs` and `Pcs` are used, [-]
+        phase_count : int, optional
+            Number of phases being solved for, [-]
+
+        Returns
+        -------
+        region : tuple(int, int, int)
+            Indexes of the reduced temperature and pressure regions, and the
+            phase count, [-]
+        '''
+        Tcs, Pcs = constants.Tcs, constants.Pcs
+        Tc = Pc = 0.0
+        for i in range(len(zs)):
+            Tc += zs[i]*Tcs[i]
+            Pc += zs[i]*Pcs[i]
+        return (int(floor(T/(Tc*self.Tr_step))),
+                int(floor(log10(P/Pc)*self.Pr_decade_steps)), phase_count)
+
+    def record(self, region, method, success, iterations=0):
+        r'''Method to record the outcome of an algorithm in a region.
+
+        Parameters
+        ----------
+        region : tuple(int, int, int)
+            Region key, [-]
+        method : str
+            Name of the algorithm, [-]
+        success : bool
+            Whether or not the algorithm converged, [-]
+        iterations : int, optional
+            Number of iterations the algorithm took to converge; not used if
+            it failed, [-]
+        '''
+        region_stats = self.stats.setdefault(region, {})
+        method_stats = region_stats.get(method)
+        if method_stats is None:
+            region_stats[method] = method_stats = [0, 0, 0]
+        if success:
+            method_stats[0] += 1
+            method_stats[2] += iterations
+        else:
+            method_stats[1] += 1
+
+    def order(self, region, methods):
+        r'''Method to return the algorithms to try in a region, in the order
+        they should be tried.
+
+        Parameters
+        ----------
+        region : tuple(int, int, int)
+            Region key, [-]
+        methods : list[str]
+            Names of the algorithms available, in their default order, [-]
+
+        Returns
+        -------
+        methods : list[str]
+            Names of the algorithms to try, [-]
+        '''
+        region_stats = self.stats.get(region)
+        if not region_stats:
+            return list(methods)
+        keys = []
+        skipped = []
+        for i, method in enumerate(methods):
+            method_stats = region_stats.get(method)
+            if method_stats is None:
+                keys.append((True, 0.0, 0.0, i))
+                continue
+            successes, failures, iterations = method_stats
+            keys.append((not successes, failures/float(successes + failures),
+                         iterations/float(successes) if successes else 0.0, i))
+            if not successes and failures >= self.skip_failures:
+                skipped.append(method)
+        ordered = [methods[key[-1]] for key in sorted(keys)]
+        if len(skipped) < len(methods):
+            ordered = [m for m in ordered if m not in skipped]
+        return ordered
+
+    def as_JSON(self):
+        r'''Method to create a JSON serialization of the strategy, including
+        its recorded statistics.
+
+        Returns
+        -------
+        json_repr : str
+            JSON representation, [-]
+        '''
+        if json is None:
+            get_json()
+        stats = {','.join(str(v) for v in region): region_stats
+                 for region, region_stats in self.stats.items()}
+        return json.dumps({'Tr_step': self.Tr_step, 'Pr_decade_steps': self.Pr_decade_steps,
+                           'skip_failures': self.skip_failures, 'stats': stats},
+                          sort_keys=True)
+
+    @classmethod
+    def from_JSON(cls, string):
+        r'''Method to create a strategy from the JSON serialization made by
+        :obj:`as_JSON`.
+
+        Parameters
+        ----------
+        json_repr : str
+            JSON representation, [-]
+
+        Returns
+        -------
+        strategy : :obj:`AdaptivePTStrategy`
+            Strategy with the saved settings and statistics, [-]
+        '''
+        if json is None:
+            get_json()
+        d = json.loads(string)
+        new = cls(Tr_step=d['Tr_step'], Pr_decade_steps=d['Pr_decade_steps'],
+                  skip_failures=d['skip_failures'])
+        new.stats = {tuple(int(v) for v in region.split(',')): region_stats
+                     for region, region_stats in d['stats'].items()}
+        return new
+
+
 def deduplicate_stab_results(results, tol_frac_err=5e-3):
     if not results:
         return results
@@ -5355,11 +9138,43 @@ class FlashVL(Flash):
         Convergence tolerance in sequential substitution when
         converging a two-phase solution that has been detected to be very
         sensitive, with a vapor fraction near 0 or 1 [-]
+    PT_methods : list[str]
+        Names of the two-phase PT flash algorithms which may be used, in
+        their default order, [-]
+    PT_strategy : :obj:`AdaptivePTStrategy` or None
+        When set, the algorithms in `PT_methods` are tried in the order given
+        by this object, which learns from the results of previous flashes;
+        when None, only sequential substitution is used, [-]
     PT_STABILITY_MAXITER : int
         Maximum number of iterations to try when converging a stability test,
         [-]
     PT_STABILITY_XTOL : float
         Convergence tolerance in the stability test [-]
+    PT_STABILITY_MEMORY : bool
+        When set to True, the stationary points found by the stability test
+        are remembered and tried before the generated trial compositions in
+        the next stability test of the same flasher (they are stored in
+        `stab_memory`); the ones which showed the mixture to be unstable are
+        tried first. This speeds up series of similar flashes, such as along
+        a column profile, [-]
+    PT_STABILITY_MEMORY_SIZE : int
+        Maximum number of stationary points remembered, [-]
+    PT_LNPHIS_DIRECT : bool
+        When set to True and both phases are :obj:`CEOSGas <thermo.phases.CEOSGas>`
+        and :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` objects of the same
+        equation of state, supported by :obj:`thermo.eos_mix_methods.lnphis_direct`,
+        the stability test and sequential substitution use the array-based
+        :obj:`stability_iteration_Michelsen_functional` and
+        :obj:`sequential_substitution_2P_functional` kernels, [-]
+    PT_REDUCED : bool
+        When set to True and the array-based kernels of `PT_LNPHIS_DIRECT` are
+        used, components with identical rows of binary interaction parameters
+        are grouped by :obj:`thermo.eos_mix_methods.kijs_reduction`; if
+        there are fewer groups than components, the stability test and
+        sequential substitution use the reduced-variable
+        :obj:`stability_iteration_Michelsen_reduced` and
+        :obj:`sequential_substitution_2P_reduced` kernels, whose cost grows
+        linearly with the number of components, [-]
     DEW_BUBBLE_QUASI_NEWTON_XTOL : float
         Convergence tolerance in quasi-Newton bubble and dew point flashes, [-]
     DEW_BUBBLE_QUASI_NEWTON_MAXITER : int
@@ -5394,6 +9209,24 @@ class FlashVL(Flash):
         numerically; this would need to be set to False if the phase objects
         used in the flash do not have complete analytical derivatives
         implemented, [-]
+    TPV_HSGUA_NEWTON_2P_FIRST : bool
+        When True, flashes with one (`T`, `P`) spec and one (`H`, `S`, `G`,
+        `U`, `A`) spec first try to converge a two-phase solution directly
+        with :obj:`nonlin_2P_HSGUAbeta_newton`, starting from the `hot_start`
+        state if it has two phases or the ideal guesses otherwise; the
+        solution is accepted if its gas fraction is between 0 and 1, and the
+        regular algorithm is used otherwise. The stability of the two-phase
+        solution is not checked, so this should only be enabled when no
+        third phase is expected, [-]
+    TPV_HSGUA_NEWTON_2P_XTOL : float
+        Tolerance in the largest residual of :obj:`nonlin_2P_HSGUAbeta_newton`
+        when `TPV_HSGUA_NEWTON_2P_FIRST` is set, [-]
+    TPV_HSGUA_NEWTON_2P_MAXITER : int
+        Maximum number of iterations of :obj:`nonlin_2P_HSGUAbeta_newton`
+        when `TPV_HSGUA_NEWTON_2P_FIRST` is set, [-]
+    K_cache : :obj:`KValueCache` or None
+        Cache of K values used when the K values of the phases do not depend
+        on composition; None to calculate them every time, the default, [-]
 
 
     Notes
@@ -5488,8 +9321,15 @@ class FlashVL(Flash):
     PT_methods = [PT_SS, PT_SS_MEHRA, PT_SS_GDEM3, PT_NEWTON_lNKVF]
     PT_algorithms = [sequential_substitution_2P, sequential_substitution_Mehra_2P,
                      sequential_substitution_GDEM3_2P, nonlin_2P_newton]
+    PT_strategy = None
 
     PT_STABILITY_MAXITER = 500 # 30 good professional default; 500 used in source DTU
+    PT_STABILITY_MEMORY = False
+    PT_STABILITY_MEMORY_SIZE = 4
+    PT_LNPHIS_DIRECT = True
+    PT_REDUCED = False
+    supports_lnphis_direct = False
+    kijs_reduced = None
     PT_STABILITY_XTOL = 5E-9 # 1e-12 was too strict; 1e-10 used in source DTU; 1e-9 set for some points near critical where convergence stopped; even some more stopped at higher Ts
 
     SS_ACCELERATION = False
@@ -5518,9 +9358,14 @@ class FlashVL(Flash):
     TPV_HSGUA_NEWTON_SOLVER = 'hybr'
     HSGUA_NEWTON_ANALYTICAL_JAC = True
 
+    TPV_HSGUA_NEWTON_2P_FIRST = False
+    TPV_HSGUA_NEWTON_2P_XTOL = 1e-10
+    TPV_HSGUA_NEWTON_2P_MAXITER = 100
+
     solids = None
     skip_solids = True
     K_composition_independent = False
+    K_cache = None
 
     max_liquids = 1
     max_phases = 2
@@ -5536,6 +9381,30 @@ class FlashVL(Flash):
         self.cmps = constants.cmps
 
         self.stab = StabilityTester(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        self.stab_memory = []
+
+        # Both phases are the same supported cubic, so the array-based kernels can be used
+        supports_lnphis_direct = False
+        if (gas.__class__ is CEOSGas and liquid.__class__ is CEOSLiquid
+                and gas.eos_class is liquid.eos_class and gas.eos_class.__name__ in lnphis_direct_models):
+            try:
+                supports_lnphis_direct = bool(gas.eos_kwargs == liquid.eos_kwargs)
+            except ValueError:
+                # numpy arrays in the kwargs
+                pass
+        self.supports_lnphis_direct = supports_lnphis_direct
+
+        # Groups of components for the reduced-variable kernels
+        kijs_reduced = None
+        if supports_lnphis_direct:
+            kijs = gas.eos_kwargs.get('kijs', None)
+            if kijs is None:
+                groups, one_minus_kijs_groups = [0]*self.N, [[1.0]]
+            else:
+                groups, one_minus_kijs_groups = kijs_reduction(kijs)
+            if len(one_minus_kijs_groups) < self.N:
+                kijs_reduced = (groups, one_minus_kijs_groups)
+        self.kijs_reduced = kijs_reduced
 
         self.flash_pure = FlashPureVLS(constants=constants, correlations=correlations,
                                        gas=gas, liquids=[liquid], solids=[],
@@ -5581,6 +9450,7 @@ class FlashVL(Flash):
         self.unique_phase_count = 1 + self.unique_liquid_count
         self.unique_liquid_hashes = unique_liquid_hashes
 
+    @_time_limited
     def flash_TVF(self, T, VF, zs, solution=None, hot_start=None):
         return self.flash_TVF_2P(T, VF, zs, self.liquid, self.gas, solution=solution, hot_start=hot_start)
 
@@ -5610,6 +9480,8 @@ class FlashVL(Flash):
                                                            correlations=correlations, T=T, VF=VF,
                                                            xtol=xtol, maxiter=dew_bubble_maxiter)
                     break
+                except FlashTimeoutError:
+                    raise
                 except Exception as e:
                     print(e)
 
@@ -5635,6 +9507,8 @@ class FlashVL(Flash):
                                 maxiter=dew_bubble_maxiter, xtol=dew_bubble_xtol,
                                 comp_guess=comp_guess)
                     break
+                except FlashTimeoutError:
+                    raise
                 except Exception as e:
                     print(e)
                     continue
@@ -5650,6 +9524,7 @@ class FlashVL(Flash):
         else:
             raise NotImplementedError("TODO")
 
+    @_time_limited
     def flash_PVF(self, P, VF, zs, solution=None, hot_start=None):
         return self.flash_PVF_2P(P, VF, zs, self.liquid, self.gas, solution=solution, hot_start=hot_start)
 
@@ -5677,6 +9552,8 @@ class FlashVL(Flash):
                                                            correlations=correlations, P=P, VF=VF,
                                                            xtol=xtol, maxiter=dew_bubble_maxiter)
                     break
+                except FlashTimeoutError:
+                    raise
                 except Exception as e:
                     print(e)
 
@@ -5702,6 +9579,8 @@ class FlashVL(Flash):
                                 maxiter=dew_bubble_maxiter, xtol=dew_bubble_xtol,
                                 comp_guess=comp_guess)
                     break
+                except FlashTimeoutError:
+                    raise
                 except Exception as e:
                     print(e)
                     continue
@@ -5717,6 +9596,217 @@ class FlashVL(Flash):
         else:
             raise NotImplementedError("TODO")
 
+    def dew_bubble_curve(self, zs_paths, VF, T=None, P=None, n_jobs=None,
+                         executor=None):
+        r'''Method to calculate the bubble or dew points of a mixture along
+        one or more paths of compositions, at a constant temperature or
+        pressure. Along each path, every point is started from the solution
+        of its neighbour, as described in :obj:`dew_bubble_curve_path`, which
+        requires many fewer iterations than solving each point independently
+        when the points are close together.
+
+        Independent paths can be distributed over a process pool, in the same
+        way as the rows of :obj:`grid_flash <Flash.grid_flash>`.
+
+        Points which fail do not stop the calculation; their values are set
+        to NaN and a record of each failure is stored in the list
+        `dew_bubble_curve_failures` of this object, as dictionaries with the
+        keys 'path' (the index of the path), 'index' (the index of the point
+        in its path), 'zs', 'error' (the exception class name), and
+        'message'.
+
+        Parameters
+        ----------
+        zs_paths : list[list[float]] or list[list[list[float]]]
+            Mole fractions of each component at each point of a path, or a
+            list of such paths, [-]
+        VF : float
+            Vapor fraction; 0 for bubble points and 1 for dew points, [-]
+        T : float, optional
+            Temperature, when calculating dew or bubble pressures [K]
+        P : float, optional
+            Pressure, when calculating dew or bubble temperatures [Pa]
+        n_jobs : int, optional
+            Number of worker processes to use; -1 uses all CPUs; None or 1
+            performs the calculation serially in this process, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            Executor to submit the paths to, instead of creating one, [-]
+
+        Returns
+        -------
+        vals : ndarray or list[ndarray]
+            Bubble or dew temperatures or pressures along the path, or a list
+            of them for each path, [K or Pa]
+        comps : ndarray or list[ndarray]
+            Mole fractions of the incipient phase (the gas for bubble points,
+            the liquid for dew points) at each point of the path, of shape
+            (points, N), or a list of them for each path, [-]
+        '''
+        if (T is None) == (P is None):
+            raise ValueError("Specify one of T or P")
+        if VF != 0.0 and VF != 1.0:
+            raise ValueError("VF must be 0 or 1")
+        fixed_var, fixed_val = ('T', T) if T is not None else ('P', P)
+        single = not hasattr(zs_paths[0][0], '__len__')
+        paths = [zs_paths] if single else zs_paths
+        path_count = len(paths)
+        results = [None]*path_count
+
+        if n_jobs is not None and n_jobs < 0:
+            n_jobs = os.cpu_count()
+        parallel = path_count > 1 and (executor is not None or (n_jobs is not None and n_jobs > 1))
+        if not parallel:
+            for n in range(path_count):
+                results[n] = dew_bubble_curve_path(self, paths[n], fixed_val, fixed_var, VF)
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            own_executor = executor is None
+            if own_executor:
+                executor = ProcessPoolExecutor(max_workers=n_jobs,
+                                               initializer=_grid_flash_worker_init,
+                                               initargs=(self,))
+                task_flasher = None
+            else:
+                task_flasher = self
+            try:
+                futures = {executor.submit(_dew_bubble_curve_worker_path, task_flasher,
+                                           [list(zs) for zs in paths[n]], fixed_val,
+                                           fixed_var, VF): n for n in range(path_count)}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            finally:
+                if own_executor:
+                    executor.shutdown()
+
+        N = self.N
+        all_vals, all_comps, all_failures = [], [], []
+        for n, (vals, comps, failures) in enumerate(results):
+            all_vals.append(np.array([v if v is not None else np.nan for v in vals]))
+            all_comps.append(np.array([c if c is not None else [np.nan]*N for c in comps]).reshape(len(comps), N))
+            for failure in failures:
+                failure['path'] = n
+                all_failures.append(failure)
+        self.dew_bubble_curve_failures = all_failures
+        if single:
+            return all_vals[0], all_comps[0]
+        return all_vals, all_comps
+
+    def bubble_T_curve(self, P, zs_paths, n_jobs=None, executor=None):
+        r'''Method to calculate the bubble point temperatures of a mixture
+        along one or more paths of compositions at a constant pressure. See
+        :obj:`dew_bubble_curve` for details.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        zs_paths : list[list[float]] or list[list[list[float]]]
+            Mole fractions of each component at each point of a path, or a
+            list of such paths, [-]
+        n_jobs : int, optional
+            Number of worker processes to use for multiple paths, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            Executor to submit the paths to, [-]
+
+        Returns
+        -------
+        Ts : ndarray or list[ndarray]
+            Bubble point temperatures, [K]
+        ys : ndarray or list[ndarray]
+            Mole fractions of the incipient gas phase, [-]
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, CEOSLiquid, CEOSGas, FlashVL, PRMIX
+        >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+        ...                                      omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+        ...                                      CASs=['74-84-0', '109-66-0'])
+        >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        >>> flasher = FlashVL(constants, None, liquid=CEOSLiquid(PRMIX, eos_kwargs), gas=CEOSGas(PRMIX, eos_kwargs))
+        >>> Ts, ys = flasher.bubble_T_curve(1e6, [[x, 1.0 - x] for x in (0.2, 0.5, 0.8)])
+        >>> [round(T, 2) for T in Ts]
+        [320.24, 270.45, 249.83]
+        '''
+        return self.dew_bubble_curve(zs_paths, 0.0, P=P, n_jobs=n_jobs, executor=executor)
+
+    def dew_T_curve(self, P, zs_paths, n_jobs=None, executor=None):
+        r'''Method to calculate the dew point temperatures of a mixture
+        along one or more paths of compositions at a constant pressure. See
+        :obj:`dew_bubble_curve` for details.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        zs_paths : list[list[float]] or list[list[list[float]]]
+            Mole fractions of each component at each point of a path, or a
+            list of such paths, [-]
+        n_jobs : int, optional
+            Number of worker processes to use for multiple paths, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            Executor to submit the paths to, [-]
+
+        Returns
+        -------
+        Ts : ndarray or list[ndarray]
+            Dew point temperatures, [K]
+        xs : ndarray or list[ndarray]
+            Mole fractions of the incipient liquid phase, [-]
+        '''
+        return self.dew_bubble_curve(zs_paths, 1.0, P=P, n_jobs=n_jobs, executor=executor)
+
+    def bubble_P_curve(self, T, zs_paths, n_jobs=None, executor=None):
+        r'''Method to calculate the bubble point pressures of a mixture
+        along one or more paths of compositions at a constant temperature.
+        See :obj:`dew_bubble_curve` for details.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        zs_paths : list[list[float]] or list[list[list[float]]]
+            Mole fractions of each component at each point of a path, or a
+            list of such paths, [-]
+        n_jobs : int, optional
+            Number of worker processes to use for multiple paths, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            Executor to submit the paths to, [-]
+
+        Returns
+        -------
+        Ps : ndarray or list[ndarray]
+            Bubble point pressures, [Pa]
+        ys : ndarray or list[ndarray]
+            Mole fractions of the incipient gas phase, [-]
+        '''
+        return self.dew_bubble_curve(zs_paths, 0.0, T=T, n_jobs=n_jobs, executor=executor)
+
+    def dew_P_curve(self, T, zs_paths, n_jobs=None, executor=None):
+        r'''Method to calculate the dew point pressures of a mixture
+        along one or more paths of compositions at a constant temperature.
+        See :obj:`dew_bubble_curve` for details.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        zs_paths : list[list[float]] or list[list[list[float]]]
+            Mole fractions of each component at each point of a path, or a
+            list of such paths, [-]
+        n_jobs : int, optional
+            Number of worker processes to use for multiple paths, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            Executor to submit the paths to, [-]
+
+        Returns
+        -------
+        Ps : ndarray or list[ndarray]
+            Dew point pressures, [Pa]
+        xs : ndarray or list[ndarray]
+            Mole fractions of the incipient liquid phase, [-]
+        '''
+        return self.dew_bubble_curve(zs_paths, 1.0, T=T, n_jobs=n_jobs, executor=executor)
+
     def stability_test_Michelsen(self, T, P, zs, min_phase, other_phase,
                                  existing_comps=None, skip=None,
                                  expect_liquid=False, expect_aqueous=False,
@@ -5741,10 +9831,34 @@ class FlashVL(Flash):
         if all_solutions:
             all_solutions_list = []
 
+        # Previous stationary points are tried before the generated guesses;
+        # their indexes are negative in the returned guess number
+        memory = self.stab_memory if (self.PT_STABILITY_MEMORY and not all_solutions) else None
+        n_memory = len(memory) if memory else 0
+        if n_memory:
+            gen = chain([list(trial_comp) for trial_comp, _ in memory], gen)
+
+        direct = self.PT_LNPHIS_DIRECT and self.supports_lnphis_direct and 0.0 not in zs
+        if direct:
+            fugacities_trial = min_phase.fugacities_lowest_Gibbs()
+            eos_mix = other_phase.eos_mix
+            if self.PT_REDUCED and self.kijs_reduced is not None:
+                stability_iteration = stability_iteration_Michelsen_reduced
+                direct_args = (eos_mix.__class__.__name__, self.kijs_reduced[0], self.kijs_reduced[1],
+                               eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots, other_phase.is_liquid)
+            else:
+                stability_iteration = stability_iteration_Michelsen_functional
+                direct_args = (eos_mix.__class__.__name__, eos_mix.kijs, eos_mix.bs,
+                               eos_mix.a_alphas, eos_mix.a_alpha_roots, other_phase.is_liquid)
+
         for i, trial_comp in enumerate(gen):
                 try:
-                    sln = stabiliy_iteration_Michelsen(min_phase, trial_comp, test_phase=other_phase,
-                                                       maxiter=self.PT_STABILITY_MAXITER, xtol=self.PT_STABILITY_XTOL)
+                    if direct:
+                        sln = stability_iteration(T, P, zs, trial_comp, fugacities_trial, *direct_args,
+                                                  maxiter=self.PT_STABILITY_MAXITER, xtol=self.PT_STABILITY_XTOL)
+                    else:
+                        sln = stabiliy_iteration_Michelsen(min_phase, trial_comp, test_phase=other_phase,
+                                                           maxiter=self.PT_STABILITY_MAXITER, xtol=self.PT_STABILITY_XTOL)
                     sum_zs_test, Ks, zs_test, V_over_F, trial_zs, appearing_zs, dG_RT = sln
                     lnK_2_tot = 0.0
                     for k in self.cmps:
@@ -5775,6 +9889,8 @@ class FlashVL(Flash):
                     stable = V_over_F < -1e-6 or V_over_F > (1.0 + 1e-6) #not (0.0 < V_over_F < 1.0)
                     if not stable:
                         always_stable = stable
+                    if memory is not None:
+                        self.stability_memory_add(zs_test, stable)
                     if all_solutions:
                         stab_guess_name = self.stab.incipient_guess_name(i, expect_liquid=expect_liquid)
                         all_solutions_list.append((trial_zs, appearing_zs, V_over_F, stab_guess_name, i, sum_criteria, lnK_2_tot))
@@ -5815,13 +9931,46 @@ class FlashVL(Flash):
                 trial_zs, appearing_zs, V_over_F, i, sum_criteria, lnK_2_tot = lowest_solution
             elif handle_iffy:
                 trial_zs, appearing_zs, V_over_F, i, sum_criteria, lnK_2_tot = iffy_solution
-            if skip is not None:
-                i += skip
-            stab_guess_name = self.stab.incipient_guess_name(i, expect_liquid=expect_liquid)
+            i -= n_memory
+            if i < 0:
+                stab_guess_name = 'previous%d' %(i + n_memory)
+            else:
+                if skip is not None:
+                    i += skip
+                stab_guess_name = self.stab.incipient_guess_name(i, expect_liquid=expect_liquid)
             return (False, (trial_zs, appearing_zs, V_over_F, stab_guess_name, i, sum_criteria, lnK_2_tot))
         else:
             return (stable, (None, None, None, None, None, None, None))
 
+    def stability_memory_add(self, zs_test, stable):
+        r'''Method to remember a stationary point found by the stability
+        test, to be tried first in the next stability test when
+        `PT_STABILITY_MEMORY` is set. Stationary points which show the
+        mixture to be unstable are kept ahead of stable ones, and the most
+        recent ones of each kind come first; the same stationary point found
+        again replaces the old entry.
+
+        Parameters
+        ----------
+        zs_test : list[float]
+            Mole fractions of the stationary point, [-]
+        stable : bool
+            Whether or not the mixture was stable to the stationary point, [-]
+        '''
+        memory = self.stab_memory
+        for j in range(len(memory)):
+            diff = 0.0
+            for zi_old, zi in zip(memory[j][0], zs_test):
+                diff = max(diff, abs(zi_old - zi))
+            if diff < 1e-3:
+                del memory[j]
+                break
+        j = 0
+        if stable:
+            while j < len(memory) and not memory[j][1]:
+                j += 1
+        memory.insert(j, (list(zs_test), stable))
+        del memory[self.PT_STABILITY_MEMORY_SIZE:]
 
     def flash_TP_stability_test(self, T, P, zs, liquid, gas, solution=None, LL=False, phases_ready=False):
         # gen = self.stab.incipient_guesses(T, P, zs)
@@ -5878,12 +10027,41 @@ class FlashVL(Flash):
             self.PT_converge(T=T, P=P, zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs, liquid_phase=min_phase,
                         gas_phase=other_phase, V_over_F_guess=V_over_F_guess)
         try:
-            V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(T=T, P=P, V=None,
-                                                                                zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs,
-                                                                                liquid_phase=min_phase,
-                                                                                gas_phase=other_phase, maxiter=self.PT_SS_MAXITER,
-                                                                                tol=self.PT_SS_TOL,
-                                                                                V_over_F_guess=V_over_F_guess)
+            if (self.PT_strategy is None and self.PT_LNPHIS_DIRECT and self.PT_REDUCED
+                    and self.kijs_reduced is not None and 0.0 not in zs):
+                eos_mix = min_phase.eos_mix
+                V_over_F, xs, ys, iteration, err = sequential_substitution_2P_reduced(T, P, zs, trial_zs, appearing_zs,
+                                                                                      eos_mix.__class__.__name__,
+                                                                                      self.kijs_reduced[0], self.kijs_reduced[1],
+                                                                                      eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots,
+                                                                                      xs_liquid=min_phase.is_liquid,
+                                                                                      ys_liquid=other_phase.is_liquid,
+                                                                                      maxiter=self.PT_SS_MAXITER, tol=self.PT_SS_TOL,
+                                                                                      V_over_F_guess=0.5 if V_over_F_guess is None else V_over_F_guess)
+                l = min_phase.to(T=T, P=P, zs=xs)
+                g = other_phase.to(T=T, P=P, zs=ys)
+            elif self.PT_strategy is None and self.PT_LNPHIS_DIRECT and self.supports_lnphis_direct:
+                eos_mix = min_phase.eos_mix
+                V_over_F, xs, ys, iteration, err = sequential_substitution_2P_functional(T, P, zs, trial_zs, appearing_zs,
+                                                                                         eos_mix.__class__.__name__, eos_mix.kijs,
+                                                                                         eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots,
+                                                                                         xs_liquid=min_phase.is_liquid,
+                                                                                         ys_liquid=other_phase.is_liquid,
+                                                                                         maxiter=self.PT_SS_MAXITER, tol=self.PT_SS_TOL,
+                                                                                         V_over_F_guess=0.5 if V_over_F_guess is None else V_over_F_guess)
+                l = min_phase.to(T=T, P=P, zs=xs)
+                g = other_phase.to(T=T, P=P, zs=ys)
+            elif self.PT_strategy is None:
+                V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(T=T, P=P, V=None,
+                                                                                    zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs,
+                                                                                    liquid_phase=min_phase,
+                                                                                    gas_phase=other_phase, maxiter=self.PT_SS_MAXITER,
+                                                                                    tol=self.PT_SS_TOL,
+                                                                                    V_over_F_guess=V_over_F_guess)
+            else:
+                V_over_F, xs, ys, l, g, iteration, err = self.flash_2P_adaptive(T=T, P=P, zs=zs, xs_guess=trial_zs,
+                                                                                ys_guess=appearing_zs, liquid_phase=min_phase,
+                                                                                gas_phase=other_phase, V_over_F_guess=V_over_F_guess)
         except TrivialSolutionError as e:
             ls, g = ([liquid], None) if min_phase is liquid else ([], gas)
             return g, ls, [], [1.0], {'iterations': 0, 'err': 0.0, 'stab_info': stab_info}
@@ -5915,6 +10093,33 @@ class FlashVL(Flash):
 
         return g, ls, [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err, 'stab_info': stab_info}
 
+    def flash_2P_adaptive(self, T, P, zs, xs_guess, ys_guess, liquid_phase,
+                          gas_phase, V_over_F_guess=None):
+        # Try the algorithms of `PT_methods` in the order given by `PT_strategy`,
+        # recording how each one did. A trivial solution is a property of the
+        # guess, not of the algorithm, so it is passed through.
+        strategy = self.PT_strategy
+        region = strategy.region(T, P, zs, self.constants, 2)
+        PT_methods = self.PT_methods
+        maxiter, tol = self.PT_SS_MAXITER, self.PT_SS_TOL
+        last_err = None
+        for method in strategy.order(region, PT_methods):
+            try:
+                sln = PT_algorithm_2P(method, T=T, P=P, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                      liquid_phase=liquid_phase, gas_phase=gas_phase,
+                                      V_over_F_guess=V_over_F_guess, maxiter=maxiter, tol=tol)
+            except TrivialSolutionError:
+                raise
+            except FlashTimeoutError:
+                raise
+            except Exception as e:
+                strategy.record(region, method, False)
+                last_err = e
+                continue
+            strategy.record(region, method, True, sln[5])
+            return sln
+        raise last_err
+
     def PT_converge(self, T, P, zs, xs_guess, ys_guess, liquid_phase,
                     gas_phase, V_over_F_guess=0.5):
         for algo in self.PT_algorithms:
@@ -5929,10 +10134,15 @@ class FlashVL(Flash):
         PT_algorithms = [sequential_substitution_2P, sequential_substitution_Mehra_2P,
                      sequential_substitution_GDEM3_2P, nonlin_2P_newton]
 
+    @_time_limited
     def flash_TPV(self, T, P, V, zs=None, solution=None, hot_start=None):
-        if hot_start is not None:
+        if (hot_start is not None and _grid_flash_continuation.active
+                and hot_start.gas is not None and hot_start.liquid_count):
+            # Only in continuation grid flashes, where the neighbouring point is
+            # trusted to be in the same phase regime, is the stability test
+            # skipped; only two phase hot starts have K values to begin from
             try:
-                VF_guess, xs, ys = hot_start.beta_gas, hot_start.liquid0.zs, hot_start.gas.zs
+                VF_guess, xs, ys = hot_start.gas_beta, hot_start.liquid0.zs, hot_start.gas.zs
                 liquid, gas = self.liquid, self.gas
 
                 V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(T=T, P=P, V=None,
@@ -5942,13 +10152,305 @@ class FlashVL(Flash):
 
                 assert 0.0 <= V_over_F <= 1.0
                 return g, [l], [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err}
-            except Exception as e:
-                print('FAILED from hot start TP')
+            except FlashTimeoutError:
+                raise
+            except Exception:
+                # Fall back to a cold start
                 pass
 
 
         return self.flash_TP_stability_test(T, P, zs, self.liquid, self.gas, solution=solution)
 
+    def Ks_composition_independent(self, T, P):
+        r'''Method to calculate the K values of a flasher whose phases do not
+        depend on composition, from its `K_cache` if one is set.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        Ks : list[float]
+            K values (ratios of the gas to the liquid mole fractions) of each
+            component, [-]
+        '''
+        if self.K_cache is not None:
+            return self.K_cache.Ks(self, T, P)
+        return self._Ks_composition_independent(T, P)
+
+    def _Ks_composition_independent(self, T, P):
+        zs = [1.0/self.N]*self.N
+        lnphis_l = self.liquids[0].to_TP_zs(T=T, P=P, zs=zs).lnphis()
+        lnphis_g = self.gas.to_TP_zs(T=T, P=P, zs=zs).lnphis()
+        return [exp(lnphis_l[i] - lnphis_g[i]) for i in range(self.N)]
+
+    def flash_TP_batch(self, T, P, zs_matrix, props=None):
+        r'''Method to perform many PT flashes of different feed compositions at
+        the same temperature and pressure. No
+        :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` objects
+        are created; the phase fractions and compositions are returned as
+        arrays.
+
+        The temperature-dependent parts of the phase models are calculated
+        only once, and shared by all of the flashes. When the K values of the
+        system do not depend on composition, they are found with
+        :obj:`Ks_composition_independent` (using the `K_cache` if one is set)
+        and the Rachford-Rice equation is solved directly for every row at
+        once. Otherwise, every row is
+        initialized with Wilson's K values and converged by sequential
+        substitution, with the Rachford-Rice step of each iteration vectorized
+        across the rows which have not yet converged.
+
+        Rows for which this does not result in a two-phase solution, or which
+        are very near a phase boundary, are flashed individually with the
+        rigorous stability test based algorithm used by
+        :obj:`flash <Flash.flash>`. Systems which can form more than one
+        liquid phase are always flashed individually, unless their K values
+        are composition independent.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        zs_matrix : list[list[float]]
+            Mole fractions of each component for each flash, with shape (M, N)
+            [-]
+        props : list[str], optional
+            Names of molar properties of the
+            :obj:`Phase <thermo.phases.Phase>` objects such as 'H', 'S', 'G',
+            'V', or 'Cp' to calculate for the overall mixture; each is
+            calculated as the phase-fraction weighted sum of the values of
+            the phases present, [-]
+
+        Returns
+        -------
+        betas : ndarray
+            Phase fractions of the gas and each liquid phase, with shape
+            (M, `max_phases`); phases not present have a fraction of zero, [-]
+        compositions : ndarray
+            Mole fractions of each component in the gas and each liquid phase,
+            with shape (M, `max_phases`, N); phases not present are filled
+            with NaN, [-]
+        values : ndarray, optional
+            Calculated values of `props` for each flash, with shape
+            (M, len(`props`)); only returned if `props` is specified,
+            [various]
+
+        Notes
+        -----
+        The gas phase is always stored first, followed by the liquids, so a
+        gas model is required.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+        >>> from thermo.interaction_parameters import IPDB
+        >>> constants, properties = ChemicalConstantsPackage.from_IDs(['methane', 'ethane', 'nitrogen'])
+        >>> kijs = IPDB.get_ip_asymmetric_matrix('ChemSep PR', constants.CASs, 'kij')
+        >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+        >>> gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+        >>> liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs, HeatCapacityGases=properties.HeatCapacityGases)
+        >>> flasher = FlashVL(constants, properties, liquid=liquid, gas=gas)
+        >>> betas, compositions = flasher.flash_TP_batch(T=110.0, P=1e5, zs_matrix=[[0.965, 0.018, 0.017], [0.9, 0.05, 0.05]])
+        >>> betas[:, 0]
+        array([0.10365, 0.27836])
+        '''
+        if self.gas is None:
+            raise ValueError("Batch flashes require a gas model")
+        zs_matrix = np.array(zs_matrix, dtype=float)
+        M, N = zs_matrix.shape
+        max_phases = self.max_phases
+        betas = np.zeros((M, max_phases))
+        compositions = np.full((M, max_phases, N), np.nan)
+        do_props = props is not None
+        if do_props:
+            values = np.full((M, len(props)), np.nan)
+
+        K_composition_independent = (self.K_composition_independent and max_phases > 1
+                                     and (self.max_liquids == 1 or self.K_COMPOSITION_INDEPENDENT_HACK))
+        if do_props or not K_composition_independent:
+            zs_ref = zs_matrix[0].tolist()
+            gas = self.gas.to_TP_zs(T=T, P=P, zs=zs_ref)
+            liquid = self.liquids[0].to_TP_zs(T=T, P=P, zs=zs_ref)
+
+        individual = np.ones(M, dtype=bool)
+        if K_composition_independent:
+            Ks = np.array(self.Ks_composition_independent(T, P))
+            VFs, xs, ys = Rachford_Rice_solution_batch(zs_matrix, np.tile(Ks, (M, 1)))
+            single_gas, single_liquid = VFs >= 1.0, VFs <= 0.0
+            betas[single_gas, 0] = 1.0
+            compositions[single_gas, 0] = zs_matrix[single_gas]
+            betas[single_liquid, 1] = 1.0
+            compositions[single_liquid, 1] = zs_matrix[single_liquid]
+            two_phase = ~(single_gas | single_liquid)
+            betas[two_phase, 0] = VFs[two_phase]
+            betas[two_phase, 1] = 1.0 - VFs[two_phase]
+            compositions[two_phase, 0] = ys[two_phase]
+            compositions[two_phase, 1] = xs[two_phase]
+            individual[:] = False
+        elif self.max_liquids == 1:
+            try:
+                constants = self.constants
+                Tcs, Pcs, omegas = constants.Tcs, constants.Pcs, constants.omegas
+                Ks = [Wilson_K_value(T, P, Tcs[i], Pcs[i], omegas[i]) for i in range(N)]
+            except (TypeError, IndexError):
+                Ks = None
+            if Ks is not None:
+                self._flash_TP_batch_SS(T, P, zs_matrix, Ks, liquid, gas, betas,
+                                        compositions, individual)
+
+        for i in range(M):
+            if individual[i]:
+                zs = zs_matrix[i].tolist()
+                g, ls, ss, row_betas, _ = self.flash_TPV(T=T, P=P, V=None, zs=zs)
+                id_phases = [g] + ls if g is not None else ls
+                g, ls, _, row_betas = identify_sort_phases(id_phases, row_betas, self.constants,
+                                                           self.correlations, settings=self.settings,
+                                                           skip_solids=self.skip_solids)
+                row_phases = [g] + ls
+                for j, phase in enumerate(row_phases):
+                    if phase is not None:
+                        compositions[i, j] = phase.zs
+                if g is None:
+                    betas[i, 1:len(row_betas)+1] = row_betas
+                else:
+                    betas[i, :len(row_betas)] = row_betas
+                if do_props:
+                    for k, prop in enumerate(props):
+                        values[i, k] = sum([betas[i, j]*getattr(p, prop)() for j, p in enumerate(row_phases)
+                                            if p is not None])
+            elif do_props:
+                row_phases = []
+                for j, base in enumerate([gas, liquid]):
+                    if betas[i, j] != 0.0:
+                        row_phases.append((betas[i, j], base.to_TP_zs(T=T, P=P, zs=compositions[i, j].tolist())))
+                for k, prop in enumerate(props):
+                    values[i, k] = sum([beta*getattr(p, prop)() for beta, p in row_phases])
+
+        if do_props:
+            return betas, compositions, values
+        return betas, compositions
+
+    def _flash_TP_batch_SS(self, T, P, zs_matrix, Ks, liquid, gas, betas,
+                           compositions, individual):
+        # Batched sequential substitution, see `flash_TP_batch`; converged
+        # rows are stored in `betas` and `compositions` and unmarked in
+        # `individual`
+        M = zs_matrix.shape[0]
+        VFs, xs, ys = Rachford_Rice_solution_batch(zs_matrix, np.tile(Ks, (M, 1)))
+        idxs = np.where((VFs > 0.0) & (VFs < 1.0))[0]
+        zs_active, xs, ys, VFs = zs_matrix[idxs], xs[idxs], ys[idxs], VFs[idxs]
+        present = zs_active > 0.0
+        tol, polish_VF = self.PT_SS_TOL, self.PT_SS_POLISH_VF
+        for _ in range(self.PT_SS_MAXITER):
+            if not idxs.size:
+                break
+            lnphis_l = np.array([liquid.lnphis_at_zs(x.tolist()) for x in xs])
+            lnphis_g = np.array([gas.lnphis_at_zs(y.tolist()) for y in ys])
+            with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+                Ks = np.exp(np.clip(lnphis_l - lnphis_g, -700.0, 700.0))
+                errs = np.where(present, Ks*xs/ys - 1.0, 0.0)
+            errs = (errs*errs).sum(axis=1)
+            VFs_new, xs_new, ys_new = Rachford_Rice_solution_batch(zs_active, Ks, guesses=VFs)
+
+            # Rows converging to the trivial solution or leaving the two-phase
+            # region are left for the rigorous flash
+            failed = (~np.isfinite(VFs_new) | ~np.isfinite(errs)
+                      | (np.abs(xs_new - ys_new).sum(axis=1) < 1e-5))
+            converged = (errs < tol) & ~failed
+            for k in np.where(converged)[0]:
+                if polish_VF < VFs[k] < 1.0 - polish_VF:
+                    i = idxs[k]
+                    betas[i, 0], betas[i, 1] = VFs[k], 1.0 - VFs[k]
+                    compositions[i, 0], compositions[i, 1] = ys[k], xs[k]
+                    individual[i] = False
+            keep = ~(failed | converged)
+            idxs, zs_active, present = idxs[keep], zs_active[keep], present[keep]
+            VFs, xs, ys = VFs_new[keep], xs_new[keep], ys_new[keep]
+
+    def phase_envelope(self, zs, P_start=1e5, VF=1.0, P_min=None, P_max=None,
+                       T_min=None, T_max=None, max_points=1000):
+        r'''Method to trace the phase envelope of a mixture, using the
+        continuation method of Michelsen implemented in
+        :obj:`envelope_2P_Michelsen`. The curve is begun with a `PVF` flash
+        at `P_start` and followed up in pressure, through the critical point,
+        and back down to `P_min` on its other side. Only the first liquid
+        phase of the flasher is considered.
+
+        With the default `VF` of 1 the dew point curve is traced first and
+        the bubble point curve second; with a `VF` of 0 the order is reversed.
+        Intermediate values trace lines of constant vapor fraction.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        P_start : float, optional
+            Pressure of the first point of the envelope, [Pa]
+        VF : float, optional
+            Vapor fraction of the envelope, [-]
+        P_min : float, optional
+            Pressure at which to stop tracing the envelope once past its
+            maximum pressure; defaults to `P_start`, [Pa]
+        P_max : float, optional
+            Pressure above which to stop tracing the envelope; defaults to
+            `P_MAX_FIXED`, [Pa]
+        T_min : float, optional
+            Temperature below which to stop tracing the envelope; defaults to
+            `T_MIN_FIXED`, [K]
+        T_max : float, optional
+            Temperature above which to stop tracing the envelope; defaults to
+            `T_MAX_FIXED`, [K]
+        max_points : int, optional
+            Maximum number of points to calculate, [-]
+
+        Returns
+        -------
+        Ts : ndarray
+            Temperatures along the envelope, [K]
+        Ps : ndarray
+            Pressures along the envelope, [Pa]
+        Ks : ndarray
+            K values (vapor over liquid mole fractions) along the envelope,
+            shape (points, N), [-]
+        critical : tuple(float, float) or None
+            Estimated critical temperature and pressure, if the envelope
+            passes through the critical point, [K, Pa]
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+        >>> from thermo.interaction_parameters import IPDB
+        >>> constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 369.83], Pcs=[4599000.0, 4872000.0, 4248000.0], omegas=[0.008, 0.098, 0.152], MWs=[16.04246, 30.06904, 44.09562], CASs=['74-82-8', '74-84-0', '74-98-6'])
+        >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        >>> gas = CEOSGas(PRMIX, eos_kwargs=eos_kwargs)
+        >>> liquid = CEOSLiquid(PRMIX, eos_kwargs=eos_kwargs)
+        >>> flasher = FlashVL(constants, None, liquid=liquid, gas=gas)
+        >>> Ts, Ps, Ks, critical = flasher.phase_envelope([0.8, 0.15, 0.05])
+        >>> critical
+        (234.48, 7410922.1)
+        >>> max(Ps)
+        7580790.
+        '''
+        if self.N == 1:
+            raise ValueError("Phase envelopes are only defined for mixtures")
+        state = self.flash(P=P_start, VF=VF, zs=zs)
+        xs, ys = state.liquid0.zs, state.gas.zs
+        Ks = [ys[i]/xs[i] if xs[i] > 0.0 else 1.0 for i in range(self.N)]
+        return envelope_2P_Michelsen(zs, state.T, state.P, Ks, self.liquids[0], self.gas,
+                                     beta=VF, P_min=P_start if P_min is None else P_min,
+                                     P_max=self.P_MAX_FIXED if P_max is None else P_max,
+                                     T_min=self.T_MIN_FIXED if T_min is None else T_min,
+                                     T_max=self.T_MAX_FIXED if T_max is None else T_max,
+                                     max_points=max_points)
+
+    @_time_limited
     def flash_TPV_HSGUA(self, fixed_val, spec_val, fixed_var='P', spec='H',
                         iter_var='T', zs=None, solution=None,
                         selection_fun_1P=None, hot_start=None):
@@ -5983,6 +10485,16 @@ class FlashVL(Flash):
                     return True
                 return False
 
+        if (self.TPV_HSGUA_NEWTON_2P_FIRST and solution is None and fixed_var in ('T', 'P')
+                and iter_var in ('T', 'P')):
+            try:
+                return self.solve_PT_HSGUA_newton_2P(zs, fixed_val, spec_val, fixed_var=fixed_var,
+                                                     spec=spec, iter_var=iter_var, hot_start=hot_start)
+            except FlashTimeoutError:
+                raise
+            except Exception:
+                pass
+
         try:
             solutions_1P = []
             G_min = 1e100
@@ -5998,9 +10510,13 @@ class FlashVL(Flash):
                         results_G_min_1P = new
 
                     solutions_1P.append(new)
+                except FlashTimeoutError:
+                    raise
                 except Exception as e:
 #                    print(e)
                     solutions_1P.append(None)
+        except FlashTimeoutError:
+            raise
         except:
             pass
 
@@ -6009,6 +10525,8 @@ class FlashVL(Flash):
                 res, flash_convergence = self.solve_PT_HSGUA_NP_guess_bisect(zs, fixed_val, spec_val,
                                                                fixed_var=fixed_var, spec=spec, iter_var=iter_var)
                 return None, res.phases, [], res.betas, flash_convergence
+            except FlashTimeoutError:
+                raise
             except:
                 g, ls, ss, betas, flash_convergence = self.solve_PT_HSGUA_NP_guess_newton_2P(zs, fixed_val, spec_val,
                                                                                              fixed_var=fixed_var,
@@ -6062,6 +10580,8 @@ class FlashVL(Flash):
                                P_ref=101325.0)
 
                 break
+            except FlashTimeoutError:
+                raise
             except Exception as e:
                 print(e)
                 pass
@@ -6077,6 +10597,45 @@ class FlashVL(Flash):
 
         return None, phases, [], betas, {'errs': errs, 'iterations': iterations}
 
+    def solve_PT_HSGUA_newton_2P(self, zs, fixed_val, spec_val, fixed_var='P',
+                                 spec='H', iter_var='T', hot_start=None):
+        liquid, gas = self.liquids[0], self.gas
+        if not hasattr(liquid, 'dlnphis_dns') or not hasattr(gas, 'dlnphis_dns'):
+            raise NotImplementedError("Phases do not implement analytical composition derivatives")
+        if hot_start is not None and hot_start.phase_count == 2 and hot_start.gas is not None:
+            guess = hot_start.T if iter_var == 'T' else hot_start.P
+            VF, xs, ys = hot_start.VF, hot_start.liquid0.zs, hot_start.gas.zs
+        else:
+            min_bound, max_bound = self.bounds_PT_HSGUA(iter_var)
+            guess = None
+            for method in (SHAW_ELEMENTAL, IDEAL_WILSON):
+                try:
+                    guess, VF, xs, ys = TPV_solve_HSGUA_guesses_VL(zs, method, self.constants, self.correlations,
+                                   fixed_val, spec_val,
+                                   iter_var=iter_var, fixed_var=fixed_var, spec=spec,
+                                   maxiter=50, xtol=1E-5, ytol=None,
+                                   bounded=False, min_bound=min_bound, max_bound=max_bound,
+                                   user_guess=None, last_conv=None, T_ref=298.15,
+                                   P_ref=101325.0)
+                    break
+                except FlashTimeoutError:
+                    raise
+                except Exception:
+                    pass
+            if guess is None:
+                raise ValueError("Could not obtain an initial guess")
+            # The ideal guess may be single phase; start inside the two phase region
+            VF = min(max(VF, 0.01), 0.99)
+        phase_kwargs = {fixed_var: fixed_val, iter_var: guess, 'zs': zs}
+        sln = nonlin_2P_HSGUAbeta_newton(spec_val, spec, guess, iter_var, fixed_val, fixed_var,
+                                         zs, xs, ys, liquid.to(**phase_kwargs), gas.to(**phase_kwargs),
+                                         maxiter=self.TPV_HSGUA_NEWTON_2P_MAXITER,
+                                         tol=self.TPV_HSGUA_NEWTON_2P_XTOL, V_over_F_guess=VF)
+        VF, iter_val, xs, ys, l, g, iterations, err = sln
+        if not (0.0 < VF < 1.0):
+            raise PhaseCountReducedError("Two phase solution has a phase fraction of %g" %(VF))
+        return None, [g, l], [], [VF, 1.0 - VF], {'iterations': iterations, 'err': err}
+
 
 
     def solve_PT_HSGUA_NP_guess_bisect(self, zs, fixed_val, spec_val,
@@ -6102,6 +10661,8 @@ class FlashVL(Flash):
                 break
             except NotImplementedError:
                 continue
+            except FlashTimeoutError:
+                raise
             except Exception as e:
                 #print(e)
                 pass
@@ -6181,6 +10742,14 @@ class FlashVLN(FlashVL):
     SS_NP_TRIVIAL_TOL : float
         Tolerance at which to quick a three-phase flash because it is
         converging to the trivial solution, [-]
+    SS_NP_RR_METHOD : str or None
+        Rachford-Rice solver used in sequential substitution for a three or
+        more phase solution; None for
+        :obj:`chemicals.rachford_rice.Rachford_Rice_solutionN`, the default,
+        or 'Okuno' for :obj:`Rachford_Rice_solutionN_Okuno`. Both give the
+        same phase fractions; the Okuno solver stays inside the region where
+        all compositions are valid, so it can be more robust, but it is about
+        40% slower per call, [-]
     SS_STAB_AQUEOUS_CHECK : bool
         If True, the first three-phase stability check will be on water (if
         it is present) as it forms a three-phase solution more than any
@@ -6243,6 +10812,7 @@ class FlashVLN(FlashVL):
     SS_NP_MAXITER = FlashVL.PT_SS_MAXITER
     SS_NP_TRIVIAL_TOL = 5e-5
     SS_NP_TOL = 1e-15
+    SS_NP_RR_METHOD = None
     SS_STAB_AQUEOUS_CHECK = True
 
     DOUBLE_CHECK_2P = False
@@ -6276,8 +10846,7 @@ class FlashVLN(FlashVL):
                 liquids_to_unique_liquids.append(i)
             else:
                 liquids_to_unique_liquids.append(unique_liquid_hashes.index(h))
-        if gas:
-            gas_hash = gas.model_hash(True)
+        gas_hash = gas.model_hash(True) if gas is not None else None
 
         gas_to_unique_liquid = None
         for i, l in enumerate(liquids):
@@ -6307,6 +10876,7 @@ class FlashVLN(FlashVL):
         self.aqueous_check = (self.SS_STAB_AQUEOUS_CHECK and '7732-18-5' in constants.CASs)
         self.stab = StabilityTester(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas,
                                     aqueous_check=self.aqueous_check, CASs=constants.CASs)
+        self.stab_memory = []
 
         try:
             self.water_index = constants.CASs.index(CAS_H2O)
@@ -6317,6 +10887,7 @@ class FlashVLN(FlashVL):
 #                                       gas=gas, liquids=unique_liquids, solids=[],
 #                                       settings=settings)
 
+    @_time_limited
     def flash_TVF(self, T, VF, zs, solution=None, hot_start=None, liquid_idx=None):
         if self.unique_liquid_count == 1:
             return self.flash_TVF_2P(T, VF, zs, self.liquids[0], self.gas, solution=solution, hot_start=hot_start)
@@ -6330,11 +10901,14 @@ class FlashVLN(FlashVL):
                     sln_G = (sln[1].G()*(1.0 - VF) + sln[2].G()*VF)
                     if sln_G < G_min:
                         sln_G_min, G_min = sln, sln_G
+                except FlashTimeoutError:
+                    raise
                 except:
                     pass
             return sln_G_min
 
 
+    @_time_limited
     def flash_PVF(self, P, VF, zs, solution=None, hot_start=None, liquid_idx=None):
         if self.unique_liquid_count == 1:
             sln_2P = self.flash_PVF_2P(P, VF, zs, self.liquids[0], self.gas, solution=solution, hot_start=hot_start)
@@ -6348,6 +10922,8 @@ class FlashVLN(FlashVL):
                     sln_G = (sln[1].G()*(1.0 - VF) + sln[2].G()*VF)
                     if sln_G < G_min:
                         sln_G_min, G_min = sln, sln_G
+                except FlashTimeoutError:
+                    raise
                 except:
                     pass
             sln_2P = sln_G_min
@@ -6388,19 +10964,23 @@ class FlashVLN(FlashVL):
             betas = hot_start.betas
             slnN = sequential_substitution_NP(T, P, zs, comps, betas, phases,
                                               maxiter=self.SS_NP_MAXITER, tol=self.SS_NP_TOL,
-                                              trivial_solution_tol=self.SS_NP_TRIVIAL_TOL)
+                                              trivial_solution_tol=self.SS_NP_TRIVIAL_TOL,
+                                              RR_method=self.SS_NP_RR_METHOD)
             return None, slnN[2], [], slnN[0], {'iterations': slnN[3], 'err': slnN[4],
                                                 'stab_guess_name': None}
 
 
+    def _Ks_composition_independent(self, T, P):
+        zs = [1.0/self.N]*self.N
+        return self.liquid0.phis_at(T, P, zs)
+
     def flash_TP_K_composition_idependent(self, T, P, zs):
         if self.max_phases == 1:
             phase = self.phases[0].to(T=T, P=P, zs=zs)
             return None, [phase], [], [1.0], {'iterations': 0, 'err': 0}
 
 
-        Ks = liquid_phis = self.liquid0.phis_at(T, P, zs)
-#        Ks = [liquid_phis[i]/gas_phis[i] for i in self.cmps]
+        Ks = self.Ks_composition_independent(T, P)
         try:
             VF, xs, ys = flash_inner_loop(zs, Ks, check=True)
         except PhaseCountReducedError:
@@ -6427,11 +11007,14 @@ class FlashVLN(FlashVL):
             liquid = self.liquid0.to(T=T, P=P, zs=xs)
             return gas, [liquid], [], [VF, 1.0 - VF], empty_flash_conv
 
+    @_time_limited
     def flash_TPV(self, T, P, V, zs=None, solution=None, hot_start=None):
         if hot_start is not None and hot_start.phase_count > 1:
             # Only allow hot start when there are multiple phases
             try:
                 return self.flash_TPV_hot(T, P, V, zs, hot_start, solution=solution)
+            except FlashTimeoutError:
+                raise
             except:
                 # Let anything fail
                 pass
@@ -6481,6 +11064,8 @@ class FlashVLN(FlashVL):
                 found_phases = [g, l0]
                 phase_evolved[0] = phase_evolved[1] = True
                 found_betas = sln_2P[3]
+        except FlashTimeoutError:
+            raise
         except:
             VL_solved = False
 
@@ -6496,6 +11081,8 @@ class FlashVLN(FlashVL):
                         found_phases = [l0, l1]
                         found_betas = sln_2P[3]
                         break
+                except FlashTimeoutError:
+                    raise
                 except:
                     pass
         if not LL_solved and not VL_solved:
@@ -6595,7 +11182,7 @@ class FlashVLN(FlashVL):
                 failed_3P = False
 
                 sln3 = sequential_substitution_NP(T, P, zs, flash_comps, flash_betas, flash_phases, maxiter=self.SS_NP_MAXITER, tol=self.SS_NP_TOL,
-                               trivial_solution_tol=self.SS_NP_TRIVIAL_TOL)
+                               trivial_solution_tol=self.SS_NP_TRIVIAL_TOL, RR_method=self.SS_NP_RR_METHOD)
                 if ideal_gas_basis:
                     G_3P = sum([sln3[0][i]*sln3[2][i].G_min_criteria() for i in range(3)])
                 else:
@@ -6614,6 +11201,8 @@ class FlashVLN(FlashVL):
                     # Might need to make this true
                     try_LL_3P_failed = False
                     failed_3P = True
+            except FlashTimeoutError:
+                raise
             except:
                 try_LL_3P_failed = True
                 failed_3P = True
@@ -6673,10 +11262,13 @@ class FlashVLN(FlashVL):
                 flash_betas = list(slnN[0])
                 flash_betas.append(0.0)
                 try:
-                    slnN = sequential_substitution_NP(T, P, zs, flash_comps, flash_betas, flash_phases)
+                    slnN = sequential_substitution_NP(T, P, zs, flash_comps, flash_betas, flash_phases,
+                                                      RR_method=self.SS_NP_RR_METHOD)
                     if self.max_phases == len(slnN[0]):
                         return None, slnN[2], [], slnN[0], {'iterations': slnN[3], 'err': slnN[4],
                                                                        'stab_guess_name': stab_guess_name, 'G_2P': G_2P}
+                except FlashTimeoutError:
+                    raise
                 except:
                     pass
 
@@ -7010,6 +11602,7 @@ class FlashPureVLS(Flash):
 
 
 
+    @_time_limited
     def flash_TPV(self, T, P, V, zs=None, solution=None, hot_start=None):
         betas = [1.0]
 
@@ -7142,6 +11735,7 @@ class FlashPureVLS(Flash):
                 Psat = 1e5
         return Psat
 
+    @_time_limited
     def flash_TVF(self, T, VF=None, zs=None, hot_start=None):
         zs = [1.0]
         if self.VL_only_CoolProp:
@@ -7181,6 +11775,7 @@ class FlashPureVLS(Flash):
 #        print('P', P, 'solved')
         return Psat, l, g, iterations, err
 
+    @_time_limited
     def flash_PVF(self, P, VF=None, zs=None, hot_start=None):
         zs = [1.0]
         if self.VL_only_CoolProp:
@@ -7329,12 +11924,15 @@ class FlashPureVLS(Flash):
                     flash_convergence['iterations'] = iterations
                     return g, ls, [], [1.0], flash_convergence
 
+            except FlashTimeoutError:
+                raise
             except Exception as e:
 #                    print(e)
                 solutions_1P.append(None)
 
 
 
+    @_time_limited
     def flash_TPV_HSGUA(self, fixed_var_val, spec_val, fixed_var='P', spec='H',
                         iter_var='T', zs=None, solution=None,
                         selection_fun_1P=None, hot_start=None):
@@ -7414,9 +12012,13 @@ class FlashPureVLS(Flash):
                         results_G_min_1P = new
 
                     solutions_1P.append(new)
+                except FlashTimeoutError:
+                    raise
                 except Exception as e:
 #                    print(e)
                     solutions_1P.append(None)
+        except FlashTimeoutError:
+            raise
         except:
             pass
 
@@ -7446,6 +12048,8 @@ class FlashPureVLS(Flash):
                 G_VL = G_g*VF + G_l*(1.0 - VF)
             else:
                 VF = None
+        except FlashTimeoutError:
+            raise
         except Exception as e:
 #            print(e, spec)
             VF = None
@@ -7466,6 +12070,8 @@ class FlashPureVLS(Flash):
                     G_SF = G_s*SF + G_other*(1.0 - SF)
             else:
                 SF = None
+        except FlashTimeoutError:
+            raise
         except:
             SF = None
 
@@ -7724,7 +12330,145 @@ class FlashPureVLS(Flash):
                 spline = CubicSpline(xs, gas_props[i], **VF_data_spline_kwargs)
                 gas_VF_interpolators[(base_prop, k)] = spline
 
+    def build_property_table(self, spec='H', Pmin=None, Pmax=None, Tmin=None,
+                             Tmax=None, P_pts=30, spec_pts=30,
+                             props=('T', 'rho_mass', 'Cp_mass', 'mu', 'k'),
+                             check=True, rtol=None, Pc_margin=0.01):
+        r'''Method to build a :obj:`PurePropertyTable` of properties as a
+        function of pressure and enthalpy or entropy, by performing `P`-`H` or
+        `P`-`S` flashes at the nodes of the table.
+
+        The pressure range is split into a block below the critical pressure,
+        where the liquid, two-phase and gas regions are tabulated separately,
+        and a block above it; each block has `P_pts` logarithmically spaced
+        pressures. At each pressure, every region is sampled at `spec_pts`
+        evenly spaced values of `spec`, between the values at `Tmin`, the
+        saturated liquid, the saturated gas, and `Tmax`.
+
+        Parameters
+        ----------
+        spec : str, optional
+            'H' or 'S', [-]
+        Pmin : float, optional
+            Lowest pressure of the table; 1e4 Pa by default, [Pa]
+        Pmax : float, optional
+            Highest pressure of the table; twice the critical pressure by
+            default, [Pa]
+        Tmin : float, optional
+            Temperature of the low `spec` bound of the table; 95% of the
+            saturation temperature at `Pmin` by default, [K]
+        Tmax : float, optional
+            Temperature of the high `spec` bound of the table; 1.5 times the
+            critical temperature by default, [K]
+        P_pts : int, optional
+            Number of pressures in each block, [-]
+        spec_pts : int, optional
+            Number of values of `spec` in each region, [-]
+        props : list[str], optional
+            Properties to tabulate, [-]
+        check : bool, optional
+            Whether or not to flash the center of every cell to calculate the
+            error of the table; this doubles the time required, [-]
+        rtol : float, optional
+            If specified, the table keeps a reference to this flasher and
+            calculates points outside the table or in cells whose error is
+            above `rtol` with a flash, [-]
+        Pc_margin : float, optional
+            Fraction of the critical pressure above and below it which is not
+            tabulated, [-]
+
+        Returns
+        -------
+        table : :obj:`PurePropertyTable`
+            Property table, [-]
+        '''
+        if P_pts < 3 or spec_pts < 3:
+            raise ValueError('At least 3 points are required in each direction')
+        Pc, Tc = self.constants.Pcs[0], self.constants.Tcs[0]
+        if Pmin is None:
+            Pmin = 1e4
+        if Pmax is None:
+            Pmax = 2.0*Pc
+        if Tmin is None:
+            Tmin = 0.95*self.flash(P=Pmin, VF=0).T
+        if Tmax is None:
+            Tmax = 1.5*Tc
+        props = list(props)
+        nan = float('nan')
+
+        def state_values(state):
+            vals = []
+            for k in props:
+                try:
+                    vals.append(float(state.value(k)))
+                except Exception:
+                    vals.append(nan)
+            return vals
 
+        def spec_flash(P, spec_val):
+            try:
+                return state_values(self.flash(P=P, **{spec: spec_val}))
+            except Exception:
+                return [nan]*len(props)
+
+        P_ranges = []
+        P_sub = min(Pmax, Pc*(1.0 - Pc_margin))
+        if Pmin < P_sub:
+            P_ranges.append((Pmin, P_sub, True))
+        P_super = max(Pmin, Pc*(1.0 + Pc_margin))
+        if P_super < Pmax:
+            P_ranges.append((P_super, Pmax, False))
+
+        us = linspace(0.0, 1.0, spec_pts)
+        # Keep the nodes on the saturation line on their side of it
+        us_flash = [min(max(u, 1e-6), 1.0 - 1e-6) for u in us]
+        blocks = []
+        for P_low, P_high, saturation in P_ranges:
+            lnPs = linspace(log(P_low), log(P_high), P_pts)
+            bounds = []
+            for lnP in lnPs:
+                P = exp(lnP)
+                pt_bounds = [self.flash(T=Tmin, P=P).value(spec)]
+                if saturation:
+                    pt_bounds.append(self.flash(P=P, VF=0).value(spec))
+                    pt_bounds.append(self.flash(P=P, VF=1).value(spec))
+                pt_bounds.append(self.flash(T=Tmax, P=P).value(spec))
+                for low, high in zip(pt_bounds, pt_bounds[1:]):
+                    if not low < high:
+                        raise ValueError('Tmin must be below and Tmax above the '
+                                         'saturation temperature at every pressure')
+                bounds.append(pt_bounds)
+            bounds = np.array(bounds).T
+
+            values = np.empty((len(bounds) - 1, len(props), P_pts, spec_pts))
+            for r in range(len(bounds) - 1):
+                for i, lnP in enumerate(lnPs):
+                    low, high = bounds[r][i], bounds[r+1][i]
+                    for j, u in enumerate(us_flash):
+                        values[r, :, i, j] = spec_flash(exp(lnP), low + u*(high - low))
+            blocks.append({'lnPs': lnPs, 'us': us, 'bounds': bounds, 'values': values,
+                           'errors': None})
+
+        table = PurePropertyTable(spec, props, blocks)
+        if check:
+            for b, block in enumerate(blocks):
+                lnPs, bound_coeffs = block['lnPs'], table._blocks[b][2]
+                errors = np.empty((len(block['values']), len(props), P_pts - 1, spec_pts - 1))
+                for r in range(len(errors)):
+                    for i in range(P_pts - 1):
+                        P = exp(0.5*(lnPs[i] + lnPs[i+1]))
+                        c_low, c_high = bound_coeffs[r][i], bound_coeffs[r+1][i]
+                        low = c_low[0] + 0.5*(c_low[1] + 0.5*(c_low[2] + 0.5*c_low[3]))
+                        high = c_high[0] + 0.5*(c_high[1] + 0.5*(c_high[2] + 0.5*c_high[3]))
+                        for j in range(spec_pts - 1):
+                            u = 0.5*(us[j] + us[j+1])
+                            actual = spec_flash(P, low + u*(high - low))
+                            for k in range(len(props)):
+                                err = abs(table._evaluate((b, r, i, j, 0.5, 0.5), k) - actual[k])
+                                errors[r, k, i, j] = err/abs(actual[k]) if actual[k] != 0.0 else err
+                block['errors'] = errors
+        return PurePropertyTable(spec, props, blocks, flasher=self if rtol is not None else None,
+                                 rtol=rtol)
 
     def flash_VF_HSGUA(self, fixed_var_val, spec_val, fixed_var='VF', spec_var='H', zs=None,
                        hot_start=None, solution='high'):
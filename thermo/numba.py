@@ -55,12 +55,15 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                      'identity_phase_states', 'sort_phases',
                     'sequential_substitution_2P',
                     'sequential_substitution_NP',
+                    'Rachford_Rice_solutionN_batch',
+                    'Rachford_Rice_solutionN_Okuno',
                     'sequential_substitution_Mehra_2P',
                     'sequential_substitution_GDEM3_2P',
                     'nonlin_equilibrium_NP',
                     'nonlin_spec_NP',
                     'nonlin_2P',
                     'nonlin_2P_HSGUAbeta',
+                    'nonlin_2P_HSGUAbeta_newton',
                     'nonlin_n_2P',
                     'nonlin_2P_newton',
                     'minimize_gibbs_2P_transformed',
@@ -95,6 +98,19 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                     'TPV_double_solve_1P',
                     'TPV_solve_HSGUA_guesses_VL',
                     'cm_flash_tol',
+                    'check_flash_deadline',
+                    'PT_algorithm_2P',
+                    'grid_flash_row',
+                    'dew_bubble_curve_path',
+                    'main_derivatives_and_departures_vectorized',
+                    'main_derivatives_and_departures_VDW_vectorized',
+                    'volume_solutions_halley_batch', 'volume_solutions_NR_batch',
+                    'volume_solutions_fast_batch', 'volume_solutions_Cardano_batch',
+                    '_volume_solutions_batch_inputs', '_volume_solutions_batch_cubic',
+                    '_lazy_memoize',
+                    'envelope_2P_Michelsen',
+                    'envelope_2P_Michelsen_point',
+                    'envelope_2P_Michelsen_residuals',
                     ])
 
     __funcs.update(normal_fluids.numba.numbafied_fluids_functions.copy())
@@ -119,6 +135,18 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
     to_change = ['eos.volume_solutions_halley', 'eos_mix.a_alpha_quadratic_terms',
                  'eos_mix_methods.a_alpha_and_derivatives_quadratic_terms',
                  'eos_mix_methods.PR_lnphis', 'eos_mix_methods.PR_lnphis_fastest',
+                 'eos_mix_methods.PR_translated_lnphis', 'eos_mix_methods.PR_translated_lnphis_fastest',
+                 'eos_mix_methods.SRK_lnphis', 'eos_mix_methods.SRK_lnphis_fastest',
+                 'eos_mix_methods.RK_lnphis_fastest', 'eos_mix_methods.SRK_translated_lnphis',
+                 'eos_mix_methods.SRK_translated_lnphis_fastest',
+                 'eos_mix_methods.VDW_lnphis', 'eos_mix_methods.VDW_lnphis_fastest',
+                 'eos_mix_methods.lnphis_direct',
+                 'flash.sequential_substitution_2P_functional',
+                 'flash.stability_iteration_Michelsen_functional',
+                 'eos_mix_methods.kijs_reduction', 'eos_mix_methods.reduced_variables',
+                 'eos_mix_methods.lnphis_reduced', 'eos_mix_methods.lnphis_direct_reduced',
+                 'flash.sequential_substitution_2P_reduced',
+                 'flash.stability_iteration_Michelsen_reduced',
                  'eos_mix_methods.a_alpha_aijs_composition_independent',
                  'eos_mix_methods.a_alpha_and_derivatives_full',
 
@@ -168,6 +196,58 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'eos_alpha_functions.PRSV2_a_alpha_and_derivatives_vectorized',
                  'eos_alpha_functions.APISRK_a_alphas_vectorized',
                  'eos_alpha_functions.APISRK_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Soave_1972_a_alphas_vectorized',
+                 'eos_alpha_functions.Soave_1972_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Heyen_a_alphas_vectorized',
+                 'eos_alpha_functions.Heyen_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Harmens_Knapp_a_alphas_vectorized',
+                 'eos_alpha_functions.Harmens_Knapp_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Mathias_1983_a_alphas_vectorized',
+                 'eos_alpha_functions.Mathias_1983_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Mathias_Copeman_untruncated_a_alphas_vectorized',
+                 'eos_alpha_functions.Mathias_Copeman_untruncated_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Gibbons_Laughton_a_alphas_vectorized',
+                 'eos_alpha_functions.Gibbons_Laughton_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Soave_1984_a_alphas_vectorized',
+                 'eos_alpha_functions.Soave_1984_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Yu_Lu_a_alphas_vectorized',
+                 'eos_alpha_functions.Yu_Lu_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Trebble_Bishnoi_a_alphas_vectorized',
+                 'eos_alpha_functions.Trebble_Bishnoi_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Melhem_a_alphas_vectorized',
+                 'eos_alpha_functions.Melhem_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Androulakis_a_alphas_vectorized',
+                 'eos_alpha_functions.Androulakis_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Schwartzentruber_a_alphas_vectorized',
+                 'eos_alpha_functions.Schwartzentruber_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Almeida_a_alphas_vectorized',
+                 'eos_alpha_functions.Almeida_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Soave_93_a_alphas_vectorized',
+                 'eos_alpha_functions.Soave_93_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Gasem_a_alphas_vectorized',
+                 'eos_alpha_functions.Gasem_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Coquelet_a_alphas_vectorized',
+                 'eos_alpha_functions.Coquelet_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Haghtalab_a_alphas_vectorized',
+                 'eos_alpha_functions.Haghtalab_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Saffari_a_alphas_vectorized',
+                 'eos_alpha_functions.Saffari_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Poly_a_alphas_vectorized',
+                 'eos_alpha_functions.Poly_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Mathias_Copeman_a_alphas_vectorized',
+                 'eos_alpha_functions.Mathias_Copeman_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Twu91_a_alphas_vectorized',
+                 'eos_alpha_functions.Twu91_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Soave_79_a_alphas_vectorized',
+                 'eos_alpha_functions.Soave_79_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.Chen_Yang_a_alphas_vectorized',
+                 'eos_alpha_functions.Chen_Yang_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions._TWU_a_alphas_vectorized',
+                 'eos_alpha_functions._TWU_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.TwuPR95_a_alphas_vectorized',
+                 'eos_alpha_functions.TwuPR95_a_alpha_and_derivatives_vectorized',
+                 'eos_alpha_functions.TwuSRK95_a_alphas_vectorized',
+                 'eos_alpha_functions.TwuSRK95_a_alpha_and_derivatives_vectorized',
 
                  'phases.IAPWS95', 'phases.IAPWS95Liquid', 'phases.IAPWS95Gas',
                  'phases.DryAirLemmon',
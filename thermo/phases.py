@@ -161,7 +161,9 @@ from chemicals.utils import (log, log10, exp, Cp_minus_Cv, phase_identification_
 from thermo.activity import IdealSolution
 from thermo.coolprop import has_CoolProp
 from thermo.eos_mix import IGMIX
-from thermo.eos_mix_methods import PR_lnphis_fastest
+from thermo.eos_mix_methods import (PR_lnphis_fastest, PR_translated_lnphis_fastest,
+                                    SRK_lnphis_fastest, RK_lnphis_fastest,
+                                    SRK_translated_lnphis_fastest, VDW_lnphis_fastest)
 from random import randint
 from collections import OrderedDict
 from chemicals.iapws import *
@@ -5517,10 +5519,30 @@ class CEOSGas(Phase):
 
     def lnphis_at_zs(self, zs):
         eos_mix = self.eos_mix
-        if eos_mix.__class__.__name__ == 'PRMIX':
+        eos_name = eos_mix.__class__.__name__
+        if eos_name == 'PRMIX':
             return PR_lnphis_fastest(zs, self.T, self.P, eos_mix.kijs, self.is_liquid, self.is_gas,
                                      eos_mix.ais, eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots,
                                      eos_mix.kappas)
+        elif eos_name == 'SRKMIX':
+            return SRK_lnphis_fastest(zs, self.T, self.P, eos_mix.kijs, self.is_liquid, self.is_gas,
+                                      eos_mix.ais, eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots,
+                                      eos_mix.ms)
+        elif eos_name == 'RKMIX':
+            return RK_lnphis_fastest(zs, self.T, self.P, eos_mix.kijs, self.is_liquid, self.is_gas,
+                                     eos_mix.ais, eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots)
+        elif eos_name == 'VDWMIX':
+            return VDW_lnphis_fastest(zs, self.T, self.P, eos_mix.kijs, self.is_liquid, self.is_gas,
+                                      eos_mix.ais, eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots)
+        elif eos_name in ('PRMIXTranslated', 'PRMIXTranslatedConsistent', 'PRMIXTranslatedPPJP'):
+            # The translated formulas divide by `a_alpha`
+            if 0.0 not in eos_mix.a_alphas:
+                return PR_translated_lnphis_fastest(zs, self.T, self.P, eos_mix.kijs, self.is_liquid, self.is_gas,
+                                                    eos_mix.b0s, eos_mix.cs, eos_mix.a_alphas, eos_mix.a_alpha_roots)
+        elif eos_name in ('SRKMIXTranslated', 'SRKMIXTranslatedConsistent', 'MSRKMIXTranslated'):
+            if 0.0 not in eos_mix.a_alphas:
+                return SRK_translated_lnphis_fastest(zs, self.T, self.P, eos_mix.kijs, self.is_liquid, self.is_gas,
+                                                     eos_mix.b0s, eos_mix.cs, eos_mix.a_alphas, eos_mix.a_alpha_roots)
         return self.to_TP_zs(self.T, self.P, zs).lnphis()
 
 